@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Output Parser Benchmark
+
+Compares OutputParser before and after the single-pass tokenizer:
+
+- "before": the previous implementation (whitespace-collapsing re.sub,
+  non-greedy findall re-run on every nested content string, plus find/rfind
+  scans per robustly extracted field), copied below
+- "after": the current OutputParser, one tokenizer pass per response
+
+Speed is measured on ~100 KB reasoning-model style responses (long
+preamble with markdown and stray tags, XML in a code fence) and on a
+pathological response with many unclosed tags. Robustness is measured on
+a seeded fuzz corpus of mutated responses: the share in which each field
+is recovered with the expected text, and the number of exceptions.
+
+Usage:
+    python scripts/benchmark_output_parser.py [--size KB] [--fuzz N] [--seed S]
+"""
+
+import argparse
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from vpsweb.services.parser import OutputParser
+
+FIELDS = {
+    "initial_translation": "雾来了，\n踏着猫的细步。\n\n它静坐着俯视\n港口和城市，",
+    "initial_translation_notes": "The translation keeps the cat imagery; 细步 renders 'little feet' while keeping rhythm.",
+    "translated_poem_title": "雾",
+    "translated_poet_name": "卡尔·桑德堡",
+}
+
+
+# --- previous implementation -------------------------------------------------
+
+
+def legacy_parse_xml(xml_string):
+    xml_string = re.sub(r"\s+(<|>)", r"\1", xml_string.strip())
+    matches = re.findall(r"<(\w+)>(.*?)</\1>", xml_string, re.DOTALL)
+    result = {}
+    for tag, content in matches:
+        if re.search(r"<\w+>", content) and re.search(r"</\w+>", content):
+            result[tag] = legacy_parse_xml(content)
+        else:
+            result[tag] = content
+    return result
+
+
+def legacy_extract(xml_string, tag_name):
+    start_tag, end_tag = f"<{tag_name}>", f"</{tag_name}>"
+    start_index = xml_string.find(start_tag)
+    if start_index == -1:
+        return ""
+    content_start = start_index + len(start_tag)
+    end_index = xml_string.rfind(end_tag, content_start)
+    if end_index == -1:
+        return xml_string[content_start:].strip()
+    return xml_string[content_start:end_index].strip()
+
+
+def legacy_parse_initial_translation_xml(xml_string):
+    initial_translation = legacy_extract(xml_string, "initial_translation")
+    initial_translation_notes = legacy_extract(xml_string, "initial_translation_notes")
+    parsed_data = legacy_parse_xml(xml_string)
+    if not initial_translation:
+        initial_translation = str(parsed_data.get("initial_translation", "")).strip()
+    if not initial_translation_notes:
+        initial_translation_notes = str(parsed_data.get("initial_translation_notes", "")).strip()
+    if not initial_translation:
+        raise ValueError("Missing required 'initial_translation' tag in XML")
+    return {
+        "initial_translation": initial_translation,
+        "initial_translation_notes": initial_translation_notes,
+        "translated_poem_title": str(parsed_data.get("translated_poem_title", "")).strip(),
+        "translated_poet_name": str(parsed_data.get("translated_poet_name", "")).strip(),
+    }
+
+
+# --- corpus ------------------------------------------------------------------
+
+
+def xml_block() -> str:
+    return "".join(f"<{tag}>\n{text}\n</{tag}>\n" for tag, text in FIELDS.items())
+
+
+def large_response(size_kb: int, rng: random.Random) -> str:
+    """Reasoning preamble with markdown, comparisons and stray tags, then the XML in a code fence"""
+    lines = [
+        "Let me consider the imagery line by line.",
+        "The meter of line 2 < line 1, so the rendering should be lighter.",
+        "**Option A**: keep 猫 explicit<br>",
+        "- `<b>`soft`</b>` vs. quiet: the second keeps the tone -> better",
+        "Checking the rhyme scheme (a > b) against the original...",
+    ]
+    preamble = []
+    size = 0
+    while size < size_kb * 1024:
+        line = rng.choice(lines)
+        preamble.append(line)
+        size += len(line.encode("utf-8")) + 1
+    return "\n".join(preamble) + "\n\n```xml\n" + xml_block() + "```\n"
+
+
+def unclosed_tags_response(count: int) -> str:
+    return "<br> line of reasoning\n" * count + xml_block()
+
+
+def mutate(document: str, rng: random.Random) -> str:
+    kind = rng.randrange(6)
+    if kind == 0:  # truncated response
+        return document[: rng.randrange(len(document) // 2, len(document))]
+    if kind == 1:  # a closing tag goes missing
+        tag = rng.choice(list(FIELDS))
+        return document.replace(f"</{tag}>", "", 1)
+    if kind == 2:  # code fence and chatter around the XML
+        return f"Here is the translation:\n```xml\n{document}```\nLet me know if you need changes."
+    if kind == 3:  # stray angle brackets and unclosed tags in the text
+        position = rng.randrange(len(document))
+        return document[:position] + rng.choice([" a < b ", "<br>", "<note>", " -> ", "</p>"]) + document[position:]
+    if kind == 4:  # extra whitespace inside tags
+        return document.replace(">", " >", rng.randrange(1, 4)).replace("\n<", "\n   <")
+    return document.replace("<translated_poem_title>", "<TRANSLATED_TITLE>", 1)  # unexpected tag
+
+
+def expected_fields(document: str) -> dict:
+    """Fields that are still wrapped in their opening and closing tags with nothing else inside"""
+    return {
+        tag: text
+        for tag, text in FIELDS.items()
+        if re.search(rf"<{tag}\s*>\s*{re.escape(text)}\s*</{tag}\s*>", document)
+    }
+
+
+def normalized(value) -> str:
+    return " ".join(str(value).split())
+
+
+def fuzz(parse, documents) -> dict:
+    recovered = expected = errors = 0
+    for document in documents:
+        wanted = expected_fields(document)
+        expected += len(wanted)
+        try:
+            result = parse(document)
+        except Exception:
+            errors += 1
+            continue
+        recovered += sum(normalized(result.get(tag, "")) == normalized(text) for tag, text in wanted.items())
+    return {"recovered": recovered, "expected": expected, "errors": errors}
+
+
+def time_parse(parse, document: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse(document)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100, help="Size of the large response in KB")
+    parser.add_argument("--fuzz", type=int, default=2000, help="Number of fuzzed responses")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the corpus")
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    # The fuzz corpus triggers a parser warning per malformed response
+    logging.disable(logging.WARNING)
+
+    print("=" * 78)
+    print("Output parser benchmark")
+    print("=" * 78)
+    cases = {
+        f"parse_xml, {args.size} KB response": (
+            legacy_parse_xml,
+            OutputParser.parse_xml,
+            large_response(args.size, rng),
+        ),
+        f"initial translation, {args.size} KB response": (
+            legacy_parse_initial_translation_xml,
+            OutputParser.parse_initial_translation_xml,
+            large_response(args.size, rng),
+        ),
+        "initial translation, 2000 unclosed <br>": (
+            legacy_parse_initial_translation_xml,
+            OutputParser.parse_initial_translation_xml,
+            unclosed_tags_response(2000),
+        ),
+    }
+    print(f"{'case':<50}{'before (ms)':>14}{'after (ms)':>14}")
+    for name, (before, after, document) in cases.items():
+        repeat = 3 if "unclosed" in name else 20
+        print(f"{name:<50}{time_parse(before, document, repeat):>14.2f}{time_parse(after, document, repeat):>14.2f}")
+
+    base = xml_block()
+    documents = [mutate(mutate(base, rng), rng) for _ in range(args.fuzz)]
+    print()
+    print(f"Fuzz corpus: {args.fuzz} mutated initial translation responses")
+    print(f"{'parser':<20}{'fields recovered':>20}{'exceptions':>14}")
+    for name, parse in (
+        ("before", legacy_parse_initial_translation_xml),
+        ("after", OutputParser.parse_initial_translation_xml),
+    ):
+        result = fuzz(parse, documents)
+        rate = result["recovered"] / max(result["expected"], 1) * 100
+        print(f"{name:<20}{result['recovered']:>9}/{result['expected']:<6}{rate:>4.0f}%{result['errors']:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Payload Storage Benchmark
+
+Measures the effect of deferring workflow step / BBR payload columns and of the
+compressed translation_payloads side table on row size and list-query latency.
+"Before" loads the payload columns eagerly (the previous mapping); "after" uses
+the deferred mapping.
+
+Usage:
+    python scripts/benchmark_payload_storage.py [--translations N] [--content-kb KB] [--repeat R]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import LargeBinary, create_engine, func, pool, select
+from sqlalchemy.orm import selectinload, sessionmaker, undefer_group
+
+from src.vpsweb.repository.crud import RepositoryService
+from src.vpsweb.repository.database import Base
+from src.vpsweb.repository.models import (
+    AILog,
+    BackgroundBriefingReport,
+    Poem,
+    Translation,
+    TranslationWorkflowStep,
+)
+
+STEP_TYPES = ("initial_translation", "editor_review", "revised_translation")
+
+
+def build_database(translations: int, content_kb: int):
+    """Create an in-memory database populated with synthetic translations"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=pool.StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    repo = RepositoryService(session)
+
+    # CJK characters are 3 bytes in UTF-8
+    content = ("月落乌啼霜满天，江枫渔火对愁眠。" * content_kb * 64)[: content_kb * 1024 // 3]
+    model_info = json.dumps({"provider": "benchmark", "model": "bench-model", "temperature": "0.7"})
+
+    for index in range(translations):
+        poem_id = f"P{index:025d}"
+        translation_id = f"T{index:025d}"
+        log_id = f"L{index:025d}"
+        session.add(
+            Poem(
+                id=poem_id,
+                poet_name=f"Poet {index % 50}",
+                poem_title=f"Poem {index}",
+                source_language="zh-CN",
+                original_text=content[:200],
+            )
+        )
+        session.add(
+            Translation(
+                id=translation_id,
+                poem_id=poem_id,
+                translator_type="ai",
+                translator_info="bench-model",
+                target_language="en",
+                translated_text=content[:400],
+            )
+        )
+        session.add(AILog(id=log_id, translation_id=translation_id, model_name="bench-model", workflow_mode="hybrid"))
+        for order, step_type in enumerate(STEP_TYPES, start=1):
+            session.add(
+                TranslationWorkflowStep(
+                    id=f"S{order}{index:024d}",
+                    translation_id=translation_id,
+                    ai_log_id=log_id,
+                    workflow_id=f"W{index:025d}",
+                    step_type=step_type,
+                    step_order=order,
+                    content=content,
+                    notes=content[: len(content) // 2],
+                    model_info=model_info,
+                    tokens_used=1000,
+                    cost=0.01,
+                    duration_seconds=3.0,
+                )
+            )
+        session.add(
+            BackgroundBriefingReport(
+                id=f"B{index:025d}",
+                poem_id=poem_id,
+                content=json.dumps({"sections": [content] * 2}, ensure_ascii=False),
+                model_info=model_info,
+            )
+        )
+    session.commit()
+
+    for index in range(translations):
+        translation_id = f"T{index:025d}"
+        repo.translation_payloads.save(
+            translation_id,
+            {"results": {step: {"content": content, "notes": content[: len(content) // 2]} for step in STEP_TYPES}},
+        )
+    return engine, session
+
+
+def time_query(session, build_stmt, repeat: int) -> float:
+    """Median wall time in milliseconds of loading all rows of a statement"""
+    samples = []
+    for _ in range(repeat):
+        session.expunge_all()
+        start = time.perf_counter()
+        session.execute(build_stmt()).scalars().all()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--translations", type=int, default=500, help="Number of translations to generate")
+    parser.add_argument("--content-kb", type=int, default=8, help="Approximate size of each step content in KB")
+    parser.add_argument("--repeat", type=int, default=7, help="Timing repetitions per query")
+    args = parser.parse_args()
+
+    engine, session = build_database(args.translations, args.content_kb)
+
+    payload_bytes = session.execute(
+        select(
+            func.avg(
+                func.length(func.cast(TranslationWorkflowStep.content, LargeBinary))
+                + func.coalesce(func.length(func.cast(TranslationWorkflowStep.notes, LargeBinary)), 0)
+                + func.coalesce(func.length(func.cast(TranslationWorkflowStep.model_info, LargeBinary)), 0)
+            )
+        )
+    ).scalar()
+    payload_stats = RepositoryService(session).translation_payloads.get_storage_stats()
+
+    print("=" * 70)
+    print(f"Payload storage benchmark: {args.translations} translations, ~{args.content_kb} KB step content")
+    print("=" * 70)
+    print(f"Deferred workflow step payload per row: {payload_bytes:,.0f} bytes (no longer loaded by list queries)")
+    print(
+        f"translation_payloads: {payload_stats['raw_bytes']:,} raw bytes -> "
+        f"{payload_stats['compressed_bytes']:,} compressed ({payload_stats['compression_ratio']:.1f}x)"
+    )
+    print()
+
+    queries = {
+        "translations + workflow_steps (list)": (
+            lambda: select(Translation).options(selectinload(Translation.workflow_steps).undefer_group("step_payload")),
+            lambda: select(Translation).options(selectinload(Translation.workflow_steps)),
+        ),
+        "workflow steps scan": (
+            lambda: select(TranslationWorkflowStep).options(undefer_group("step_payload")),
+            lambda: select(TranslationWorkflowStep),
+        ),
+        "BBR existence check (has_bbr)": (
+            lambda: select(BackgroundBriefingReport).options(undefer_group("bbr_payload")),
+            lambda: select(BackgroundBriefingReport),
+        ),
+    }
+
+    print(f"{'query':<40}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name, (before, after) in queries.items():
+        before_ms = time_query(session, before, args.repeat)
+        after_ms = time_query(session, after, args.repeat)
+        speedup = before_ms / after_ms if after_ms else float("inf")
+        print(f"{name:<40}{before_ms:>12.2f}{after_ms:>12.2f}{speedup:>9.1f}x")
+
+    session.close()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Prompt Rendering Benchmark
+
+Compares the per-call cost of PromptService.render_prompt:
+
+- "before": every render re-parses the system and user templates with
+  ``Environment.from_string`` and re-extracts their variables with a regex
+  (the previous implementation)
+- "after": the compiled templates and variable sets cached per template file
+
+Every template in the config/prompts* sets is rendered with placeholder
+string values for the variables it uses; templates that need structured
+values are skipped.
+
+Usage:
+    python scripts/benchmark_prompt_rendering.py [--renders N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from vpsweb.services.prompts import PROMPT_PARTS, PromptService
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+
+def render_uncached(service: PromptService, template_name: str, variables: dict) -> tuple:
+    """The previous render path: regex validation and from_string on every call"""
+    template_data = service.get_template(template_name)
+    service._validate_template_variables(template_data, variables)
+    return tuple(
+        service.jinja_env.from_string(template_data[part]).render(**variables) if part in template_data else ""
+        for part in PROMPT_PARTS
+    )
+
+
+def render_cached(service: PromptService, template_name: str, variables: dict) -> tuple:
+    return service.render_prompt(template_name, variables)
+
+
+def time_renders(render, service: PromptService, template_name: str, variables: dict, renders: int) -> float:
+    start = time.perf_counter()
+    for _ in range(renders):
+        render(service, template_name, variables)
+    return (time.perf_counter() - start) / renders * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=200, help="Renders per template and mode")
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"Prompt rendering benchmark: {args.renders} renders per template")
+    print("=" * 78)
+    print(f"{'template':<50}{'before (ms)':>14}{'after (ms)':>14}")
+
+    totals = {"before": 0.0, "after": 0.0}
+    for prompts_dir in sorted(CONFIG_DIR.glob("prompts*")):
+        service = PromptService(str(prompts_dir))
+        for template_file in sorted(prompts_dir.glob("*.yaml")):
+            name = template_file.stem
+            try:
+                prompt_template = service.load_prompt_template(name)
+                if not any(part in prompt_template.data for part in PROMPT_PARTS):
+                    continue
+                variables = {variable.split(".")[0]: f"<{variable}>" for variable in prompt_template.variables}
+                if render_uncached(service, name, variables) != render_cached(service, name, variables):
+                    raise AssertionError("cached render differs")
+            except Exception as e:
+                print(f"{prompts_dir.name + '/' + name:<50}  skipped: {type(e).__name__}")
+                continue
+
+            before = time_renders(render_uncached, service, name, variables, args.renders)
+            after = time_renders(render_cached, service, name, variables, args.renders)
+            totals["before"] += before
+            totals["after"] += after
+            print(f"{prompts_dir.name + '/' + name:<50}{before:>14.3f}{after:>14.3f}")
+
+    print("-" * 78)
+    print(f"{'total':<50}{totals['before']:>14.3f}{totals['after']:>14.3f}")
+    if totals["after"]:
+        print(f"speedup: {totals['before'] / totals['after']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+SSE Fan-out Benchmark
+
+Compares the CPU cost of keeping many task progress streams open:
+
+- "before": every stream polls the task store every 200 ms and diffs the
+  task's ``to_dict()`` output (the previous SSE implementation)
+- "after": streams subscribe to a TaskEventHub; one pump per task waits for
+  changes and publishes a snapshot that is fanned out to all subscribers
+
+Both are measured while the task is idle and while it receives updates.
+
+Usage:
+    python scripts/benchmark_sse_fanout.py [--streams N] [--tasks T] [--seconds S] [--updates U]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from vpsweb.webui.event_hub import TaskEventHub
+from vpsweb.webui.task_models import TaskStatus
+from vpsweb.webui.task_store import InMemoryTaskStore
+
+STEPS = ["Initial Translation", "Editor Review", "Translator Revision"]
+
+
+async def polling_stream(tasks, task_id: str, received: list) -> None:
+    last = None
+    while True:
+        await asyncio.sleep(0.2)
+        current = tasks.get(task_id).to_dict()
+        if last is None or current["updated_at"] != last["updated_at"]:
+            received.append(current)
+            last = current
+
+
+async def hub_stream(hub: TaskEventHub, task_id: str, received: list) -> None:
+    with hub.subscribe(task_id) as subscription:
+        async for event in subscription:
+            received.append(event["task"])
+
+
+async def measure(mode: str, streams: int, task_count: int, seconds: float, updates: int) -> dict:
+    tasks = InMemoryTaskStore().namespace("tasks")
+    task_ids = [f"task-{index}" for index in range(task_count)]
+    for task_id in task_ids:
+        tasks[task_id] = TaskStatus(task_id=task_id)
+    hub = TaskEventHub(tasks)
+    received: list = []
+
+    if mode == "before":
+        consumers = [
+            asyncio.create_task(polling_stream(tasks, task_ids[index % task_count], received))
+            for index in range(streams)
+        ]
+    else:
+        consumers = [
+            asyncio.create_task(hub_stream(hub, task_ids[index % task_count], received)) for index in range(streams)
+        ]
+    await asyncio.sleep(0.5)  # let every stream connect
+
+    # Idle: nothing changes
+    cpu_start = time.process_time()
+    await asyncio.sleep(seconds)
+    idle_cpu = time.process_time() - cpu_start
+
+    # Busy: each task receives `updates` progress updates spread over the window
+    received.clear()
+    cpu_start = time.process_time()
+    interval = seconds / updates
+    for update in range(updates):
+        for task_id in task_ids:
+            with tasks.edit(task_id) as task:
+                task.update_step(STEPS[update % 3], {"step_status": "running"}, step_percent=update)
+        await asyncio.sleep(interval)
+    await asyncio.sleep(0.3)  # let the last update drain
+    busy_cpu = time.process_time() - cpu_start
+
+    for consumer in consumers:
+        consumer.cancel()
+    await asyncio.gather(*consumers, return_exceptions=True)
+    return {
+        "idle_cpu_pct": idle_cpu / seconds * 100,
+        "busy_cpu_pct": busy_cpu / (seconds + 0.3) * 100,
+        "deliveries": len(received),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--streams", type=int, default=500, help="Number of open SSE streams")
+    parser.add_argument("--tasks", type=int, default=50, help="Number of tasks the streams follow")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Length of each measurement window")
+    parser.add_argument("--updates", type=int, default=20, help="Updates per task in the busy window")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"SSE fan-out benchmark: {args.streams} streams over {args.tasks} tasks, {args.seconds:.0f}s windows")
+    print("=" * 70)
+    results = {
+        mode: asyncio.run(measure(mode, args.streams, args.tasks, args.seconds, args.updates))
+        for mode in ("before", "after")
+    }
+
+    print(f"{'measurement':<30}{'before':>14}{'after':>14}")
+    print(
+        f"{'CPU while idle':<30}{results['before']['idle_cpu_pct']:>13.1f}%{results['after']['idle_cpu_pct']:>13.1f}%"
+    )
+    print(
+        f"{'CPU while updating':<30}{results['before']['busy_cpu_pct']:>13.1f}%{results['after']['busy_cpu_pct']:>13.1f}%"
+    )
+    print(f"{'updates delivered':<30}{results['before']['deliveries']:>14}{results['after']['deliveries']:>14}")
+    print(f"(expected deliveries: {args.streams * args.updates})")
+
+
+if __name__ == "__main__":
+    main()
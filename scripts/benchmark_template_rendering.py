@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+HTML Template Rendering Benchmark
+
+Renders poem_detail.html (the largest page template) the way the web UI
+does and compares:
+
+- "before": a new Jinja2 Environment per render, so every render parses and
+  compiles poem_detail.html and base.html from disk
+- "after": the shared environment from vpsweb.webui.templating, where
+  templates are compiled once and then rendered from the in-memory cache
+
+It also shows the cost of the first render in a fresh process with a cold
+and a warm on-disk bytecode cache.
+
+Usage:
+    python scripts/benchmark_template_rendering.py [--renders N] [--template NAME]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from vpsweb.webui.templating import get_template_environment, strip_leading_spaces
+
+TEMPLATE_DIR = str(Path(__file__).parent.parent / "src" / "vpsweb" / "webui" / "web" / "templates")
+
+CONTEXT = {
+    "poem_id": "01HZX3V9K2M4N6P8Q0R2S4T6V8",
+    "poem": {
+        "id": "01HZX3V9K2M4N6P8Q0R2S4T6V8",
+        "poet_name": "李白",
+        "poem_title": "静夜思",
+        "source_language": "zh-CN",
+        "content": "床前明月光，\n疑是地上霜。\n举头望明月，\n低头思故乡。",
+        "metadata_json": None,
+        "created_at": "2025-01-01T00:00:00",
+        "updated_at": "2025-01-01T00:00:00",
+        "translation_count": 3,
+        "ai_translation_count": 2,
+        "human_translation_count": 1,
+        "selected": True,
+    },
+    "title": "VPSWeb Repository",
+    "request": SimpleNamespace(url=SimpleNamespace(path="/poems/01HZX3V9K2M4N6P8Q0R2S4T6V8")),
+    "current_path": "/poems/01HZX3V9K2M4N6P8Q0R2S4T6V8",
+    "query_params": {},
+}
+
+
+def render_uncached(template_name: str) -> str:
+    env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+    env.filters["strip_leading_spaces"] = strip_leading_spaces
+    return env.get_template(template_name).render(**CONTEXT)
+
+
+def timed_ms(func, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=200, help="Renders per measurement")
+    parser.add_argument("--template", default="poem_detail.html", help="Template to render")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"Template rendering benchmark: {args.template}, {args.renders} renders")
+    print("=" * 70)
+
+    results = {"before (env per render)": timed_ms(lambda: render_uncached(args.template), args.renders)}
+    for auto_reload in (True, False):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = get_template_environment(TEMPLATE_DIR, auto_reload, cache_dir)
+            env.get_template(args.template)  # warm-up (what precompile_templates does at startup)
+            label = "after, auto_reload" if auto_reload else "after, no auto_reload"
+            results[label] = timed_ms(lambda: env.get_template(args.template).render(**CONTEXT), args.renders)
+
+    print(f"{'per render':<30}{'median ms':>12}{'p95 ms':>12}{'renders/s':>12}")
+    for label, samples in results.items():
+        median = statistics.median(samples)
+        p95 = sorted(samples)[int(len(samples) * 0.95) - 1]
+        print(f"{label:<30}{median:>12.3f}{p95:>12.3f}{1000 / median:>12.0f}")
+    print()
+
+    # First render in a fresh environment: compile from source vs load from the bytecode cache
+    with tempfile.TemporaryDirectory() as cache_dir:
+
+        def first_render():
+            env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), bytecode_cache=FileSystemBytecodeCache(cache_dir))
+            env.filters["strip_leading_spaces"] = strip_leading_spaces
+            return env.get_template(args.template).render(**CONTEXT)
+
+        cold = timed_ms(first_render, 1)[0]
+        warm = statistics.median(timed_ms(first_render, 20))
+    print(f"first render, cold bytecode cache: {cold:.2f} ms; warm bytecode cache: {warm:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+ULID Key Storage Benchmark
+
+Compares 26-character TEXT ULID keys ("before") with 16-byte BLOB keys
+("after", the ULIDBinary column type) on identical synthetic repositories:
+on-disk size of the key indexes, join and point-lookup latency, and the
+Python cost of converting keys at the ORM boundary.
+
+Usage:
+    python scripts/benchmark_ulid_storage.py [--poems N] [--translations-per-poem T] [--repeat R]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import create_engine, pool, text
+
+from src.vpsweb.repository.database import Base
+from src.vpsweb.repository.models import ULIDBinary
+from src.vpsweb.utils.ulid_utils import generate_ulid_batch, ulid_to_binary
+
+JOIN_QUERY = """
+    SELECT COUNT(*), SUM(LENGTH(l.model_name))
+    FROM translations t
+    JOIN poems p ON p.id = t.poem_id
+    JOIN ai_logs l ON l.translation_id = t.id
+    WHERE p.poet_name = :poet_name
+"""
+
+
+def build_database(poems: int, translations_per_poem: int, binary: bool):
+    """Create an in-memory database with TEXT or BLOB keys"""
+    engine = create_engine("sqlite://", poolclass=pool.StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    key = ulid_to_binary if binary else str
+
+    poem_ids = generate_ulid_batch(poems)
+    translation_ids = generate_ulid_batch(poems * translations_per_poem)
+    log_ids = generate_ulid_batch(len(translation_ids))
+
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO poems (id, poet_name, poem_title, source_language, original_text, selected, "
+                "created_at, updated_at) VALUES (:id, :poet_name, :title, 'zh-CN', '床前明月光', 0, "
+                "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ),
+            [
+                {"id": key(poem_id), "poet_name": f"Poet {index % 100}", "title": f"Poem {index}"}
+                for index, poem_id in enumerate(poem_ids)
+            ],
+        )
+        conn.execute(
+            text(
+                "INSERT INTO translations (id, poem_id, translator_type, target_language, translated_text, "
+                "created_at) VALUES (:id, :poem_id, 'ai', 'en', 'Moonlight before my bed', CURRENT_TIMESTAMP)"
+            ),
+            [
+                {"id": key(translation_id), "poem_id": key(poem_ids[index // translations_per_poem])}
+                for index, translation_id in enumerate(translation_ids)
+            ],
+        )
+        conn.execute(
+            text(
+                "INSERT INTO ai_logs (id, translation_id, model_name, workflow_mode, created_at) "
+                "VALUES (:id, :translation_id, 'bench-model', 'hybrid', CURRENT_TIMESTAMP)"
+            ),
+            [
+                {"id": key(log_id), "translation_id": key(translation_id)}
+                for log_id, translation_id in zip(log_ids, translation_ids)
+            ],
+        )
+        conn.execute(text("ANALYZE"))
+    return engine, poem_ids
+
+
+def key_index_bytes(engine) -> dict:
+    """Bytes used by each index over a key column, from the dbstat virtual table"""
+    with engine.connect() as conn:
+        indexes = conn.execute(
+            text(
+                "SELECT il.name FROM sqlite_master m, pragma_index_list(m.name) il, pragma_index_info(il.name) ii "
+                "WHERE m.type = 'table' AND m.name IN ('poems', 'translations', 'ai_logs') "
+                "AND ii.name IN ('id', 'poem_id', 'translation_id') "
+                "GROUP BY il.name HAVING COUNT(*) = 1"
+            )
+        ).scalars()
+        sizes = dict(conn.execute(text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")).all())
+        return {name: sizes.get(name, 0) for name in indexes}
+
+
+def median_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--poems", type=int, default=20000, help="Number of poems to generate")
+    parser.add_argument("--translations-per-poem", type=int, default=3, help="Translations (and AI logs) per poem")
+    parser.add_argument("--repeat", type=int, default=7, help="Timing repetitions per measurement")
+    args = parser.parse_args()
+
+    before_engine, poem_ids = build_database(args.poems, args.translations_per_poem, binary=False)
+    after_engine, after_poem_ids = build_database(args.poems, args.translations_per_poem, binary=True)
+    lookup_ids = poem_ids[:: max(1, len(poem_ids) // 2000)]
+    after_lookup_ids = [ulid_to_binary(poem_id) for poem_id in after_poem_ids[:: max(1, len(poem_ids) // 2000)]]
+
+    print("=" * 70)
+    print(
+        f"ULID key storage benchmark: {args.poems} poems, "
+        f"{args.poems * args.translations_per_poem} translations and AI logs"
+    )
+    print("=" * 70)
+
+    before_sizes = key_index_bytes(before_engine)
+    after_sizes = key_index_bytes(after_engine)
+    print(f"{'key index':<40}{'before KiB':>12}{'after KiB':>12}{'ratio':>10}")
+    for name in sorted(before_sizes):
+        before_kib, after_kib = before_sizes[name] / 1024, after_sizes.get(name, 0) / 1024
+        print(f"{name:<40}{before_kib:>12.0f}{after_kib:>12.0f}{before_kib / after_kib if after_kib else 0:>9.2f}x")
+    total_before, total_after = sum(before_sizes.values()) / 1024, sum(after_sizes.values()) / 1024
+    print(f"{'total':<40}{total_before:>12.0f}{total_after:>12.0f}{total_before / total_after:>9.2f}x")
+    print()
+
+    def join(engine):
+        with engine.connect() as conn:
+            for poet in range(10):
+                conn.execute(text(JOIN_QUERY), {"poet_name": f"Poet {poet}"}).one()
+
+    def lookups(engine, ids):
+        with engine.connect() as conn:
+            stmt = text("SELECT id, poem_title FROM poems WHERE id = :id")
+            for poem_id in ids:
+                conn.execute(stmt, {"id": poem_id}).one()
+
+    timings = {
+        "poems-translations-ai_logs join (x10)": (lambda: join(before_engine), lambda: join(after_engine)),
+        f"poem point lookups (x{len(lookup_ids)})": (
+            lambda: lookups(before_engine, lookup_ids),
+            lambda: lookups(after_engine, after_lookup_ids),
+        ),
+    }
+    print(f"{'query':<40}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name, (before, after) in timings.items():
+        before_ms, after_ms = median_ms(before, args.repeat), median_ms(after, args.repeat)
+        print(f"{name:<40}{before_ms:>12.2f}{after_ms:>12.2f}{before_ms / after_ms:>9.2f}x")
+    print()
+
+    # Every bound key and every loaded key goes through the type processors
+    key_type = ULIDBinary()
+    to_db, from_db = key_type.bind_processor(None), key_type.result_processor(None, None)
+    sample = poem_ids[:10000]
+    bind_us = median_ms(lambda: [to_db(poem_id) for poem_id in sample], args.repeat) * 1000 / len(sample)
+    stored = [to_db(poem_id) for poem_id in sample]
+    load_us = median_ms(lambda: [from_db(value) for value in stored], args.repeat) * 1000 / len(sample)
+    print(f"ULIDBinary conversion: {bind_us:.2f} µs per bound key, {load_us:.2f} µs per loaded key")
+
+    before_engine.dispose()
+    after_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -35,39 +35,84 @@ __version__ = "0.7.3"
 __author__ = "Vox Poetica Studio"
 __description__ = "Professional AI-powered poetry translation system"
 
-# CLI entry point
-from .__main__ import cli
-from .core.executor import StepExecutor
-
-# Core components
-from .core.workflow import TranslationWorkflow
-from .models.config import (
-    LoggingConfig,
-    ModelProviderConfig,
-    StepConfig,
-    TaskTemplateStepConfig,
-    WorkflowConfig,
-)
-
-# Data models
-from .models.translation import (
-    EditorReview,
-    InitialTranslation,
-    RevisedTranslation,
-    TranslationInput,
-    TranslationOutput,
-)
-from .services.config import ConfigFacade, get_config_facade, initialize_config_facade
-
-# Services
-from .services.llm.factory import LLMFactory
-from .services.parser import OutputParser
-from .services.prompts import PromptService
-from .utils.config_loader import load_model_registry_config, load_task_templates_config
-
-# Utilities
-from .utils.logger import get_logger, setup_logging
-from .utils.storage import StorageHandler
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the modules that define them. They are imported on first
+# access so that `import vpsweb` (and with it `vpsweb --help` or the web app)
+# does not load the workflow, the LLM clients and their HTTP stack up front.
+_LAZY_EXPORTS = {
+    # CLI entry point
+    "cli": ".__main__",
+    # Core components
+    "TranslationWorkflow": ".core.workflow",
+    "StepExecutor": ".core.executor",
+    # Data models
+    "TranslationInput": ".models.translation",
+    "InitialTranslation": ".models.translation",
+    "EditorReview": ".models.translation",
+    "RevisedTranslation": ".models.translation",
+    "TranslationOutput": ".models.translation",
+    "WorkflowConfig": ".models.config",
+    "TaskTemplateStepConfig": ".models.config",
+    "ModelProviderConfig": ".models.config",
+    "LoggingConfig": ".models.config",
+    "StepConfig": ".models.config",
+    # Services
+    "LLMFactory": ".services.llm.factory",
+    "PromptService": ".services.prompts",
+    "OutputParser": ".services.parser",
+    "ConfigFacade": ".services.config",
+    "get_config_facade": ".services.config",
+    "initialize_config_facade": ".services.config",
+    # Utilities
+    "setup_logging": ".utils.logger",
+    "get_logger": ".utils.logger",
+    "load_model_registry_config": ".utils.config_loader",
+    "load_task_templates_config": ".utils.config_loader",
+    "StorageHandler": ".utils.storage",
+}
+
+if TYPE_CHECKING:
+    from .__main__ import cli
+    from .core.executor import StepExecutor
+    from .core.workflow import TranslationWorkflow
+    from .models.config import (
+        LoggingConfig,
+        ModelProviderConfig,
+        StepConfig,
+        TaskTemplateStepConfig,
+        WorkflowConfig,
+    )
+    from .models.translation import (
+        EditorReview,
+        InitialTranslation,
+        RevisedTranslation,
+        TranslationInput,
+        TranslationOutput,
+    )
+    from .services.config import ConfigFacade, get_config_facade, initialize_config_facade
+    from .services.llm.factory import LLMFactory
+    from .services.parser import OutputParser
+    from .services.prompts import PromptService
+    from .utils.config_loader import load_model_registry_config, load_task_templates_config
+    from .utils.logger import get_logger, setup_logging
+    from .utils.storage import StorageHandler
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache it so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Core components
@@ -5,13 +5,13 @@ Professional AI-powered poetry translation using a
 Translator→Editor→Translator workflow.
 """
 
-import asyncio
 import json
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import click
 
@@ -24,19 +24,14 @@ except ImportError:
     # dotenv not available, continue without it
     pass
 
-from .core.workflow import TranslationWorkflow
-from .models.config import LogLevel, WorkflowMode
-from .models.translation import TranslationInput
-from .services.config import get_config_facade, initialize_config_facade
-from .utils.article_generator import ArticleGenerator
-from .utils.config_loader import (
-    load_config,
-    load_wechat_complete_config,
-    validate_config_files,
-    validate_wechat_setup,
-)
+# Workflow, configuration and storage modules pull in pydantic, the LLM clients and
+# their HTTP stack; each command imports what it needs so `vpsweb --help` stays fast
 from .utils.logger import get_logger, setup_logging
-from .utils.storage import StorageHandler
+
+if TYPE_CHECKING:
+    from .core.workflow import TranslationWorkflow
+    from .models.translation import TranslationInput
+    from .utils.storage import StorageHandler
 
 
 class CLIError(Exception):
@@ -131,6 +126,10 @@ def initialize_system(config_path: Optional[str], verbose: bool) -> tuple:
     Raises:
         ConfigError: If configuration loading fails
     """
+    from .models.config import LogLevel
+    from .services.config import initialize_config_facade
+    from .utils.config_loader import load_config
+
     try:
         click.echo("⚙️  Loading configuration...")
 
@@ -159,9 +158,9 @@ def initialize_system(config_path: Optional[str], verbose: bool) -> tuple:
 
 
 async def execute_translation_workflow(
-    workflow: TranslationWorkflow,
-    input_data: TranslationInput,
-    storage_handler: StorageHandler,
+    workflow: "TranslationWorkflow",
+    input_data: "TranslationInput",
+    storage_handler: "StorageHandler",
     workflow_mode: str = None,
     include_mode_tag: bool = False,
 ) -> tuple:
@@ -295,7 +294,7 @@ def display_summary(translation_output, saved_files: Dict[str, Path]) -> None:
     click.echo("\n✅ Translation saved successfully!")
 
 
-def validate_input_only(input_data: TranslationInput, config_path: Optional[str]) -> None:
+def validate_input_only(input_data: "TranslationInput", config_path: Optional[str]) -> None:
     """
     Validate input and configuration without executing workflow.
 
@@ -306,6 +305,8 @@ def validate_input_only(input_data: TranslationInput, config_path: Optional[str]
     Raises:
         ConfigError: If validation fails
     """
+    from .utils.config_loader import validate_config_files
+
     try:
         click.echo("🔍 Validating configuration and input...")
 
@@ -390,6 +391,14 @@ def translate(input, source, target, workflow_mode, config, output, verbose, dry
     # Dry run (validation only)
     vpsweb translate -i poem.txt -s English -t Chinese --dry-run
     """
+    import asyncio
+
+    from .core.workflow import TranslationWorkflow
+    from .models.config import WorkflowMode
+    from .models.translation import TranslationInput
+    from .services.config import get_config_facade
+    from .utils.storage import StorageHandler
+
     try:
         click.echo("🎭 Vox Poetica Studio Web - Professional Poetry Translation")
         click.echo("=" * 60)
@@ -518,6 +527,11 @@ def generate_article(input_json, output_dir, author, digest, model_type, dry_run
     # Dry run to validate without external calls
     vpsweb generate-article -j translation.json --dry-run
     """
+    from .models.config import LogLevel
+    from .services.config import initialize_config_facade
+    from .utils.article_generator import ArticleGenerator
+    from .utils.config_loader import load_config, load_wechat_complete_config
+
     try:
         # Setup logging
         if verbose:
@@ -721,6 +735,10 @@ def publish_article(directory, config, dry_run, verbose):
     # Use custom WeChat configuration
     vpsweb publish-article -d directory/ -c custom_wechat.yaml
     """
+    import asyncio
+
+    from .models.config import LogLevel
+
     try:
         # For dry run, we don't need async
         if dry_run:
@@ -967,6 +985,9 @@ def extract_metadata(directory: Path) -> Dict[str, Any]:
 
 async def _publish_article_async(directory, config, verbose):
     """Async implementation for publishing article from directory to WeChat."""
+    from .models.config import LogLevel
+    from .utils.config_loader import load_wechat_complete_config, validate_wechat_setup
+
     try:
         # Setup logging
         if verbose:
@@ -1148,5 +1169,321 @@ async def _publish_article_async(directory, config, verbose):
         raise  # Re-raise to be caught by outer function
 
 
+@cli.command("profile-startup")
+@click.option(
+    "--target",
+    "-t",
+    "targets",
+    type=click.Choice(["cli", "app"]),
+    multiple=True,
+    help="What to start: 'cli' (vpsweb --help) or 'app' (web app ready); default both",
+)
+@click.option("--top", type=int, default=15, show_default=True, help="Slowest imports listed per target")
+@click.option("--no-imports", is_flag=True, help="Only time the startup, without the per-module breakdown")
+def profile_startup(targets, top, no_imports):
+    """Measure cold-start time against its budget and show the slowest imports.
+
+    Each target is started in a fresh interpreter. The time is compared with
+    its budget, then the target is started again under `python -X importtime`
+    to list the modules that took longest to import (with everything they
+    imported in turn). Exits with status 1 when a target exceeds its budget.
+
+    The web app resolves its configuration relative to the working
+    directory, so run the 'app' target from the project root.
+
+    Examples:
+
+    \b
+    vpsweb profile-startup
+    vpsweb profile-startup -t cli --top 30
+    """
+    from .utils.startup import StartupError, measure_startup
+
+    over_budget = False
+    for target in targets or ("cli", "app"):
+        try:
+            profile = measure_startup(target)
+            imports = [] if no_imports else measure_startup(target, profile_imports=True).slowest(top)
+        except StartupError as e:
+            raise click.ClickException(str(e))
+
+        status = "✅" if profile.within_budget else "❌"
+        click.echo(f"{status} {target}: {profile.elapsed_ms:.0f} ms (budget {profile.budget_ms:.0f} ms)")
+        over_budget = over_budget or not profile.within_budget
+        for timing in imports:
+            click.echo(
+                f"   {timing.cumulative_us / 1000:8.1f} ms {timing.self_us / 1000:8.1f} ms  "
+                f"{'  ' * timing.depth}{timing.module}"
+            )
+
+    if over_budget:
+        sys.exit(1)
+
+
+@cli.group()
+def repo():
+    """Repository database maintenance commands."""
+
+
+@repo.command("check-stats")
+@click.option("--fix", is_flag=True, help="Rewrite mismatched counters and drop orphaned rows")
+@click.option("--verbose", "-v", is_flag=True, help="Show expected and stored values for each mismatch")
+def check_stats(fix, verbose):
+    """Verify the denormalized poem counters and poet summaries.
+
+    Recomputes translation counts and poet aggregates from the poems and
+    translations tables and compares them with poem_translation_stats and
+    poets. Exits with status 1 when mismatches remain (i.e. they were found
+    and --fix was not given).
+
+    Examples:
+
+    \b
+    vpsweb repo check-stats
+    vpsweb repo check-stats --fix
+    """
+    from .repository.crud import RepositoryService
+    from .repository.database import create_session
+
+    db = create_session()
+    try:
+        repository = RepositoryService(db)
+        checks = [
+            ("poem counter", "poem_id", repository.poem_stats.check_consistency(fix=fix)),
+            ("poet summary", "poet_key", repository.poet_summaries.check_consistency(fix=fix)),
+        ]
+    finally:
+        db.close()
+
+    inconsistent = 0
+    for label, key, mismatches in checks:
+        if not mismatches:
+            click.echo(f"✅ {label.capitalize()} rows are consistent")
+            continue
+
+        inconsistent += len(mismatches)
+        for mismatch in mismatches:
+            click.echo(f"  • {mismatch[key]}: {mismatch['problem']}")
+            if verbose and mismatch["problem"] == "mismatch":
+                click.echo(f"      expected: {mismatch['expected']}")
+                click.echo(f"      stored:   {mismatch['stored']}")
+
+        if fix:
+            click.echo(f"🔧 Repaired {len(mismatches)} {label} row(s)")
+        else:
+            click.echo(f"❌ {len(mismatches)} inconsistent {label} row(s); rerun with --fix to repair", err=True)
+
+    if inconsistent and not fix:
+        sys.exit(1)
+
+
+@repo.command("import-poems")
+@click.argument("source", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--format",
+    "input_format",
+    type=click.Choice(["jsonl", "csv", "text"]),
+    help="Input format (default: from file extension; directories are read as text files)",
+)
+@click.option("--chunk-size", type=int, default=500, show_default=True, help="Poems inserted per transaction")
+@click.option("--poet", help="Poet name for records that omit one")
+@click.option("--language", help="Source language for records that omit one")
+@click.option("--allow-duplicates", is_flag=True, help="Import poems whose content is already stored")
+@click.option("--dry-run", is_flag=True, help="Validate and report without writing")
+@click.option("--verbose", "-v", is_flag=True, help="List every reported error")
+def import_poems(source, input_format, chunk_size, poet, language, allow_duplicates, dry_run, verbose):
+    """Bulk import poems from a JSONL/CSV file or a directory of text files.
+
+    Records are validated and inserted in chunked transactions; poems whose
+    content hash is already stored are skipped unless --allow-duplicates is
+    given. Exits with status 1 when any record was invalid or failed.
+
+    Examples:
+
+    \b
+    vpsweb repo import-poems corpus.jsonl
+    vpsweb repo import-poems poems.csv --language zh-CN --dry-run
+    vpsweb repo import-poems ./tang_poems --poet 李白 --language zh-CN
+    """
+    from .repository.bulk_import import BulkPoemImporter, ImportFormatError, iter_path_records
+    from .repository.database import create_session
+
+    try:
+        records = iter_path_records(source, input_format)
+    except ImportFormatError as e:
+        raise click.UsageError(str(e))
+
+    def show_progress(report):
+        click.echo(
+            f"  {report.total} read, {report.imported} imported, {report.duplicates} duplicates, "
+            f"{report.invalid} invalid ({report.rate:,.0f} poems/s)"
+        )
+
+    defaults = {"poet_name": poet, "source_language": language}
+    db = create_session()
+    try:
+        importer = BulkPoemImporter(
+            db,
+            chunk_size=chunk_size,
+            skip_duplicates=not allow_duplicates,
+            dry_run=dry_run,
+            defaults={key: value for key, value in defaults.items() if value},
+            progress=show_progress,
+        )
+        report = importer.run(records)
+    finally:
+        db.close()
+
+    for error in report.errors if verbose else report.errors[:10]:
+        click.echo(f"  • {error['ref']}: {error['error']}", err=True)
+    hidden = report.invalid + report.failed - len(report.errors if verbose else report.errors[:10])
+    if hidden > 0:
+        click.echo(f"  … {hidden} more error(s){'' if verbose else ' (use -v to list reported errors)'}", err=True)
+
+    verb = "Validated" if dry_run else "Imported"
+    click.echo(
+        f"{'🔍' if dry_run else '✅'} {verb} {report.imported} of {report.total} poems in {report.elapsed:.2f}s "
+        f"({report.rate:,.0f} poems/s); {report.duplicates} duplicates, {report.invalid} invalid, "
+        f"{report.failed} failed"
+    )
+    if report.invalid or report.failed:
+        sys.exit(1)
+
+
+def _parse_timestamp(ctx, param, value):
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise click.BadParameter(f"'{value}' is not an ISO 8601 date or timestamp")
+
+
+@repo.command("export")
+@click.option("--output", "-o", default="-", show_default=True, help="Output file ('-' for stdout)")
+@click.option(
+    "--entity",
+    "entities",
+    multiple=True,
+    type=click.Choice(["poems", "translations", "workflow_steps", "bbrs"]),
+    help="Entity to export (repeatable; default: all)",
+)
+@click.option("--format", "output_format", type=click.Choice(["ndjson", "csv"]), default="ndjson", show_default=True)
+@click.option("--since", callback=_parse_timestamp, help="Only rows created at or after this date/time")
+@click.option("--until", callback=_parse_timestamp, help="Only rows created before this date/time")
+@click.option("--poet", help="Only rows belonging to this poet's poems")
+@click.option("--language", help="Source language for poems/BBRs, target language for translations/steps")
+@click.option("--changed-since", callback=_parse_timestamp, help="Only rows changed after this watermark")
+@click.option(
+    "--watermark-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Read --changed-since from this file and store the new watermark in it after the export",
+)
+@click.option("--gzip", "compress", is_flag=True, help="Gzip the output (implied by a .gz output file)")
+@click.option("--batch-size", type=int, default=1000, show_default=True, help="Rows fetched per batch")
+def export_repository(
+    output, entities, output_format, since, until, poet, language, changed_since, watermark_file, compress, batch_size
+):
+    """Stream repository rows to NDJSON or CSV.
+
+    Rows are fetched in batches and written as they arrive, so memory use
+    does not grow with the repository. With --watermark-file, repeated runs
+    export only rows changed since the previous run.
+
+    Examples:
+
+    \b
+    vpsweb repo export -o backup.ndjson.gz
+    vpsweb repo export --entity translations --format csv --language en -o en.csv
+    vpsweb repo export -o delta.ndjson --watermark-file .export-watermark
+    """
+    from .repository.database import create_session
+    from .repository.export import ExportError, RepositoryExporter
+
+    if changed_since is None and watermark_file is not None and watermark_file.exists():
+        changed_since = _parse_timestamp(None, None, watermark_file.read_text().strip() or None)
+    compress = compress or output.endswith(".gz")
+
+    db = create_session()
+    try:
+        try:
+            exporter = RepositoryExporter(
+                db,
+                entities=entities or None,
+                fmt=output_format,
+                since=since,
+                until=until,
+                poet_name=poet,
+                language=language,
+                changed_since=changed_since,
+                batch_size=batch_size,
+            )
+        except ExportError as e:
+            raise click.UsageError(str(e))
+
+        start = time.perf_counter()
+        with click.open_file(output, "wb") as stream:
+            for chunk in exporter.iter_bytes(compress=compress):
+                stream.write(chunk)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+
+    if watermark_file is not None and exporter.watermark is not None:
+        watermark_file.write_text(exporter.watermark.isoformat() + "\n")
+
+    counts = ", ".join(f"{count} {name}" for name, count in exporter.counts.items())
+    click.echo(f"✅ Exported {counts} in {elapsed:.2f}s", err=True)
+    if exporter.watermark is not None:
+        click.echo(f"   Watermark: {exporter.watermark.isoformat()}", err=True)
+
+
+@repo.command("backup")
+@click.option(
+    "--backup-dir", type=click.Path(file_okay=False, path_type=Path), help="Backup directory (default: settings)"
+)
+@click.option("--no-snapshot", is_flag=True, help="Back up only the database, not the output directories")
+def backup_repository(backup_dir, no_snapshot):
+    """Take an online backup of the repository database.
+
+    The database is copied with the SQLite online backup API while the web
+    application keeps running, and the output directories are snapshotted
+    incrementally (unchanged files are hard-linked to the previous
+    snapshot). Exits with status 1 when the backup failed.
+
+    Examples:
+
+    \b
+    vpsweb repo backup
+    vpsweb repo backup --backup-dir /mnt/backups/vpsweb --no-snapshot
+    """
+    from .repository.backup import BackupError, BackupManager
+
+    try:
+        manager = BackupManager.from_settings()
+    except BackupError as e:
+        raise click.UsageError(str(e))
+    if backup_dir is not None:
+        manager.backup_dir = backup_dir
+
+    run = manager.run(snapshot=not no_snapshot)
+    if not run.success:
+        click.echo(f"❌ Backup failed: {run.error}", err=True)
+        sys.exit(1)
+
+    database = run.database
+    click.echo(
+        f"✅ Database backed up to {database.path} ({database.bytes / 1024:,.0f} KiB, {database.pages} pages "
+        f"in {database.steps} steps, {database.duration_seconds:.2f}s)"
+    )
+    if run.snapshot is not None:
+        snapshot = run.snapshot
+        click.echo(
+            f"✅ Snapshot {snapshot.path}: {snapshot.files} files, {snapshot.copied} copied "
+            f"({snapshot.bytes_copied / 1024:,.0f} KiB), {snapshot.linked} unchanged, {snapshot.removed} removed "
+            f"({snapshot.duration_seconds:.2f}s)"
+        )
+
+
 if __name__ == "__main__":
     cli()
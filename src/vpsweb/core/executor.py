@@ -9,18 +9,21 @@ import asyncio
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 from ..models.config import StepConfig
 from ..models.translation import EditorReview, InitialTranslation, TranslationInput
 from ..services.llm.factory import LLMFactory
 from ..services.parser import (
+    STEP_OUTPUT_TAGS,
     EmptyNotesFieldError,
     OutputParser,
+    StreamingXMLExtractor,
     ValidationError,
     XMLParsingError,
 )
 from ..services.prompts import PromptService, TemplateLoadError, TemplateVariableError
+from ..utils.metrics import LLM_REQUEST_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +67,9 @@ class StepExecutor:
         self.llm_factory = llm_factory
         self.prompt_service = prompt_service
         self.system_config = system_config or {}
+        # Awaited with (step_name, field, content) as each output field completes;
+        # setting it makes LLM calls stream when the provider supports it
+        self.field_callback: Optional[Callable[[str, str, str], Awaitable[None]]] = None
         logger.info("Initialized StepExecutor with LLM factory and prompt service")
 
     def _get_strategy_value(self, key: str, default: str) -> str:
@@ -110,7 +116,7 @@ class StepExecutor:
             logger.debug(f"Using provider: {config.provider} with model: {config.model}")
 
             # Step 3: Render prompt template
-            system_prompt, user_prompt = await self._render_prompt_template(step_name, input_data, config)
+            system_prompt, user_prompt, prompt_hash = await self._render_prompt_template(step_name, input_data, config)
             logger.debug(f"Rendered system prompt: {len(system_prompt)} chars")
             logger.debug(f"Rendered user prompt: {len(user_prompt)} chars")
 
@@ -125,7 +131,9 @@ class StepExecutor:
 
             # Step 6: Build result with metadata
             execution_time = time.time() - start_time
-            result = self._build_step_result(step_name, parsed_output, llm_response, execution_time, config)
+            result = self._build_step_result(
+                step_name, parsed_output, llm_response, execution_time, config, prompt_hash=prompt_hash
+            )
 
             logger.info(f"Step {step_name} completed successfully in {execution_time:.2f}s")
             return result
@@ -168,18 +176,20 @@ class StepExecutor:
 
     async def _render_prompt_template(
         self, step_name: str, input_data: Dict[str, Any], config: StepConfig
-    ) -> tuple[str, str]:
-        """Render the appropriate prompt template for the step."""
+    ) -> tuple[str, str, str]:
+        """Render the appropriate prompt template for the step, returning the prompts and the template version."""
         template_name = config.prompt_template
 
         try:
             logger.debug(f"Rendering template: {template_name} with variables: {list(input_data.keys())}")
-            system_prompt, user_prompt = self.prompt_service.render_prompt(template_name, input_data)
+            system_prompt, user_prompt, prompt_hash = self.prompt_service.render_prompt_versioned(
+                template_name, input_data
+            )
 
             # DEBUG: Print the rendered prompts for verification
             print(f"\n=== {step_name.upper()} PROMPT DEBUG ===")
             print(f"Step: {step_name}")
-            print(f"Template: {template_name}")
+            print(f"Template: {template_name} ({prompt_hash[:12]})")
             print(f"Variables: {list(input_data.keys())}")
             print(f"System Prompt ({len(system_prompt)} chars):")
             print(system_prompt)
@@ -187,7 +197,7 @@ class StepExecutor:
             print(user_prompt)
             print(f"=== END {step_name.upper()} PROMPT DEBUG ===\n")
 
-            return system_prompt, user_prompt
+            return system_prompt, user_prompt, prompt_hash
 
         except (TemplateLoadError, TemplateVariableError) as e:
             logger.error(f"Prompt template rendering failed: {e}")
@@ -215,13 +225,32 @@ class StepExecutor:
                     {"role": "user", "content": user_prompt},
                 ]
 
-                response = await provider.generate(
-                    messages=messages,
-                    model=config.model,
-                    temperature=config.temperature,
-                    max_tokens=config.max_tokens,
-                    timeout=config.timeout,
-                )
+                stream_options = {}
+                finish_stream = None
+                if self.field_callback and getattr(provider, "supports_streaming", False) is True:
+                    on_chunk, finish_stream = self._field_streamer(step_name)
+                    stream_options = {"stream": True, "on_chunk": on_chunk}
+
+                started = time.perf_counter()
+                outcome = "error"
+                try:
+                    response = await provider.generate(
+                        messages=messages,
+                        model=config.model,
+                        temperature=config.temperature,
+                        max_tokens=config.max_tokens,
+                        timeout=config.timeout,
+                        **stream_options,
+                    )
+                    outcome = "ok"
+                finally:
+                    LLM_REQUEST_SECONDS.observe(
+                        time.perf_counter() - started, config.provider, config.model, step_name, outcome
+                    )
+                # Only a stream that ended normally (e.g. cut off by max_tokens) completes the fields
+                # left open; a failed attempt's partial fields are dropped with its extractor
+                if finish_stream is not None:
+                    await finish_stream()
 
                 if not response or not response.content:
                     raise LLMCallError("LLM returned empty response")
@@ -248,6 +277,32 @@ class StepExecutor:
                 logger.warning(f"LLM call attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f}s")
                 await asyncio.sleep(delay)
 
+    def _field_streamer(self, step_name: str) -> Tuple[Callable[[str], Awaitable[None]], Callable[[], Awaitable[None]]]:
+        """
+        Chunk and end-of-stream callbacks for one LLM call that report each output field of the step as it completes.
+
+        The end-of-stream callback, run once the response has been received, also reports
+        fields a truncated response left open.
+        """
+        extractor = StreamingXMLExtractor()
+        fields = STEP_OUTPUT_TAGS.get(step_name)
+
+        async def report(events) -> None:
+            for event in events:
+                if event.kind == "close" and (fields is None or event.tag in fields):
+                    try:
+                        await self.field_callback(step_name, event.tag, event.text)
+                    except Exception as e:
+                        logger.warning(f"Field callback failed for {step_name}.{event.tag}: {e}")
+
+        async def on_chunk(chunk: str) -> None:
+            await report(extractor.feed(chunk))
+
+        async def finish() -> None:
+            await report(extractor.close())
+
+        return on_chunk, finish
+
     async def _parse_and_validate_output(self, step_name: str, llm_content: str, config: StepConfig) -> Dict[str, Any]:
         """Parse LLM output and validate required fields."""
         try:
@@ -311,6 +366,7 @@ class StepExecutor:
         llm_response: Any,
         execution_time: float,
         config: StepConfig,
+        prompt_hash: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Build the final step result with all metadata."""
         return {
@@ -320,6 +376,7 @@ class StepExecutor:
             "metadata": {
                 "timestamp": datetime.utcnow().isoformat(),
                 "execution_time_seconds": execution_time,
+                "prompt_hash": prompt_hash,
                 "model_info": {
                     "provider": config.provider,
                     "model": config.model,
@@ -219,8 +219,9 @@ class TranslationWorkflow:
 
             try:
                 # Check if BBR exists for this poem using repository service
+                # (cached snapshot: stays readable after the session is gone)
                 if self.repository_service:
-                    bbr = self.repository_service.repo.background_briefing_reports.get_by_poem(poem_id)
+                    bbr = self.repository_service.repo.background_briefing_reports.get_snapshot_by_poem(poem_id)
 
                     if bbr:
                         # Store the full BBR record for final output
@@ -670,6 +671,7 @@ class TranslationWorkflow:
                 tokens_used=usage.get("tokens_used", 0),
                 prompt_tokens=usage.get("prompt_tokens"),
                 completion_tokens=usage.get("completion_tokens"),
+                prompt_hash=result.get("metadata", {}).get("prompt_hash"),
             )
 
         except Exception as e:
@@ -745,6 +747,7 @@ class TranslationWorkflow:
                 tokens_used=usage.get("tokens_used", 0),
                 prompt_tokens=usage.get("prompt_tokens"),
                 completion_tokens=usage.get("completion_tokens"),
+                prompt_hash=result.get("metadata", {}).get("prompt_hash"),
                 duration=result.get("duration"),
                 cost=result.get("cost"),
             )
@@ -833,6 +836,7 @@ class TranslationWorkflow:
                 tokens_used=usage.get("tokens_used", 0),
                 prompt_tokens=usage.get("prompt_tokens"),
                 completion_tokens=usage.get("completion_tokens"),
+                prompt_hash=result.get("metadata", {}).get("prompt_hash"),
             )
 
         except Exception as e:
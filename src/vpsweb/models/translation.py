@@ -151,6 +151,7 @@ class InitialTranslation(BaseModel):
         description="Time taken for initial translation in seconds",
     )
     cost: Optional[float] = Field(None, ge=0.0, description="Cost in RMB for this translation step")
+    prompt_hash: Optional[str] = Field(None, description="Content hash of the prompt template version used")
 
     @field_validator("initial_translation_notes")
     @classmethod
@@ -190,6 +191,7 @@ class EditorReview(BaseModel):
     completion_tokens: Optional[int] = Field(None, ge=0, description="Number of output tokens used for this review")
     duration: Optional[float] = Field(None, ge=0.0, description="Time taken for editor review in seconds")
     cost: Optional[float] = Field(None, ge=0.0, description="Cost in RMB for this editor review step")
+    prompt_hash: Optional[str] = Field(None, description="Content hash of the prompt template version used")
 
     def get_suggestions_list(self) -> List[str]:
         """Extract numbered suggestions from the editor's text."""
@@ -261,6 +263,7 @@ class RevisedTranslation(BaseModel):
         ge=0.0,
         description="Cost in RMB for this translator revision step",
     )
+    prompt_hash: Optional[str] = Field(None, description="Content hash of the prompt template version used")
 
     @field_validator("revised_translation_notes")
     @classmethod
@@ -0,0 +1,480 @@
+"""
+VPSWeb Repository Online Backup
+
+Hot backups of the live SQLite database and incremental snapshots of the
+output directories, safe to run while the application serves requests.
+
+The database is copied with the SQLite online backup API a few pages per
+step. The source is read-locked only for the duration of one step and the
+backup sleeps between steps, so writers are never held up for long. SQLite
+restarts a backup whose source was written to by another connection; after
+``max_restarts`` restarts the remaining copy is done in a single step.
+
+Output directories are snapshotted against a SHA-256 manifest of the
+previous snapshot. Unchanged files are hard-linked to the previous copy and
+only new or changed files are copied, so every snapshot is a complete tree
+that costs only the changed bytes. Files whose size and modification time
+match the previous manifest are not re-hashed.
+
+Layout under ``backup_dir``::
+
+    database/repo-<timestamp>.db
+    snapshots/<timestamp>/<directory name>/...
+    snapshots/<timestamp>/manifest.json
+
+``BackupScheduler`` runs backups periodically from the web application.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+from sqlalchemy.engine import make_url
+
+from .models import UTC_PLUS_8
+from .settings import settings
+
+logger = logging.getLogger("vpsweb.repository.backup")
+
+MANIFEST_NAME = "manifest.json"
+
+# Runs kept in the status history
+HISTORY_SIZE = 20
+
+# Minimum delay before the first scheduled backup after startup
+STARTUP_DELAY_SECONDS = 60.0
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+class BackupError(RuntimeError):
+    """Raised when a backup cannot be taken"""
+
+
+class _BackupRestarted(Exception):
+    """Raised from the progress callback to abandon a stepwise backup"""
+
+
+@dataclass
+class DatabaseBackupResult:
+    path: str
+    bytes: int
+    pages: int
+    steps: int
+    restarts: int
+    duration_seconds: float
+
+
+@dataclass
+class SnapshotResult:
+    path: str
+    files: int
+    copied: int
+    linked: int
+    removed: int
+    bytes_copied: int
+    duration_seconds: float
+
+
+@dataclass
+class BackupRun:
+    """One backup run: the database copy, the output snapshot and the outcome"""
+
+    started_at: str
+    trigger: str
+    duration_seconds: float = 0.0
+    success: bool = False
+    error: Optional[str] = None
+    database: Optional[DatabaseBackupResult] = None
+    snapshot: Optional[SnapshotResult] = None
+
+
+def _timestamp() -> str:
+    return datetime.now(UTC_PLUS_8).strftime("%Y%m%dT%H%M%S_%f")
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def database_path_from_url(database_url: str) -> Path:
+    """
+    Path of the SQLite database file behind a database URL
+
+    Raises:
+        BackupError: If the URL is not a file-backed SQLite database
+    """
+    url = make_url(database_url)
+    # A URI filename (uri=true) is not a plain path, and may name a shared in-memory database
+    in_memory = url.database == ":memory:" or url.query.get("mode") == "memory"
+    if not url.get_backend_name() == "sqlite" or not url.database or in_memory or url.query.get("uri") == "true":
+        raise BackupError(f"Online backup needs a file-backed SQLite database, not '{url.render_as_string()}'")
+    return Path(url.database)
+
+
+class BackupManager:
+    """
+    Takes online database backups and incremental output snapshots
+
+    Runs are serialized; ``status()`` may be called from any thread.
+
+    Example:
+        manager = BackupManager.from_settings()
+        run = manager.run()
+        print(run.database.path, run.duration_seconds)
+    """
+
+    def __init__(
+        self,
+        database_path: os.PathLike,
+        backup_dir: os.PathLike,
+        snapshot_dirs: Sequence[os.PathLike] = (),
+        keep: int = 7,
+        pages_per_step: int = 256,
+        step_sleep: float = 0.005,
+        max_restarts: int = 3,
+    ):
+        """
+        Args:
+            database_path: SQLite database file to back up
+            backup_dir: Directory receiving database copies and snapshots
+            snapshot_dirs: Output directories to snapshot; missing ones are skipped
+            keep: Database copies and snapshots retained (oldest are deleted first)
+            pages_per_step: Database pages copied per backup step
+            step_sleep: Seconds slept between steps, letting writers in
+            max_restarts: Restarts tolerated before copying the rest in one step
+        """
+        self.database_path = Path(database_path)
+        self.backup_dir = Path(backup_dir)
+        self.snapshot_dirs = [Path(path) for path in snapshot_dirs]
+        self.keep = max(1, keep)
+        self.pages_per_step = max(1, pages_per_step)
+        self.step_sleep = max(0.0, step_sleep)
+        self.max_restarts = max(0, max_restarts)
+
+        self._run_lock = threading.Lock()
+        self._status_lock = threading.Lock()
+        self._history: Deque[BackupRun] = deque(maxlen=HISTORY_SIZE)
+        self._running: Optional[BackupRun] = None
+        self._runs = 0
+        self._failures = 0
+        self._total_seconds = 0.0
+        self._last_success: Optional[BackupRun] = None
+
+    @classmethod
+    def from_settings(cls) -> "BackupManager":
+        """Manager for the configured repository database and output directories"""
+        return cls(
+            database_path_from_url(settings.database_url),
+            settings.backup_dir,
+            snapshot_dirs=settings.backup_snapshot_dirs,
+            keep=settings.backup_keep,
+            pages_per_step=settings.backup_pages_per_step,
+            step_sleep=settings.backup_step_sleep_ms / 1000,
+        )
+
+    @property
+    def database_backup_dir(self) -> Path:
+        return self.backup_dir / "database"
+
+    @property
+    def snapshot_root(self) -> Path:
+        return self.backup_dir / "snapshots"
+
+    @property
+    def is_running(self) -> bool:
+        return self._running is not None
+
+    def run(self, snapshot: bool = True, trigger: str = "manual") -> BackupRun:
+        """
+        Back up the database and (optionally) snapshot the output directories
+
+        Failures are recorded in the returned run rather than raised.
+
+        Raises:
+            BackupError: If another run is in progress
+        """
+        if not self._run_lock.acquire(blocking=False):
+            raise BackupError("A backup is already running")
+        try:
+            run = BackupRun(started_at=datetime.now(UTC_PLUS_8).isoformat(), trigger=trigger)
+            with self._status_lock:
+                self._running = run
+            start = time.perf_counter()
+            try:
+                run.database = self.backup_database()
+                if snapshot and self.snapshot_dirs:
+                    run.snapshot = self.snapshot_outputs()
+                run.success = True
+            except Exception as e:
+                run.error = f"{type(e).__name__}: {e}"
+                logger.exception("Backup failed")
+            run.duration_seconds = time.perf_counter() - start
+
+            with self._status_lock:
+                self._running = None
+                self._history.append(run)
+                self._runs += 1
+                self._total_seconds += run.duration_seconds
+                if run.success:
+                    self._last_success = run
+                else:
+                    self._failures += 1
+            if run.success:
+                logger.info(f"Backup completed in {run.duration_seconds:.2f}s: {run.database.path}")
+            return run
+        finally:
+            self._run_lock.release()
+
+    def backup_database(self) -> DatabaseBackupResult:
+        """
+        Copy the live database with the online backup API
+
+        The copy is written next to its final name and renamed once it passed
+        ``PRAGMA quick_check``, so a listed backup is always complete.
+        """
+        if not self.database_path.is_file():
+            raise BackupError(f"Database file not found: {self.database_path}")
+        self.database_backup_dir.mkdir(parents=True, exist_ok=True)
+        target_path = self.database_backup_dir / f"{self.database_path.stem}-{_timestamp()}.db"
+        partial_path = target_path.with_name(target_path.name + ".partial")
+
+        progress = {"steps": 0, "restarts": 0, "pages": 0, "remaining": None}
+
+        def on_step(status, remaining, total):
+            progress["steps"] += 1
+            progress["pages"] = total
+            if progress["remaining"] is not None and remaining > progress["remaining"]:
+                progress["restarts"] += 1
+                if progress["restarts"] > self.max_restarts:
+                    raise _BackupRestarted()
+            progress["remaining"] = remaining
+            if remaining and self.step_sleep:
+                time.sleep(self.step_sleep)
+
+        start = time.perf_counter()
+        source = sqlite3.connect(self.database_path, timeout=20)
+        try:
+            target = sqlite3.connect(partial_path)
+            try:
+                try:
+                    source.backup(target, pages=self.pages_per_step, progress=on_step)
+                except _BackupRestarted:
+                    logger.warning(
+                        f"Database changed during {progress['restarts']} backup attempts; copying in a single step"
+                    )
+                    source.backup(target, pages=-1)
+                    progress["steps"] += 1
+                check = target.execute("PRAGMA quick_check").fetchone()[0]
+                if check != "ok":
+                    raise BackupError(f"Backup failed integrity check: {check}")
+            finally:
+                target.close()
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        finally:
+            source.close()
+
+        os.replace(partial_path, target_path)
+        self._prune(sorted(self.database_backup_dir.glob(f"{self.database_path.stem}-*.db")))
+        return DatabaseBackupResult(
+            path=str(target_path),
+            bytes=target_path.stat().st_size,
+            pages=progress["pages"],
+            steps=progress["steps"],
+            restarts=progress["restarts"],
+            duration_seconds=time.perf_counter() - start,
+        )
+
+    def snapshot_outputs(self) -> SnapshotResult:
+        """Snapshot the output directories, copying only files changed since the previous snapshot"""
+        start = time.perf_counter()
+        self.snapshot_root.mkdir(parents=True, exist_ok=True)
+        previous_dir = self.latest_snapshot()
+        previous_files: Dict[str, Dict[str, Any]] = {}
+        if previous_dir is not None:
+            previous_files = json.loads((previous_dir / MANIFEST_NAME).read_text(encoding="utf-8"))["files"]
+
+        snapshot_dir = self.snapshot_root / _timestamp()
+        partial_dir = snapshot_dir.with_name(snapshot_dir.name + ".partial")
+        files: Dict[str, Dict[str, Any]] = {}
+        copied = linked = bytes_copied = 0
+        try:
+            for source_dir in self.snapshot_dirs:
+                if not source_dir.is_dir():
+                    continue
+                for path in sorted(source_dir.rglob("*")):
+                    if not path.is_file() or path.is_symlink():
+                        continue
+                    relative = f"{source_dir.name}/{path.relative_to(source_dir).as_posix()}"
+                    stat = path.stat()
+                    previous = previous_files.get(relative)
+                    if previous and previous["size"] == stat.st_size and previous["mtime_ns"] == stat.st_mtime_ns:
+                        sha256 = previous["sha256"]
+                    else:
+                        sha256 = _file_sha256(path)
+                    files[relative] = {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+                    destination = partial_dir / relative
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    if previous and previous["sha256"] == sha256 and self._link(previous_dir / relative, destination):
+                        linked += 1
+                    else:
+                        shutil.copy2(path, destination)
+                        copied += 1
+                        bytes_copied += stat.st_size
+
+            partial_dir.mkdir(parents=True, exist_ok=True)
+            manifest = {
+                "created_at": datetime.now(UTC_PLUS_8).isoformat(),
+                "sources": [str(path) for path in self.snapshot_dirs],
+                "previous": previous_dir.name if previous_dir else None,
+                "files": files,
+            }
+            (partial_dir / MANIFEST_NAME).write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+        except BaseException:
+            shutil.rmtree(partial_dir, ignore_errors=True)
+            raise
+
+        os.replace(partial_dir, snapshot_dir)
+        self._prune(self._snapshots())
+        return SnapshotResult(
+            path=str(snapshot_dir),
+            files=len(files),
+            copied=copied,
+            linked=linked,
+            removed=len(previous_files.keys() - files.keys()),
+            bytes_copied=bytes_copied,
+            duration_seconds=time.perf_counter() - start,
+        )
+
+    def latest_snapshot(self) -> Optional[Path]:
+        """Most recent complete snapshot directory, if any"""
+        snapshots = self._snapshots()
+        return snapshots[-1] if snapshots else None
+
+    def latest_backup_time(self) -> Optional[float]:
+        """Modification time of the newest database copy, as a Unix timestamp"""
+        backups = sorted(self.database_backup_dir.glob(f"{self.database_path.stem}-*.db"))
+        return backups[-1].stat().st_mtime if backups else None
+
+    def _snapshots(self) -> List[Path]:
+        if not self.snapshot_root.is_dir():
+            return []
+        return sorted(path.parent for path in self.snapshot_root.glob(f"*/{MANIFEST_NAME}"))
+
+    @staticmethod
+    def _link(source: Path, destination: Path) -> bool:
+        try:
+            os.link(source, destination)
+            return True
+        except OSError:
+            return False
+
+    def _prune(self, paths: List[Path]) -> None:
+        """Delete all but the newest ``keep`` of the (chronologically sorted) paths"""
+        for path in paths[: -self.keep]:
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+
+    def status(self) -> Dict[str, Any]:
+        """Run counters, durations and the recent run history"""
+        with self._status_lock:
+            history = [asdict(run) for run in self._history]
+            return {
+                "running": asdict(self._running) if self._running else None,
+                "runs": self._runs,
+                "failures": self._failures,
+                "last_run": history[-1] if history else None,
+                "last_success_at": self._last_success.started_at if self._last_success else None,
+                "last_duration_seconds": history[-1]["duration_seconds"] if history else None,
+                "average_duration_seconds": self._total_seconds / self._runs if self._runs else None,
+                "history": history,
+            }
+
+
+class BackupScheduler:
+    """
+    Periodic backups from the web application's event loop
+
+    Backups run in a worker thread. The first scheduled run comes one
+    interval after the newest existing database copy (but not sooner than
+    ``STARTUP_DELAY_SECONDS`` after startup), so restarts do not reset the
+    schedule. An interval of 0 disables scheduling; ``run_now`` still works.
+    """
+
+    def __init__(self, manager: BackupManager, interval_seconds: float):
+        self.manager = manager
+        self.interval_seconds = max(0.0, interval_seconds)
+        self.next_run_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_settings(cls) -> "BackupScheduler":
+        return cls(BackupManager.from_settings(), settings.backup_interval_hours * 3600)
+
+    def start(self) -> None:
+        if self.interval_seconds and self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.next_run_at = None
+
+    async def run_now(self, snapshot: bool = True, trigger: str = "manual") -> BackupRun:
+        """
+        Run a backup in a worker thread
+
+        Raises:
+            BackupError: If a backup is already running
+        """
+        return await asyncio.to_thread(self.manager.run, snapshot, trigger)
+
+    async def _loop(self) -> None:
+        last_backup = self.manager.latest_backup_time()
+        delay = self.interval_seconds - (time.time() - last_backup) if last_backup else 0.0
+        delay = max(delay, STARTUP_DELAY_SECONDS)
+        while True:
+            self.next_run_at = time.time() + delay
+            await asyncio.sleep(delay)
+            try:
+                await self.run_now(trigger="scheduled")
+            except BackupError as e:
+                logger.warning(f"Scheduled backup skipped: {e}")
+            delay = self.interval_seconds
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "scheduled": self._task is not None,
+            "interval_seconds": self.interval_seconds,
+            "next_run_at": (
+                datetime.fromtimestamp(self.next_run_at, UTC_PLUS_8).isoformat() if self.next_run_at else None
+            ),
+            "database_path": str(self.manager.database_path),
+            "backup_dir": str(self.manager.backup_dir),
+            **self.manager.status(),
+        }
@@ -0,0 +1,356 @@
+"""
+VPSWeb Repository Bulk Poem Import
+
+Streams poems from JSONL, CSV or a directory of text files into the poems
+table. Records are validated in chunks, IDs are allocated per chunk with
+``generate_ulid_batch`` and each chunk is inserted with a single executemany
+in its own transaction, so a corpus of thousands of poems loads in seconds
+instead of one request and commit per poem.
+
+Duplicates are detected by content hash (see ``compute_content_hash``), both
+within the import and against poems already stored.
+
+Record fields are the PoemCreate fields; ``poet``, ``title``, ``language``,
+``text``/``content`` and ``metadata`` are accepted as aliases. Text files may
+start with a ``Key: value`` header block (Title, Poet, Language) followed by
+a blank line; the file name is the default title.
+"""
+
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, NamedTuple, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from vpsweb.utils.ulid_utils import generate_ulid_batch
+
+from .crud import CRUDPoem, CRUDPoetSummary
+from .models import UTC_PLUS_8, Poem, compute_content_hash
+from .schemas import PoemCreate
+
+# Poems validated and inserted per transaction
+DEFAULT_CHUNK_SIZE = 500
+
+# Errors kept in the report; further errors are only counted
+MAX_REPORTED_ERRORS = 100
+
+SUPPORTED_FORMATS = ("jsonl", "csv", "text")
+
+FIELD_ALIASES = {
+    "poet": "poet_name",
+    "author": "poet_name",
+    "title": "poem_title",
+    "language": "source_language",
+    "text": "original_text",
+    "content": "original_text",
+    "metadata": "metadata_json",
+}
+
+POEM_FIELDS = ("poet_name", "poem_title", "source_language", "original_text", "metadata_json", "selected")
+
+
+class ImportFormatError(ValueError):
+    """Raised when the input format cannot be determined or is unsupported"""
+
+
+class SourceRecord(NamedTuple):
+    """One raw record read from an import source"""
+
+    ref: str  # Location in the source, e.g. "poems.jsonl:12"
+    data: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+
+
+@dataclass
+class ImportReport:
+    """Progress and outcome of a bulk import"""
+
+    dry_run: bool = False
+    total: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    failed: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+    errors: List[Dict[str, str]] = field(default_factory=list)
+
+    @property
+    def rate(self) -> float:
+        """Records processed per second"""
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def add_error(self, ref: str, message: str) -> None:
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"ref": ref, "error": message})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dry_run": self.dry_run,
+            "total": self.total,
+            "imported": self.imported,
+            "duplicates": self.duplicates,
+            "invalid": self.invalid,
+            "failed": self.failed,
+            "chunks": self.chunks,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "poems_per_second": round(self.rate, 1),
+            "errors": self.errors,
+        }
+
+
+def _normalize_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map aliased keys to PoemCreate fields and drop empty values"""
+    record = {}
+    for key, value in data.items():
+        if key is None:
+            continue
+        name = key.strip().lower()
+        name = FIELD_ALIASES.get(name, name)
+        if name not in POEM_FIELDS or value is None or value == "":
+            continue
+        if name == "metadata_json" and not isinstance(value, str):
+            value = json.dumps(value, ensure_ascii=False)
+        record[name] = value
+    return record
+
+
+def iter_jsonl(stream: IO[str], name: str = "<jsonl>") -> Iterator[SourceRecord]:
+    """Read one JSON object per line, skipping blank lines"""
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        ref = f"{name}:{line_number}"
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield SourceRecord(ref, None, f"Invalid JSON: {e}")
+            continue
+        if not isinstance(data, dict):
+            yield SourceRecord(ref, None, "Expected a JSON object")
+            continue
+        yield SourceRecord(ref, _normalize_fields(data))
+
+
+def iter_csv(stream: IO[str], name: str = "<csv>") -> Iterator[SourceRecord]:
+    """Read rows of a CSV file with a header row"""
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield SourceRecord(f"{name}:{reader.line_num}", _normalize_fields(row))
+
+
+def parse_text_poem(text: str, default_title: str) -> Dict[str, Any]:
+    """
+    Split a text poem into header fields and body
+
+    The first block is treated as a header only when every line in it is a
+    ``Key: value`` pair with a known key.
+    """
+    head, separator, body = text.strip().partition("\n\n")
+    header = {}
+    for line in head.splitlines() if separator else ():
+        key, colon, value = line.partition(":")
+        name = FIELD_ALIASES.get(key.strip().lower(), key.strip().lower())
+        if not colon or name not in POEM_FIELDS:
+            header = None
+            break
+        header[name] = value.strip()
+
+    if header:
+        record = {"poem_title": default_title, **header, "original_text": body}
+    else:
+        record = {"poem_title": default_title, "original_text": text}
+    return _normalize_fields(record)
+
+
+def iter_text_files(path: Path) -> Iterator[SourceRecord]:
+    """Read ``*.txt`` files of a directory tree (or a single file), one poem per file"""
+    files = sorted(path.rglob("*.txt")) if path.is_dir() else [path]
+    for file_path in files:
+        ref = str(file_path)
+        try:
+            text = file_path.read_text(encoding="utf-8-sig")
+        except (OSError, UnicodeDecodeError) as e:
+            yield SourceRecord(ref, None, f"Cannot read file: {e}")
+            continue
+        yield SourceRecord(ref, parse_text_poem(text, file_path.stem))
+
+
+def detect_format(name: str, is_dir: bool = False) -> str:
+    """Infer the import format from a path or upload file name"""
+    if is_dir:
+        return "text"
+    suffix = Path(name).suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".csv":
+        return "csv"
+    if suffix == ".txt":
+        return "text"
+    raise ImportFormatError(f"Cannot infer import format from '{name}'; specify one of {', '.join(SUPPORTED_FORMATS)}")
+
+
+def iter_stream_records(stream: IO[str], fmt: str, name: str) -> Iterator[SourceRecord]:
+    """Records of an open JSONL or CSV text stream"""
+    if fmt == "jsonl":
+        return iter_jsonl(stream, name)
+    if fmt == "csv":
+        return iter_csv(stream, name)
+    raise ImportFormatError(f"Unsupported stream format '{fmt}'; expected jsonl or csv")
+
+
+def _iter_file_records(path: Path, fmt: str) -> Iterator[SourceRecord]:
+    with path.open(encoding="utf-8-sig", newline="") as stream:
+        yield from iter_stream_records(stream, fmt, path.name)
+
+
+def iter_path_records(path: Path, fmt: Optional[str] = None) -> Iterator[SourceRecord]:
+    """
+    Records of a JSONL/CSV file or a directory of text files
+
+    Raises:
+        ImportFormatError: If the format is unsupported or cannot be inferred
+    """
+    fmt = fmt or detect_format(path.name, path.is_dir())
+    if fmt == "text":
+        return iter_text_files(path)
+    if fmt not in SUPPORTED_FORMATS:
+        raise ImportFormatError(f"Unsupported import format '{fmt}'; expected one of {', '.join(SUPPORTED_FORMATS)}")
+    return _iter_file_records(path, fmt)
+
+
+def _chunked(records: Iterable[SourceRecord], size: int) -> Iterator[List[SourceRecord]]:
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'record'}: {err['msg']}" for err in error.errors()
+    )
+
+
+class BulkPoemImporter:
+    """
+    Chunked poem importer
+
+    Example:
+        importer = BulkPoemImporter(db, defaults={"source_language": "zh-CN"})
+        report = importer.run(iter_path_records(Path("corpus.jsonl")))
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        skip_duplicates: bool = True,
+        dry_run: bool = False,
+        defaults: Optional[Dict[str, Any]] = None,
+        progress: Optional[Callable[[ImportReport], None]] = None,
+    ):
+        """
+        Args:
+            db: Database session
+            chunk_size: Records validated and inserted per transaction
+            skip_duplicates: Skip poems whose content hash is already stored or seen earlier in the import
+            dry_run: Validate and detect duplicates without writing
+            defaults: Field values for records that omit them (e.g. poet_name, source_language)
+            progress: Called with the running report after every chunk
+        """
+        self.db = db
+        self.chunk_size = max(1, chunk_size)
+        self.skip_duplicates = skip_duplicates
+        self.dry_run = dry_run
+        self.defaults = _normalize_fields(defaults or {})
+        self.progress = progress
+        self.poems = CRUDPoem(db)
+        self.poet_summaries = CRUDPoetSummary(db)
+
+    def run(self, records: Iterable[SourceRecord]) -> ImportReport:
+        """Import all records and return the report"""
+        report = ImportReport(dry_run=self.dry_run)
+        seen_hashes: set = set()
+        start = time.perf_counter()
+
+        for chunk in _chunked(records, self.chunk_size):
+            self._import_chunk(chunk, report, seen_hashes)
+            report.chunks += 1
+            report.elapsed = time.perf_counter() - start
+            if self.progress:
+                self.progress(report)
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _import_chunk(self, chunk: List[SourceRecord], report: ImportReport, seen_hashes: set) -> None:
+        candidates = []
+        for record in chunk:
+            report.total += 1
+            if record.error:
+                report.invalid += 1
+                report.add_error(record.ref, record.error)
+                continue
+            try:
+                poem = PoemCreate.model_validate({**self.defaults, **record.data})
+            except ValidationError as e:
+                report.invalid += 1
+                report.add_error(record.ref, _format_validation_error(e))
+                continue
+
+            content_hash = compute_content_hash(poem.poet_name, poem.poem_title, poem.original_text)
+            if self.skip_duplicates and content_hash in seen_hashes:
+                report.duplicates += 1
+                continue
+            seen_hashes.add(content_hash)
+            candidates.append((content_hash, poem))
+
+        if self.skip_duplicates and candidates:
+            existing = self.poems.get_existing_hashes([content_hash for content_hash, _ in candidates])
+            report.duplicates += sum(1 for content_hash, _ in candidates if content_hash in existing)
+            candidates = [(content_hash, poem) for content_hash, poem in candidates if content_hash not in existing]
+
+        if not candidates:
+            return
+        if self.dry_run:
+            report.imported += len(candidates)
+            return
+
+        now = datetime.now(UTC_PLUS_8)
+        rows = [
+            {
+                "id": poem_id,
+                "poet_name": poem.poet_name,
+                "poem_title": poem.poem_title,
+                "source_language": poem.source_language,
+                "original_text": poem.original_text,
+                "metadata_json": poem.metadata_json,
+                "content_hash": content_hash,
+                "selected": poem.selected,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for poem_id, (content_hash, poem) in zip(generate_ulid_batch(len(candidates)), candidates)
+        ]
+
+        try:
+            self.db.execute(insert(Poem), rows)
+            self.poet_summaries.refresh_many(row["poet_name"] for row in rows)
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            report.failed += len(rows)
+            report.add_error(f"chunk {report.chunks + 1}", f"Insert failed: {e}")
+            for content_hash, _ in candidates:
+                seen_hashes.discard(content_hash)
+            return
+
+        report.imported += len(rows)
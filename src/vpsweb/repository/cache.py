@@ -0,0 +1,224 @@
+"""
+VPSWeb Repository Entity Cache
+
+In-process read-through LRU cache with TTL for poem and Background Briefing
+Report lookups. Pages, the BBR modal and the translation workflow re-read the
+same rows within seconds; the cache serves those reads from memory.
+
+Cached values are frozen snapshots copied out of the ORM instance, never live
+session-bound objects, so they are safe to share between requests and threads.
+The CRUD create, update and delete methods invalidate affected entries; the TTL
+bounds staleness for writes made outside the CRUD layer.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .settings import settings
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class PoemSnapshot:
+    """Immutable copy of a Poem row"""
+
+    id: str
+    poet_name: str
+    poem_title: str
+    source_language: str
+    original_text: str
+    metadata_json: Optional[str]
+    selected: bool
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+    @classmethod
+    def from_model(cls, poem: Any) -> "PoemSnapshot":
+        """Copy the column values of a Poem instance"""
+        return cls(**{f.name: getattr(poem, f.name) for f in fields(cls)})
+
+
+@dataclass(frozen=True, slots=True)
+class BBRSnapshot:
+    """Immutable copy of a BackgroundBriefingReport row"""
+
+    id: str
+    poem_id: str
+    content: str
+    model_info: Optional[str]
+    tokens_used: Optional[int]
+    cost: Optional[float]
+    time_spent: Optional[float]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+    @classmethod
+    def from_model(cls, bbr: Any) -> "BBRSnapshot":
+        """Copy the column values of a BackgroundBriefingReport instance"""
+        return cls(**{f.name: getattr(bbr, f.name) for f in fields(cls)})
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate memory held by a cached snapshot in bytes"""
+    if value is None:
+        return sys.getsizeof(None)
+    size = sys.getsizeof(value)
+    for f in fields(value):
+        size += sys.getsizeof(getattr(value, f.name))
+    return size
+
+
+class EntityCache:
+    """
+    Thread-safe LRU cache with per-entry TTL.
+
+    ``None`` results are cached too, so repeated existence checks for a
+    missing row (e.g. a poem without BBR) do not hit the database.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for ``key``, calling ``loader`` on a miss.
+
+        A value loaded while the cache was invalidated concurrently is
+        returned but not stored, so a stale read never outlives the write.
+        """
+        if not self.enabled:
+            return loader()
+
+        with self._lock:
+            value = self._get_locked(key)
+            generation = self._generation
+        if value is not _MISSING:
+            return value
+
+        value = loader()
+        with self._lock:
+            if generation == self._generation:
+                self._set_locked(key, value)
+        return value
+
+    def _get_locked(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return _MISSING
+        value, expires_at, size = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._memory_bytes -= size
+            self.expirations += 1
+            self.misses += 1
+            return _MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _set_locked(self, key: Hashable, value: Any) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous[2]
+        size = _estimate_size(value)
+        self._entries[key] = (value, time.monotonic() + self.ttl_seconds, size)
+        self._memory_bytes += size
+        while len(self._entries) > self.max_entries:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._memory_bytes -= evicted_size
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry"""
+        with self._lock:
+            self._generation += 1
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._memory_bytes -= entry[2]
+                self.invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[Any], bool]) -> None:
+        """Drop every entry whose cached value matches ``predicate``"""
+        with self._lock:
+            self._generation += 1
+            for key in [k for k, entry in self._entries.items() if entry[0] is not None and predicate(entry[0])]:
+                self._memory_bytes -= self._entries.pop(key)[2]
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._memory_bytes = 0
+            self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit ratio, size and memory usage of the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "memory_bytes": self._memory_bytes,
+            }
+
+
+def _shared_cache(attribute: str, name: str) -> EntityCache:
+    # The package is importable both as ``vpsweb`` and ``src.vpsweb``; both
+    # copies of this module must invalidate the same cache instance.
+    for module_name in ("vpsweb.repository.cache", "src.vpsweb.repository.cache"):
+        module = sys.modules.get(module_name)
+        existing = getattr(module, attribute, None) if module is not None else None
+        if existing is not None:
+            return existing
+    return EntityCache(name, settings.entity_cache_size, settings.entity_cache_ttl)
+
+
+# Poem snapshots keyed by poem ID
+poem_cache = _shared_cache("poem_cache", "poems")
+
+# BBR snapshots keyed by ("poem", poem_id) and ("id", bbr_id)
+bbr_cache = _shared_cache("bbr_cache", "background_briefing_reports")
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Statistics for all entity caches"""
+    return {cache.name: cache.stats() for cache in (poem_cache, bbr_cache)}
+
+
+def clear_caches() -> None:
+    """Empty all entity caches"""
+    poem_cache.clear()
+    bbr_cache.clear()
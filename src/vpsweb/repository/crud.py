@@ -6,27 +6,40 @@ Provides create, read, update, and delete operations for poems, translations,
 AI logs, and human notes with proper error handling and type safety.
 """
 
+import json
+import string
+import zlib
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 # Define UTC+8 timezone
 UTC_PLUS_8 = timezone(timedelta(hours=8))
 
-from sqlalchemy import and_, delete, func, or_, select, update
+# SQLite's lower() only folds ASCII letters
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+from sqlalchemy import String, and_, case, delete, func, or_, select, type_coerce, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer, selectinload, undefer_group
 
 # Import ULID generation utility from v0.3.0 utils
 from vpsweb.utils.ulid_utils import generate_ulid
 
+from .cache import BBRSnapshot, PoemSnapshot, bbr_cache, poem_cache
 from .models import (
     AILog,
     BackgroundBriefingReport,
     HumanNote,
     Poem,
+    PoemTranslationStats,
+    PoetSummary,
     Translation,
+    TranslationPayload,
     TranslationWorkflowStep,
+    compute_content_hash,
 )
+from .pagination import count_rows, decode_cursor, encode_cursor
 from .schemas import (
     AILogCreate,
     HumanNoteCreate,
@@ -46,6 +59,7 @@ class CRUDPoem:
 
     def __init__(self, db: Session):
         self.db = db
+        self.poet_summaries = CRUDPoetSummary(db)
 
     def _safe_rollback(self):
         """Gracefully handle rollback errors that occur when no transaction is active"""
@@ -78,13 +92,17 @@ class CRUDPoem:
             source_language=poem_data.source_language,
             original_text=poem_data.original_text,
             metadata_json=poem_data.metadata_json,
+            content_hash=compute_content_hash(poem_data.poet_name, poem_data.poem_title, poem_data.original_text),
             selected=getattr(poem_data, "selected", False),
         )
 
         try:
             self.db.add(db_poem)
+            self.db.flush()
+            self.poet_summaries.refresh(db_poem.poet_name)
             self.db.commit()
             self.db.refresh(db_poem)
+            poem_cache.invalidate(poem_id)
             return db_poem
         except IntegrityError:
             self._safe_rollback()
@@ -108,6 +126,26 @@ class CRUDPoem:
 
         return poem
 
+    def get_snapshot(self, poem_id: str) -> Optional[PoemSnapshot]:
+        """
+        Get a cached read-only snapshot of a poem
+
+        Use for read paths that only need column values; the snapshot is not
+        attached to a session and has no relationships.
+
+        Args:
+            poem_id: Poem ID
+
+        Returns:
+            PoemSnapshot if found, None otherwise
+        """
+
+        def load() -> Optional[PoemSnapshot]:
+            poem = self.get_by_id(poem_id)
+            return PoemSnapshot.from_model(poem) if poem else None
+
+        return poem_cache.get_or_load(poem_id, load)
+
     def get_multi(
         self,
         skip: int = 0,
@@ -131,24 +169,162 @@ class CRUDPoem:
         Returns:
             List of poem objects
         """
-        stmt = select(Poem)
-
-        # Apply filters
-        if poet_name:
-            stmt = stmt.where(Poem.poet_name.ilike(f"%{poet_name}%"))
-        if language:
-            stmt = stmt.where(Poem.source_language == language)
-        if title_search:
-            stmt = stmt.where(Poem.poem_title.ilike(f"%{title_search}%"))
-        if selected is not None:
-            stmt = stmt.where(Poem.selected == selected)
+        stmt = self._apply_filters(select(Poem), poet_name, language, title_search, selected)
 
-        # Apply ordering and pagination
-        stmt = stmt.order_by(Poem.created_at.desc()).offset(skip).limit(limit)
+        # Apply ordering and pagination (id breaks created_at ties so pages match keyset order)
+        stmt = stmt.order_by(Poem.created_at.desc(), Poem.id.desc()).offset(skip).limit(limit)
 
         result = self.db.execute(stmt).scalars().all()
         return result
 
+    def get_multi_after(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        poet_name: Optional[str] = None,
+        language: Optional[str] = None,
+        title_search: Optional[str] = None,
+        selected: Optional[bool] = None,
+    ) -> Tuple[List[Poem], Optional[str]]:
+        """
+        Get a page of poems using keyset pagination on (created_at, id)
+
+        Args:
+            limit: Maximum number of records to return
+            cursor: Cursor returned with the previous page, None for the first page
+            poet_name: Filter by poet name
+            language: Filter by source language
+            title_search: Search in poem title
+            selected: Filter by selection status
+
+        Returns:
+            Tuple of (poems, cursor for the next page or None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        stmt = self._apply_filters(select(Poem), poet_name, language, title_search, selected)
+
+        if cursor:
+            created_at, poem_id = decode_cursor(cursor, 2)
+            stmt = stmt.where(
+                or_(
+                    Poem.created_at < created_at,
+                    and_(Poem.created_at == created_at, Poem.id < poem_id),
+                )
+            )
+
+        stmt = stmt.order_by(Poem.created_at.desc(), Poem.id.desc()).limit(limit + 1)
+        poems = self.db.execute(stmt).scalars().all()
+
+        next_cursor = None
+        if len(poems) > limit:
+            poems = poems[:limit]
+            next_cursor = encode_cursor(poems[-1].created_at, poems[-1].id)
+        return poems, next_cursor
+
+    def get_list_page(
+        self,
+        limit: int = 100,
+        skip: int = 0,
+        cursor: Optional[str] = None,
+        include_text: bool = True,
+        poet_name: Optional[str] = None,
+        language: Optional[str] = None,
+        title_search: Optional[str] = None,
+        selected: Optional[bool] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get a page of poem list rows with translation counters in one query
+
+        Counters come from the denormalized poem_translation_stats table.
+        Pages by keyset when a cursor is given, by offset otherwise.
+
+        Args:
+            limit: Maximum number of records to return
+            skip: Number of records to skip (ignored with a cursor)
+            cursor: Cursor returned with the previous page
+            include_text: Include ``original_text``; False leaves it None and skips loading it
+            poet_name: Filter by poet name
+            language: Filter by source language
+            title_search: Search in poem title
+            selected: Filter by selection status
+
+        Returns:
+            Tuple of (poem dictionaries, cursor for the next page or None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        columns = [
+            Poem.id,
+            Poem.poet_name,
+            Poem.poem_title,
+            Poem.source_language,
+            Poem.metadata_json,
+            Poem.created_at,
+            Poem.updated_at,
+            # Raw value: legacy rows store selected as text, which Boolean would misread
+            type_coerce(Poem.selected, String).label("selected_raw"),
+            PoemTranslationStats.translation_count,
+            PoemTranslationStats.ai_translation_count,
+            PoemTranslationStats.human_translation_count,
+            PoemTranslationStats.last_translation_at,
+            PoemTranslationStats.last_activity_at,
+        ]
+        if include_text:
+            columns.append(Poem.original_text)
+
+        stmt = select(*columns).outerjoin(PoemTranslationStats, PoemTranslationStats.poem_id == Poem.id)
+        stmt = self._apply_filters(stmt, poet_name, language, title_search, selected)
+
+        if cursor:
+            created_at, poem_id = decode_cursor(cursor, 2)
+            stmt = stmt.where(
+                or_(
+                    Poem.created_at < created_at,
+                    and_(Poem.created_at == created_at, Poem.id < poem_id),
+                )
+            )
+        else:
+            stmt = stmt.offset(skip)
+
+        stmt = stmt.order_by(Poem.created_at.desc(), Poem.id.desc()).limit(limit + 1)
+        rows = self.db.execute(stmt).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+        poems = [
+            {
+                "id": row.id,
+                "poet_name": row.poet_name,
+                "poem_title": row.poem_title,
+                "source_language": row.source_language,
+                "original_text": row.original_text if include_text else None,
+                "metadata_json": row.metadata_json,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+                "translation_count": row.translation_count or 0,
+                "ai_translation_count": row.ai_translation_count or 0,
+                "human_translation_count": row.human_translation_count or 0,
+                "last_translation_at": row.last_translation_at,
+                "last_activity_at": row.last_activity_at,
+                "selected": self._coerce_selected(row.selected_raw),
+            }
+            for row in rows
+        ]
+        return poems, next_cursor
+
+    @staticmethod
+    def _coerce_selected(value: Any) -> bool:
+        """Convert a raw selected column value (bool, int or legacy text) to bool"""
+        if isinstance(value, str):
+            return value.lower() in ("true", "1", "t", "yes")
+        return bool(value) if value is not None else False
+
     def count(
         self,
         poet_name: Optional[str] = None,
@@ -168,9 +344,37 @@ class CRUDPoem:
         Returns:
             Total count of poems matching criteria
         """
-        stmt = select(func.count(Poem.id))
+        stmt = self._apply_filters(select(func.count(Poem.id)), poet_name, language, title_search, selected)
 
-        # Apply filters
+        result = self.db.execute(stmt).scalar()
+        return result
+
+    def count_by_mode(
+        self,
+        mode: str = "exact",
+        poet_name: Optional[str] = None,
+        language: Optional[str] = None,
+        title_search: Optional[str] = None,
+        selected: Optional[bool] = None,
+    ) -> Tuple[Optional[int], bool]:
+        """
+        Count poems matching the filters with an exact, approximate or skipped count
+
+        Returns:
+            Tuple of (count or None, whether the count is exact)
+        """
+        stmt = self._apply_filters(select(Poem.id), poet_name, language, title_search, selected)
+        return count_rows(self.db, stmt, mode)
+
+    @staticmethod
+    def _apply_filters(
+        stmt,
+        poet_name: Optional[str] = None,
+        language: Optional[str] = None,
+        title_search: Optional[str] = None,
+        selected: Optional[bool] = None,
+    ):
+        """Apply the poem list filters to a select statement"""
         if poet_name:
             stmt = stmt.where(Poem.poet_name.ilike(f"%{poet_name}%"))
         if language:
@@ -179,9 +383,7 @@ class CRUDPoem:
             stmt = stmt.where(Poem.poem_title.ilike(f"%{title_search}%"))
         if selected is not None:
             stmt = stmt.where(Poem.selected == selected)
-
-        result = self.db.execute(stmt).scalar()
-        return result
+        return stmt
 
     def update(self, poem_id: str, poem_data: PoemUpdate) -> Optional[Poem]:
         """
@@ -196,7 +398,7 @@ class CRUDPoem:
         """
         # Build update values dynamically, only including non-None fields
         update_values = {
-            "updated_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(UTC_PLUS_8),
         }
 
         if poem_data.poet_name is not None:
@@ -212,13 +414,29 @@ class CRUDPoem:
         if poem_data.selected is not None:
             update_values["selected"] = poem_data.selected
 
+        current = self.db.execute(
+            select(Poem.poet_name, Poem.poem_title, Poem.original_text).where(Poem.id == poem_id)
+        ).one_or_none()
+        if current is None:
+            return None
+        old_poet_name = current.poet_name
+        if {"poet_name", "poem_title", "original_text"} & update_values.keys():
+            update_values["content_hash"] = compute_content_hash(
+                update_values.get("poet_name", current.poet_name),
+                update_values.get("poem_title", current.poem_title),
+                update_values.get("original_text", current.original_text),
+            )
         stmt = update(Poem).where(Poem.id == poem_id).values(**update_values)
 
         result = self.db.execute(stmt)
         if result.rowcount == 0:
             return None
 
+        # A renamed poem moves between two poet summaries
+        for poet_name in {old_poet_name, update_values.get("poet_name", old_poet_name)}:
+            self.poet_summaries.refresh(poet_name)
         self.db.commit()
+        poem_cache.invalidate(poem_id)
         return self.get_by_id(poem_id)
 
     def update_selection(self, poem_id: str, selected: bool) -> Optional[Poem]:
@@ -237,7 +455,7 @@ class CRUDPoem:
             .where(Poem.id == poem_id)
             .values(
                 selected=selected,
-                updated_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(UTC_PLUS_8),
             )
         )
 
@@ -246,6 +464,7 @@ class CRUDPoem:
             return None
 
         self.db.commit()
+        poem_cache.invalidate(poem_id)
         return self.get_by_id(poem_id)
 
     def delete(self, poem_id: str) -> bool:
@@ -258,11 +477,33 @@ class CRUDPoem:
         Returns:
             True if deleted, False if not found
         """
+        poet_name = self.db.execute(select(Poem.poet_name).where(Poem.id == poem_id)).scalar()
         stmt = delete(Poem).where(Poem.id == poem_id)
         result = self.db.execute(stmt)
+        if poet_name is not None:
+            self.poet_summaries.refresh(poet_name)
         self.db.commit()
+        # The BBR row goes with the poem (ON DELETE CASCADE)
+        poem_cache.invalidate(poem_id)
+        bbr_cache.invalidate(("poem", poem_id))
+        bbr_cache.invalidate_where(lambda bbr: bbr.poem_id == poem_id)
         return result.rowcount > 0
 
+    def get_existing_hashes(self, content_hashes: List[str]) -> set:
+        """
+        Return the subset of content hashes that already belong to stored poems
+
+        Args:
+            content_hashes: Hashes from compute_content_hash
+
+        Returns:
+            Set of hashes present in the poems table
+        """
+        if not content_hashes:
+            return set()
+        stmt = select(Poem.content_hash).where(Poem.content_hash.in_(content_hashes))
+        return set(self.db.execute(stmt).scalars())
+
     def get_by_poet(self, poet_name: str) -> List[Poem]:
         """Get all poems by a specific poet"""
         stmt = select(Poem).where(Poem.poet_name == poet_name).order_by(Poem.created_at.desc())
@@ -448,6 +689,8 @@ class CRUDTranslation:
 
     def __init__(self, db: Session):
         self.db = db
+        self.poem_stats = CRUDPoemTranslationStats(db)
+        self.poet_summaries = CRUDPoetSummary(db)
 
     def _safe_rollback(self):
         """Gracefully handle rollback errors that occur when no transaction is active"""
@@ -485,6 +728,9 @@ class CRUDTranslation:
 
         try:
             self.db.add(db_translation)
+            self.db.flush()
+            self.poem_stats.refresh(db_translation.poem_id)
+            self.poet_summaries.refresh_for_poem(db_translation.poem_id)
             self.db.commit()
             self.db.refresh(db_translation)
             return db_translation
@@ -514,20 +760,71 @@ class CRUDTranslation:
         translator_type: Optional[TranslatorType] = None,
         target_language: Optional[str] = None,
         poem_id: Optional[str] = None,
+        source_language: Optional[str] = None,
     ) -> List[Translation]:
         """Get multiple translations with optional filtering"""
-        stmt = select(Translation)
+        stmt = self._apply_filters(select(Translation), translator_type, target_language, poem_id, source_language)
+
+        stmt = stmt.order_by(Translation.created_at.desc(), Translation.id.desc()).offset(skip).limit(limit)
+        result = self.db.execute(stmt).scalars().all()
+        return result
+
+    def get_multi_after(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        translator_type: Optional[TranslatorType] = None,
+        target_language: Optional[str] = None,
+        poem_id: Optional[str] = None,
+        source_language: Optional[str] = None,
+    ) -> Tuple[List[Translation], Optional[str]]:
+        """
+        Get a page of translations using keyset pagination on (created_at, id)
+
+        Returns:
+            Tuple of (translations, cursor for the next page or None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        stmt = self._apply_filters(select(Translation), translator_type, target_language, poem_id, source_language)
+
+        if cursor:
+            created_at, translation_id = decode_cursor(cursor, 2)
+            stmt = stmt.where(
+                or_(
+                    Translation.created_at < created_at,
+                    and_(Translation.created_at == created_at, Translation.id < translation_id),
+                )
+            )
+
+        stmt = stmt.order_by(Translation.created_at.desc(), Translation.id.desc()).limit(limit + 1)
+        translations = self.db.execute(stmt).scalars().all()
+
+        next_cursor = None
+        if len(translations) > limit:
+            translations = translations[:limit]
+            next_cursor = encode_cursor(translations[-1].created_at, translations[-1].id)
+        return translations, next_cursor
 
+    @staticmethod
+    def _apply_filters(
+        stmt,
+        translator_type: Optional[TranslatorType] = None,
+        target_language: Optional[str] = None,
+        poem_id: Optional[str] = None,
+        source_language: Optional[str] = None,
+    ):
+        """Apply the translation list filters to a select statement"""
         if translator_type:
             stmt = stmt.where(Translation.translator_type == translator_type)
         if target_language:
             stmt = stmt.where(Translation.target_language == target_language)
         if poem_id:
             stmt = stmt.where(Translation.poem_id == poem_id)
-
-        stmt = stmt.order_by(Translation.created_at.desc()).offset(skip).limit(limit)
-        result = self.db.execute(stmt).scalars().all()
-        return result
+        if source_language:
+            stmt = stmt.join(Poem, Poem.id == Translation.poem_id).where(Poem.source_language == source_language)
+        return stmt
 
     def update(self, translation_id: str, translation_data: TranslationUpdate) -> Optional[Translation]:
         """Update existing translation"""
@@ -548,22 +845,54 @@ class CRUDTranslation:
         if result.rowcount == 0:
             return None
 
+        poem_id = self.db.execute(select(Translation.poem_id).where(Translation.id == translation_id)).scalar()
+        self.poem_stats.refresh(poem_id)
+        self.poet_summaries.refresh_for_poem(poem_id)
         self.db.commit()
         return self.get_by_id(translation_id)
 
     def delete(self, translation_id: str) -> bool:
         """Delete translation by ID"""
+        poem_id = self.db.execute(select(Translation.poem_id).where(Translation.id == translation_id)).scalar()
         stmt = delete(Translation).where(Translation.id == translation_id)
         result = self.db.execute(stmt)
+        if poem_id is not None:
+            self.poem_stats.refresh(poem_id)
+            self.poet_summaries.refresh_for_poem(poem_id)
         self.db.commit()
         return result.rowcount > 0
 
-    def count(self) -> int:
-        """Get total number of translations"""
-        stmt = select(func.count(Translation.id))
+    def count(
+        self,
+        translator_type: Optional[TranslatorType] = None,
+        target_language: Optional[str] = None,
+        poem_id: Optional[str] = None,
+        source_language: Optional[str] = None,
+    ) -> int:
+        """Get total number of translations with optional filtering"""
+        stmt = self._apply_filters(
+            select(func.count(Translation.id)), translator_type, target_language, poem_id, source_language
+        )
         result = self.db.execute(stmt).scalar()
         return result
 
+    def count_by_mode(
+        self,
+        mode: str = "exact",
+        translator_type: Optional[TranslatorType] = None,
+        target_language: Optional[str] = None,
+        poem_id: Optional[str] = None,
+        source_language: Optional[str] = None,
+    ) -> Tuple[Optional[int], bool]:
+        """
+        Count translations matching the filters with an exact, approximate or skipped count
+
+        Returns:
+            Tuple of (count or None, whether the count is exact)
+        """
+        stmt = self._apply_filters(select(Translation.id), translator_type, target_language, poem_id, source_language)
+        return count_rows(self.db, stmt, mode)
+
     def get_by_language_pair(self, source_lang: str, target_lang: str) -> List[Translation]:
         """Get translations by language pair"""
         stmt = (
@@ -608,6 +937,7 @@ class CRUDAILog:
             token_usage_json=ai_log_data.token_usage_json,
             cost_info_json=ai_log_data.cost_info_json,
             runtime_seconds=ai_log_data.runtime_seconds,
+            prompt_hash=ai_log_data.prompt_hash,
             notes=ai_log_data.notes,
         )
 
@@ -750,6 +1080,7 @@ class CRUDTranslationWorkflowStep:
             completion_tokens=step_data.completion_tokens,
             duration_seconds=step_data.duration_seconds,
             cost=step_data.cost,
+            prompt_hash=step_data.prompt_hash,
             additional_metrics=step_data.additional_metrics,
             translated_title=step_data.translated_title,
             translated_poet_name=step_data.translated_poet_name,
@@ -768,16 +1099,21 @@ class CRUDTranslationWorkflowStep:
             self._safe_rollback()
             raise e
 
+    @staticmethod
+    def _select_with_payload():
+        """Select workflow steps with their deferred content columns loaded in the same query"""
+        return select(TranslationWorkflowStep).options(undefer_group("step_payload"))
+
     def get_by_id(self, step_id: str) -> Optional[TranslationWorkflowStep]:
         """Get workflow step by ID"""
-        stmt = select(TranslationWorkflowStep).where(TranslationWorkflowStep.id == step_id)
+        stmt = self._select_with_payload().where(TranslationWorkflowStep.id == step_id)
         result = self.db.execute(stmt).scalar_one_or_none()
         return result
 
     def get_by_translation(self, translation_id: str) -> List[TranslationWorkflowStep]:
         """Get all workflow steps for a translation"""
         stmt = (
-            select(TranslationWorkflowStep)
+            self._select_with_payload()
             .where(TranslationWorkflowStep.translation_id == translation_id)
             .order_by(
                 TranslationWorkflowStep.step_order.asc(),
@@ -790,7 +1126,7 @@ class CRUDTranslationWorkflowStep:
     def get_by_ai_log(self, ai_log_id: str) -> List[TranslationWorkflowStep]:
         """Get all workflow steps for an AI log"""
         stmt = (
-            select(TranslationWorkflowStep)
+            self._select_with_payload()
             .where(TranslationWorkflowStep.ai_log_id == ai_log_id)
             .order_by(
                 TranslationWorkflowStep.step_order.asc(),
@@ -803,7 +1139,7 @@ class CRUDTranslationWorkflowStep:
     def get_by_workflow(self, workflow_id: str) -> List[TranslationWorkflowStep]:
         """Get all workflow steps for a workflow execution"""
         stmt = (
-            select(TranslationWorkflowStep)
+            self._select_with_payload()
             .where(TranslationWorkflowStep.workflow_id == workflow_id)
             .order_by(
                 TranslationWorkflowStep.step_order.asc(),
@@ -816,7 +1152,7 @@ class CRUDTranslationWorkflowStep:
     def get_by_step_type(self, translation_id: str, step_type: WorkflowStepType) -> Optional[TranslationWorkflowStep]:
         """Get a specific step type for a translation"""
         stmt = (
-            select(TranslationWorkflowStep)
+            self._select_with_payload()
             .where(
                 and_(
                     TranslationWorkflowStep.translation_id == translation_id,
@@ -933,6 +1269,8 @@ class CRUDBackgroundBriefingReport:
             self.db.add(db_bbr)
             self.db.commit()
             self.db.refresh(db_bbr)
+            bbr_cache.invalidate(("poem", db_bbr.poem_id))
+            bbr_cache.invalidate(("id", db_bbr.id))
             return db_bbr
         except IntegrityError:
             self._safe_rollback()
@@ -967,6 +1305,59 @@ class CRUDBackgroundBriefingReport:
         stmt = select(BackgroundBriefingReport).where(BackgroundBriefingReport.poem_id == poem_id)
         return self.db.execute(stmt).scalar_one_or_none()
 
+    def get_snapshot_by_poem(self, poem_id: str) -> Optional[BBRSnapshot]:
+        """
+        Get a cached read-only snapshot of the BBR for a poem
+
+        Args:
+            poem_id: Poem ID
+
+        Returns:
+            BBRSnapshot if the poem has a BBR, None otherwise
+        """
+
+        def load() -> Optional[BBRSnapshot]:
+            stmt = (
+                select(BackgroundBriefingReport)
+                .where(BackgroundBriefingReport.poem_id == poem_id)
+                .options(undefer_group("bbr_payload"))
+            )
+            bbr = self.db.execute(stmt).scalar_one_or_none()
+            return BBRSnapshot.from_model(bbr) if bbr else None
+
+        return bbr_cache.get_or_load(("poem", poem_id), load)
+
+    def get_snapshot(self, bbr_id: str) -> Optional[BBRSnapshot]:
+        """
+        Get a cached read-only snapshot of a BBR by ID
+
+        Args:
+            bbr_id: BBR ID
+
+        Returns:
+            BBRSnapshot if found, None otherwise
+        """
+
+        def load() -> Optional[BBRSnapshot]:
+            stmt = (
+                select(BackgroundBriefingReport)
+                .where(BackgroundBriefingReport.id == bbr_id)
+                .options(undefer_group("bbr_payload"))
+            )
+            bbr = self.db.execute(stmt).scalar_one_or_none()
+            return BBRSnapshot.from_model(bbr) if bbr else None
+
+        return bbr_cache.get_or_load(("id", bbr_id), load)
+
+    def _invalidate_cache(self, bbr_id: Optional[str] = None, poem_id: Optional[str] = None) -> None:
+        """Drop cached snapshots of a BBR, by ID and/or poem ID"""
+        if bbr_id is not None:
+            bbr_cache.invalidate(("id", bbr_id))
+            bbr_cache.invalidate_where(lambda bbr: bbr.id == bbr_id)
+        if poem_id is not None:
+            bbr_cache.invalidate(("poem", poem_id))
+            bbr_cache.invalidate_where(lambda bbr: bbr.poem_id == poem_id)
+
     def update(self, bbr_id: str, update_data: dict) -> Optional[BackgroundBriefingReport]:
         """
         Update BBR by ID
@@ -989,6 +1380,7 @@ class CRUDBackgroundBriefingReport:
         if result:
             self.db.commit()
             self.db.refresh(result)
+            self._invalidate_cache(bbr_id=bbr_id, poem_id=result.poem_id)
 
         return result
 
@@ -1005,6 +1397,7 @@ class CRUDBackgroundBriefingReport:
         stmt = delete(BackgroundBriefingReport).where(BackgroundBriefingReport.id == bbr_id)
         result = self.db.execute(stmt)
         self.db.commit()
+        self._invalidate_cache(bbr_id=bbr_id)
         return result.rowcount > 0
 
     def delete_by_poem(self, poem_id: str) -> bool:
@@ -1020,6 +1413,7 @@ class CRUDBackgroundBriefingReport:
         stmt = delete(BackgroundBriefingReport).where(BackgroundBriefingReport.poem_id == poem_id)
         result = self.db.execute(stmt)
         self.db.commit()
+        self._invalidate_cache(poem_id=poem_id)
         return result.rowcount > 0
 
     def count(self) -> int:
@@ -1029,6 +1423,491 @@ class CRUDBackgroundBriefingReport:
         return result or 0
 
 
+class CRUDTranslationPayload:
+    """CRUD operations for compressed translation payloads"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _safe_rollback(self):
+        """Safely rollback transaction with error handling"""
+        try:
+            self.db.rollback()
+        except Exception:
+            # Ignore rollback errors - session might be in a bad state
+            pass
+
+    def save(self, translation_id: str, data: Dict[str, Any]) -> TranslationPayload:
+        """
+        Store (or replace) the payload for a translation
+
+        Args:
+            translation_id: Translation ID
+            data: JSON-serializable payload document
+
+        Returns:
+            Stored payload row
+        """
+        raw = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+        compressed = zlib.compress(raw)
+        try:
+            payload = self.db.get(TranslationPayload, translation_id)
+            if payload is None:
+                payload = TranslationPayload(translation_id=translation_id)
+                self.db.add(payload)
+            payload.encoding = "zlib"
+            payload.raw_size = len(raw)
+            payload.compressed_size = len(compressed)
+            payload.data = compressed
+            self.db.commit()
+            self.db.refresh(payload)
+            return payload
+        except SQLAlchemyError as e:
+            self._safe_rollback()
+            raise e
+
+    def get_data(self, translation_id: str) -> Optional[Dict[str, Any]]:
+        """Get the decompressed payload document for a translation"""
+        payload = self.db.get(TranslationPayload, translation_id)
+        return payload.payload_data if payload else None
+
+    def delete(self, translation_id: str) -> bool:
+        """Delete the payload for a translation"""
+        stmt = delete(TranslationPayload).where(TranslationPayload.translation_id == translation_id)
+        result = self.db.execute(stmt)
+        self.db.commit()
+        return result.rowcount > 0
+
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """Get raw vs compressed byte totals across all payloads"""
+        row = self.db.execute(
+            select(
+                func.count(TranslationPayload.translation_id),
+                func.coalesce(func.sum(TranslationPayload.raw_size), 0),
+                func.coalesce(func.sum(TranslationPayload.compressed_size), 0),
+            )
+        ).one()
+        count, raw_bytes, compressed_bytes = row
+        return {
+            "payload_count": count,
+            "raw_bytes": raw_bytes,
+            "compressed_bytes": compressed_bytes,
+            "compression_ratio": (raw_bytes / compressed_bytes) if compressed_bytes else None,
+        }
+
+
+class CRUDPoemTranslationStats:
+    """Maintenance and verification of the denormalized per-poem translation counters"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def _aggregate_stmt():
+        """Per-poem counters computed from the translations table"""
+        return select(
+            Translation.poem_id,
+            func.count(Translation.id).label("translation_count"),
+            func.coalesce(func.sum(case((Translation.translator_type == "ai", 1), else_=0)), 0).label(
+                "ai_translation_count"
+            ),
+            func.coalesce(func.sum(case((Translation.translator_type == "human", 1), else_=0)), 0).label(
+                "human_translation_count"
+            ),
+            func.max(Translation.created_at).label("last_translation_at"),
+        ).group_by(Translation.poem_id)
+
+    def refresh(self, poem_id: str) -> PoemTranslationStats:
+        """
+        Recompute the counters of one poem inside the current transaction
+
+        Called by the translation CRUD paths before they commit, so the
+        counters change atomically with the translation rows. Pending ORM
+        changes must be flushed first.
+
+        Args:
+            poem_id: Poem ID
+
+        Returns:
+            Updated stats row
+        """
+        row = self.db.execute(self._aggregate_stmt().where(Translation.poem_id == poem_id)).one_or_none()
+
+        stats = self.db.get(PoemTranslationStats, poem_id)
+        if stats is None:
+            stats = PoemTranslationStats(poem_id=poem_id)
+            self.db.add(stats)
+        stats.translation_count = row.translation_count if row else 0
+        stats.ai_translation_count = row.ai_translation_count if row else 0
+        stats.human_translation_count = row.human_translation_count if row else 0
+        stats.last_translation_at = row.last_translation_at if row else None
+        stats.last_activity_at = datetime.now(UTC_PLUS_8)
+        self.db.flush()
+        return stats
+
+    def get_by_poem(self, poem_id: str) -> Optional[PoemTranslationStats]:
+        """Get the counters of a poem (None when it never had translations)"""
+        return self.db.get(PoemTranslationStats, poem_id)
+
+    def check_consistency(self, fix: bool = False) -> List[Dict[str, Any]]:
+        """
+        Compare the stored counters with counts recomputed from translations
+
+        Args:
+            fix: Rewrite mismatched rows and drop orphaned ones
+
+        Returns:
+            List of mismatches with poem_id, expected and stored values
+        """
+        expected = {row.poem_id: row for row in self.db.execute(self._aggregate_stmt())}
+        stored = {stats.poem_id: stats for stats in self.db.execute(select(PoemTranslationStats)).scalars()}
+        poem_ids = (
+            set(self.db.execute(select(Poem.id).where(Poem.id.in_(stored.keys()))).scalars()) if stored else set()
+        )
+
+        fields = ("translation_count", "ai_translation_count", "human_translation_count", "last_translation_at")
+        mismatches = []
+        for poem_id in sorted(set(expected) | set(stored)):
+            row = expected.get(poem_id)
+            stats = stored.get(poem_id)
+            if stats is not None and poem_id not in poem_ids:
+                mismatches.append({"poem_id": poem_id, "problem": "orphaned", "expected": None, "stored": None})
+                continue
+
+            want = {f: getattr(row, f) if row else (None if f == "last_translation_at" else 0) for f in fields}
+            have = {f: getattr(stats, f) if stats else (None if f == "last_translation_at" else 0) for f in fields}
+            if want != have:
+                mismatches.append({"poem_id": poem_id, "problem": "mismatch", "expected": want, "stored": have})
+
+        if fix and mismatches:
+            try:
+                for mismatch in mismatches:
+                    if mismatch["problem"] == "orphaned":
+                        self.db.execute(
+                            delete(PoemTranslationStats).where(PoemTranslationStats.poem_id == mismatch["poem_id"])
+                        )
+                    else:
+                        self.refresh(mismatch["poem_id"])
+                self.db.commit()
+            except SQLAlchemyError:
+                self.db.rollback()
+                raise
+
+        return mismatches
+
+
+class CRUDPoetSummary:
+    """
+    Maintenance and queries of the materialized per-poet aggregates
+
+    Rows are keyed by the normalized poet name and recomputed from the poems
+    and translations of that poet whenever one of them is written, so poet
+    listings never aggregate the Poem-Translation join at read time.
+    """
+
+    # Columns compared by check_consistency
+    FIELDS = (
+        "poet_name",
+        "poem_count",
+        "translation_count",
+        "ai_translation_count",
+        "human_translation_count",
+        "avg_quality_rating",
+        "ai_avg_quality_rating",
+        "human_avg_quality_rating",
+        "source_languages",
+        "target_languages",
+        "language_pairs",
+        "first_poem_at",
+        "last_poem_at",
+        "first_translation_at",
+        "last_translation_at",
+        "last_activity_at",
+    )
+
+    SORT_COLUMNS = {
+        "name": PoetSummary.poet_name,
+        "poem_count": PoetSummary.poem_count,
+        "translation_count": PoetSummary.translation_count,
+        "recent_activity": PoetSummary.last_activity_at,
+    }
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def normalize(poet_name: str) -> str:
+        """
+        Key of a poet name
+
+        Mirrors SQLite's ``lower(trim(...))`` (space trimming, ASCII-only
+        lowercasing) so the key can be matched in SQL as well.
+        """
+        return poet_name.strip(" ").translate(_ASCII_LOWER)
+
+    @staticmethod
+    def _key_expr():
+        return func.lower(func.trim(Poem.poet_name))
+
+    @classmethod
+    def matches(cls, poet_name: str):
+        """SQL condition selecting the poems of a poet under every spelling that shares its key"""
+        return cls._key_expr() == cls.normalize(poet_name)
+
+    @staticmethod
+    def _rows_stmt():
+        """Poems outer-joined to their translations"""
+        return select(
+            Poem.id,
+            Poem.poet_name,
+            Poem.source_language,
+            Poem.created_at,
+            Translation.id.label("translation_id"),
+            Translation.target_language,
+            Translation.translator_type,
+            Translation.quality_rating,
+            Translation.created_at.label("translation_created_at"),
+        ).outerjoin(Translation, Translation.poem_id == Poem.id)
+
+    @classmethod
+    def _summarize(cls, rows) -> Dict[str, Dict[str, Any]]:
+        """Fold poem/translation join rows into column values per poet key"""
+        poets: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            key = cls.normalize(row.poet_name)
+            poet = poets.setdefault(
+                key,
+                {
+                    "poems": {},
+                    "sources": set(),
+                    "targets": set(),
+                    "pairs": {},
+                    "types": {"ai": [0, 0, 0], "human": [0, 0, 0]},  # count, rating sum, rated count
+                    "translation_dates": [],
+                },
+            )
+            poet["poems"][row.id] = (row.created_at, row.poet_name)
+            poet["sources"].add(row.source_language)
+            if row.translation_id is None:
+                continue
+
+            poet["targets"].add(row.target_language)
+            pair = (row.source_language, row.target_language)
+            poet["pairs"][pair] = poet["pairs"].get(pair, 0) + 1
+            translator_type = getattr(row.translator_type, "value", row.translator_type)
+            counters = poet["types"].setdefault(translator_type, [0, 0, 0])
+            counters[0] += 1
+            if row.quality_rating is not None:
+                counters[1] += row.quality_rating
+                counters[2] += 1
+            if row.translation_created_at is not None:
+                poet["translation_dates"].append(row.translation_created_at)
+
+        summaries = {}
+        for key, poet in poets.items():
+            poem_dates = [created_at for created_at, _ in poet["poems"].values() if created_at is not None]
+            newest_poem = max(poet["poems"].items(), key=lambda item: (item[1][0] is not None, item[1][0], item[0]))
+            translation_dates = poet["translation_dates"]
+            types = poet["types"]
+            rating_sum = sum(counters[1] for counters in types.values())
+            rated = sum(counters[2] for counters in types.values())
+            last_poem_at = max(poem_dates) if poem_dates else None
+            last_translation_at = max(translation_dates) if translation_dates else None
+
+            summaries[key] = {
+                "poet_name": newest_poem[1][1],
+                "poem_count": len(poet["poems"]),
+                "translation_count": sum(counters[0] for counters in types.values()),
+                "ai_translation_count": types["ai"][0],
+                "human_translation_count": types["human"][0],
+                "avg_quality_rating": rating_sum / rated if rated else None,
+                "ai_avg_quality_rating": types["ai"][1] / types["ai"][2] if types["ai"][2] else None,
+                "human_avg_quality_rating": types["human"][1] / types["human"][2] if types["human"][2] else None,
+                "source_languages": json.dumps(sorted(poet["sources"]), ensure_ascii=False),
+                "target_languages": json.dumps(sorted(poet["targets"]), ensure_ascii=False),
+                "language_pairs": json.dumps(
+                    [
+                        {"source_language": source, "target_language": target, "translation_count": count}
+                        for (source, target), count in sorted(
+                            poet["pairs"].items(), key=lambda item: (-item[1], item[0])
+                        )
+                    ],
+                    ensure_ascii=False,
+                ),
+                "first_poem_at": min(poem_dates) if poem_dates else None,
+                "last_poem_at": last_poem_at,
+                "first_translation_at": min(translation_dates) if translation_dates else None,
+                "last_translation_at": last_translation_at,
+                "last_activity_at": max(
+                    (date for date in (last_poem_at, last_translation_at) if date is not None), default=None
+                ),
+            }
+        return summaries
+
+    def refresh(self, poet_name: str) -> Optional[PoetSummary]:
+        """
+        Recompute the aggregates of one poet inside the current transaction
+
+        Called by the poem and translation CRUD paths before they commit.
+        The row is removed when the poet has no poems left.
+
+        Args:
+            poet_name: Poet name in any spelling variant
+
+        Returns:
+            Updated summary row, None if the poet no longer has poems
+        """
+        return self.refresh_many([poet_name]).get(self.normalize(poet_name))
+
+    def refresh_many(self, poet_names: Iterable[str]) -> Dict[str, Optional[PoetSummary]]:
+        """
+        Recompute the aggregates of several poets in a fixed number of statements
+
+        Used by bulk writes. The aggregates come from one query over the
+        poems of all the poets; rows of poets without poems are removed with
+        one DELETE and the others written with one INSERT ... ON CONFLICT DO
+        UPDATE, so the cost does not grow by a round trip per poet.
+
+        Args:
+            poet_names: Poet names in any spelling variant
+
+        Returns:
+            Updated summary rows by poet key, None for poets without poems
+        """
+        keys = {self.normalize(poet_name) for poet_name in poet_names}
+        if not keys:
+            return {}
+        self.db.flush()
+        rows = self.db.execute(self._rows_stmt().where(self._key_expr().in_(keys))).all()
+        aggregates = self._summarize(rows)
+
+        summaries: Dict[str, Optional[PoetSummary]] = dict.fromkeys(keys)
+        removed = keys - aggregates.keys()
+        if removed:
+            self.db.execute(delete(PoetSummary).where(PoetSummary.poet_key.in_(removed)))
+        if aggregates:
+            stmt = sqlite_insert(PoetSummary)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[PoetSummary.poet_key],
+                set_={name: stmt.excluded[name] for name in self.FIELDS},
+            ).returning(PoetSummary)
+            # render_nulls keeps one parameter shape (a single statement); populate_existing
+            # refreshes rows already loaded in this session
+            upserted = self.db.scalars(
+                stmt,
+                [{"poet_key": key, **values} for key, values in aggregates.items()],
+                execution_options={"render_nulls": True, "populate_existing": True},
+            )
+            summaries.update((summary.poet_key, summary) for summary in upserted)
+        return summaries
+
+    def refresh_for_poem(self, poem_id: str) -> Optional[PoetSummary]:
+        """Recompute the aggregates of the poet of a poem"""
+        poet_name = self.db.execute(select(Poem.poet_name).where(Poem.id == poem_id)).scalar()
+        return self.refresh(poet_name) if poet_name is not None else None
+
+    def get_by_name(self, poet_name: str) -> Optional[PoetSummary]:
+        """Get the summary of a poet by any spelling variant of the name"""
+        return self.db.get(PoetSummary, self.normalize(poet_name))
+
+    def _filtered(self, stmt, search: Optional[str], min_poems: Optional[int], min_translations: Optional[int]):
+        if search:
+            stmt = stmt.where(PoetSummary.poet_name.ilike(f"%{search}%"))
+        if min_poems is not None:
+            stmt = stmt.where(PoetSummary.poem_count >= min_poems)
+        if min_translations is not None:
+            stmt = stmt.where(PoetSummary.translation_count >= min_translations)
+        return stmt
+
+    def list_stmt(
+        self,
+        search: Optional[str] = None,
+        sort_by: str = "name",
+        sort_order: str = "asc",
+        min_poems: Optional[int] = None,
+        min_translations: Optional[int] = None,
+    ):
+        """
+        Filtered and ordered select of poet summaries
+
+        Ties on the sort column are broken by poet name, so ``name`` ordering
+        is a valid keyset for cursor pagination.
+        """
+        stmt = self._filtered(select(PoetSummary), search, min_poems, min_translations)
+        order_column = self.SORT_COLUMNS.get(sort_by, PoetSummary.poet_name)
+        if sort_order.lower() == "desc":
+            return stmt.order_by(order_column.desc(), PoetSummary.poet_name.desc())
+        return stmt.order_by(order_column, PoetSummary.poet_name)
+
+    def count(
+        self,
+        search: Optional[str] = None,
+        min_poems: Optional[int] = None,
+        min_translations: Optional[int] = None,
+    ) -> int:
+        """Count poets matching the filters"""
+        stmt = self._filtered(select(func.count()).select_from(PoetSummary), search, min_poems, min_translations)
+        return self.db.execute(stmt).scalar() or 0
+
+    def get_names(self) -> List[str]:
+        """Display names of all poets, alphabetically"""
+        return list(self.db.execute(select(PoetSummary.poet_name).order_by(PoetSummary.poet_name)).scalars())
+
+    @staticmethod
+    def to_dict(summary: PoetSummary) -> Dict[str, Any]:
+        """Column values with the JSON language columns decoded"""
+        data = {name: getattr(summary, name) for name in CRUDPoetSummary.FIELDS}
+        for name in ("source_languages", "target_languages", "language_pairs"):
+            data[name] = json.loads(data[name] or "[]")
+        return data
+
+    def check_consistency(self, fix: bool = False) -> List[Dict[str, Any]]:
+        """
+        Compare the stored summaries with aggregates recomputed from poems and translations
+
+        Args:
+            fix: Rewrite mismatched rows, add missing ones and drop orphaned ones
+
+        Returns:
+            List of mismatches with poet_key, problem, expected and stored values
+        """
+        expected = self._summarize(self.db.execute(self._rows_stmt()).all())
+        stored = {summary.poet_key: summary for summary in self.db.execute(select(PoetSummary)).scalars()}
+
+        mismatches = []
+        for key in sorted(set(expected) | set(stored)):
+            want = expected.get(key)
+            summary = stored.get(key)
+            if want is None:
+                mismatches.append({"poet_key": key, "problem": "orphaned", "expected": None, "stored": None})
+                continue
+            have = {name: getattr(summary, name) for name in self.FIELDS} if summary is not None else None
+            if have is None:
+                mismatches.append({"poet_key": key, "problem": "missing", "expected": want, "stored": None})
+            elif want != have:
+                mismatches.append({"poet_key": key, "problem": "mismatch", "expected": want, "stored": have})
+
+        if fix and mismatches:
+            try:
+                for mismatch in mismatches:
+                    key = mismatch["poet_key"]
+                    if mismatch["problem"] == "orphaned":
+                        self.db.execute(delete(PoetSummary).where(PoetSummary.poet_key == key))
+                        continue
+                    summary = stored.get(key)
+                    if summary is None:
+                        summary = PoetSummary(poet_key=key)
+                        self.db.add(summary)
+                    for name, value in mismatch["expected"].items():
+                        setattr(summary, name, value)
+                self.db.commit()
+            except SQLAlchemyError:
+                self.db.rollback()
+                raise
+
+        return mismatches
+
+
 # Repository service that combines all CRUD operations
 class RepositoryService:
     """Main repository service combining all CRUD operations"""
@@ -1041,12 +1920,15 @@ class RepositoryService:
         self.human_notes = CRUDHumanNote(db)
         self.workflow_steps = CRUDTranslationWorkflowStep(db)
         self.background_briefing_reports = CRUDBackgroundBriefingReport(db)
+        self.translation_payloads = CRUDTranslationPayload(db)
+        self.poem_stats = CRUDPoemTranslationStats(db)
+        self.poet_summaries = CRUDPoetSummary(db)
         # workflow_tasks removed - now using FastAPI app.state for task tracking
 
     def get_repository_stats(self) -> Dict[str, Any]:
         """Get comprehensive repository statistics"""
         return {
-            "total_poets": self.db.execute(select(func.count(func.distinct(Poem.poet_name)))).scalar(),
+            "total_poets": self.poet_summaries.count(),
             "total_poems": self.poems.count(),
             "total_translations": self.translations.count(),
             "ai_translations": self.db.execute(
@@ -1075,31 +1957,87 @@ class RepositoryService:
         )
         return self.db.execute(stmt).scalars().all()
 
-    def get_poem_with_translations(self, poem_id: str) -> Optional[Dict[str, Any]]:
-        """Get poem with all its translations and related data"""
-        poem = self.poems.get_by_id(poem_id)
+    def get_poem_aggregate(
+        self,
+        poem_id: str,
+        include_text: bool = True,
+        include_step_content: bool = True,
+        include_bbr_content: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load a poem with its translations, AI logs, human notes, workflow steps and BBR.
+
+        Related rows are fetched with selectin loading, so the number of queries is fixed
+        (poem, BBR, translations, AI logs, human notes, workflow steps) regardless of how
+        many translations the poem has.
+
+        Args:
+            poem_id: Poem ID
+            include_text: Load ``Translation.translated_text``
+            include_step_content: Load workflow step content/notes/model info and AI log notes
+            include_bbr_content: Load the BBR JSON content
+
+        Columns skipped by the projection flags are deferred, not dropped: touching
+        them later issues a lazy load for that row only. Workflow step and BBR payload
+        columns are deferred by the models and are only loaded here when requested.
+
+        Returns:
+            Aggregate dictionary if the poem exists, None otherwise
+        """
+        bbr_loader = selectinload(Poem.background_briefing_report)
+        if include_bbr_content:
+            bbr_loader = bbr_loader.undefer_group("bbr_payload")
+
+        poem = self.db.execute(select(Poem).where(Poem.id == poem_id).options(bbr_loader)).scalar_one_or_none()
         if not poem:
             return None
 
-        translations = self.translations.get_by_poem(poem_id)
+        ai_log_loader = selectinload(Translation.ai_logs)
+        step_loader = selectinload(Translation.workflow_steps)
+        if include_step_content:
+            step_loader = step_loader.undefer_group("step_payload")
+        else:
+            ai_log_loader = ai_log_loader.defer(AILog.notes)
 
-        result = {"poem": poem, "translations": []}
+        options = [ai_log_loader, selectinload(Translation.human_notes), step_loader]
+        if not include_text:
+            options.append(defer(Translation.translated_text))
 
-        for translation in translations:
-            ai_logs = self.ai_logs.get_by_translation(translation.id)
-            human_notes = self.human_notes.get_by_translation(translation.id)
-            workflow_steps = self.workflow_steps.get_by_translation(translation.id)
+        stmt = (
+            select(Translation)
+            .where(Translation.poem_id == poem_id)
+            .order_by(Translation.created_at.desc())
+            .options(*options)
+        )
+        translations = self.db.execute(stmt).scalars().all()
 
-            result["translations"].append(
+        entries = []
+        for translation in translations:
+            # Match the ordering of the per-translation CRUD getters
+            entries.append(
                 {
                     "translation": translation,
-                    "ai_logs": ai_logs,
-                    "human_notes": human_notes,
-                    "workflow_steps": workflow_steps,
+                    "ai_logs": sorted(translation.ai_logs, key=lambda log: log.created_at, reverse=True),
+                    "human_notes": sorted(translation.human_notes, key=lambda note: note.created_at, reverse=True),
+                    "workflow_steps": sorted(
+                        translation.workflow_steps,
+                        key=lambda step: (step.step_order, step.timestamp),
+                    ),
                 }
             )
 
-        return result
+        return {
+            "poem": poem,
+            "background_briefing_report": poem.background_briefing_report,
+            "translations": entries,
+            "translation_count": len(translations),
+            "ai_translation_count": sum(1 for t in translations if t.translator_type == "ai"),
+            "human_translation_count": sum(1 for t in translations if t.translator_type == "human"),
+        }
+
+    def get_poem_with_translations(self, poem_id: str) -> Optional[Dict[str, Any]]:
+        """Get poem with all its translations and related data"""
+        return self.get_poem_aggregate(poem_id)
 
 
 # Dependency function for FastAPI
@@ -9,6 +9,7 @@ from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from .instrumentation import install_query_instrumentation
 from .settings import settings
 
 # Create SQLAlchemy engine with SQLite-specific settings
@@ -32,6 +33,10 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     print("🔥 DEBUG: Setting foreign_keys=ON for new connection")
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
+    # Lets maintenance release free pages with incremental_vacuum. It only takes
+    # effect before the first table is created, so new files get it for free;
+    # existing ones need the opt-in VACUUM conversion (see maintenance.py)
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
     cursor.close()
 
 
@@ -44,6 +49,10 @@ def on_checkout(dbapi_connection, connection_record, connection_proxy):
     cursor.close()
 
 
+# Per-request query counting, timing and N+1 detection
+install_query_instrumentation()
+
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
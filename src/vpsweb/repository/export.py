@@ -0,0 +1,270 @@
+"""
+VPSWeb Repository Streaming Export
+
+Streams poems, translations, workflow steps and Background Briefing Reports
+as NDJSON or CSV. Rows are read with Core selects executed with ``yield_per``,
+so the driver hands them over in fixed-size batches and no ORM instances are
+kept in the identity map; output is produced in bounded byte chunks and can
+be gzip-compressed on the fly. Memory use stays flat regardless of the size
+of the repository.
+
+All entities are read inside one transaction, so an export is a consistent
+snapshot of the database.
+
+Incremental exports pass ``changed_since``: only rows whose change column
+(``updated_at`` where the table has one, ``created_at`` otherwise) is newer
+than the watermark are exported. The NDJSON stream ends with an
+``export_end`` record carrying the watermark to pass to the next run.
+Deletions and edits of translations (which have no ``updated_at``) are not
+visible to incremental exports.
+"""
+
+import csv
+import io
+import json
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .crud import CRUDPoetSummary
+from .models import UTC_PLUS_8, BackgroundBriefingReport, Poem, Translation, TranslationWorkflowStep
+
+# Rows fetched from the driver per batch
+DEFAULT_BATCH_SIZE = 1000
+
+# Output is yielded once this many bytes are buffered
+CHUNK_BYTES = 64 * 1024
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+
+class ExportError(ValueError):
+    """Raised for an unsupported combination of export options"""
+
+
+@dataclass(frozen=True)
+class _EntitySpec:
+    record_type: str
+    model: Any
+    change_column: str
+    language_column: Any
+    joins: Sequence[Callable[[Any], Any]]
+
+
+def _join_translation(stmt):
+    return stmt.join(Translation, Translation.id == TranslationWorkflowStep.translation_id)
+
+
+def _join_poem_via_translation(stmt):
+    return stmt.join(Poem, Poem.id == Translation.poem_id)
+
+
+def _join_poem_via_bbr(stmt):
+    return stmt.join(Poem, Poem.id == BackgroundBriefingReport.poem_id)
+
+
+# Exportable entities in dependency order. ``joins`` reach the poems table for
+# the poet filter (and the translations table for the language of steps).
+EXPORT_ENTITIES: Dict[str, _EntitySpec] = {
+    "poems": _EntitySpec("poem", Poem, "updated_at", Poem.source_language, ()),
+    "translations": _EntitySpec(
+        "translation", Translation, "created_at", Translation.target_language, (_join_poem_via_translation,)
+    ),
+    "workflow_steps": _EntitySpec(
+        "workflow_step",
+        TranslationWorkflowStep,
+        "created_at",
+        Translation.target_language,
+        (_join_translation, _join_poem_via_translation),
+    ),
+    "bbrs": _EntitySpec("bbr", BackgroundBriefingReport, "updated_at", Poem.source_language, (_join_poem_via_bbr,)),
+}
+
+
+def _to_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Timestamps are stored as naive UTC+8 wall time"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(UTC_PLUS_8).replace(tzinfo=None)
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class RepositoryExporter:
+    """
+    Streaming exporter for repository tables
+
+    ``counts`` and ``watermark`` are updated while the output is consumed.
+
+    Example:
+        exporter = RepositoryExporter(db, ["poems"], changed_since=last_watermark)
+        for chunk in exporter.iter_bytes(compress=True):
+            out.write(chunk)
+        last_watermark = exporter.watermark
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        entities: Optional[Sequence[str]] = None,
+        fmt: str = "ndjson",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        poet_name: Optional[str] = None,
+        language: Optional[str] = None,
+        changed_since: Optional[datetime] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """
+        Args:
+            db: Database session, used only for reads
+            entities: Entities to export, in any order (default: all)
+            fmt: ``ndjson`` or ``csv``; CSV holds a single entity
+            since: Only rows created at or after this time
+            until: Only rows created before this time
+            poet_name: Only rows belonging to poems of this poet (any spelling variant)
+            language: Poem source language for poems and BBRs, target language for translations and steps
+            changed_since: Watermark of a previous export; only rows changed after it
+            batch_size: Rows fetched from the driver per batch
+
+        Raises:
+            ExportError: If an entity or the format is unknown, or CSV is requested for several entities
+        """
+        entities = list(dict.fromkeys(entities or EXPORT_ENTITIES))
+        unknown = [name for name in entities if name not in EXPORT_ENTITIES]
+        if unknown:
+            raise ExportError(f"Unknown export entity '{unknown[0]}'; expected one of {', '.join(EXPORT_ENTITIES)}")
+        if fmt not in EXPORT_FORMATS:
+            raise ExportError(f"Unsupported export format '{fmt}'; expected one of {', '.join(EXPORT_FORMATS)}")
+        if fmt == "csv" and len(entities) != 1:
+            raise ExportError("CSV export holds a single entity; choose exactly one")
+
+        self.db = db
+        self.entities = [name for name in EXPORT_ENTITIES if name in entities]
+        self.fmt = fmt
+        self.since = _to_naive(since)
+        self.until = _to_naive(until)
+        self.poet_name = poet_name
+        self.language = language
+        self.changed_since = _to_naive(changed_since)
+        self.batch_size = max(1, batch_size)
+        self.counts: Dict[str, int] = {name: 0 for name in self.entities}
+        self.watermark: Optional[datetime] = self.changed_since
+
+    @property
+    def media_type(self) -> str:
+        return "application/x-ndjson" if self.fmt == "ndjson" else "text/csv"
+
+    @property
+    def extension(self) -> str:
+        return self.fmt
+
+    def _stmt(self, name: str):
+        spec = EXPORT_ENTITIES[name]
+        table = spec.model.__table__
+        stmt = select(*table.c)
+        if self.poet_name or (self.language and spec.language_column.table is not table):
+            for join in spec.joins:
+                stmt = join(stmt)
+
+        if self.since is not None:
+            stmt = stmt.where(table.c.created_at >= self.since)
+        if self.until is not None:
+            stmt = stmt.where(table.c.created_at < self.until)
+        if self.changed_since is not None:
+            stmt = stmt.where(table.c[spec.change_column] > self.changed_since)
+        if self.poet_name:
+            stmt = stmt.where(CRUDPoetSummary._key_expr() == CRUDPoetSummary.normalize(self.poet_name))
+        if self.language:
+            stmt = stmt.where(spec.language_column == self.language)
+        return stmt.order_by(table.c.id).execution_options(yield_per=self.batch_size)
+
+    def iter_rows(self, name: str) -> Iterator[Dict[str, Any]]:
+        """Rows of one entity as column dictionaries, fetched in batches"""
+        change_column = EXPORT_ENTITIES[name].change_column
+        for row in self.db.execute(self._stmt(name)).mappings():
+            changed_at = row[change_column]
+            if changed_at is not None and (self.watermark is None or changed_at > self.watermark):
+                self.watermark = changed_at
+            self.counts[name] += 1
+            yield row
+
+    def iter_lines(self) -> Iterator[str]:
+        """Output lines (NDJSON records or CSV rows)"""
+        if self.fmt == "csv":
+            yield from self._iter_csv_lines(self.entities[0])
+            return
+
+        for name in self.entities:
+            record_type = EXPORT_ENTITIES[name].record_type
+            for row in self.iter_rows(name):
+                yield json.dumps({"type": record_type, **row}, ensure_ascii=False, default=_json_default) + "\n"
+        yield json.dumps(self.summary(), ensure_ascii=False) + "\n"
+
+    def _iter_csv_lines(self, name: str) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        columns = [column.name for column in EXPORT_ENTITIES[name].model.__table__.c]
+        writer.writerow(columns)
+        for row in self.iter_rows(name):
+            writer.writerow([_csv_value(row[column]) for column in columns])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue()
+
+    def iter_bytes(self, compress: bool = False, chunk_bytes: int = CHUNK_BYTES) -> Iterator[bytes]:
+        """
+        Encoded output in chunks of roughly ``chunk_bytes``
+
+        Args:
+            compress: Gzip the output on the fly
+            chunk_bytes: Uncompressed bytes buffered before a chunk is emitted
+        """
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+        pending: List[bytes] = []
+        size = 0
+        for line in self.iter_lines():
+            data = line.encode("utf-8")
+            pending.append(data)
+            size += len(data)
+            if size >= chunk_bytes:
+                chunk = b"".join(pending)
+                pending.clear()
+                size = 0
+                chunk = compressor.compress(chunk) if compressor else chunk
+                if chunk:
+                    yield chunk
+
+        chunk = b"".join(pending)
+        if compressor:
+            chunk = compressor.compress(chunk) + compressor.flush()
+        if chunk:
+            yield chunk
+
+    def summary(self) -> Dict[str, Any]:
+        """Trailing NDJSON record: row counts and the watermark for the next incremental export"""
+        return {
+            "type": "export_end",
+            "counts": dict(self.counts),
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "exported_at": datetime.now(UTC_PLUS_8).isoformat(),
+        }
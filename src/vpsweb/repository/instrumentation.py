@@ -0,0 +1,209 @@
+"""
+VPSWeb Repository SQL Instrumentation
+
+Per-request query accounting hooked into SQLAlchemy engine events.
+Statements executed while a ``track_queries`` scope is active are counted,
+timed and grouped by statement shape (the SQL with literals and bound values
+collapsed), so repeated shapes within one request point at N+1 patterns.
+
+The same scope backs the ``X-DB-Queries``/``X-DB-Time`` response headers and
+the ``assert_max_queries`` helper used by tests to cap the query count of an
+endpoint or repository call.
+
+Every statement, inside a scope or not (background workflows), is also timed
+into the ``vpsweb_db_query_duration_seconds`` histogram by SQL verb.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from vpsweb.utils.metrics import DB_QUERY_SECONDS
+
+from .settings import settings
+
+logger = logging.getLogger("vpsweb.repository.sql")
+slow_query_logger = logging.getLogger("vpsweb.repository.sql.slow")
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("vpsweb_query_stats", default=None)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_POSTCOMPILE = re.compile(r"\(?__\[POSTCOMPILE_\w+\]\)?")
+_WHITESPACE = re.compile(r"\s+")
+
+# Histogram label values; other statements (PRAGMA, BEGIN, ...) count as OTHER
+_STATEMENT_VERBS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce a SQL statement to its shape.
+
+    String and numeric literals become ``?`` and ``IN`` lists of any length
+    collapse to ``(?)``, so the same query issued for different rows yields
+    the same shape.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _POSTCOMPILE.sub("(?)", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryStats:
+    """Queries executed within one tracking scope"""
+
+    route: Optional[str] = None
+    query_count: int = 0
+    total_time: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    slow_queries: List[Tuple[str, float]] = field(default_factory=list)
+
+    @property
+    def total_time_ms(self) -> float:
+        """Total database time in milliseconds"""
+        return self.total_time * 1000
+
+    def record(self, statement: str, duration: float) -> None:
+        """Account for one executed statement"""
+        self.query_count += 1
+        self.total_time += duration
+        self.shapes[normalize_statement(statement)] += 1
+
+    def repeated_statements(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Statement shapes executed at least ``threshold`` times.
+
+        Args:
+            threshold: Minimum repetitions, defaults to ``settings.n_plus_one_threshold``
+
+        Returns:
+            List of (shape, count) tuples, most repeated first
+        """
+        threshold = threshold or settings.n_plus_one_threshold
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    def to_dict(self) -> dict:
+        """Summary suitable for performance logs"""
+        return {
+            "route": self.route,
+            "db_queries": self.query_count,
+            "db_time_ms": round(self.total_time_ms, 2),
+            "db_repeated_statements": len(self.repeated_statements()),
+            "db_slow_queries": len(self.slow_queries),
+        }
+
+
+def log_repeated_statements(stats: QueryStats, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+    """
+    Warn about statement shapes repeated within one scope (likely N+1 queries).
+
+    Returns:
+        The repeated (shape, count) tuples that were logged
+    """
+    repeated = stats.repeated_statements(threshold)
+    for shape, count in repeated:
+        logger.warning(
+            "Possible N+1 on %s: statement executed %d times: %s",
+            stats.route or "<no route>",
+            count,
+            shape,
+        )
+    return repeated
+
+
+def get_current_stats() -> Optional[QueryStats]:
+    """Return the stats of the active tracking scope, if any"""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(route: Optional[str] = None) -> Iterator[QueryStats]:
+    """
+    Count the queries executed inside the block.
+
+    Scopes do not nest: an inner scope replaces the outer one until it exits.
+    The stats object is shared with tasks and threadpool workers spawned from
+    the block, since they inherit the current context.
+    """
+    stats = QueryStats(route=route)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int, route: Optional[str] = None) -> Iterator[QueryStats]:
+    """
+    Fail when the block executes more than ``limit`` queries.
+
+    Example:
+        with assert_max_queries(6):
+            repo.get_poem_aggregate(poem_id)
+
+    Raises:
+        AssertionError: Listing the executed statement shapes
+    """
+    with track_queries(route=route) as stats:
+        yield stats
+    if stats.query_count > limit:
+        details = "\n".join(f"  {count}x {shape}" for shape, count in stats.shapes.most_common())
+        raise AssertionError(f"Expected at most {limit} queries, {stats.query_count} were executed:\n{details}")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._vpsweb_query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_vpsweb_query_start", None)
+    if start is None:
+        return
+    duration = time.perf_counter() - start
+    DB_QUERY_SECONDS.observe(duration, _statement_verb(statement))
+
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.record(statement, duration)
+
+    if duration * 1000 >= settings.slow_query_ms:
+        stats.slow_queries.append((statement, duration))
+        slow_query_logger.warning(
+            "Slow query (%.2fms) on %s: %s",
+            duration * 1000,
+            stats.route or "<no route>",
+            _WHITESPACE.sub(" ", statement).strip(),
+        )
+
+
+def _statement_verb(statement: str) -> str:
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return verb if verb in _STATEMENT_VERBS else "OTHER"
+
+
+def install_query_instrumentation() -> None:
+    """
+    Register the cursor execute listeners on all engines.
+
+    Idempotent. Outside a ``track_queries`` scope listeners only time the
+    statement into the latency histogram.
+    """
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,383 @@
+"""
+VPSWeb Repository Database Maintenance
+
+Keeps the SQLite planner statistics fresh and returns free pages to the
+file system, in short budgeted runs while the application is idle.
+
+Each run:
+
+- runs ``ANALYZE`` (with ``PRAGMA analysis_limit``) on tables that were never
+  analyzed or whose row count drifted from the count recorded in
+  ``sqlite_stat1``, one table at a time, followed by ``PRAGMA optimize``;
+- releases free pages with ``PRAGMA incremental_vacuum`` in small steps.
+  Databases created by the application are incremental from the start
+  (``database.py`` sets the pragma on connect). An older file created
+  without ``auto_vacuum = INCREMENTAL`` needs a full
+  ``VACUUM`` to convert, which locks out writers for its whole run; that is
+  opt-in (``vacuum_convert_max_bytes`` is 0 by default) and skipped when its
+  estimated duration does not fit in the remaining budget;
+- records page, freelist and per-index page counts in ``maintenance_runs``.
+
+Work stops once the time budget is spent and resumes on the next run.
+``MaintenanceScheduler`` triggers runs from the web application.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import create_engine, delete, desc, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool
+
+from .backup import database_path_from_url
+from .models import UTC_PLUS_8, MaintenanceRun
+from .settings import settings
+
+logger = logging.getLogger("vpsweb.repository.maintenance")
+
+# ``PRAGMA auto_vacuum`` values
+AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+# Relative row count change that makes a table's statistics stale
+STALE_ROW_RATIO = 0.1
+
+# Maintenance runs kept in the history table
+HISTORY_ROWS = 1000
+
+# Seconds between idle checks of the scheduler
+CHECK_INTERVAL_SECONDS = 30.0
+
+# Conservative full VACUUM rate used to estimate whether a conversion fits the budget
+VACUUM_BYTES_PER_SECOND = 20 * 1024 * 1024
+
+
+class MaintenanceManager:
+    """
+    Budgeted ANALYZE/optimize/incremental vacuum runs on one database
+
+    Example:
+        manager = MaintenanceManager.from_settings()
+        result = manager.run(budget_seconds=2.0)
+        print(result["vacuumed_pages"], result["fragmentation"])
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        budget_seconds: float = 5.0,
+        analysis_limit: int = 1000,
+        vacuum_pages_per_step: int = 256,
+        vacuum_convert_max_bytes: int = 0,
+    ):
+        """
+        Args:
+            engine: Engine for the database; runs hold one connection for their duration
+            budget_seconds: Wall-clock time after which a run stops starting new work
+            analysis_limit: Rows sampled per index by ``ANALYZE`` (0 for a full scan)
+            vacuum_pages_per_step: Free pages released per incremental vacuum step
+            vacuum_convert_max_bytes: Largest database converted to incremental auto-vacuum
+                with a full VACUUM; 0 never converts
+        """
+        self.engine = engine
+        self.budget_seconds = budget_seconds
+        self.analysis_limit = max(0, analysis_limit)
+        self.vacuum_pages_per_step = max(1, vacuum_pages_per_step)
+        self.vacuum_convert_max_bytes = vacuum_convert_max_bytes
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_settings(cls) -> "MaintenanceManager":
+        """
+        Manager for the configured repository database, on a connection of its own
+
+        Raises:
+            BackupError: If the database is not a file-backed SQLite database
+        """
+        database_path = database_path_from_url(settings.database_url)
+        engine = create_engine(f"sqlite:///{database_path}", poolclass=NullPool, connect_args={"timeout": 20})
+        return cls(
+            engine,
+            budget_seconds=settings.maintenance_budget_seconds,
+            analysis_limit=settings.maintenance_analysis_limit,
+            vacuum_pages_per_step=settings.maintenance_vacuum_pages_per_step,
+            vacuum_convert_max_bytes=int(settings.maintenance_vacuum_convert_max_mb * 1024 * 1024),
+        )
+
+    def storage_stats(self, conn: Optional[Connection] = None) -> Dict[str, Any]:
+        """Page size, page and freelist counts, fragmentation and auto-vacuum mode"""
+        if conn is None:
+            with self.engine.connect() as conn:
+                return self.storage_stats(conn)
+
+        def pragma(name):
+            return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+        page_size, page_count, freelist_count = pragma("page_size"), pragma("page_count"), pragma("freelist_count")
+        return {
+            "page_size": page_size,
+            "page_count": page_count,
+            "freelist_count": freelist_count,
+            "file_bytes": page_size * page_count,
+            "free_bytes": page_size * freelist_count,
+            "fragmentation": round(freelist_count / page_count, 4) if page_count else 0.0,
+            "auto_vacuum": AUTO_VACUUM_MODES.get(pragma("auto_vacuum"), "unknown"),
+        }
+
+    @staticmethod
+    def index_stats(conn: Connection) -> Dict[str, Dict[str, Any]]:
+        """Pages used by each index, from the ``dbstat`` virtual table when SQLite provides it"""
+        try:
+            rows = conn.exec_driver_sql(
+                "SELECT d.name, m.tbl_name, COUNT(*) FROM dbstat d JOIN sqlite_master m ON m.name = d.name "
+                "WHERE m.type = 'index' GROUP BY d.name"
+            ).all()
+        except OperationalError:
+            return {}
+        return {name: {"table": table, "pages": pages} for name, table, pages in rows}
+
+    @staticmethod
+    def stale_tables(conn: Connection) -> List[str]:
+        """Tables never analyzed or whose row count moved more than ``STALE_ROW_RATIO`` since"""
+        tables = conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        ).scalars()
+        analyzed: Dict[str, int] = {}
+        has_stat1 = conn.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").scalar()
+        if has_stat1:
+            for table, stat in conn.exec_driver_sql("SELECT tbl, stat FROM sqlite_stat1").all():
+                analyzed[table] = max(analyzed.get(table, 0), int((stat or "0").split()[0]))
+
+        stale = []
+        for table in list(tables):
+            rows = conn.exec_driver_sql(f'SELECT COUNT(*) FROM "{table}"').scalar()
+            if table not in analyzed:
+                if rows:
+                    stale.append(table)
+            elif abs(rows - analyzed[table]) > STALE_ROW_RATIO * max(analyzed[table], 1):
+                stale.append(table)
+        return stale
+
+    def run(self, trigger: str = "manual", budget_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run one budgeted maintenance pass and record it in ``maintenance_runs``
+
+        Failures are recorded in the result (and the history row) rather than raised.
+        """
+        budget = self.budget_seconds if budget_seconds is None else budget_seconds
+        started_at = datetime.now(UTC_PLUS_8)
+        start = time.perf_counter()
+        deadline = start + budget
+        analyzed: List[str] = []
+        vacuumed = 0
+        exhausted = False
+        error = None
+
+        with self.engine.connect() as conn:
+            try:
+                conn.exec_driver_sql(f"PRAGMA analysis_limit = {self.analysis_limit}")
+                for table in self.stale_tables(conn):
+                    if time.perf_counter() >= deadline:
+                        exhausted = True
+                        break
+                    conn.exec_driver_sql(f'ANALYZE "{table}"')
+                    analyzed.append(table)
+                conn.exec_driver_sql("PRAGMA optimize")
+                conn.commit()
+
+                if not exhausted:
+                    vacuumed, exhausted = self._vacuum(conn, deadline)
+            except OperationalError as e:
+                # Typically "database is locked": the remaining work is left for the next run
+                conn.rollback()
+                error = str(e.orig)
+                logger.warning(f"Database maintenance interrupted: {error}")
+
+            stats = self.storage_stats(conn)
+            indexes = self.index_stats(conn)
+            result = {
+                "started_at": started_at.isoformat(),
+                "trigger": trigger,
+                "duration_ms": (time.perf_counter() - start) * 1000,
+                "analyzed_tables": analyzed,
+                "vacuumed_pages": vacuumed,
+                "budget_exhausted": exhausted,
+                "error": error,
+                **stats,
+                "index_stats": indexes,
+            }
+            self._record(conn, result)
+
+        self.last_run = result
+        logger.info(
+            f"Database maintenance in {result['duration_ms']:.0f} ms: analyzed {len(analyzed)} tables, "
+            f"released {vacuumed} pages, fragmentation {stats['fragmentation']:.1%}"
+        )
+        return result
+
+    def _vacuum(self, conn: Connection, deadline: float):
+        """Release free pages until none are left or the deadline passes; returns (pages, exhausted)"""
+        stats = self.storage_stats(conn)
+        if not stats["freelist_count"]:
+            return 0, False
+
+        if stats["auto_vacuum"] == "none":
+            if stats["file_bytes"] > self.vacuum_convert_max_bytes:
+                logger.info("Database too large to convert to incremental auto-vacuum during maintenance")
+                return 0, False
+            # The VACUUM cannot be interrupted and blocks writers, so it has to fit in what is left
+            remaining = deadline - time.perf_counter()
+            if stats["file_bytes"] / VACUUM_BYTES_PER_SECOND > remaining:
+                logger.info("Converting to incremental auto-vacuum does not fit in the remaining budget")
+                return 0, True
+            # One-off rebuild that switches the file to incremental auto-vacuum
+            conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.exec_driver_sql("VACUUM")
+            return stats["freelist_count"], False
+
+        vacuumed = 0
+        while time.perf_counter() < deadline:
+            free = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+            if not free:
+                return vacuumed, False
+            step = min(free, self.vacuum_pages_per_step)
+            conn.commit()
+            # The pragma frees one page per VM step and execute() stops after the
+            # first; executescript() steps the statement to completion
+            conn.connection.driver_connection.executescript(f"PRAGMA incremental_vacuum({step})")
+            vacuumed += step
+        return vacuumed, True
+
+    def _record(self, conn: Connection, result: Dict[str, Any]) -> None:
+        table = MaintenanceRun.__table__
+        try:
+            conn.execute(
+                insert(table).values(
+                    started_at=datetime.fromisoformat(result["started_at"]).replace(tzinfo=None),
+                    trigger=result["trigger"],
+                    duration_ms=result["duration_ms"],
+                    page_size=result["page_size"],
+                    page_count=result["page_count"],
+                    freelist_count=result["freelist_count"],
+                    index_stats=json.dumps(result["index_stats"]),
+                    analyzed_tables=json.dumps(result["analyzed_tables"]),
+                    vacuumed_pages=result["vacuumed_pages"],
+                    budget_exhausted=result["budget_exhausted"],
+                    error=result["error"],
+                )
+            )
+            keep_from = conn.execute(
+                select(table.c.id).order_by(desc(table.c.id)).offset(HISTORY_ROWS - 1).limit(1)
+            ).scalar()
+            if keep_from is not None:
+                conn.execute(delete(table).where(table.c.id < keep_from))
+            conn.commit()
+        except OperationalError as e:
+            conn.rollback()
+            logger.warning(f"Could not record maintenance run: {e.orig}")
+
+    def history(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent recorded runs, newest first"""
+        table = MaintenanceRun.__table__
+        try:
+            with self.engine.connect() as conn:
+                rows = conn.execute(select(table).order_by(desc(table.c.id)).limit(limit)).mappings().all()
+        except OperationalError:
+            # maintenance_runs does not exist before the migration is applied
+            return []
+        return [
+            {
+                **row,
+                "started_at": row["started_at"].replace(tzinfo=UTC_PLUS_8),
+                "index_stats": json.loads(row["index_stats"]),
+                "analyzed_tables": json.loads(row["analyzed_tables"]),
+                "fragmentation": round(row["freelist_count"] / row["page_count"], 4) if row["page_count"] else 0.0,
+            }
+            for row in rows
+        ]
+
+
+class MaintenanceScheduler:
+    """
+    Runs database maintenance from the web application when it is idle
+
+    Every ``CHECK_INTERVAL_SECONDS`` the scheduler checks whether a run is
+    due (``interval_seconds`` since the last one) and ``is_idle()`` holds;
+    the run itself happens in a worker thread. An interval of 0 disables
+    scheduling; ``run_now`` still works.
+    """
+
+    def __init__(
+        self,
+        manager: MaintenanceManager,
+        interval_seconds: float,
+        is_idle: Callable[[], bool] = lambda: True,
+    ):
+        self.manager = manager
+        self.interval_seconds = max(0.0, interval_seconds)
+        self.is_idle = is_idle
+        self.last_run_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_settings(cls, is_idle: Callable[[], bool] = lambda: True) -> "MaintenanceScheduler":
+        return cls(MaintenanceManager.from_settings(), settings.maintenance_interval_hours * 3600, is_idle)
+
+    def start(self) -> None:
+        if self.interval_seconds and self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run_now(self, trigger: str = "manual") -> Dict[str, Any]:
+        async with self._lock:
+            result = await asyncio.to_thread(self.manager.run, trigger)
+            self.last_run_at = time.time()
+            return result
+
+    async def _loop(self) -> None:
+        # Runs recorded by earlier processes count towards the schedule
+        history = await asyncio.to_thread(self.manager.history, 1)
+        if history:
+            self.last_run_at = history[0]["started_at"].timestamp()
+        while True:
+            await asyncio.sleep(CHECK_INTERVAL_SECONDS)
+            due = self.last_run_at is None or time.time() - self.last_run_at >= self.interval_seconds
+            if due and self.is_idle() and not self._lock.locked():
+                try:
+                    await self.run_now(trigger="scheduled")
+                except Exception as e:
+                    logger.error(f"Scheduled database maintenance failed: {e}")
+
+    async def health(self) -> Dict[str, Any]:
+        """Current fragmentation and the time of the last maintenance run"""
+        stats = await asyncio.to_thread(self.manager.storage_stats)
+        last_run = self.manager.last_run
+        if last_run is None:
+            history = await asyncio.to_thread(self.manager.history, 1)
+            last_run_at = history[0]["started_at"].isoformat() if history else None
+        else:
+            last_run_at = last_run["started_at"]
+        return {**stats, "last_maintenance_at": last_run_at}
+
+    async def status(self, limit: int = 20) -> Dict[str, Any]:
+        return {
+            "scheduled": self._task is not None,
+            "interval_seconds": self.interval_seconds,
+            "running": self._lock.locked(),
+            "budget_seconds": self.manager.budget_seconds,
+            "storage": await self.health(),
+            "history": await asyncio.to_thread(self.manager.history, limit),
+        }
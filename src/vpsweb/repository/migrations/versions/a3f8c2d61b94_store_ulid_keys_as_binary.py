@@ -0,0 +1,103 @@
+"""Store ULID primary and foreign keys as 16-byte BLOBs
+
+Revision ID: a3f8c2d61b94
+Revises: f5c2e7d90a13
+Create Date: 2026-10-18 21:52:06.418305
+
+Key values are rewritten in place. SQLite column affinity never alters BLOB
+values, so the declared VARCHAR(26) types are kept and no table is rebuilt;
+databases created from the models declare BLOB instead, with identical
+behavior. Keys that are not valid ULIDs stay TEXT.
+
+"""
+
+import re
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f8c2d61b94"
+down_revision: Union[str, Sequence[str], None] = "f5c2e7d90a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Distinct key values converted per batch
+CONVERT_BATCH_SIZE = 1000
+
+# Key columns holding ULIDs, primary keys before the foreign keys referencing them
+ULID_COLUMNS = (
+    ("poems", "id"),
+    ("translations", "id"),
+    ("translations", "poem_id"),
+    ("ai_logs", "id"),
+    ("ai_logs", "translation_id"),
+    ("human_notes", "id"),
+    ("human_notes", "translation_id"),
+    ("translation_workflow_steps", "id"),
+    ("translation_workflow_steps", "translation_id"),
+    ("translation_workflow_steps", "ai_log_id"),
+    ("translation_payloads", "translation_id"),
+    ("background_briefing_reports", "id"),
+    ("background_briefing_reports", "poem_id"),
+    ("poem_translation_stats", "poem_id"),
+)
+
+# Frozen copy of the ULID codec at the time of this revision
+CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_ULID_PATTERN = re.compile(r"^[0-7][0123456789ABCDEFGHJKMNPQRSTVWXYZ]{25}$")
+_TO_INT_DIGITS = str.maketrans(CROCKFORD_BASE32, "0123456789abcdefghijklmnopqrstuv")
+
+
+def _to_binary(value: str):
+    if not _ULID_PATTERN.match(value):
+        return None
+    return int(value.translate(_TO_INT_DIGITS), 32).to_bytes(16, "big")
+
+
+def _to_text(value: bytes):
+    if len(value) != 16:
+        return None
+    number = int.from_bytes(value, "big")
+    return "".join(CROCKFORD_BASE32[(number >> shift) & 0x1F] for shift in range(125, -1, -5))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _convert_keys("text", _to_binary)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _convert_keys("blob", _to_text)
+
+
+def _convert_keys(storage_class: str, convert) -> None:
+    """Rewrite the key values of one storage class with ``convert`` (None keeps a value)"""
+    conn = op.get_bind()
+    # Parent and child keys are rewritten one column at a time; check foreign
+    # keys (if enforced) only when the transaction commits
+    conn.execute(sa.text("PRAGMA defer_foreign_keys = ON"))
+
+    for table, column in ULID_COLUMNS:
+        select_batch = sa.text(
+            f"SELECT DISTINCT {column} AS value FROM {table} "
+            f"WHERE typeof({column}) = :storage_class AND {column} > :last "
+            f"ORDER BY {column} LIMIT :limit"
+        )
+        update = sa.text(f"UPDATE {table} SET {column} = :new WHERE {column} = :old")
+
+        last = "" if storage_class == "text" else b""
+        while True:
+            values = (
+                conn.execute(select_batch, {"storage_class": storage_class, "last": last, "limit": CONVERT_BATCH_SIZE})
+                .scalars()
+                .all()
+            )
+            if not values:
+                break
+            changes = [{"old": value, "new": new} for value in values if (new := convert(value)) is not None]
+            if changes:
+                conn.execute(update, changes)
+            last = values[-1]
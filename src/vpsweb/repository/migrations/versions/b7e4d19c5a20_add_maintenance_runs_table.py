@@ -0,0 +1,45 @@
+"""Add maintenance_runs table for database maintenance statistics
+
+Revision ID: b7e4d19c5a20
+Revises: a3f8c2d61b94
+Create Date: 2026-10-19 09:12:37.540218
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4d19c5a20"
+down_revision: Union[str, Sequence[str], None] = "a3f8c2d61b94"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "maintenance_runs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("trigger", sa.String(length=20), nullable=False),
+        sa.Column("duration_ms", sa.Float(), nullable=False),
+        sa.Column("page_size", sa.Integer(), nullable=False),
+        sa.Column("page_count", sa.Integer(), nullable=False),
+        sa.Column("freelist_count", sa.Integer(), nullable=False),
+        sa.Column("index_stats", sa.Text(), nullable=False),
+        sa.Column("analyzed_tables", sa.Text(), nullable=False),
+        sa.Column("vacuumed_pages", sa.Integer(), nullable=False),
+        sa.Column("budget_exhausted", sa.Boolean(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_maintenance_runs_started_at", "maintenance_runs", ["started_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_maintenance_runs_started_at", table_name="maintenance_runs")
+    op.drop_table("maintenance_runs")
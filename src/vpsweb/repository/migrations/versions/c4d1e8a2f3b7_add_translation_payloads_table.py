@@ -0,0 +1,123 @@
+"""Add compressed translation_payloads side table and backfill from workflow steps
+
+Revision ID: c4d1e8a2f3b7
+Revises: 1fae562162e3
+Create Date: 2026-10-18 10:12:41.218305
+
+"""
+
+import json
+import zlib
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d1e8a2f3b7"
+down_revision: Union[str, Sequence[str], None] = "1fae562162e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Translations processed per backfill batch
+BACKFILL_BATCH_SIZE = 200
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "translation_payloads",
+        sa.Column("translation_id", sa.String(length=26), nullable=False),
+        sa.Column("encoding", sa.String(length=10), nullable=False, server_default="zlib"),
+        sa.Column("raw_size", sa.Integer(), nullable=False),
+        sa.Column("compressed_size", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.CheckConstraint("encoding IN ('zlib')", name="ck_translation_payloads_encoding"),
+        sa.ForeignKeyConstraint(["translation_id"], ["translations.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("translation_id"),
+    )
+
+    _backfill_payloads()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("translation_payloads")
+
+
+def _backfill_payloads() -> None:
+    """Archive the step results of existing AI translations into translation_payloads"""
+    conn = op.get_bind()
+    payloads = sa.table(
+        "translation_payloads",
+        sa.column("translation_id", sa.String),
+        sa.column("encoding", sa.String),
+        sa.column("raw_size", sa.Integer),
+        sa.column("compressed_size", sa.Integer),
+        sa.column("data", sa.LargeBinary),
+    )
+
+    translation_ids = [
+        row[0]
+        for row in conn.execute(
+            sa.text("SELECT DISTINCT translation_id FROM translation_workflow_steps ORDER BY translation_id")
+        )
+    ]
+
+    for start in range(0, len(translation_ids), BACKFILL_BATCH_SIZE):
+        batch = translation_ids[start : start + BACKFILL_BATCH_SIZE]
+        steps = conn.execute(
+            sa.text(
+                "SELECT translation_id, step_type, content, notes, model_info, tokens_used, "
+                "prompt_tokens, completion_tokens, duration_seconds, cost, additional_metrics "
+                "FROM translation_workflow_steps WHERE translation_id IN :ids "
+                "ORDER BY translation_id, step_order"
+            ).bindparams(sa.bindparam("ids", expanding=True)),
+            {"ids": batch},
+        ).mappings()
+
+        documents = {}
+        for step in steps:
+            document = documents.setdefault(
+                step["translation_id"],
+                {"status": "completed", "steps_executed": [], "results": {}, "backfilled": True},
+            )
+            document["steps_executed"].append(step["step_type"])
+            document["results"][step["step_type"]] = {
+                "content": step["content"],
+                "notes": step["notes"],
+                "model_info": _parse_json(step["model_info"]),
+                "tokens_used": step["tokens_used"],
+                "prompt_tokens": step["prompt_tokens"],
+                "completion_tokens": step["completion_tokens"],
+                "duration": step["duration_seconds"],
+                "cost": step["cost"],
+                "additional_metrics": _parse_json(step["additional_metrics"]),
+            }
+
+        rows = []
+        for translation_id, document in documents.items():
+            raw = json.dumps(document, ensure_ascii=False).encode("utf-8")
+            compressed = zlib.compress(raw)
+            rows.append(
+                {
+                    "translation_id": translation_id,
+                    "encoding": "zlib",
+                    "raw_size": len(raw),
+                    "compressed_size": len(compressed),
+                    "data": compressed,
+                }
+            )
+        if rows:
+            op.bulk_insert(payloads, rows)
+
+
+def _parse_json(value):
+    """Parse a JSON text column, keeping unparseable values as strings"""
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except (TypeError, ValueError):
+        return value
@@ -0,0 +1,43 @@
+"""Add prompt_hash to ai_logs and translation_workflow_steps
+
+Revision ID: c8e2a5f17d34
+Revises: b7e4d19c5a20
+Create Date: 2026-10-19 14:03:52.918364
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e2a5f17d34"
+down_revision: Union[str, Sequence[str], None] = "b7e4d19c5a20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("ai_logs", sa.Column("prompt_hash", sa.String(length=64), nullable=True))
+    op.create_index("idx_ai_logs_prompt_hash", "ai_logs", ["prompt_hash"], unique=False)
+
+    op.add_column("translation_workflow_steps", sa.Column("prompt_hash", sa.String(length=64), nullable=True))
+    op.create_index(
+        "idx_workflow_steps_prompt_hash",
+        "translation_workflow_steps",
+        ["step_type", "prompt_hash"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_workflow_steps_prompt_hash", table_name="translation_workflow_steps")
+    with op.batch_alter_table("translation_workflow_steps", schema=None) as batch_op:
+        batch_op.drop_column("prompt_hash")
+
+    op.drop_index("idx_ai_logs_prompt_hash", table_name="ai_logs")
+    with op.batch_alter_table("ai_logs", schema=None) as batch_op:
+        batch_op.drop_column("prompt_hash")
@@ -0,0 +1,63 @@
+"""Add denormalized poem_translation_stats table and backfill from translations
+
+Revision ID: d7a2f9c41e05
+Revises: c4d1e8a2f3b7
+Create Date: 2026-10-18 14:37:09.512640
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a2f9c41e05"
+down_revision: Union[str, Sequence[str], None] = "c4d1e8a2f3b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "poem_translation_stats",
+        sa.Column("poem_id", sa.String(length=26), nullable=False),
+        sa.Column("translation_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("ai_translation_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("human_translation_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_translation_at", sa.DateTime(), nullable=True),
+        sa.Column("last_activity_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["poem_id"], ["poems.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("poem_id"),
+    )
+    op.create_index(
+        op.f("ix_poem_translation_stats_last_activity_at"),
+        "poem_translation_stats",
+        ["last_activity_at"],
+        unique=False,
+    )
+
+    # Backfill counters for poems that already have translations
+    op.execute(
+        """
+        INSERT INTO poem_translation_stats (
+            poem_id, translation_count, ai_translation_count, human_translation_count,
+            last_translation_at, last_activity_at
+        )
+        SELECT poem_id,
+               COUNT(id),
+               SUM(CASE WHEN translator_type = 'ai' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN translator_type = 'human' THEN 1 ELSE 0 END),
+               MAX(created_at),
+               MAX(created_at)
+        FROM translations
+        GROUP BY poem_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_poem_translation_stats_last_activity_at"), table_name="poem_translation_stats")
+    op.drop_table("poem_translation_stats")
@@ -0,0 +1,169 @@
+"""Add materialized poets summary table and backfill from poems and translations
+
+Revision ID: e3b9a6c1d842
+Revises: d7a2f9c41e05
+Create Date: 2026-10-18 16:05:52.804113
+
+"""
+
+import json
+from datetime import datetime
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b9a6c1d842"
+down_revision: Union[str, Sequence[str], None] = "d7a2f9c41e05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "poets",
+        sa.Column("poet_key", sa.String(length=200), nullable=False),
+        sa.Column("poet_name", sa.String(length=200), nullable=False),
+        sa.Column("poem_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("translation_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("ai_translation_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("human_translation_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("avg_quality_rating", sa.Float(), nullable=True),
+        sa.Column("ai_avg_quality_rating", sa.Float(), nullable=True),
+        sa.Column("human_avg_quality_rating", sa.Float(), nullable=True),
+        sa.Column("source_languages", sa.Text(), nullable=False, server_default="[]"),
+        sa.Column("target_languages", sa.Text(), nullable=False, server_default="[]"),
+        sa.Column("language_pairs", sa.Text(), nullable=False, server_default="[]"),
+        sa.Column("first_poem_at", sa.DateTime(), nullable=True),
+        sa.Column("last_poem_at", sa.DateTime(), nullable=True),
+        sa.Column("first_translation_at", sa.DateTime(), nullable=True),
+        sa.Column("last_translation_at", sa.DateTime(), nullable=True),
+        sa.Column("last_activity_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("poet_key"),
+    )
+    op.create_index("idx_poets_poet_name", "poets", ["poet_name"], unique=False)
+    op.create_index("idx_poets_poem_count", "poets", ["poem_count"], unique=False)
+    op.create_index("idx_poets_translation_count", "poets", ["translation_count"], unique=False)
+    op.create_index("idx_poets_last_activity_at", "poets", ["last_activity_at"], unique=False)
+    # Summary refreshes look up poems by the normalized poet name
+    op.create_index("idx_poems_poet_key", "poems", [sa.text("lower(trim(poet_name))")], unique=False)
+
+    _backfill_poets()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_poems_poet_key", table_name="poems")
+    op.drop_index("idx_poets_last_activity_at", table_name="poets")
+    op.drop_index("idx_poets_translation_count", table_name="poets")
+    op.drop_index("idx_poets_poem_count", table_name="poets")
+    op.drop_index("idx_poets_poet_name", table_name="poets")
+    op.drop_table("poets")
+
+
+def _backfill_poets() -> None:
+    """Aggregate existing poems and translations per normalized poet name"""
+    conn = op.get_bind()
+    poets = sa.table(
+        "poets",
+        sa.column("poet_key", sa.String),
+        sa.column("poet_name", sa.String),
+        sa.column("poem_count", sa.Integer),
+        sa.column("translation_count", sa.Integer),
+        sa.column("ai_translation_count", sa.Integer),
+        sa.column("human_translation_count", sa.Integer),
+        sa.column("avg_quality_rating", sa.Float),
+        sa.column("ai_avg_quality_rating", sa.Float),
+        sa.column("human_avg_quality_rating", sa.Float),
+        sa.column("source_languages", sa.Text),
+        sa.column("target_languages", sa.Text),
+        sa.column("language_pairs", sa.Text),
+        sa.column("first_poem_at", sa.DateTime),
+        sa.column("last_poem_at", sa.DateTime),
+        sa.column("first_translation_at", sa.DateTime),
+        sa.column("last_translation_at", sa.DateTime),
+        sa.column("last_activity_at", sa.DateTime),
+    )
+
+    keys = [row[0] for row in conn.execute(sa.text("SELECT DISTINCT lower(trim(poet_name)) FROM poems"))]
+    rows = []
+    for key in keys:
+        poems = conn.execute(
+            sa.text(
+                "SELECT poet_name, COUNT(id), MIN(created_at), MAX(created_at) FROM poems "
+                "WHERE lower(trim(poet_name)) = :key GROUP BY poet_name ORDER BY MAX(created_at) DESC"
+            ),
+            {"key": key},
+        ).all()
+        sources = conn.execute(
+            sa.text("SELECT DISTINCT source_language FROM poems WHERE lower(trim(poet_name)) = :key"),
+            {"key": key},
+        ).scalars()
+        pairs = conn.execute(
+            sa.text(
+                "SELECT p.source_language, t.target_language, COUNT(t.id) FROM translations t "
+                "JOIN poems p ON p.id = t.poem_id WHERE lower(trim(p.poet_name)) = :key "
+                "GROUP BY p.source_language, t.target_language"
+            ),
+            {"key": key},
+        ).all()
+        types = {
+            row[0]: row
+            for row in conn.execute(
+                sa.text(
+                    "SELECT t.translator_type, COUNT(t.id), AVG(t.quality_rating), "
+                    "MIN(t.created_at), MAX(t.created_at), SUM(t.quality_rating), COUNT(t.quality_rating) "
+                    "FROM translations t JOIN poems p ON p.id = t.poem_id "
+                    "WHERE lower(trim(p.poet_name)) = :key GROUP BY t.translator_type"
+                ),
+                {"key": key},
+            )
+        }
+
+        first_poem_at = _as_datetime(min((row[2] for row in poems if row[2] is not None), default=None))
+        last_poem_at = _as_datetime(max((row[3] for row in poems if row[3] is not None), default=None))
+        first_translation_at = _as_datetime(min((row[3] for row in types.values() if row[3] is not None), default=None))
+        last_translation_at = _as_datetime(max((row[4] for row in types.values() if row[4] is not None), default=None))
+        rating_sum = sum(row[5] or 0 for row in types.values())
+        rated = sum(row[6] for row in types.values())
+        rows.append(
+            {
+                "poet_key": key,
+                "poet_name": poems[0][0],
+                "poem_count": sum(row[1] for row in poems),
+                "translation_count": sum(row[1] for row in types.values()),
+                "ai_translation_count": types["ai"][1] if "ai" in types else 0,
+                "human_translation_count": types["human"][1] if "human" in types else 0,
+                "avg_quality_rating": rating_sum / rated if rated else None,
+                "ai_avg_quality_rating": types["ai"][2] if "ai" in types else None,
+                "human_avg_quality_rating": types["human"][2] if "human" in types else None,
+                "source_languages": json.dumps(sorted(sources), ensure_ascii=False),
+                "target_languages": json.dumps(sorted({row[1] for row in pairs}), ensure_ascii=False),
+                "language_pairs": json.dumps(
+                    [
+                        {"source_language": source, "target_language": target, "translation_count": count}
+                        for source, target, count in sorted(pairs, key=lambda row: (-row[2], row[0], row[1]))
+                    ],
+                    ensure_ascii=False,
+                ),
+                "first_poem_at": first_poem_at,
+                "last_poem_at": last_poem_at,
+                "first_translation_at": first_translation_at,
+                "last_translation_at": last_translation_at,
+                "last_activity_at": max(
+                    (date for date in (last_poem_at, last_translation_at) if date is not None), default=None
+                ),
+            }
+        )
+
+    if rows:
+        op.bulk_insert(poets, rows)
+
+
+def _as_datetime(value):
+    """Parse a raw SQLite timestamp string"""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
@@ -0,0 +1,68 @@
+"""Add poems.content_hash for duplicate detection and backfill existing poems
+
+Revision ID: f5c2e7d90a13
+Revises: e3b9a6c1d842
+Create Date: 2026-10-18 18:22:40.173956
+
+"""
+
+import hashlib
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f5c2e7d90a13"
+down_revision: Union[str, Sequence[str], None] = "e3b9a6c1d842"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Poems hashed per backfill batch
+BACKFILL_BATCH_SIZE = 500
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("poems", sa.Column("content_hash", sa.String(length=64), nullable=True))
+    op.create_index("idx_poems_content_hash", "poems", ["content_hash"], unique=False)
+
+    _backfill_content_hashes()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_poems_content_hash", table_name="poems")
+    with op.batch_alter_table("poems", schema=None) as batch_op:
+        batch_op.drop_column("content_hash")
+
+
+def _content_hash(poet_name: str, poem_title: str, original_text: str) -> str:
+    # Frozen copy of models.compute_content_hash at the time of this revision
+    parts = (" ".join(value.split()).casefold() for value in (poet_name, poem_title, original_text))
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _backfill_content_hashes() -> None:
+    """Hash the poet, title and text of every existing poem"""
+    conn = op.get_bind()
+    update = sa.text("UPDATE poems SET content_hash = :content_hash WHERE id = :id")
+
+    last_id = ""
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT id, poet_name, poem_title, original_text FROM poems WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            update,
+            [
+                {"id": row.id, "content_hash": _content_hash(row.poet_name, row.poem_title, row.original_text)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
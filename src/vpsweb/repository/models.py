@@ -5,6 +5,7 @@ SQLAlchemy ORM models for the 4-table database schema.
 Defines Poem, Translation, AILog, and HumanNote models with relationships.
 """
 
+import hashlib
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
@@ -20,22 +21,76 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
+
+from vpsweb.utils.ulid_utils import InvalidULIDError, binary_to_ulid, is_valid_ulid, ulid_to_binary
 
 from .database import Base
 
 
+def _ulid_to_db(value):
+    if value is None or isinstance(value, bytes) or not is_valid_ulid(value):
+        return value
+    try:
+        return ulid_to_binary(value)
+    except InvalidULIDError:
+        return value
+
+
+def _ulid_from_db(value):
+    if isinstance(value, bytes) and len(value) == 16:
+        return binary_to_ulid(value)
+    return value
+
+
+class ULIDBinary(TypeDecorator):
+    """
+    ULID key stored as a 16-byte BLOB and exposed as its 26-character string
+
+    The big-endian bytes sort like the string, so ordering and keyset
+    pagination on IDs are unchanged. Keys that are not valid ULIDs (legacy
+    or client-supplied IDs) are stored as TEXT as before; SQLite keeps the
+    storage class per value, so both forms coexist and match only
+    themselves.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    # The LargeBinary processors would wrap every value in a DBAPI Binary,
+    # which legacy TEXT keys cannot pass through
+    def bind_processor(self, dialect):
+        return _ulid_to_db
+
+    def result_processor(self, dialect, coltype):
+        return _ulid_from_db
+
+
+def compute_content_hash(poet_name: str, poem_title: str, original_text: str) -> str:
+    """
+    SHA-256 fingerprint of a poem used for duplicate detection
+
+    Case and whitespace differences are ignored, so re-importing the same
+    poem with different line wrapping or capitalization is still a duplicate.
+    """
+    parts = (" ".join(value.split()).casefold() for value in (poet_name, poem_title, original_text))
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
 class Poem(Base):
     """Poem model representing original poetry content"""
 
     __tablename__ = "poems"
 
     # Primary key
-    id: Mapped[str] = mapped_column(String(26), primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(ULIDBinary, primary_key=True, index=True)
 
     # Core fields
     poet_name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
@@ -45,6 +100,7 @@ class Poem(Base):
 
     # Optional metadata
     metadata_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)  # See compute_content_hash
     selected: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
@@ -75,6 +131,13 @@ class Poem(Base):
         cascade="all, delete-orphan",
         lazy="dynamic",
     )
+    translation_stats: Mapped[Optional["PoemTranslationStats"]] = relationship(
+        "PoemTranslationStats",
+        back_populates="poem",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
     # Indexes for better query performance
     __table_args__ = (
@@ -83,6 +146,9 @@ class Poem(Base):
         Index("idx_poems_title", "poem_title"),
         Index("idx_poems_language", "source_language"),
         Index("idx_poems_selected", "selected"),
+        Index("idx_poems_content_hash", "content_hash"),
+        # Poet summaries match poems by the normalized name (CRUDPoetSummary.normalize)
+        Index("idx_poems_poet_key", func.lower(func.trim(text("poet_name")))),
     )
 
     def __repr__(self) -> str:
@@ -104,17 +170,97 @@ class Poem(Base):
         return self.translations.filter_by(translator_type="human").count()
 
 
+class PoemTranslationStats(Base):
+    """Denormalized per-poem translation counters, maintained by the translation CRUD paths"""
+
+    __tablename__ = "poem_translation_stats"
+
+    # Primary key doubles as the foreign key (one row per poem with translations)
+    poem_id: Mapped[str] = mapped_column(
+        ULIDBinary,
+        ForeignKey("poems.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Counters
+    translation_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    ai_translation_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    human_translation_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    # Activity timestamps
+    last_translation_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # Newest translation
+    last_activity_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(UTC_PLUS_8),
+        server_default=func.now(),
+        index=True,
+    )  # Last translation create/update/delete
+
+    # Relationships
+    poem: Mapped["Poem"] = relationship("Poem", back_populates="translation_stats")
+
+    def __repr__(self) -> str:
+        return (
+            f"PoemTranslationStats(poem_id={self.poem_id}, total={self.translation_count}, "
+            f"ai={self.ai_translation_count}, human={self.human_translation_count})"
+        )
+
+
+class PoetSummary(Base):
+    """Materialized per-poet aggregates, maintained by the poem and translation CRUD paths"""
+
+    __tablename__ = "poets"
+
+    # Normalized poet name (trimmed, lowercased) so spelling variants share one row
+    poet_key: Mapped[str] = mapped_column(String(200), primary_key=True)
+    poet_name: Mapped[str] = mapped_column(String(200), nullable=False)  # Display name (newest poem's spelling)
+
+    # Counters
+    poem_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    translation_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    ai_translation_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    human_translation_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    # Quality ratings (averages over rated translations only)
+    avg_quality_rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    ai_avg_quality_rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    human_avg_quality_rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    # Language sets as JSON arrays; language_pairs as [{source_language, target_language, translation_count}]
+    source_languages: Mapped[str] = mapped_column(Text, nullable=False, default="[]", server_default="[]")
+    target_languages: Mapped[str] = mapped_column(Text, nullable=False, default="[]", server_default="[]")
+    language_pairs: Mapped[str] = mapped_column(Text, nullable=False, default="[]", server_default="[]")
+
+    # Activity timestamps
+    first_poem_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_poem_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    first_translation_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_translation_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_activity_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # Newest poem or translation
+
+    __table_args__ = (
+        Index("idx_poets_poet_name", "poet_name"),
+        Index("idx_poets_poem_count", "poem_count"),
+        Index("idx_poets_translation_count", "translation_count"),
+        Index("idx_poets_last_activity_at", "last_activity_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"PoetSummary(poet='{self.poet_name}', poems={self.poem_count}, translations={self.translation_count})"
+
+
 class Translation(Base):
     """Translation model representing translated poetry content"""
 
     __tablename__ = "translations"
 
     # Primary key
-    id: Mapped[str] = mapped_column(String(26), primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(ULIDBinary, primary_key=True, index=True)
 
     # Foreign key to Poem
     poem_id: Mapped[str] = mapped_column(
-        String(26),
+        ULIDBinary,
         ForeignKey("poems.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -168,6 +314,12 @@ class Translation(Base):
         back_populates="translation",
         cascade="all, delete-orphan",
     )
+    payload: Mapped[Optional["TranslationPayload"]] = relationship(
+        "TranslationPayload",
+        back_populates="translation",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
 
     # Indexes
     __table_args__ = (
@@ -243,11 +395,11 @@ class AILog(Base):
     __tablename__ = "ai_logs"
 
     # Primary key
-    id: Mapped[str] = mapped_column(String(26), primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(ULIDBinary, primary_key=True, index=True)
 
     # Foreign key to Translation
     translation_id: Mapped[str] = mapped_column(
-        String(26),
+        ULIDBinary,
         ForeignKey("translations.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -264,6 +416,9 @@ class AILog(Base):
     cost_info_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     runtime_seconds: Mapped[Optional[float]] = mapped_column(nullable=True)
 
+    # Prompt versions of the workflow's steps (see prompts.combine_prompt_hashes)
+    prompt_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
     # Additional information
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -289,6 +444,7 @@ class AILog(Base):
         Index("idx_ai_logs_model_name", "model_name"),
         Index("idx_ai_logs_workflow_mode", "workflow_mode"),
         Index("idx_ai_logs_created_at", "created_at"),
+        Index("idx_ai_logs_prompt_hash", "prompt_hash"),
         CheckConstraint(
             "workflow_mode IN ('reasoning', 'non_reasoning', 'hybrid', 'manual')",
             name="ck_workflow_mode",
@@ -328,11 +484,11 @@ class HumanNote(Base):
     __tablename__ = "human_notes"
 
     # Primary key
-    id: Mapped[str] = mapped_column(String(26), primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(ULIDBinary, primary_key=True, index=True)
 
     # Foreign key to Translation
     translation_id: Mapped[str] = mapped_column(
-        String(26),
+        ULIDBinary,
         ForeignKey("translations.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -368,11 +524,11 @@ class TranslationWorkflowStep(Base):
     __tablename__ = "translation_workflow_steps"
 
     # Primary key
-    id: Mapped[str] = mapped_column(String(26), primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(ULIDBinary, primary_key=True, index=True)
 
     # Foreign key to Translation (for aggregation queries)
     translation_id: Mapped[str] = mapped_column(
-        String(26),
+        ULIDBinary,
         ForeignKey("translations.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -380,7 +536,7 @@ class TranslationWorkflowStep(Base):
 
     # Foreign key to AILog (for provenance)
     ai_log_id: Mapped[str] = mapped_column(
-        String(26),
+        ULIDBinary,
         ForeignKey("ai_logs.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -395,10 +551,10 @@ class TranslationWorkflowStep(Base):
     )  # 'initial_translation', 'editor_review', 'revised_translation'
     step_order: Mapped[int] = mapped_column(Integer, nullable=False)
 
-    # Core content
-    content: Mapped[str] = mapped_column(Text, nullable=False)
-    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    model_info: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Core content (deferred: loaded together on first access, not by list/relationship queries)
+    content: Mapped[str] = mapped_column(Text, nullable=False, deferred=True, deferred_group="step_payload")
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group="step_payload")
+    model_info: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group="step_payload")
 
     # NEW: Dedicated columns for key metrics (SQL-queryable)
     tokens_used: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
@@ -407,8 +563,13 @@ class TranslationWorkflowStep(Base):
     duration_seconds: Mapped[Optional[float]] = mapped_column(Float, nullable=True, index=True)
     cost: Mapped[Optional[float]] = mapped_column(Float, nullable=True, index=True)
 
+    # Content hash of the prompt template version the step was rendered from
+    prompt_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
     # Keep JSON for additional/future metrics (flexibility)
-    additional_metrics: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    additional_metrics: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="step_payload"
+    )
 
     # Translated metadata (for initial_translation and revised_translation steps)
     translated_title: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
@@ -443,6 +604,7 @@ class TranslationWorkflowStep(Base):
         Index("idx_workflow_steps_cost", "cost"),
         Index("idx_workflow_steps_duration", "duration_seconds"),
         Index("idx_workflow_steps_tokens", "tokens_used"),
+        Index("idx_workflow_steps_prompt_hash", "step_type", "prompt_hash"),
         Index(
             "idx_workflow_steps_step_metrics",
             "step_type",
@@ -480,26 +642,74 @@ class TranslationWorkflowStep(Base):
         return None
 
 
+class TranslationPayload(Base):
+    """Compressed archive of the full workflow results for a translation"""
+
+    __tablename__ = "translation_payloads"
+
+    # Primary key doubles as the foreign key (one payload per translation)
+    translation_id: Mapped[str] = mapped_column(
+        ULIDBinary,
+        ForeignKey("translations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Compressed JSON document
+    encoding: Mapped[str] = mapped_column(String(10), nullable=False, default="zlib", server_default="zlib")
+    raw_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    compressed_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    # Timestamp
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(UTC_PLUS_8),
+        server_default=func.now(),
+    )
+
+    # Relationships
+    translation: Mapped["Translation"] = relationship("Translation", back_populates="payload")
+
+    __table_args__ = (CheckConstraint("encoding IN ('zlib')", name="ck_translation_payloads_encoding"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"TranslationPayload(translation_id={self.translation_id}, "
+            f"raw_size={self.raw_size}, compressed_size={self.compressed_size})"
+        )
+
+    @property
+    def payload_data(self) -> dict:
+        """Decompress and parse the payload JSON"""
+        import json
+        import zlib
+
+        return json.loads(zlib.decompress(self.data).decode("utf-8"))
+
+
 class BackgroundBriefingReport(Base):
     """BackgroundBriefingReport model for storing AI-generated poem analysis"""
 
     __tablename__ = "background_briefing_reports"
 
     # Primary key
-    id: Mapped[str] = mapped_column(String(26), primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(ULIDBinary, primary_key=True, index=True)
 
     # Foreign key to Poem (one-to-one relationship)
     poem_id: Mapped[str] = mapped_column(
-        String(26),
+        ULIDBinary,
         ForeignKey("poems.id", ondelete="CASCADE"),
         nullable=False,
         unique=True,
         index=True,
     )
 
-    # Core content
-    content: Mapped[str] = mapped_column(Text, nullable=False)  # JSON content
-    model_info: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Core content (deferred: existence checks and listings do not load the JSON)
+    content: Mapped[str] = mapped_column(
+        Text, nullable=False, deferred=True, deferred_group="bbr_payload"
+    )  # JSON content
+    model_info: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group="bbr_payload")
 
     # Performance metrics
     tokens_used: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
@@ -561,6 +771,42 @@ class BackgroundBriefingReport(Base):
         return None
 
 
+class MaintenanceRun(Base):
+    """Database storage statistics recorded by each background maintenance run"""
+
+    __tablename__ = "maintenance_runs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(UTC_PLUS_8),
+        server_default=func.now(),
+    )
+    trigger: Mapped[str] = mapped_column(String(20), nullable=False)  # scheduled or manual
+    duration_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    # Storage statistics after the run
+    page_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    page_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    freelist_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    index_stats: Mapped[str] = mapped_column(Text, nullable=False, default="{}")  # JSON {index: {table, pages}}
+
+    # Work done
+    analyzed_tables: Mapped[str] = mapped_column(Text, nullable=False, default="[]")  # JSON array
+    vacuumed_pages: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    budget_exhausted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (Index("idx_maintenance_runs_started_at", "started_at"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"MaintenanceRun(id={self.id}, started_at={self.started_at}, "
+            f"pages={self.page_count}, free={self.freelist_count})"
+        )
+
+
 # Add relationship to Poem model
 Poem.background_briefing_report = relationship(
     "BackgroundBriefingReport",
@@ -0,0 +1,87 @@
+"""
+VPSWeb Repository Keyset Pagination Helpers
+
+Opaque cursor tokens and bounded counting for keyset (cursor) pagination.
+A cursor carries the sort key of the last row of a page; the next page is
+selected with a ``WHERE key < cursor`` predicate instead of ``OFFSET``, so
+deep pages cost the same as the first one.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+# Rows counted before an approximate count gives up and reports a lower bound
+APPROXIMATE_COUNT_CAP = 1000
+
+COUNT_MODES = ("exact", "approximate", "none")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode sort key values into an opaque URL-safe cursor token.
+
+    Datetimes are stored as ISO strings and restored by ``decode_cursor``.
+    """
+    payload = [{"dt": v.isoformat()} if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> List[Any]:
+    """
+    Decode a cursor token produced by ``encode_cursor``.
+
+    Args:
+        token: Cursor token from a previous page
+        size: Expected number of key values
+
+    Returns:
+        List of key values
+
+    Raises:
+        InvalidCursorError: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+        if not isinstance(payload, list) or len(payload) != size:
+            raise ValueError("unexpected cursor shape")
+        return [datetime.fromisoformat(v["dt"]) if isinstance(v, dict) else v for v in payload]
+    except (ValueError, TypeError, KeyError, UnicodeDecodeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {token!r}") from e
+
+
+def count_rows(db: Session, stmt: Select, mode: str = "exact") -> Tuple[Optional[int], bool]:
+    """
+    Count the rows a statement would return.
+
+    Args:
+        db: Database session
+        stmt: Unpaginated select statement
+        mode: ``exact`` counts every row, ``approximate`` stops at
+            ``APPROXIMATE_COUNT_CAP`` rows, ``none`` skips counting
+
+    Returns:
+        Tuple of (count or None, whether the count is exact)
+    """
+    if mode == "none":
+        return None, False
+
+    stmt = stmt.order_by(None)
+    if mode == "approximate":
+        stmt = stmt.limit(APPROXIMATE_COUNT_CAP + 1)
+
+    total = db.execute(select(func.count()).select_from(stmt.subquery())).scalar() or 0
+    if mode == "approximate" and total > APPROXIMATE_COUNT_CAP:
+        return APPROXIMATE_COUNT_CAP, False
+    return total, True
@@ -253,6 +253,27 @@ class PoemResponse(PoemBase):
     bbr_metadata: Optional[Dict[str, Any]] = Field(None, description="BBR metadata including generation info")
 
 
+class PoemListItem(BaseSchema):
+    """Schema for a poem list row; the body is omitted when the list is requested without text"""
+
+    id: str = Field(..., description="Poem ID (ULID)")
+    poet_name: str = Field(..., description="Name of the poet")
+    poem_title: str = Field(..., description="Title of the poem")
+    source_language: str = Field(..., description="Source language code (BCP-47)")
+    original_text: Optional[str] = Field(None, description="Original poem text (None when omitted)")
+    metadata_json: Optional[str] = Field(None, description="Optional metadata as JSON string")
+    selected: bool = Field(False, description="Whether the poem is marked as selected")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+    translation_count: int = Field(0, description="Number of translations")
+    ai_translation_count: int = Field(0, description="Number of AI translations")
+    human_translation_count: int = Field(0, description="Number of human translations")
+    last_translation_at: Optional[datetime] = Field(None, description="Creation time of the newest translation")
+    last_activity_at: Optional[datetime] = Field(None, description="Last translation create/update/delete")
+    has_bbr: Optional[bool] = Field(False, description="Whether poem has a Background Briefing Report")
+    bbr_metadata: Optional[Dict[str, Any]] = Field(None, description="BBR metadata including generation info")
+
+
 class PoemList(BaseSchema):
     """Schema for poem list response"""
 
@@ -594,6 +615,7 @@ class AILogBase(BaseSchema):
         le=3600,  # Max 1 hour runtime
         description="Translation runtime in seconds (0-3600)",
     )
+    prompt_hash: Optional[str] = Field(None, max_length=64, description="Hash of the prompt versions used by the steps")
     notes: Optional[str] = Field(
         None,
         max_length=1000,
@@ -875,6 +897,7 @@ class TranslationWorkflowStepBase(BaseSchema):
     completion_tokens: Optional[int] = Field(None, ge=0, le=50000, description="Completion tokens generated")
     duration_seconds: Optional[float] = Field(None, ge=0, le=3600, description="Step duration in seconds")
     cost: Optional[float] = Field(None, ge=0, le=100, description="Step cost in USD")
+    prompt_hash: Optional[str] = Field(None, max_length=64, description="Content hash of the prompt template version")
 
     # Flexible JSON for additional metrics
     additional_metrics: Optional[str] = Field(None, max_length=2000, description="Additional metrics as JSON string")
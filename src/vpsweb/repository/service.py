@@ -141,13 +141,16 @@ class RepositoryWebService:
 
     def get_poem_translations(self, poem_id: str) -> List[TranslationResponse]:
         """Get all translations for a poem"""
-        translations = self.repo.translations.get_by_poem(poem_id)
+        aggregate = self.repo.get_poem_aggregate(poem_id, include_step_content=False, include_bbr_content=False)
+        if not aggregate:
+            return []
+
         result = []
-        for translation in translations:
-            # Manually load AI logs for workflow mode
+        for entry in aggregate["translations"]:
+            translation = entry["translation"]
             workflow_mode = None
             if translation.translator_type == "ai":
-                ai_logs = self.repo.ai_logs.get_by_translation(translation.id)
+                ai_logs = entry["ai_logs"]
                 workflow_mode = ai_logs[0].workflow_mode if ai_logs else None
 
             translation_response = self._translation_to_response(translation, workflow_mode)
@@ -334,79 +337,22 @@ class RepositoryWebService:
         logger = logging.getLogger(__name__)
         logger.debug(f"Getting poets: skip={skip}, limit={limit}, search={search}")
 
-        from sqlalchemy import case, desc, func
-
-        # Base query with poet statistics (separated by AI and Human)
-        query = (
-            self.db.query(
-                Poem.poet_name,
-                func.count(func.distinct(Poem.id)).label("poem_count"),
-                func.count(Translation.id).label("translation_count"),
-                func.sum(case((Translation.translator_type == "ai", 1), else_=0)).label("ai_translation_count"),
-                func.sum(case((Translation.translator_type == "human", 1), else_=0)).label("human_translation_count"),
-                func.avg(Translation.quality_rating).label("avg_quality_rating"),
-                func.max(Translation.created_at).label("last_translation_date"),
-                func.max(Poem.created_at).label("last_poem_date"),
-            )
-            .outerjoin(
-                Translation,
-                Poem.id == Translation.poem_id,
-            )
-            .group_by(Poem.poet_name)
-        )
-
-        # Apply filters
-        if search:
-            query = query.filter(Poem.poet_name.ilike(f"%{search}%"))
-
-        if min_poems is not None:
-            query = query.having(func.count(func.distinct(Poem.id)) >= min_poems)
-
-        if min_translations is not None:
-            query = query.having(func.count(Translation.id) >= min_translations)
-
-        # Apply sorting
-        if sort_by == "name":
-            order_column = Poem.poet_name
-        elif sort_by == "poem_count":
-            order_column = func.count(func.distinct(Poem.id))
-        elif sort_by == "translation_count":
-            order_column = func.count(Translation.id)
-        elif sort_by == "recent_activity":
-            # SQLite doesn't support greatest() function
-            # Use a CASE statement to choose the latest date
-            from sqlalchemy import case
-
-            order_column = case(
-                (
-                    func.max(Translation.created_at) >= func.max(Poem.created_at),
-                    func.max(Translation.created_at),
-                ),
-                else_=func.max(Poem.created_at),
-            )
-        else:
-            order_column = Poem.poet_name
-
-        if sort_order.lower() == "desc":
-            query = query.order_by(desc(order_column))
-        else:
-            query = query.order_by(order_column)
-
-        # Get total count and apply pagination
-        total_count = query.count()
-        poets_data = query.offset(skip).limit(limit).all()
+        poet_summaries = self.repo.poet_summaries
+        stmt = poet_summaries.list_stmt(search, sort_by, sort_order, min_poems, min_translations)
+        total_count = poet_summaries.count(search, min_poems, min_translations)
+        poets_data = self.db.execute(stmt.offset(skip).limit(limit)).scalars().all()
 
         return {
             "poets": [
                 {
                     "poet_name": row.poet_name,
                     "poem_count": row.poem_count,
-                    "translation_count": row.translation_count or 0,
-                    "ai_translation_count": row.ai_translation_count or 0,
-                    "human_translation_count": row.human_translation_count or 0,
-                    "avg_quality_rating": (float(row.avg_quality_rating) if row.avg_quality_rating else None),
-                    "last_translation_date": row.last_translation_date,
-                    "last_poem_date": row.last_poem_date,
+                    "translation_count": row.translation_count,
+                    "ai_translation_count": row.ai_translation_count,
+                    "human_translation_count": row.human_translation_count,
+                    "avg_quality_rating": row.avg_quality_rating or None,
+                    "last_translation_date": row.last_translation_at,
+                    "last_poem_date": row.last_poem_at,
                 }
                 for row in poets_data
             ],
@@ -601,61 +547,26 @@ class RepositoryWebService:
         # Ensure fresh transaction snapshot
         self.db.rollback()
 
-        from sqlalchemy import func
-
-        # Check if poet exists
-        poet_exists = self.db.query(Poem).filter(Poem.poet_name == poet_name).first()
-
-        if not poet_exists:
+        summary = self.repo.poet_summaries.get_by_name(poet_name)
+        if summary is None:
             raise ValueError(f"Poet '{poet_name}' not found")
-
-        # Get poem statistics
-        poem_stats = (
-            self.db.query(
-                func.count(Poem.id).label("total_poems"),
-                func.count(func.distinct(Poem.source_language)).label("source_languages_count"),
-                func.min(Poem.created_at).label("first_poem_date"),
-                func.max(Poem.created_at).label("last_poem_date"),
-            )
-            .filter(Poem.poet_name == poet_name)
-            .first()
-        )
-
-        # Get translation statistics
-        translation_stats = (
-            self.db.query(
-                func.count(Translation.id).label("total_translations"),
-                func.count(func.distinct(Translation.target_language)).label("target_languages_count"),
-                func.avg(Translation.quality_rating).label("avg_quality_rating"),
-                func.count(func.distinct(Translation.translator_type)).label("translator_types_count"),
-                func.min(Translation.created_at).label("first_translation_date"),
-                func.max(Translation.created_at).label("last_translation_date"),
-            )
-            .join(
-                Poem,
-                Translation.poem_id == Poem.id,
-            )
-            .filter(Poem.poet_name == poet_name)
-            .first()
-        )
+        data = self.repo.poet_summaries.to_dict(summary)
 
         return {
             "poet_name": poet_name,
             "poem_statistics": {
-                "total_poems": poem_stats.total_poems,
-                "source_languages_count": poem_stats.source_languages_count,
-                "first_poem_date": poem_stats.first_poem_date,
-                "last_poem_date": poem_stats.last_poem_date,
+                "total_poems": summary.poem_count,
+                "source_languages_count": len(data["source_languages"]),
+                "first_poem_date": summary.first_poem_at,
+                "last_poem_date": summary.last_poem_at,
             },
             "translation_statistics": {
-                "total_translations": translation_stats.total_translations or 0,
-                "target_languages_count": translation_stats.target_languages_count or 0,
-                "avg_quality_rating": (
-                    float(translation_stats.avg_quality_rating) if translation_stats.avg_quality_rating else None
-                ),
-                "translator_types_count": translation_stats.translator_types_count or 0,
-                "first_translation_date": translation_stats.first_translation_date,
-                "last_translation_date": translation_stats.last_translation_date,
+                "total_translations": summary.translation_count,
+                "target_languages_count": len(data["target_languages"]),
+                "avg_quality_rating": summary.avg_quality_rating or None,
+                "translator_types_count": (summary.ai_translation_count > 0) + (summary.human_translation_count > 0),
+                "first_translation_date": summary.first_translation_at,
+                "last_translation_date": summary.last_translation_at,
             },
         }
 
@@ -4,6 +4,8 @@ VPSWeb Repository Settings Configuration v0.3.1
 Configuration settings for the repository layer.
 """
 
+from typing import List
+
 from pydantic_settings import BaseSettings
 
 
@@ -24,6 +26,31 @@ class RepositorySettings(BaseSettings):
     # Logging settings
     log_level: str = "INFO"
 
+    # Entity cache settings (poem and BBR snapshots); size 0 disables the cache
+    entity_cache_size: int = 512
+    entity_cache_ttl: float = 60.0  # Seconds
+
+    # SQL instrumentation settings
+    slow_query_ms: float = 200.0  # Statements slower than this are logged
+    n_plus_one_threshold: int = 5  # Identical statement shapes per request flagged as N+1
+
+    # Online backup settings; an interval of 0 disables scheduled backups
+    backup_dir: str = "./repository_root/backups"
+    backup_interval_hours: float = 24.0
+    backup_keep: int = 7  # Database copies and output snapshots retained
+    backup_pages_per_step: int = 256  # Database pages copied per online backup step
+    backup_step_sleep_ms: float = 5.0  # Pause between steps so writers are not held up
+    backup_snapshot_dirs: List[str] = ["outputs"]  # Directories snapshotted incrementally
+
+    # Database maintenance settings (ANALYZE/optimize/incremental vacuum while idle); interval 0 disables
+    maintenance_interval_hours: float = 6.0
+    maintenance_idle_seconds: float = 60.0  # Time without requests before a run may start
+    maintenance_budget_seconds: float = 5.0  # A run starts no new work after this long
+    maintenance_analysis_limit: int = 1000  # Rows sampled per index by ANALYZE
+    maintenance_vacuum_pages_per_step: int = 256
+    # Largest database switched to incremental auto-vacuum by a full VACUUM, which blocks writers; 0 disables
+    maintenance_vacuum_convert_max_mb: float = 0.0
+
     model_config = {
         "env_file": ".env.local",
         "env_prefix": "REPO_",
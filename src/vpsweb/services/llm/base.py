@@ -48,6 +48,9 @@ class BaseLLMProvider(ABC):
     DeepSeek, OpenAI, etc.
     """
 
+    # Whether generate() accepts stream=True with an on_chunk callback
+    supports_streaming = False
+
     def __init__(self, base_url: str, api_key: str, **kwargs):
         """
         Initialize the LLM provider.
@@ -88,7 +91,7 @@ class BaseLLMProvider(ABC):
             frequency_penalty: Frequency penalty parameter
             presence_penalty: Presence penalty parameter
             stop: Optional list of stop sequences
-            stream: Whether to stream the response (not currently supported)
+            stream: Whether to stream the response (see ``supports_streaming``)
             **kwargs: Additional provider-specific parameters
 
         Returns:
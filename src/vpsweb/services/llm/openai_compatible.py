@@ -7,9 +7,7 @@ Tongyi (Qwen), DeepSeek, and other providers that follow the OpenAI API format.
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
-
-import httpx
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
 
 from .base import (
     AuthenticationError,
@@ -22,6 +20,9 @@ from .base import (
     TimeoutError,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +34,8 @@ class OpenAICompatibleProvider(BaseLLMProvider):
     the OpenAI API format.
     """
 
+    supports_streaming = True
+
     def __init__(self, base_url: str, api_key: str, **kwargs):
         """
         Initialize the OpenAI-compatible provider.
@@ -70,6 +73,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         stop: Optional[List[str]] = None,
         stream: bool = False,
         timeout: Optional[float] = None,
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
         **kwargs,
     ) -> LLMResponse:
         """
@@ -84,8 +88,9 @@ class OpenAICompatibleProvider(BaseLLMProvider):
             frequency_penalty: Frequency penalty parameter
             presence_penalty: Presence penalty parameter
             stop: Optional list of stop sequences
-            stream: Whether to stream the response (currently not supported)
+            stream: Whether to stream the response; the result is the same complete response
             timeout: Optional timeout for this specific request (overrides provider default)
+            on_chunk: Awaited with each piece of content as it streams in
             **kwargs: Additional provider-specific parameters
 
         Returns:
@@ -102,9 +107,6 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         self.validate_messages(messages)
         self.validate_generation_params(temperature, max_tokens, top_p, frequency_penalty, presence_penalty)
 
-        if stream:
-            raise NotImplementedError("Streaming is not currently supported")
-
         # Log request
         self.log_request(messages, model, temperature=temperature, max_tokens=max_tokens)
 
@@ -125,7 +127,12 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         headers = self._prepare_headers()
 
         # Make request with retry logic
-        response_data = await self._make_request_with_retry(payload=payload, headers=headers, timeout=timeout)
+        if stream:
+            response_data = await self._stream_request_with_retry(
+                payload=payload, headers=headers, timeout=timeout, on_chunk=on_chunk
+            )
+        else:
+            response_data = await self._make_request_with_retry(payload=payload, headers=headers, timeout=timeout)
 
         # Parse response
         llm_response = self._parse_response(response_data, model)
@@ -218,6 +225,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         """
         import asyncio
 
+        import httpx
         from httpx import ConnectError, HTTPStatusError, TimeoutException
 
         for attempt in range(self.max_retries + 1):
@@ -318,7 +326,107 @@ class OpenAICompatibleProvider(BaseLLMProvider):
             provider=self.get_provider_name(),
         )
 
-    async def _handle_http_error(self, response: httpx.Response) -> None:
+    async def _stream_request_with_retry(
+        self,
+        payload: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make a streaming request, passing content to ``on_chunk`` as it arrives.
+
+        Connection failures are retried only before any content has been
+        delivered, so ``on_chunk`` never sees a response twice.
+
+        Returns:
+            Response data assembled in the non-streaming response format
+        """
+        import asyncio
+
+        import httpx
+        from httpx import ConnectError, TimeoutException
+
+        request_timeout = timeout if timeout is not None else self.timeout
+        stream_payload = {**payload, "stream": True, "stream_options": {"include_usage": True}}
+
+        for attempt in range(self.max_retries + 1):
+            received = False
+            try:
+                async with httpx.AsyncClient(
+                    timeout=httpx.Timeout(request_timeout),
+                    limits=httpx.Limits(max_connections=self.connection_pool_size),
+                    http2=True,
+                ) as client:
+                    logger.info(f"Making streaming POST request to {self.base_url}/chat/completions")
+                    async with client.stream(
+                        "POST",
+                        f"{self.base_url}/chat/completions",
+                        json=stream_payload,
+                        headers=headers,
+                    ) as response:
+                        if response.status_code != 200:
+                            await self._handle_http_error(response)
+
+                        content: List[str] = []
+                        reasoning: List[str] = []
+                        finish_reason = None
+                        response_data: Dict[str, Any] = {}
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            data = line[5:].strip()
+                            if data == "[DONE]":
+                                break
+                            chunk = json.loads(data)
+                            response_data.update({key: chunk.get(key) for key in ("id", "created", "model")})
+                            if chunk.get("usage"):
+                                response_data["usage"] = chunk["usage"]
+                            for choice in chunk.get("choices") or []:
+                                delta = choice.get("delta") or {}
+                                finish_reason = choice.get("finish_reason") or finish_reason
+                                if delta.get("reasoning_content"):
+                                    reasoning.append(delta["reasoning_content"])
+                                if delta.get("content"):
+                                    received = True
+                                    content.append(delta["content"])
+                                    if on_chunk:
+                                        await on_chunk(delta["content"])
+
+                logger.info(f"Streaming request completed, content length: {sum(map(len, content))}")
+                message = {"role": "assistant", "content": "".join(content)}
+                if reasoning:
+                    message["reasoning_content"] = "".join(reasoning)
+                return {
+                    **response_data,
+                    "object": "chat.completion",
+                    "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+                    "usage": response_data.get("usage", {}),
+                }
+
+            except (ConnectError, TimeoutException) as e:
+                if attempt < self.max_retries and not received:
+                    wait_time = self.retry_delay * (2**attempt)
+                    logger.warning(f"Streaming request failed (attempt {attempt + 1}), retrying in {wait_time}s: {e}")
+                    await asyncio.sleep(wait_time)
+                else:
+                    raise TimeoutError(
+                        f"Streaming request to {self.get_provider_name()} failed: {e}",
+                        provider=self.get_provider_name(),
+                    )
+
+            except json.JSONDecodeError as e:
+                raise LLMProviderError(
+                    f"Invalid stream chunk from {self.get_provider_name()}: {e}",
+                    provider=self.get_provider_name(),
+                )
+
+        raise LLMProviderError(
+            f"Streaming request to {self.get_provider_name()} failed after all retries",
+            provider=self.get_provider_name(),
+        )
+
+    async def _handle_http_error(self, response: "httpx.Response") -> None:
         """
         Handle HTTP error responses.
 
@@ -4,14 +4,51 @@ XML output parser for Vox Poetica Studio Web.
 This module provides utilities for parsing XML-formatted responses from LLM providers,
 extracting structured data, and validating parsed outputs based on the exact parsing
 logic from docs/vpts.yml.
+
+Responses are tokenized in a single pass (``scan_xml``): each opening or
+closing tag is matched once and a stack of open elements builds the
+nested result, so parsing is linear in the response length however
+deeply tags nest, and text outside tags (reasoning, code fences, stray
+``<`` characters) is skipped rather than re-scanned.
+
+Streamed responses are handled incrementally by ``StreamingXMLExtractor``
+(and ``StreamingJSONExtractor`` for JSON outputs), which emit open, text
+and close events as chunks arrive, so each field is available as soon as
+it is complete.
 """
 
+import json
 import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, NamedTuple, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Opening or closing tag; whitespace before ">" is tolerated ("<tag >")
+TAG_PATTERN = re.compile(r"<(/?)(\w+)\s*>")
+# Unfinished tag at the end of a streamed chunk
+PARTIAL_TAG_PATTERN = re.compile(r"<(?:/?\w+\s*|/)?\Z")
+# Characters that change JSON nesting or string state
+JSON_STRUCTURE_PATTERN = re.compile(r'[{}\[\]",:\\]')
+
+# Output fields of each streamed step, in the order the prompts request them
+STEP_OUTPUT_TAGS: Dict[str, Tuple[str, ...]] = {
+    "initial_translation": (
+        "initial_translation",
+        "initial_translation_notes",
+        "translated_poem_title",
+        "translated_poet_name",
+    ),
+    "editor_review": ("editor_suggestions",),
+    "translator_revision": (
+        "revised_translation",
+        "revised_translation_notes",
+        "refined_translated_poem_title",
+        "refined_translated_poet_name",
+    ),
+    "translation_notes": ("digest", "notes"),
+}
+
 
 class ParserError(Exception):
     """Base exception for parser errors."""
@@ -38,12 +75,279 @@ class EmptyNotesFieldError(ValidationError):
         super().__init__(message)
 
 
+class XMLScan:
+    """Tags found in one pass over an LLM response"""
+
+    def __init__(self, text: str):
+        self.text = text
+        # Nested tag contents, as returned by OutputParser.parse_xml
+        self.elements: Dict[str, Any] = {}
+        # Per tag name: end of its first opening tag and start of its last closing tag
+        self.first_open: Dict[str, int] = {}
+        self.last_close: Dict[str, int] = {}
+
+    def extract(self, tag_name: str) -> str:
+        """
+        Content from the first opening tag to the last closing tag after it, stripped.
+
+        An unclosed tag extends to the end of the text; a missing one gives "".
+        """
+        start = self.first_open.get(tag_name)
+        if start is None:
+            return ""
+        end = self.last_close.get(tag_name, -1)
+        if end < start:
+            logger.warning(f"Missing </{tag_name}> closing tag for <{tag_name}>. Extracting to end of string.")
+            end = len(self.text)
+        return self.text[start:end].strip()
+
+
+def scan_xml(text: str) -> XMLScan:
+    """
+    Tokenize tags in a single pass and build the nested element tree.
+
+    An element whose content holds closed child elements becomes a dict of
+    them, otherwise its stripped text. Children of tags that are never
+    closed belong to the nearest enclosing closed element (or the top
+    level), and closing tags without an opening tag are ignored.
+    """
+    scan = XMLScan(text)
+    # Open elements: (name, content start, closed children)
+    stack: List[Tuple[str, int, Dict[str, Any]]] = []
+    open_counts: Dict[str, int] = {}
+
+    for match in TAG_PATTERN.finditer(text):
+        closing, name = match.groups()
+        if not closing:
+            scan.first_open.setdefault(name, match.end())
+            stack.append((name, match.end(), {}))
+            open_counts[name] = open_counts.get(name, 0) + 1
+            continue
+
+        scan.last_close[name] = match.start()
+        if not open_counts.get(name):
+            continue
+
+        # Elements opened after this one were never closed
+        unclosed = []
+        while True:
+            frame = stack.pop()
+            open_counts[frame[0]] -= 1
+            if frame[0] == name:
+                break
+            unclosed.append(frame)
+        _, start, children = frame
+        for _, _, orphans in reversed(unclosed):
+            children.update(orphans)
+
+        parent = stack[-1][2] if stack else scan.elements
+        parent[name] = children if children else text[start : match.start()].strip()
+
+    for _, _, orphans in stack:
+        scan.elements.update(orphans)
+    return scan
+
+
+class StreamEvent(NamedTuple):
+    """
+    Event emitted while extracting fields from a partial response
+
+    ``kind`` is "open", "text" or "close". Text events carry a piece of an
+    element's direct text; close events carry the element's complete,
+    stripped content (the raw JSON text for ``StreamingJSONExtractor``,
+    whose close events also carry the decoded ``value``).
+    """
+
+    kind: str
+    tag: str
+    text: str = ""
+    value: Any = None
+
+
+class StreamingXMLExtractor:
+    """
+    Incremental tag extractor for LLM responses arriving in chunks
+
+    ``feed`` consumes each chunk once and returns the events it completes,
+    so ``<initial_translation>`` is available as soon as its closing tag
+    arrives. Tags split across chunks are held back until complete. Content
+    follows ``scan_xml``: an element's close event carries everything
+    between its tags (nested tags included), closing tags without an
+    opening tag stay part of the text, and ``close`` ends elements that
+    were never closed at the end of the response.
+    """
+
+    def __init__(self):
+        # Open elements: (name, opening tag, content pieces)
+        self._stack: List[Tuple[str, str, List[str]]] = []
+        self._open_counts: Dict[str, int] = {}
+        self._pending = ""
+        # Content of every element closed so far; a repeated tag keeps its last content
+        self.fields: Dict[str, str] = {}
+
+    def feed(self, chunk: str) -> List[StreamEvent]:
+        """Consume the next chunk of the response and return the events it completes"""
+        data = self._pending + chunk
+        events: List[StreamEvent] = []
+        position = 0
+        for match in TAG_PATTERN.finditer(data):
+            self._text(data[position : match.start()], events)
+            position = match.end()
+            closing, name = match.groups()
+            if not closing:
+                self._stack.append((name, match.group(), []))
+                self._open_counts[name] = self._open_counts.get(name, 0) + 1
+                events.append(StreamEvent("open", name))
+            elif self._open_counts.get(name):
+                self._close(name, match.group(), events)
+            elif self._stack:
+                self._stack[-1][2].append(match.group())
+
+        # A trailing "<..." may be the start of a tag completed by the next chunk
+        partial = PARTIAL_TAG_PATTERN.search(data, position)
+        end = partial.start() if partial else len(data)
+        self._text(data[position:end], events)
+        self._pending = data[end:]
+        return events
+
+    def close(self) -> List[StreamEvent]:
+        """End of the response: flush held-back text and close elements left open"""
+        events: List[StreamEvent] = []
+        self._text(self._pending, events)
+        self._pending = ""
+        while self._stack:
+            name, _, pieces = self._stack.pop()
+            self._open_counts[name] -= 1
+            self._emit_close(name, "".join(pieces), events)
+        return events
+
+    def _text(self, text: str, events: List[StreamEvent]) -> None:
+        # Text outside every element is ignored, as in scan_xml
+        if text and self._stack:
+            name, _, pieces = self._stack[-1]
+            pieces.append(text)
+            events.append(StreamEvent("text", name, text))
+
+    def _close(self, name: str, closing_tag: str, events: List[StreamEvent]) -> None:
+        # Elements opened after this one were never closed; their text becomes content
+        while True:
+            frame_name, opening_tag, pieces = self._stack.pop()
+            self._open_counts[frame_name] -= 1
+            content = "".join(pieces)
+            if frame_name == name:
+                break
+            self._stack[-1][2].append(opening_tag + content)
+
+        self._emit_close(name, content, events)
+        if self._stack:
+            self._stack[-1][2].append(opening_tag + content + closing_tag)
+
+    def _emit_close(self, name: str, content: str, events: List[StreamEvent]) -> None:
+        content = content.strip()
+        self.fields[name] = content
+        events.append(StreamEvent("close", name, content))
+
+
+class StreamingJSONExtractor:
+    """
+    Incremental extractor for the top-level fields of a JSON object response
+
+    Used for JSON outputs such as the Background Briefing Report: text
+    before the first ``{`` (reasoning, code fences) is skipped, and each
+    top-level key yields an open event when its value starts and a close
+    event, with the decoded value, as soon as the value is complete.
+    Only structural characters are inspected, tracking strings, escapes
+    and nesting depth across chunk boundaries.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._expect = "key"
+        self._key = ""
+        self._key_start = 0
+        self._value_start = 0
+        self.done = False
+        self.fields: Dict[str, Any] = {}
+
+    def feed(self, chunk: str) -> List[StreamEvent]:
+        """Consume the next chunk of the response and return the fields it completes"""
+        events: List[StreamEvent] = []
+        if self.done:
+            return events
+        self._buffer += chunk
+        buffer = self._buffer
+
+        while not self.done:
+            if self._depth == 0:
+                start = buffer.find("{", self._position)
+                if start == -1:
+                    # Nothing before the object is kept
+                    self._buffer, self._position = "", 0
+                    return events
+                buffer = self._buffer = buffer[start + 1 :]
+                self._position, self._depth, self._expect = 0, 1, "key"
+                continue
+
+            match = JSON_STRUCTURE_PATTERN.search(buffer, self._position)
+            if match is None:
+                # An escape at the end of the buffer still skips the next character
+                self._position = max(self._position, len(buffer))
+                break
+            char, index = match.group(), match.start()
+            self._position = index + 1
+
+            if self._in_string:
+                if char == "\\":
+                    self._position = index + 2
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._expect == "key":
+                        self._key = json.loads(buffer[self._key_start : index + 1])
+                        self._expect = "colon"
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect == "key":
+                    self._key_start = index
+            elif char in "{[":
+                self._depth += 1
+            elif char == ":" and self._depth == 1 and self._expect == "colon":
+                self._value_start = index + 1
+                self._expect = "value"
+                events.append(StreamEvent("open", self._key))
+            elif (char == "," or char == "}") and self._depth == 1:
+                if self._expect == "value":
+                    self._emit_close(buffer[self._value_start : index], events)
+                self._expect = "key"
+                if char == "}":
+                    self._depth = 0
+                    self.done = True
+                # Completed fields are not needed again
+                buffer = self._buffer = buffer[index + 1 :]
+                self._position = 0
+            elif char in "}]":
+                self._depth -= 1
+        return events
+
+    def _emit_close(self, raw: str, events: List[StreamEvent]) -> None:
+        raw = raw.strip()
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning(f"Could not decode streamed JSON value of '{self._key}'")
+            return
+        self.fields[self._key] = value
+        events.append(StreamEvent("close", self._key, raw, value))
+
+
 class OutputParser:
     """
     Parser for extracting structured data from XML-formatted LLM responses.
 
     This parser implements the exact XML parsing logic from docs/vpts.yml,
-    handling nested tags, whitespace normalization, and comprehensive error cases.
+    handling nested tags, surrounding whitespace, and malformed or partial output.
     """
 
     @staticmethod
@@ -51,11 +355,11 @@ class OutputParser:
         """
         Parse XML string and extract all tags with their content.
 
-        This method implements the exact parsing logic from docs/vpts.yml:
-        - Removes whitespace between tags
-        - Uses regex to find all tags and their contents
-        - Handles nested tags recursively
-        - Strips whitespace from content
+        Follows the tag structure of docs/vpts.yml in a single pass (see ``scan_xml``):
+        - Finds all tags and their contents
+        - Returns nested tags as nested dictionaries
+        - Strips surrounding whitespace from content
+        - Ignores text outside tags and unmatched tags
 
         Args:
             xml_string: XML-formatted string to parse
@@ -70,31 +374,15 @@ class OutputParser:
             raise XMLParsingError(f"Invalid XML input: expected non-empty string, got {type(xml_string)}")
 
         try:
-            # Remove whitespace between tags (exact logic from vpts.yml)
-            xml_string = re.sub(r"\s+(<|>)", r"\1", xml_string.strip())
-
-            # Find all tags and their contents (exact pattern from vpts.yml)
-            pattern = r"<(\w+)>(.*?)</\1>"
-            matches = re.findall(pattern, xml_string, re.DOTALL)
+            result = scan_xml(xml_string).elements
 
-            if not matches:
+            if not result:
                 logger.warning(f"No XML tags found in string: {xml_string[:100]}...")
                 return {}
 
-            result = {}
-            for tag, content in matches:
-                # Recursively parse nested tags if present (exact logic from vpts.yml)
-                # Only recurse if content has well-formed opening/closing tag pairs
-                if re.search(r"<\w+>", content) and re.search(r"</\w+>", content):
-                    result[tag] = OutputParser.parse_xml(content)  # Recursive call for nested tags
-                else:
-                    result[tag] = content  # Preserve internal whitespace, don't strip content
-
             logger.debug(f"Successfully parsed XML with {len(result)} tags: {list(result.keys())}")
             return result
 
-        except re.error as e:
-            raise XMLParsingError(f"Regex error while parsing XML: {e}")
         except Exception as e:
             raise XMLParsingError(f"Unexpected error parsing XML: {e}")
 
@@ -200,24 +488,15 @@ class OutputParser:
             XMLParsingError: If parsing fails or expected tags are missing
         """
         try:
-            # First, try to robustly extract initial_translation and initial_translation_notes
-            initial_translation = OutputParser._extract_content_robustly(
-                xml_string,
-                "<initial_translation>",
-                "</initial_translation>",
-                "initial_translation",
-            )
-            initial_translation_notes = OutputParser._extract_content_robustly(
-                xml_string,
-                "<initial_translation_notes>",
-                "</initial_translation_notes>",
-                "initial_translation_notes",
-            )
+            scan = scan_xml(xml_string)
 
-            # Then, parse the full XML string to get other structured data, including potentially nested content
-            # This is important for "translated_poem_title" and "translated_poet_name" which are expected
-            # to be well-formed XML elements.
-            parsed_data = OutputParser.parse_xml(xml_string)
+            # First, robustly extract initial_translation and initial_translation_notes (tolerating unclosed tags)
+            initial_translation = scan.extract("initial_translation")
+            initial_translation_notes = scan.extract("initial_translation_notes")
+
+            # The other structured data comes from the element tree of the same scan.
+            # "translated_poem_title" and "translated_poet_name" are expected to be well-formed XML elements.
+            parsed_data = scan.elements
 
             # If no XML tags are found at all by the general parser, return empty content for all fields
             if not parsed_data and not initial_translation and not initial_translation_notes:
@@ -274,24 +553,15 @@ class OutputParser:
             XMLParsingError: If parsing fails or expected tags are missing
         """
         try:
-            # First, try to robustly extract revised_translation and revised_translation_notes
-            revised_translation = OutputParser._extract_content_robustly(
-                xml_string,
-                "<revised_translation>",
-                "</revised_translation>",
-                "revised_translation",
-            )
-            revised_translation_notes = OutputParser._extract_content_robustly(
-                xml_string,
-                "<revised_translation_notes>",
-                "</revised_translation_notes>",
-                "revised_translation_notes",
-            )
+            scan = scan_xml(xml_string)
 
-            # Then, parse the full XML string to get other structured data, including potentially nested content
-            # This is important for "refined_translated_poem_title" and "refined_translated_poet_name" which are expected
-            # to be well-formed XML elements.
-            parsed_data = OutputParser.parse_xml(xml_string)
+            # First, robustly extract revised_translation and revised_translation_notes (tolerating unclosed tags)
+            revised_translation = scan.extract("revised_translation")
+            revised_translation_notes = scan.extract("revised_translation_notes")
+
+            # The other structured data comes from the element tree of the same scan.
+            # "refined_translated_poem_title" and "refined_translated_poet_name" are expected to be well-formed.
+            parsed_data = scan.elements
 
             # If no XML tags are found at all by the general parser, return empty content for all fields
             if not parsed_data and not revised_translation and not revised_translation_notes:
@@ -331,28 +601,6 @@ class OutputParser:
         except Exception as e:
             raise XMLParsingError(f"Error parsing revised translation XML: {e}")
 
-    @staticmethod
-    def _extract_content_robustly(xml_string: str, start_tag: str, end_tag: str, tag_name: str) -> str:
-        """
-        Robustly extracts content between a start and end XML tag.
-        Handles cases where the end tag might be missing.
-        """
-        start_index = xml_string.find(start_tag)
-        if start_index == -1:
-            return ""
-
-        content_start = start_index + len(start_tag)
-        end_index = xml_string.rfind(end_tag, content_start)
-
-        if end_index == -1:
-            # If end tag is not found, extract from start tag to the end of the string
-            logger.warning(f"Missing {end_tag} closing tag for <{tag_name}>. Extracting to end of string.")
-            content = xml_string[content_start:].strip()
-        else:
-            # If both tags are found, extract the content between them
-            content = xml_string[content_start:end_index].strip()
-        return content
-
     @staticmethod
     def parse_editor_review_xml(xml_string: str) -> Dict[str, str]:
         """
@@ -368,33 +616,15 @@ class OutputParser:
             XMLParsingError: If parsing fails
         """
         try:
-            # Find the start of the editor_suggestions tag
-            start_tag = "<editor_suggestions>"
-            start_index = xml_string.find(start_tag)
-
-            if start_index == -1:
-                # If start tag is not found, try to parse as a whole
-                parsed_data = OutputParser.parse_xml(xml_string)
-                if "editor_suggestions" in parsed_data:
-                    return {"editor_suggestions": parsed_data["editor_suggestions"]}
-                else:
-                    # As a last resort, return the whole string if no tags are found
-                    logger.warning("Could not find <editor_suggestions> tag, returning raw content.")
-                    return {"editor_suggestions": xml_string}
-
-            # Find the end of the editor_suggestions tag
-            end_tag = "</editor_suggestions>"
-            end_index = xml_string.rfind(end_tag)
-
-            if end_index == -1:
-                # If end tag is not found, extract from start tag to the end of the string
-                logger.warning("Missing </editor_suggestions> closing tag. Parsing to end of string.")
-                content = xml_string[start_index + len(start_tag) :]
-            else:
-                # If both tags are found, extract the content between them
-                content = xml_string[start_index + len(start_tag) : end_index]
+            scan = scan_xml(xml_string)
+
+            if "editor_suggestions" not in scan.first_open:
+                # As a last resort, return the whole string if no tag is found
+                logger.warning("Could not find <editor_suggestions> tag, returning raw content.")
+                return {"editor_suggestions": xml_string}
 
-            return {"editor_suggestions": content.strip()}
+            # From the opening tag to the last closing tag, or to the end of the string if unclosed
+            return {"editor_suggestions": scan.extract("editor_suggestions")}
 
         except Exception as e:
             raise XMLParsingError(f"Error parsing editor review XML: {e}")
@@ -3,19 +3,53 @@ Prompt template service for Vox Poetica Studio Web.
 
 This module provides a service for loading, validating, and rendering
 prompt templates using Jinja2 templating engine.
+
+Templates are parsed once: each loaded YAML file is kept with its content
+hash, its compiled system/user Jinja templates and the variables they
+use, so rendering a prompt is a dictionary lookup plus ``Template.render``.
+Loaded templates live in a registry per prompts directory that every
+PromptService on that directory shares.
+
+Edited prompt files are picked up without a restart: ``reload_changed``
+(run periodically by ``start_watching``) re-reads templates whose files
+changed, compiles them, and swaps them into the registry in a single
+assignment. A broken edit is logged and the previous version keeps
+serving. Each render can report the content hash of the version it used,
+and recent versions stay available by hash so a render can be pinned to
+one of them.
 """
 
+import hashlib
 import logging
 import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import yaml
-from jinja2 import Environment, FileSystemLoader, TemplateError, UndefinedError
+from jinja2 import (
+    ChainableUndefined,
+    Environment,
+    StrictUndefined,
+    Template,
+    TemplateError,
+    UndefinedError,
+)
 
 logger = logging.getLogger(__name__)
 
+JINJA_VARIABLE_PATTERN = re.compile(
+    r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s*(?:\|[\w\(\)\s,\.]*)?\s*\}\}"
+)
+
+PROMPT_PARTS = ("system", "user")
+
+# Versions of each template kept for renders pinned to a content hash
+PROMPT_VERSION_HISTORY = 8
+
 
 class PromptServiceError(Exception):
     """Base exception for prompt service errors."""
@@ -29,6 +63,141 @@ class TemplateVariableError(PromptServiceError):
     """Raised when template variables are invalid or missing."""
 
 
+def _prompt_environment(undefined) -> Environment:
+    env = Environment(
+        undefined=undefined,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+    )
+    # Add strip filter to remove extra whitespace
+    env.filters["strip"] = lambda x: x.strip() if x else x
+    # Add word count filter
+    env.filters["wordcount"] = lambda x: (len(x.split()) if x else 0)
+    return env
+
+
+# Raise errors for undefined variables
+_STRICT_ENV = _prompt_environment(StrictUndefined)
+# Don't raise errors for undefined vars (render_prompt_safe fallback)
+_PERMISSIVE_ENV = _prompt_environment(ChainableUndefined)
+
+
+@lru_cache(maxsize=256)
+def _compile(source: str, strict: bool = True) -> Template:
+    """Compiled template for a prompt source, shared by all services"""
+    return (_STRICT_ENV if strict else _PERMISSIVE_ENV).from_string(source)
+
+
+def combine_prompt_hashes(content_hashes: Iterable[Optional[str]]) -> Optional[str]:
+    """Hash identifying a sequence of prompt versions (e.g. a workflow's steps); None if none is known"""
+    content_hashes = [content_hash for content_hash in content_hashes if content_hash]
+    if not content_hashes:
+        return None
+    return hashlib.sha256("\n".join(content_hashes).encode("ascii")).hexdigest()
+
+
+def _file_stat(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class PromptTemplate:
+    """A loaded prompt template file and its lazily compiled parts"""
+
+    name: str
+    path: Path
+    content_hash: str  # SHA-256 of the YAML file
+    data: Dict[str, Any]
+    variables: FrozenSet[str]
+    file_stat: Tuple[int, int] = (0, 0)  # mtime and size when read, for change detection
+    _compiled: Dict[Tuple[str, bool], Template] = field(default_factory=dict, repr=False)
+
+    @property
+    def is_v1(self) -> bool:
+        return self.path.parent.name == "prompts_V1"
+
+    def file_changed(self) -> bool:
+        """Whether the file was modified since it was read; False if it no longer exists"""
+        try:
+            return _file_stat(self.path) != self.file_stat
+        except OSError:
+            return False
+
+    def compiled(self, part: str, strict: bool = True) -> Template:
+        """Compiled system or user template; raises TemplateError for invalid Jinja"""
+        key = (part, strict)
+        template = self._compiled.get(key)
+        if template is None:
+            template = self._compiled[key] = _compile(self.data[part], strict)
+        return template
+
+
+class PromptTemplateRegistry:
+    """
+    Loaded templates of one prompts directory, shared by every PromptService using it
+
+    Replacing a template is a single dictionary assignment, so a render in
+    progress finishes with the version it started with. The last
+    ``PROMPT_VERSION_HISTORY`` versions of each template are kept by
+    content hash.
+    """
+
+    def __init__(self, history_size: int = PROMPT_VERSION_HISTORY):
+        self.history_size = history_size
+        self._current: Dict[str, PromptTemplate] = {}
+        self._versions: Dict[str, "OrderedDict[str, PromptTemplate]"] = {}
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+
+    def get(self, template_name: str) -> Optional[PromptTemplate]:
+        return self._current.get(template_name)
+
+    def version(self, template_name: str, content_hash: str) -> Optional[PromptTemplate]:
+        """A retained version of a template"""
+        with self._lock:
+            return self._versions.get(template_name, {}).get(content_hash)
+
+    def versions(self, template_name: str) -> List[str]:
+        """Content hashes of the retained versions of a template, oldest first"""
+        with self._lock:
+            return list(self._versions.get(template_name, ()))
+
+    def install(self, prompt_template: PromptTemplate) -> None:
+        """Make a template version the current one"""
+        with self._lock:
+            versions = self._versions.setdefault(prompt_template.name, OrderedDict())
+            versions[prompt_template.content_hash] = prompt_template
+            versions.move_to_end(prompt_template.content_hash)
+            while len(versions) > self.history_size:
+                versions.popitem(last=False)
+            self._current[prompt_template.name] = prompt_template
+
+    def loaded(self) -> List[PromptTemplate]:
+        return list(self._current.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._current.clear()
+            self._versions.clear()
+
+
+_registries: Dict[str, PromptTemplateRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_prompt_registry(prompts_dir: Path) -> PromptTemplateRegistry:
+    """Shared template registry of a prompts directory"""
+    key = str(Path(prompts_dir).resolve())
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = PromptTemplateRegistry()
+        return registry
+
+
 class PromptService:
     """
     Service for managing and rendering prompt templates.
@@ -63,33 +232,13 @@ class PromptService:
         if not self.prompts_dir.is_dir():
             raise TemplateLoadError(f"Prompts path is not a directory: {self.prompts_dir}")
 
-        # Initialize Jinja2 environment
-        from jinja2 import StrictUndefined
-
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            undefined=StrictUndefined,  # Raise errors for undefined variables
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
-        )
-
-        # Add custom filters if needed
-        self._setup_custom_filters()
+        # Loaded templates, shared with every other service on this directory
+        self.registry = get_prompt_registry(self.prompts_dir)
 
         logger.info(f"Initialized PromptService with prompts directory: {self.prompts_dir}")
         if self.fallback_dir.exists():
             logger.info(f"V1 fallback directory available: {self.fallback_dir}")
 
-    def _setup_custom_filters(self) -> None:
-        """Setup custom Jinja2 filters."""
-        # Add strip filter to remove extra whitespace
-        self.jinja_env.filters["strip"] = lambda x: x.strip() if x else x
-
-        # Add word count filter
-        self.jinja_env.filters["wordcount"] = lambda x: (len(x.split()) if x else 0)
-
-    @lru_cache(maxsize=32)
     def _load_template_file(self, template_name: str) -> Dict[str, Any]:
         """
         Load a template file from disk with caching.
@@ -103,6 +252,96 @@ class PromptService:
         Raises:
             TemplateLoadError: If template file cannot be loaded
         """
+        return self.load_prompt_template(template_name).data
+
+    def load_prompt_template(self, template_name: str) -> PromptTemplate:
+        """
+        Get a loaded template (file data, content hash and compiled parts), loading it on first use.
+
+        Raises:
+            TemplateLoadError: If template file cannot be loaded
+        """
+        prompt_template = self.registry.get(template_name)
+        if prompt_template is None:
+            prompt_template = self._read_template(template_name)
+            self.registry.install(prompt_template)
+        return prompt_template
+
+    def get_prompt_version(self, template_name: str) -> str:
+        """Content hash of the current version of a template"""
+        return self.load_prompt_template(template_name).content_hash
+
+    def reload_changed(self) -> List[str]:
+        """
+        Reload loaded templates whose files changed on disk.
+
+        A changed file is parsed and compiled before it replaces the loaded
+        version; if that fails the error is logged and the loaded version
+        stays in use until the file changes again.
+
+        Returns:
+            Names of the templates that were replaced
+        """
+        reloaded = []
+        for current in self.registry.loaded():
+            if not current.file_changed():
+                continue
+            try:
+                prompt_template = self._read_template(current.name)
+                for part in PROMPT_PARTS:
+                    if part in prompt_template.data:
+                        prompt_template.compiled(part)
+            except (TemplateLoadError, TemplateError) as e:
+                logger.error(f"Keeping version {current.content_hash[:12]} of prompt template '{current.name}': {e}")
+                current.file_stat = _file_stat(current.path)
+                continue
+
+            if prompt_template.content_hash == current.content_hash:
+                # Touched but not modified
+                current.file_stat = prompt_template.file_stat
+                continue
+            self.registry.install(prompt_template)
+            reloaded.append(current.name)
+            logger.info(
+                f"Reloaded prompt template '{current.name}': "
+                f"{current.content_hash[:12]} -> {prompt_template.content_hash[:12]}"
+            )
+        return reloaded
+
+    def start_watching(self, interval: float = 1.0) -> None:
+        """
+        Check loaded templates for changes every ``interval`` seconds in a background thread.
+
+        The watcher belongs to the shared registry: one runs per prompts
+        directory however many services start it.
+        """
+        registry = self.registry
+        with registry._lock:
+            if registry._watcher is not None and registry._watcher.is_alive():
+                return
+            registry._stop_watching.clear()
+            registry._watcher = threading.Thread(
+                target=self._watch, args=(interval,), name="prompt-template-watcher", daemon=True
+            )
+            registry._watcher.start()
+        logger.info(f"Watching prompt templates in {self.prompts_dir} every {interval}s")
+
+    def stop_watching(self) -> None:
+        registry = self.registry
+        registry._stop_watching.set()
+        watcher = registry._watcher
+        if watcher is not None and watcher is not threading.current_thread():
+            watcher.join(timeout=5)
+
+    def _watch(self, interval: float) -> None:
+        while not self.registry._stop_watching.wait(interval):
+            try:
+                self.reload_changed()
+            except Exception as e:
+                logger.error(f"Prompt template watcher error: {e}")
+
+    def _resolve_template_file(self, template_name: str) -> Path:
+        """Path of a template file, falling back to the V1 directory"""
         template_file = self.prompts_dir / f"{template_name}.yaml"
 
         if not template_file.exists():
@@ -128,10 +367,17 @@ class PromptService:
                     f"Template file '{template_name}.yaml' not found in {self.prompts_dir}. "
                     f"Available templates: {available_names}"
                 )
+        return template_file
+
+    def _read_template(self, template_name: str) -> PromptTemplate:
+        """Read and parse a template file"""
+        template_file = self._resolve_template_file(template_name)
 
         try:
-            with open(template_file, "r", encoding="utf-8") as f:
-                template_data = yaml.safe_load(f)
+            # Stat before reading: a write in between shows up as a change on the next check
+            file_stat = _file_stat(template_file)
+            content = template_file.read_bytes()
+            template_data = yaml.safe_load(content.decode("utf-8"))
 
             if template_data is None:
                 raise TemplateLoadError(f"Template file '{template_name}.yaml' is empty")
@@ -142,7 +388,19 @@ class PromptService:
             else:
                 logger.debug(f"Loaded V2 template: {template_name}")
 
-            return template_data
+            variables: Set[str] = set()
+            for part in PROMPT_PARTS:
+                if part in template_data:
+                    variables.update(self._extract_jinja_variables(template_data[part]))
+
+            return PromptTemplate(
+                name=template_name,
+                path=template_file,
+                content_hash=hashlib.sha256(content).hexdigest(),
+                data=template_data,
+                variables=frozenset(variables),
+                file_stat=file_stat,
+            )
 
         except yaml.YAMLError as e:
             raise TemplateLoadError(f"Invalid YAML in template file '{template_name}.yaml': {e}")
@@ -196,10 +454,7 @@ class PromptService:
         """
         # Simple regex to find Jinja2 variables {{ variable_name }}
         # This handles nested variables and filters
-        variable_pattern = (
-            r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s*(?:\|[\w\(\)\s,\.]*)?\s*\}\}"
-        )
-        matches = re.findall(variable_pattern, template_str)
+        matches = JINJA_VARIABLE_PATTERN.findall(template_str)
 
         # Extract base variable names (before any dots for attribute access)
         variables = set()
@@ -221,20 +476,17 @@ class PromptService:
         Raises:
             TemplateVariableError: If required variables are missing
         """
-        required_vars = set()
-
-        # Extract variables from system prompt
-        if "system" in template_data:
-            system_vars = self._extract_jinja_variables(template_data["system"])
-            required_vars.update(system_vars)
-
-        # Extract variables from user prompt
-        if "user" in template_data:
-            user_vars = self._extract_jinja_variables(template_data["user"])
-            required_vars.update(user_vars)
+        if isinstance(template_data, PromptTemplate):
+            # Variables were extracted when the template was loaded
+            required_vars = template_data.variables
+        else:
+            required_vars = set()
+            for part in PROMPT_PARTS:
+                if part in template_data:
+                    required_vars.update(self._extract_jinja_variables(template_data[part]))
 
         # Check if all required variables are provided
-        missing_vars = required_vars - set(variables.keys())
+        missing_vars = required_vars - variables.keys()
         if missing_vars:
             available_vars = list(variables.keys())
             raise TemplateVariableError(
@@ -242,35 +494,58 @@ class PromptService:
                 f"Available variables: {available_vars}"
             )
 
-    def render_prompt(self, template_name: str, variables: Dict[str, Any]) -> Tuple[str, str]:
+    def render_prompt(
+        self, template_name: str, variables: Dict[str, Any], content_hash: Optional[str] = None
+    ) -> Tuple[str, str]:
         """
         Render a prompt template with the given variables.
 
         Args:
             template_name: Name of the template to render
             variables: Dictionary of variables to substitute in the template
+            content_hash: Render this retained version of the template instead of the current one
 
         Returns:
             Tuple of (system_prompt, user_prompt)
 
         Raises:
-            TemplateLoadError: If template cannot be loaded
+            TemplateLoadError: If template (or the pinned version) cannot be loaded
             TemplateVariableError: If required variables are missing
             TemplateError: If template rendering fails
         """
+        system_prompt, user_prompt, _ = self.render_prompt_versioned(template_name, variables, content_hash)
+        return system_prompt, user_prompt
+
+    def render_prompt_versioned(
+        self, template_name: str, variables: Dict[str, Any], content_hash: Optional[str] = None
+    ) -> Tuple[str, str, str]:
+        """
+        Render a prompt template like ``render_prompt``, also returning the version used.
+
+        Returns:
+            Tuple of (system_prompt, user_prompt, content_hash of the template version)
+        """
         logger.debug(f"Rendering template: {template_name} with variables: {list(variables.keys())}")
 
         # Load template data
-        template_data = self.get_template(template_name)
+        prompt_template = self.load_prompt_template(template_name)
+        if content_hash is not None and content_hash != prompt_template.content_hash:
+            prompt_template = self.registry.version(template_name, content_hash)
+            if prompt_template is None:
+                raise TemplateLoadError(
+                    f"Version {content_hash[:12]} of template '{template_name}' is not loaded. "
+                    f"Available versions: {self.registry.versions(template_name)}"
+                )
+        template_data = prompt_template.data
 
         # Validate required variables
-        self._validate_template_variables(template_data, variables)
+        self._validate_template_variables(prompt_template, variables)
 
         # Render system prompt if present
         system_prompt = ""
         if "system" in template_data:
             try:
-                system_template = self.jinja_env.from_string(template_data["system"])
+                system_template = prompt_template.compiled("system")
                 system_prompt = system_template.render(**variables)
                 logger.debug(f"Rendered system prompt ({len(system_prompt)} chars)")
             except (TemplateError, UndefinedError) as e:
@@ -280,14 +555,14 @@ class PromptService:
         user_prompt = ""
         if "user" in template_data:
             try:
-                user_template = self.jinja_env.from_string(template_data["user"])
+                user_template = prompt_template.compiled("user")
                 user_prompt = user_template.render(**variables)
                 logger.debug(f"Rendered user prompt ({len(user_prompt)} chars)")
             except (TemplateError, UndefinedError) as e:
                 raise TemplateVariableError(f"Error rendering user prompt: {e}")
 
-        logger.info(f"Successfully rendered template: {template_name}")
-        return system_prompt, user_prompt
+        logger.info(f"Successfully rendered template: {template_name} ({prompt_template.content_hash[:12]})")
+        return system_prompt, user_prompt, prompt_template.content_hash
 
     def render_prompt_safe(
         self,
@@ -322,29 +597,16 @@ class PromptService:
             # If validation fails with defaults, try without strict validation
             logger.warning(f"Template validation failed with defaults, attempting safe render: {e}")
 
-            # Load template and render with available variables
-            template_data = self.get_template(template_name)
-
-            # Create a more permissive Jinja2 environment
-            from jinja2 import ChainableUndefined
-
-            permissive_env = Environment(
-                loader=FileSystemLoader(str(self.templates_dir)),
-                undefined=ChainableUndefined,  # Don't raise errors for undefined vars
-                trim_blocks=True,
-                lstrip_blocks=True,
-                keep_trailing_newline=True,
-            )
+            # Load template and render with available variables, using the permissive environment
+            prompt_template = self.load_prompt_template(template_name)
 
             system_prompt = ""
-            if "system" in template_data:
-                system_template = permissive_env.from_string(template_data["system"])
-                system_prompt = system_template.render(**variables)
+            if "system" in prompt_template.data:
+                system_prompt = prompt_template.compiled("system", strict=False).render(**variables)
 
             user_prompt = ""
-            if "user" in template_data:
-                user_template = permissive_env.from_string(template_data["user"])
-                user_prompt = user_template.render(**variables)
+            if "user" in prompt_template.data:
+                user_prompt = prompt_template.compiled("user", strict=False).render(**variables)
 
             return system_prompt, user_prompt
 
@@ -465,9 +727,9 @@ class PromptService:
 
     def clear_cache(self) -> None:
         """
-        Clear the template cache.
+        Clear the template cache of every service on this prompts directory.
         """
-        self._load_template_file.cache_clear()
+        self.registry.clear()
         logger.info("Cleared template cache")
 
     def validate_template(self, template_name: str) -> bool:
@@ -481,15 +743,12 @@ class PromptService:
             True if template is valid, False otherwise
         """
         try:
-            template_data = self.get_template(template_name)
+            prompt_template = self.load_prompt_template(template_name)
 
-            # Try to parse system prompt if present
-            if "system" in template_data:
-                self.jinja_env.from_string(template_data["system"])
-
-            # Try to parse user prompt if present
-            if "user" in template_data:
-                self.jinja_env.from_string(template_data["user"])
+            # Try to compile the system and user prompts if present
+            for part in PROMPT_PARTS:
+                if part in prompt_template.data:
+                    prompt_template.compiled(part)
 
             logger.debug(f"Template validation passed: {template_name}")
             return True
@@ -509,12 +768,12 @@ class PromptService:
             Dictionary with template information
         """
         try:
-            template_data = self.get_template(template_name)
-            template_file = self.prompts_dir / f"{template_name}.yaml"
+            prompt_template = self.load_prompt_template(template_name)
+            template_data = prompt_template.data
+            template_file = prompt_template.path
 
             # Determine if V1 or V2
-            is_v1 = str(self.fallback_dir) in str(self._load_template_file.__wrapped__(self, template_name))
-            version = "v1" if is_v1 else "v2"
+            version = "v1" if prompt_template.is_v1 else "v2"
 
             info = {
                 "name": template_name,
@@ -523,6 +782,7 @@ class PromptService:
                 "has_user": "user" in template_data,
                 "file_path": str(template_file),
                 "file_size": (template_file.stat().st_size if template_file.exists() else 0),
+                "content_hash": prompt_template.content_hash,
                 "validation_status": self.validate_template(template_name),
             }
 
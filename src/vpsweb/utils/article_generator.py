@@ -8,9 +8,11 @@ including metadata extraction, HTML rendering, and file management.
 import asyncio
 import json
 import re
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from jinja2 import Environment, FileSystemLoader
 
@@ -33,6 +35,10 @@ class ArticleGeneratorError(Exception):
     """Exception raised for article generation errors."""
 
 
+class ArticleGenerationCancelled(ArticleGeneratorError):
+    """Exception raised when article generation is cancelled between phases."""
+
+
 class ArticleGenerator:
     """
     Generates WeChat articles from translation JSON outputs.
@@ -114,6 +120,9 @@ class ArticleGenerator:
             self._cached_translation_notes = None
             logger.info("Article generator initialized without LLM synthesis capabilities")
 
+        # Seconds spent in each phase of the last generation
+        self.phase_timings: Dict[str, float] = {}
+
     def _init_template_system(self) -> None:
         """Initialize the Jinja2 template system for HTML rendering."""
         try:
@@ -183,23 +192,29 @@ class ArticleGenerator:
         author: Optional[str] = None,
         digest: Optional[str] = None,
         dry_run: bool = False,
+        cancel_check: Optional[Callable[[], bool]] = None,
     ) -> ArticleGenerationResult:
         """
         Generate WeChat article from translation JSON file.
 
+        Per-phase durations are recorded in ``phase_timings``.
+
         Args:
             translation_json_path: Path to translation JSON file
             output_dir: Output directory for generated files
             author: Article author name
             digest: Custom digest for article
             dry_run: Generate article without external API calls
+            cancel_check: Called before each phase; generation stops if it returns True
 
         Returns:
             ArticleGenerationResult with generated article information
 
         Raises:
+            ArticleGenerationCancelled: If cancel_check requested cancellation
             ArticleGeneratorError: If generation fails
         """
+        self.phase_timings = {}
         try:
             # Load translation JSON
             translation_data = self._load_translation_json(translation_json_path)
@@ -221,13 +236,15 @@ class ArticleGenerator:
             output_dir.mkdir(parents=True, exist_ok=True)
 
             # Handle cover image fallback logic
-            cover_image_abs_path = self._handle_cover_image_fallback(output_dir)
+            with self._phase("cover_image", cancel_check):
+                cover_image_abs_path = self._handle_cover_image_fallback(output_dir)
 
             # Pre-generate translation notes to get the LLM digest
             llm_digest = None
             if self.config.include_translation_notes and not dry_run:
                 # This will trigger the LLM call and populate self.llm_metrics with digest
-                translation_notes_section = self._generate_translation_notes_section(translation_data, metadata)
+                with self._phase("notes_synthesis", cancel_check):
+                    self._generate_translation_notes_section(translation_data, metadata)
 
                 if self.llm_metrics and "digest" in self.llm_metrics:
                     llm_digest = self.llm_metrics["digest"]
@@ -270,12 +287,13 @@ class ArticleGenerator:
                 self._cached_translation_notes = mock_translation_notes
 
             # Generate HTML content (pass cached translation notes to avoid duplicate LLM calls)
-            html_content = self._generate_html_content(
-                translation_data,
-                metadata,
-                self._cached_translation_notes,
-                cover_image_abs_path,
-            )
+            with self._phase("html_render", cancel_check):
+                html_content = self._generate_html_content(
+                    translation_data,
+                    metadata,
+                    self._cached_translation_notes,
+                    cover_image_abs_path,
+                )
 
             # Determine final digest (prioritize LLM-generated)
             final_digest = llm_digest or digest or self._generate_digest(translation_data)
@@ -342,10 +360,24 @@ class ArticleGenerator:
             logger.info(f"Article generated successfully: {result.slug}")
             return result
 
+        except ArticleGenerationCancelled:
+            logger.info("Article generation cancelled")
+            raise
         except Exception as e:
             logger.error(f"Article generation failed: {e}")
             raise ArticleGeneratorError(f"Failed to generate article: {e}")
 
+    @contextmanager
+    def _phase(self, name: str, cancel_check: Optional[Callable[[], bool]] = None):
+        """Time one generation phase into phase_timings, first honouring a pending cancellation."""
+        if cancel_check is not None and cancel_check():
+            raise ArticleGenerationCancelled(f"Article generation cancelled before {name}")
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_timings[name] = round(time.perf_counter() - start, 3)
+
     def _load_translation_json(self, json_path: str) -> Dict[str, Any]:
         """Load and validate translation JSON file."""
         json_path = Path(json_path)
@@ -0,0 +1,231 @@
+"""
+Latency histograms for Vox Poetica Studio Web.
+
+Fixed-memory histograms with logarithmic buckets, grouped into labelled
+families and exported in the Prometheus text format. A histogram keeps
+one counter per bucket, so memory does not grow with the number of
+observations, and percentiles (p50/p95/p99) are estimated by
+interpolating within the bucket that holds them, as Prometheus'
+``histogram_quantile`` does.
+
+Label values must come from bounded sets (route templates, configured
+providers and models, step names); a family accepts at most
+``max_series`` label combinations and folds any further ones into a
+single ``other`` series, so an unexpected label source cannot grow
+memory without bound.
+
+The process-wide ``metrics`` registry holds the families that the web
+app serves at ``/metrics``::
+
+    HTTP_REQUEST_SECONDS.labels("GET", "/api/v1/poems/{poem_id}", "2xx").observe(0.012)
+    print(metrics.render())
+"""
+
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 1ms doubling up to about 9 minutes
+LATENCY_BUCKETS: Tuple[float, ...] = tuple(0.001 * 2**i for i in range(20))
+
+OVERFLOW_LABEL = "other"
+
+# Route label of requests that matched no route template
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class Histogram:
+    """Counts of observations per bucket, with their sum and maximum"""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        # One slot per upper bound plus the +Inf bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = _bucket_index(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Estimated value below which a fraction ``q`` of observations fall; 0 if empty"""
+        with self._lock:
+            counts, total, maximum = list(self.counts), self.count, self.max
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else maximum
+                # The largest observation bounds every bucket's estimate
+                return min(lower + (upper - lower) * (rank - seen) / count, maximum)
+            seen += count
+        return maximum
+
+    def cumulative_counts(self) -> List[int]:
+        """Observations at or below each upper bound, ending with the +Inf bucket"""
+        with self._lock:
+            counts = list(self.counts)
+        running, cumulative = 0, []
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return cumulative
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "avg_seconds": round(self.sum / self.count, 3) if self.count else 0.0,
+            "p50_seconds": round(self.quantile(0.5), 3),
+            "p95_seconds": round(self.quantile(0.95), 3),
+            "p99_seconds": round(self.quantile(0.99), 3),
+            "max_seconds": round(self.max, 3),
+        }
+
+
+def _bucket_index(buckets: Tuple[float, ...], value: float) -> int:
+    # Bisect on the upper bounds; values above the last bound go to +Inf
+    low, high = 0, len(buckets)
+    while low < high:
+        middle = (low + high) // 2
+        if value <= buckets[middle]:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+class HistogramFamily:
+    """Histograms of one metric, one per combination of label values"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        max_series: int = 500,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self.max_series = max_series
+        self._series: Dict[Tuple[str, ...], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: object) -> Histogram:
+        """Histogram for the label values, created on first use"""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        key = tuple("" if value is None else str(value) for value in values)
+        histogram = self._series.get(key)
+        if histogram is None:
+            with self._lock:
+                if key not in self._series and len(self._series) >= self.max_series:
+                    key = (OVERFLOW_LABEL,) * len(self.labelnames)
+                histogram = self._series.setdefault(key, Histogram(self.buckets))
+        return histogram
+
+    def observe(self, value: float, *labels: object) -> None:
+        self.labels(*labels).observe(value)
+
+    def series(self) -> List[Tuple[Tuple[str, ...], Histogram]]:
+        with self._lock:
+            return sorted(self._series.items())
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for values, histogram in self.series():
+            labels = list(zip(self.labelnames, values))
+            bounds = [_format_number(bound) for bound in self.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, histogram.cumulative_counts()):
+                lines.append(f"{self.name}_bucket{_format_labels(labels + [('le', bound)])} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_number(histogram.sum)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {histogram.count}")
+        return lines
+
+
+def _format_number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels: List[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    escaped = ((name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')) for name, value in labels)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+class MetricsRegistry:
+    """Named histogram families rendered together in the Prometheus text format"""
+
+    def __init__(self):
+        self._families: Dict[str, HistogramFamily] = {}
+        self._lock = threading.Lock()
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> HistogramFamily:
+        """The family registered under ``name``, created on first use"""
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = HistogramFamily(name, documentation, labelnames, buckets)
+            return family
+
+    def get(self, name: str) -> Optional[HistogramFamily]:
+        return self._families.get(name)
+
+    def render(self) -> str:
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda family: family.name)
+        lines: List[str] = []
+        for family in families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = metrics.histogram(
+    "vpsweb_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+LLM_REQUEST_SECONDS = metrics.histogram(
+    "vpsweb_llm_request_duration_seconds",
+    "LLM call latency by provider, model and workflow step",
+    ("provider", "model", "step", "outcome"),
+)
+DB_QUERY_SECONDS = metrics.histogram(
+    "vpsweb_db_query_duration_seconds",
+    "Repository database statement execution time",
+    ("operation",),
+)
+JOB_WAIT_SECONDS = metrics.histogram(
+    "vpsweb_job_wait_seconds",
+    "Time jobs waited in the job queue before starting",
+    ("kind", "lane"),
+)
+JOB_RUN_SECONDS = metrics.histogram(
+    "vpsweb_job_run_seconds",
+    "Time jobs ran once started",
+    ("kind", "lane"),
+)
@@ -0,0 +1,158 @@
+"""
+Startup-time measurement for Vox Poetica Studio Web.
+
+Starts the CLI or the web app in a fresh interpreter, as a shell script
+or a new container would, and reports how long it took together with
+Python's own per-module import timings (``python -X importtime``). This
+backs the ``vpsweb profile-startup`` command and the startup budget
+tests, which keep heavy modules (the workflow, the LLM clients and
+their HTTP stack) out of the import path of commands that do not use
+them.
+
+Targets:
+
+- ``cli``: ``vpsweb --help``, timed until the process exits
+- ``app``: the web app imported and its startup handlers run, timed
+  until it is ready to serve requests
+"""
+
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence
+
+# Prints the wall-clock time at which the app finished its startup handlers
+_APP_READINESS_SCRIPT = """
+import asyncio, time
+from vpsweb.webui.main import app
+
+async def main():
+    await app.router.startup()
+    print(f"ready {time.time()!r}", flush=True)
+    await app.router.shutdown()
+
+asyncio.run(main())
+"""
+
+STARTUP_TARGETS: Dict[str, Sequence[str]] = {
+    "cli": ("-m", "vpsweb", "--help"),
+    "app": ("-c", _APP_READINESS_SCRIPT),
+}
+
+# Milliseconds each target may take on a warm filesystem cache
+STARTUP_BUDGETS_MS: Dict[str, float] = {
+    "cli": 500.0,
+    "app": 4000.0,
+}
+
+
+class StartupError(Exception):
+    """Raised when a startup target cannot be run or exits with an error"""
+
+
+@dataclass
+class ImportTiming:
+    """One module's import time as reported by ``-X importtime``"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    # Nesting level; 0 for modules imported directly by the target
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    target: str
+    elapsed_ms: float
+    imports: List[ImportTiming] = field(default_factory=list)
+
+    @property
+    def budget_ms(self) -> Optional[float]:
+        return STARTUP_BUDGETS_MS.get(self.target)
+
+    @property
+    def within_budget(self) -> bool:
+        return self.budget_ms is None or self.elapsed_ms <= self.budget_ms
+
+    def slowest(self, limit: int = 15, cumulative: bool = True) -> List[ImportTiming]:
+        """Modules with the longest import time, including (cumulative) or excluding their own imports"""
+        key = (lambda timing: timing.cumulative_us) if cumulative else (lambda timing: timing.self_us)
+        return sorted(self.imports, key=key, reverse=True)[:limit]
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Timings from ``-X importtime`` output; other lines are ignored"""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            # The header line
+            continue
+        name = parts[2].rstrip()
+        module = name.lstrip()
+        # Each nesting level adds two spaces after the single separator space
+        depth = (len(name) - len(module) - 1) // 2
+        timings.append(ImportTiming(module, int(parts[0]), int(parts[1]), depth))
+    return timings
+
+
+def measure_startup(
+    target: str,
+    profile_imports: bool = False,
+    cwd: Optional[str] = None,
+    env: Optional[Mapping[str, str]] = None,
+    timeout: float = 120.0,
+) -> StartupProfile:
+    """
+    Start ``target`` in a new interpreter and time it.
+
+    Args:
+        target: A key of ``STARTUP_TARGETS``
+        profile_imports: Also collect per-module import times
+        cwd: Working directory of the process (the web app resolves its
+            config and static files relative to it)
+        env: Extra environment variables for the process
+        timeout: Seconds to wait before giving up
+
+    Raises:
+        StartupError: If the target is unknown, times out or fails
+    """
+    if target not in STARTUP_TARGETS:
+        raise StartupError(f"Unknown startup target '{target}' (expected one of {', '.join(STARTUP_TARGETS)})")
+
+    command = [sys.executable]
+    if profile_imports:
+        command += ["-X", "importtime"]
+    command += list(STARTUP_TARGETS[target])
+
+    # Let the child import this same vpsweb tree even when it is not installed
+    package_root = str(Path(__file__).resolve().parents[2])
+    child_env = {**os.environ, **(env or {})}
+    child_env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, child_env.get("PYTHONPATH")]))
+
+    started = time.time()
+    try:
+        result = subprocess.run(
+            command, cwd=cwd, env=child_env, capture_output=True, text=True, timeout=timeout, check=False
+        )
+    except subprocess.TimeoutExpired as e:
+        raise StartupError(f"'{target}' did not start within {timeout:g}s") from e
+    finished = time.time()
+
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.strip().splitlines()[-5:])
+        raise StartupError(f"'{target}' exited with status {result.returncode}:\n{tail}")
+
+    for line in result.stdout.splitlines():
+        if line.startswith("ready "):
+            finished = float(line.split()[1])
+            break
+
+    imports = parse_importtime(result.stderr) if profile_imports else []
+    return StartupProfile(target, (finished - started) * 1000, imports)
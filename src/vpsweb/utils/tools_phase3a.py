@@ -18,6 +18,8 @@ from dataclasses import dataclass, field
 from functools import wraps
 from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
 
+from .metrics import Histogram
+
 # ============================================================================
 # Async Utilities
 # ============================================================================
@@ -541,6 +543,7 @@ class PerformanceMetrics:
     min_duration: float = float("inf")
     max_duration: float = 0.0
     error_count: int = 0
+    durations: Histogram = field(default_factory=Histogram)
 
     @property
     def average_duration(self) -> float:
@@ -553,6 +556,7 @@ class PerformanceMetrics:
         self.total_duration += duration
         self.min_duration = min(self.min_duration, duration)
         self.max_duration = max(self.max_duration, duration)
+        self.durations.observe(duration)
 
         if not success:
             self.error_count += 1
@@ -564,6 +568,9 @@ class PerformanceMetrics:
             "average_duration": self.average_duration,
             "min_duration": self.min_duration,
             "max_duration": self.max_duration,
+            "p50_duration": self.durations.quantile(0.5),
+            "p95_duration": self.durations.quantile(0.95),
+            "p99_duration": self.durations.quantile(0.99),
             "error_count": self.error_count,
             "success_rate": (self.operation_count - self.error_count) / max(self.operation_count, 1),
         }
@@ -590,7 +597,12 @@ class PerformanceMonitor:
         duration_ms: float,
         additional_data: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Record HTTP request performance metrics."""
+        """
+        Record HTTP request performance metrics.
+
+        ``path`` should be the route template (``/api/v1/poems/{poem_id}``) rather
+        than the requested URL, so that one series covers every ID.
+        """
         operation_name = f"{method} {path}"
         success = status_code < 400
 
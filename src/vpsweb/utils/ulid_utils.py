@@ -11,12 +11,14 @@ Features:
 - Monotonic ULID generation
 - Custom encoding/decoding support
 - Batch ULID generation
+- Thread-safe ID service with per-thread monotonic generators
 """
 
 import random
 import re
-import struct
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
@@ -28,6 +30,28 @@ CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
 ENCODE_MAP = {char: i for i, char in enumerate(CROCKFORD_BASE32)}
 DECODE_MAP = {i: char for i, char in enumerate(CROCKFORD_BASE32)}
 
+# Two-character codes for every 10-bit value: 13 lookups encode 130 bits
+_BASE32_PAIRS = [high + low for high in CROCKFORD_BASE32 for low in CROCKFORD_BASE32]
+_PAIR_SHIFTS = tuple(range(120, -1, -10))
+
+# int(..., 32) reads the digits 0-9a-v, so decoding is a translate plus one C call
+_TO_INT_DIGITS = str.maketrans(CROCKFORD_BASE32, "0123456789abcdefghijklmnopqrstuv")
+
+_ULID_PATTERN = re.compile(r"^[0123456789ABCDEFGHJKMNPQRSTVWXYZ]{26}$")
+
+
+def _int_to_ulid(value: int) -> str:
+    """Encode a 128-bit integer as a 26-character ULID string"""
+    return "".join([_BASE32_PAIRS[(value >> shift) & 0x3FF] for shift in _PAIR_SHIFTS])
+
+
+def _ulid_to_int(ulid: str) -> int:
+    """Decode a 26-character ULID string (validated by the caller) to its integer value"""
+    value = int(ulid.translate(_TO_INT_DIGITS), 32)
+    if value >> 128:
+        raise InvalidULIDError(f"ULID out of 128-bit range: {ulid}")
+    return value
+
 
 class ULIDError(Exception):
     """Base exception for ULID operations."""
@@ -119,6 +143,9 @@ class ULIDGenerator:
         """
         Generate multiple ULIDs.
 
+        The clock is read and the random component drawn once; the batch then
+        continues the monotonic sequence, so IDs sort in allocation order.
+
         Args:
             count: Number of ULIDs to generate
 
@@ -128,10 +155,18 @@ class ULIDGenerator:
         if count <= 0:
             return []
 
-        ulids = []
-        for _ in range(count):
-            ulids.append(self.generate())
+        timestamp_ms = int(time.time() * 1000)
+        if timestamp_ms <= self._last_time:
+            # Same millisecond as the previous ULID (or the clock stepped back)
+            timestamp_ms = self._last_time
+            randomness = self._last_random + 1
+        else:
+            randomness = self._generate_randomness()
+
+        ulids = [self._encode_ulid(timestamp_ms, randomness + offset) for offset in range(count)]
 
+        self._last_time = timestamp_ms
+        self._last_random = randomness + count - 1
         return ulids
 
     def parse(self, ulid: str) -> ULIDComponents:
@@ -185,7 +220,7 @@ class ULIDGenerator:
             return False
 
         # Check characters
-        if not re.match(r"^[0123456789ABCDEFGHJKMNPQRSTVWXYZ]{26}$", ulid):
+        if not _ULID_PATTERN.match(ulid):
             return False
 
         return True
@@ -248,39 +283,22 @@ class ULIDGenerator:
 
     def _generate_randomness(self) -> int:
         """Generate 80-bit random component."""
-        # Generate 10 bytes (80 bits) of randomness
-        randomness = 0
-        for _ in range(10):
-            randomness = randomness * 256 + random.randint(0, 255)
-        return randomness
+        return random.getrandbits(80)
 
     def _encode_ulid(self, timestamp: int, randomness: int) -> str:
         """Encode timestamp and randomness into ULID string."""
         # Ensure values fit in their bit ranges
         timestamp &= 0xFFFFFFFFFFFF  # 48 bits
-        randomness &= 0xFFFFFFFFFFFFFFFFFFFFFFFF  # 80 bits
-
-        # Encode timestamp (48 bits = 8 base32 characters + 4 bits of the 9th)
-        encoded = []
-        value = (timestamp << 80) | randomness
-
-        # Encode 128 bits as 26 base32 characters
-        for _ in range(26):
-            encoded.append(DECODE_MAP[value & 0x1F])
-            value >>= 5
+        randomness &= 0xFFFFFFFFFFFFFFFFFFFF  # 80 bits
 
-        # Reverse to get correct order
-        return "".join(reversed(encoded))
+        return _int_to_ulid((timestamp << 80) | randomness)
 
     def _decode_ulid(self, ulid: str) -> tuple[int, int]:
         """Decode ULID string into timestamp and randomness."""
-        value = 0
-
-        for char in ulid:
-            value = value * 32 + ENCODE_MAP[char]
+        value = _ulid_to_int(ulid)
 
         # Extract components
-        randomness = value & 0xFFFFFFFFFFFFFFFFFFFFFFFF  # 80 bits
+        randomness = value & 0xFFFFFFFFFFFFFFFFFFFF  # 80 bits
         timestamp = value >> 80  # 48 bits
 
         return timestamp, randomness
@@ -293,10 +311,14 @@ class ULIDGenerator:
             ulid: ULID string
 
         Returns:
-            16-byte binary representation
+            16-byte big-endian representation; byte order matches string order
+
+        Raises:
+            InvalidULIDError: If ULID is invalid
         """
-        timestamp, randomness = self._decode_ulid(ulid)
-        return struct.pack(">QQ", timestamp, randomness)
+        if not self.is_valid(ulid):
+            raise InvalidULIDError(f"Invalid ULID: {ulid}")
+        return _ulid_to_int(ulid).to_bytes(16, "big")
 
     def decode_binary(self, binary_data: bytes) -> str:
         """
@@ -311,15 +333,16 @@ class ULIDGenerator:
         if len(binary_data) != 16:
             raise InvalidULIDError("Binary data must be exactly 16 bytes")
 
-        timestamp, randomness = struct.unpack(">QQ", binary_data)
-        return self._encode_ulid(timestamp, randomness)
+        return _int_to_ulid(int.from_bytes(binary_data, "big"))
 
 
 class ULIDPool:
     """
     Pool of pre-generated ULIDs for performance optimization.
 
-    Useful when generating many ULIDs in quick succession.
+    Useful when generating many ULIDs in quick succession. Safe to share
+    between threads: ``get`` pops from a deque without locking and only
+    refills take the lock.
     """
 
     def __init__(self, pool_size: int = 1000):
@@ -330,13 +353,14 @@ class ULIDPool:
             pool_size: Number of ULIDs to pre-generate
         """
         self.pool_size = pool_size
-        self._pool: List[str] = []
+        self._pool: deque = deque()
         self._generator = ULIDGenerator()
+        self._lock = threading.Lock()
         self._refill()
 
     def _refill(self) -> None:
         """Refill the ULID pool."""
-        self._pool = self._generator.generate_batch(self.pool_size)
+        self._pool.extend(self._generator.generate_batch(self.pool_size))
 
     def get(self) -> str:
         """
@@ -345,10 +369,13 @@ class ULIDPool:
         Returns:
             ULID string
         """
-        if not self._pool:
-            self._refill()
-
-        return self._pool.pop(0)
+        while True:
+            try:
+                return self._pool.popleft()
+            except IndexError:
+                with self._lock:
+                    if not self._pool:
+                        self._refill()
 
     def get_batch(self, count: int) -> List[str]:
         """
@@ -363,12 +390,14 @@ class ULIDPool:
         if count <= 0:
             return []
 
-        # If we don't have enough, generate more
-        while len(self._pool) < count:
-            self._pool.extend(self._generator.generate_batch(self.pool_size))
-
-        result = self._pool[:count]
-        self._pool = self._pool[count:]
+        result = []
+        with self._lock:
+            while len(result) < count:
+                try:
+                    result.append(self._pool.popleft())
+                except IndexError:
+                    # Lock-free gets may drain the pool concurrently; refill and continue
+                    self._pool.extend(self._generator.generate_batch(max(self.pool_size, count - len(result))))
         return result
 
     def size(self) -> int:
@@ -376,10 +405,57 @@ class ULIDPool:
         return len(self._pool)
 
 
-# Global ULID generator instance
+class ULIDService:
+    """
+    Thread-safe ULID allocation for concurrent workers.
+
+    Every thread gets its own ULIDGenerator, so no lock is taken when an ID
+    is allocated and the IDs of each thread are strictly monotonic. IDs of
+    different threads created in the same millisecond are unordered; their
+    uniqueness rests on the 80 random bits drawn per thread and millisecond.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _generator(self) -> ULIDGenerator:
+        generator = getattr(self._local, "generator", None)
+        if generator is None:
+            generator = self._local.generator = ULIDGenerator()
+        return generator
+
+    def generate(self, timestamp_ms: Optional[int] = None) -> str:
+        """
+        Allocate one ULID.
+
+        Args:
+            timestamp_ms: Timestamp in milliseconds (uses current time if None)
+
+        Returns:
+            26-character ULID string
+        """
+        return self._generator().generate(timestamp_ms)
+
+    def generate_batch(self, count: int) -> List[str]:
+        """
+        Allocate a monotonic run of ULIDs.
+
+        Args:
+            count: Number of ULIDs to generate
+
+        Returns:
+            List of ULID strings
+        """
+        return self._generator().generate_batch(count)
+
+
+# Global ULID generator instance (parsing and validation)
 _ulid_generator: Optional[ULIDGenerator] = None
 _ulid_pool: Optional[ULIDPool] = None
 
+# Global ID service (allocation)
+_ulid_service = ULIDService()
+
 
 def get_ulid_generator() -> ULIDGenerator:
     """
@@ -394,6 +470,16 @@ def get_ulid_generator() -> ULIDGenerator:
     return _ulid_generator
 
 
+def get_ulid_service() -> ULIDService:
+    """
+    Get the global ID service instance.
+
+    Returns:
+        Global ULIDService instance
+    """
+    return _ulid_service
+
+
 def get_ulid_pool() -> ULIDPool:
     """
     Get the global ULID pool instance.
@@ -417,8 +503,7 @@ def generate_ulid(timestamp_ms: Optional[int] = None) -> str:
     Returns:
         26-character ULID string
     """
-    generator = get_ulid_generator()
-    return generator.generate(timestamp_ms)
+    return _ulid_service.generate(timestamp_ms)
 
 
 def generate_ulid_batch(count: int) -> List[str]:
@@ -431,8 +516,7 @@ def generate_ulid_batch(count: int) -> List[str]:
     Returns:
         List of ULID strings
     """
-    generator = get_ulid_generator()
-    return generator.generate_batch(count)
+    return _ulid_service.generate_batch(count)
 
 
 def parse_ulid(ulid: str) -> ULIDComponents:
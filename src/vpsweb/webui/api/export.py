@@ -0,0 +1,93 @@
+"""
+VPSWeb Web UI - Repository Export API Endpoints
+
+Streaming NDJSON/CSV export of poems, translations, workflow steps and
+Background Briefing Reports for analysis, backup and incremental sync.
+"""
+
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from src.vpsweb.repository.database import get_db
+from src.vpsweb.repository.export import (
+    DEFAULT_BATCH_SIZE,
+    EXPORT_ENTITIES,
+    ExportError,
+    RepositoryExporter,
+)
+
+router = APIRouter()
+
+
+def _stream(exporter: RepositoryExporter, compress: bool) -> Iterator[bytes]:
+    try:
+        yield from exporter.iter_bytes(compress=compress)
+    finally:
+        exporter.db.close()
+
+
+@router.get("/")
+async def export_repository(
+    entities: Optional[List[str]] = Query(
+        None,
+        alias="entity",
+        description=f"Entities to export (repeatable; default: all of {', '.join(EXPORT_ENTITIES)})",
+    ),
+    output_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    since: Optional[datetime] = Query(None, description="Only rows created at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only rows created before this time"),
+    poet_name: Optional[str] = Query(None, description="Only rows belonging to this poet's poems"),
+    language: Optional[str] = Query(
+        None, description="Source language for poems/BBRs, target language for translations/steps"
+    ),
+    changed_since: Optional[datetime] = Query(
+        None, description="Watermark from a previous export; only rows changed after it"
+    ),
+    gzip: bool = Query(False, description="Gzip the output on the fly"),
+    batch_size: int = Query(DEFAULT_BATCH_SIZE, ge=1, le=10000, description="Rows fetched per batch"),
+    db: Session = Depends(get_db),
+):
+    """
+    Stream a repository export.
+
+    NDJSON output holds one ``{"type": ..., <columns>}`` record per row and
+    ends with an ``export_end`` record whose ``watermark`` can be passed as
+    ``changed_since`` to fetch only later changes. CSV output holds exactly
+    one entity.
+
+    **Returns:**
+    - Streaming NDJSON or CSV body, gzip-compressed when ``gzip=true``
+    """
+    # The request session is closed before the body is streamed, so the
+    # export reads through its own session on the same engine.
+    export_db = Session(bind=db.get_bind())
+    try:
+        exporter = RepositoryExporter(
+            export_db,
+            entities=entities,
+            fmt=output_format,
+            since=since,
+            until=until,
+            poet_name=poet_name,
+            language=language,
+            changed_since=changed_since,
+            batch_size=batch_size,
+        )
+    except ExportError as e:
+        export_db.close()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    filename = f"vpsweb-export-{datetime.now().strftime('%Y%m%dT%H%M%S')}.{exporter.extension}"
+    media_type = exporter.media_type
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        _stream(exporter, gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
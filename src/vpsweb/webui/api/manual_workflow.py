@@ -5,7 +5,7 @@ API endpoints for managing manual translation workflows where users
 interact with external LLM services through copy-paste operations.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
@@ -37,6 +37,7 @@ _manual_workflow_service_instance = None
 
 
 def get_manual_workflow_service(
+    request: Request,
     db: Session = Depends(get_db),
 ) -> ManualWorkflowService:
     """Dependency to get manual workflow service instance."""
@@ -45,6 +46,10 @@ def get_manual_workflow_service(
     if _manual_workflow_service_instance is not None:
         return _manual_workflow_service_instance
 
+    # Sessions live in the shared task store so any worker can continue them
+    task_store = getattr(request.app.state, "task_store", None)
+    sessions = task_store.namespace("manual_sessions") if task_store is not None else None
+
     # Import here to avoid circular imports
     from vpsweb.core.container import get_container
 
@@ -72,6 +77,7 @@ def get_manual_workflow_service(
             workflow_service=workflow_service,
             repository_service=repository_service,
             storage_handler=storage_handler,
+            sessions=sessions,
         )
 
     except Exception:
@@ -91,7 +97,7 @@ def get_manual_workflow_service(
         container = DIContainer()
 
         # Register dependencies
-        container.register_instance(ITaskManagementServiceV2, TaskManagementServiceV2({}, logger=None))
+        container.register_instance(ITaskManagementServiceV2, TaskManagementServiceV2(logger=None))
         container.register_singleton(type(WorkflowServiceV2), WorkflowServiceV2)
 
         # Create services
@@ -112,6 +118,7 @@ def get_manual_workflow_service(
             workflow_service=workflow_service,
             repository_service=repository_service,
             storage_handler=storage_handler,
+            sessions=sessions,
         )
 
     return _manual_workflow_service_instance
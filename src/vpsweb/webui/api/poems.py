@@ -4,15 +4,25 @@ VPSWeb Web UI - Poem API Endpoints v0.3.1
 API endpoints for poem management operations with comprehensive CRUD functionality.
 """
 
+import asyncio
+import io
 from typing import List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
-from sqlalchemy import func, select
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, UploadFile
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from src.vpsweb.repository.bulk_import import (
+    DEFAULT_CHUNK_SIZE,
+    BulkPoemImporter,
+    ImportFormatError,
+    detect_format,
+    iter_stream_records,
+)
 from src.vpsweb.repository.crud import RepositoryService
 from src.vpsweb.repository.database import get_db
-from src.vpsweb.repository.models import Poem, Translation
+from src.vpsweb.repository.models import Poem, ULIDBinary
+from src.vpsweb.repository.pagination import InvalidCursorError
 from src.vpsweb.repository.schemas import (
     PoemCreate,
     PoemResponse,
@@ -60,6 +70,13 @@ async def list_poems(
     language: Optional[str] = Query(None, description="Filter by source language"),
     title_search: Optional[str] = Query(None, description="Search in poem title"),
     selected: Optional[bool] = Query(None, description="Filter by selection status"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (keyset pagination)"),
+    count: Optional[str] = Query(
+        None,
+        pattern="^(exact|approximate|none)$",
+        description="Total count mode: exact, approximate or none",
+    ),
+    include_text: bool = Query(True, description="Include the poem body (original_text) in each item"),
     service: RepositoryService = Depends(get_repository_service),
 ):
     """
@@ -72,103 +89,42 @@ async def list_poems(
     - **language**: Filter poems by source language
     - **title_search**: Search poems by title (partial match)
     - **selected**: Filter poems by selection status (true/false)
+    - **cursor**: Opaque cursor returned as `next_cursor`; when given, `page` is ignored
+    - **count**: Total count mode (default: exact for page mode, none for cursor mode)
+    - **include_text**: Set to false to omit poem bodies from the list
 
     **Returns:**
     - Paginated list of poems with pagination metadata
     """
-    # Convert page-based pagination to skip/limit
-    skip = (page - 1) * page_size
+    filters = {
+        "poet_name": poet_name,
+        "language": language,
+        "title_search": title_search,
+        "selected": selected,
+    }
+    count_mode = count or ("none" if cursor else "exact")
 
     # Get total count for pagination
-    total_count = service.poems.count(
-        poet_name=poet_name,
-        language=language,
-        title_search=title_search,
-        selected=selected,
-    )
-
-    # Get poems for current page
-    poems = service.poems.get_multi(
-        skip=skip,
-        limit=page_size,
-        poet_name=poet_name,
-        language=language,
-        title_search=title_search,
-        selected=selected,
-    )
+    total_count, total_is_exact = service.poems.count_by_mode(count_mode, **filters)
 
-    # Build response data
-    response_data = []
-    poem_ids = [poem.id for poem in poems]
-
-    # Batch query for all selected fields to avoid N+1 problem
-    selected_mapping = {}
-    if poem_ids:
-        from sqlalchemy import text
-
-        placeholders = ",".join([f":id_{i}" for i in range(len(poem_ids))])
-        params = {f"id_{i}": poem_id for i, poem_id in enumerate(poem_ids)}
-        selected_results = service.db.execute(
-            text(f"SELECT id, selected FROM poems WHERE id IN ({placeholders})"),
-            params,
-        ).fetchall()
-
-        # Create mapping of poem_id -> selected_value
-        for poem_id, selected_val in selected_results:
-            if isinstance(selected_val, str):
-                selected_mapping[poem_id] = selected_val.lower() in (
-                    "true",
-                    "1",
-                    "t",
-                    "yes",
-                )
-            else:
-                selected_mapping[poem_id] = bool(selected_val) if selected_val is not None else False
-
-    # Build response data for each poem with individual translation counts
-    for poem in poems:
-        # Calculate translation counts for this specific poem using direct SQL queries
-        ai_translation_count = (
-            service.db.execute(
-                select(func.count(Translation.id)).where(
-                    Translation.poem_id == poem.id,
-                    Translation.translator_type == "ai",
-                )
-            ).scalar()
-            or 0
-        )
-
-        human_translation_count = (
-            service.db.execute(
-                select(func.count(Translation.id)).where(
-                    Translation.poem_id == poem.id,
-                    Translation.translator_type == "human",
-                )
-            ).scalar()
-            or 0
+    # One query: poem columns plus the denormalized translation counters
+    try:
+        response_data, next_cursor = service.poems.get_list_page(
+            limit=page_size,
+            skip=(page - 1) * page_size,
+            cursor=cursor,
+            include_text=include_text,
+            **filters,
         )
-
-        selected_value = selected_mapping.get(poem.id, False)
-        poem_dict = {
-            "id": poem.id,
-            "poet_name": poem.poet_name,
-            "poem_title": poem.poem_title,
-            "source_language": poem.source_language,
-            "original_text": poem.original_text,
-            "metadata_json": poem.metadata_json,
-            "created_at": poem.created_at,
-            "updated_at": poem.updated_at,
-            "translation_count": poem.translation_count or 0,
-            "ai_translation_count": ai_translation_count,
-            "human_translation_count": human_translation_count,
-            "selected": selected_value,
-        }
-        response_data.append(poem_dict)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # Calculate pagination info
-    total_pages = (total_count + page_size - 1) // page_size  # Ceiling division
-    has_next = page < total_pages
-    has_previous = page > 1
+    total_pages = None
+    if total_count is not None:
+        total_pages = (total_count + page_size - 1) // page_size  # Ceiling division
+    has_next = next_cursor is not None
+    has_previous = page > 1 and not cursor
 
     # Build pagination URLs
     base_query_params = []
@@ -180,12 +136,14 @@ async def list_poems(
         base_query_params.append(f"title_search={title_search}")
     if page_size != 20:  # Include page_size if not default
         base_query_params.append(f"page_size={page_size}")
+    if not include_text:
+        base_query_params.append("include_text=false")
 
     "&".join(base_query_params) if base_query_params else ""
 
     next_page_url = None
     if has_next:
-        next_params = base_query_params + [f"page={page + 1}"]
+        next_params = base_query_params + ([f"cursor={next_cursor}"] if cursor else [f"page={page + 1}"])
         next_page_url = f"/api/v1/poems/?{'&'.join(next_params)}"
 
     previous_page_url = None
@@ -197,11 +155,13 @@ async def list_poems(
         current_page=page,
         total_pages=total_pages,
         total_items=total_count,
+        total_is_exact=total_is_exact,
         page_size=page_size,
         has_next=has_next,
         has_previous=has_previous,
         next_page_url=next_page_url,
         previous_page_url=previous_page_url,
+        next_cursor=next_cursor,
     )
 
     return PaginatedPoemResponse(
@@ -244,6 +204,66 @@ async def create_poem(
         raise HTTPException(status_code=400, detail=f"Failed to create poem: {str(e)}")
 
 
+@router.post("/bulk-import", response_model=WebAPIResponse)
+async def bulk_import_poems(
+    file: UploadFile = File(..., description="JSONL or CSV file of poems"),
+    input_format: Optional[str] = Query(
+        None, alias="format", pattern="^(jsonl|csv)$", description="Input format (default: from file name)"
+    ),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=5000, description="Poems inserted per transaction"),
+    skip_duplicates: bool = Query(True, description="Skip poems whose content is already stored"),
+    dry_run: bool = Query(False, description="Validate and report without writing"),
+    poet_name: Optional[str] = Query(None, description="Poet for records that omit one"),
+    source_language: Optional[str] = Query(None, description="Source language for records that omit one"),
+    service: RepositoryService = Depends(get_repository_service),
+):
+    """
+    Import many poems from one JSONL or CSV upload.
+
+    The upload is parsed as a stream and inserted in chunked transactions;
+    records failing validation are reported and skipped.
+
+    **Returns:**
+    - Import report with imported, duplicate and invalid counts, throughput and the first errors
+    """
+    try:
+        fmt = input_format or detect_format(file.filename or "")
+    except ImportFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    defaults = {"poet_name": poet_name, "source_language": source_language}
+    importer = BulkPoemImporter(
+        service.db,
+        chunk_size=chunk_size,
+        skip_duplicates=skip_duplicates,
+        dry_run=dry_run,
+        defaults={key: value for key, value in defaults.items() if value},
+    )
+
+    def run_import():
+        stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        try:
+            return importer.run(iter_stream_records(stream, fmt, file.filename or fmt))
+        finally:
+            stream.detach()
+
+    try:
+        report = await asyncio.to_thread(run_import)
+    except UnicodeDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Upload is not valid UTF-8: {e}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Bulk import failed: {str(e)}")
+
+    return WebAPIResponse(
+        success=report.failed == 0,
+        message=(
+            f"{'Validated' if dry_run else 'Imported'} {report.imported} of {report.total} poems "
+            f"in {report.elapsed:.2f}s"
+        ),
+        data=report.to_dict(),
+    )
+
+
 @router.get("/filter-options", response_model=PoemFilterOptions)
 async def get_filter_options(
     service: RepositoryService = Depends(get_repository_service),
@@ -255,10 +275,8 @@ async def get_filter_options(
     - List of all available poets and languages for filtering
     """
     try:
-        # Get all unique poets from database
-        poets_query = select(Poem.poet_name).distinct().order_by(Poem.poet_name)
-        poets_result = service.db.execute(poets_query).scalars().all()
-        poets = [poet for poet in poets_result if poet]  # Filter out None values
+        # Get all poets from the materialized poets summary table
+        poets = service.poet_summaries.get_names()
 
         # Get all unique languages from database
         languages_query = select(Poem.source_language).distinct().order_by(Poem.source_language)
@@ -345,10 +363,10 @@ async def get_poem(
     has_bbr = bbr_service.has_bbr(poem_id)
 
     # Fix SQLAlchemy boolean mapping issue by getting fresh value directly from database
-    from sqlalchemy import text
+    from sqlalchemy import bindparam, text
 
     result = service.db.execute(
-        text("SELECT selected FROM poems WHERE id = :poem_id"),
+        text("SELECT selected FROM poems WHERE id = :poem_id").bindparams(bindparam("poem_id", type_=ULIDBinary)),
         {"poem_id": poem_id},
     )
     direct_db_value = result.scalar()
@@ -516,21 +534,20 @@ async def get_poem_translations(poem_id: str, service: RepositoryService = Depen
     **Returns:**
     - List of translations for the poem
     """
-    # Check if poem exists
-    poem = service.poems.get_by_id(poem_id)
-    if not poem:
+    # Load poem, translations and AI logs together
+    aggregate = service.get_poem_aggregate(poem_id, include_step_content=False, include_bbr_content=False)
+    if not aggregate:
         raise HTTPException(status_code=404, detail=f"Poem with ID '{poem_id}' not found")
-
-    # Get translations for this poem
-    translations = service.translations.get_by_poem(poem_id)
+    poem = aggregate["poem"]
 
     # Convert to dict format for API response with poem fallback data
     result = []
-    for t in translations:
+    for entry in aggregate["translations"]:
+        t = entry["translation"]
         # Load workflow_mode for AI translations
         workflow_mode = None
         if t.translator_type == "ai":
-            ai_logs = service.ai_logs.get_by_translation(t.id)
+            ai_logs = entry["ai_logs"]
             workflow_mode = ai_logs[0].workflow_mode if ai_logs else None
 
         result.append(
@@ -605,17 +622,17 @@ async def get_poem_translations_with_workflows(
     - Includes performance summary for AI translations
     - Indicates which translations have detailed notes available
     """
-    # Check if poem exists
-    poem = service.poems.get_by_id(poem_id)
-    if not poem:
+    # Load poem and translations with workflow steps, skipping heavy text columns
+    aggregate = service.get_poem_aggregate(
+        poem_id, include_text=False, include_step_content=False, include_bbr_content=False
+    )
+    if not aggregate:
         raise HTTPException(status_code=404, detail=f"Poem with ID '{poem_id}' not found")
 
-    # Get translations for this poem
-    translations = service.translations.get_by_poem(poem_id)
-
     # Build response with workflow information
     result = []
-    for translation in translations:
+    for entry in aggregate["translations"]:
+        translation = entry["translation"]
         # Get workflow step information
         has_workflow_steps = translation.has_workflow_steps
         workflow_step_count = translation.workflow_step_count
@@ -668,7 +685,7 @@ async def generate_bbr(
     """
     try:
         # Verify poem exists
-        poem = repository_service.poems.get_by_id(poem_id)
+        poem = repository_service.poems.get_snapshot(poem_id)
         if not poem:
             raise HTTPException(status_code=404, detail=f"Poem with ID '{poem_id}' not found")
 
@@ -712,7 +729,7 @@ async def get_bbr(
     """
     try:
         # Verify poem exists
-        poem = repository_service.poems.get_by_id(poem_id)
+        poem = repository_service.poems.get_snapshot(poem_id)
         if not poem:
             raise HTTPException(status_code=404, detail=f"Poem with ID '{poem_id}' not found")
 
@@ -752,7 +769,7 @@ async def delete_bbr(
     """
     try:
         # Verify poem exists
-        poem = repository_service.poems.get_by_id(poem_id)
+        poem = repository_service.poems.get_snapshot(poem_id)
         if not poem:
             raise HTTPException(status_code=404, detail=f"Poem with ID '{poem_id}' not found")
 
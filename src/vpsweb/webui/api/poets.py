@@ -5,14 +5,22 @@ API endpoints for poet browsing and discovery operations.
 Provides database-driven poet listings, poems by poet, and translation statistics.
 """
 
+import json
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import case, desc, func
+from sqlalchemy import desc, func
 from sqlalchemy.orm import Session
 
+from src.vpsweb.repository.crud import CRUDPoetSummary
 from src.vpsweb.repository.database import get_db
-from src.vpsweb.repository.models import Poem, Translation
+from src.vpsweb.repository.models import Poem, PoetSummary, Translation
+from src.vpsweb.repository.pagination import (
+    InvalidCursorError,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+)
 from src.vpsweb.repository.service import RepositoryWebService
 
 from ..schemas import PaginationInfo, WebAPIResponse
@@ -39,6 +47,12 @@ async def list_poets(
     sort_order: Optional[str] = Query("asc", description="Sort order: asc, desc"),
     min_poems: Optional[int] = Query(None, ge=0, description="Minimum number of poems"),
     min_translations: Optional[int] = Query(None, ge=0, description="Minimum number of translations"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (name sort only)"),
+    count: Optional[str] = Query(
+        None,
+        pattern="^(exact|approximate|none)$",
+        description="Total count mode: exact, approximate or none",
+    ),
     service: RepositoryWebService = Depends(get_repository_service),
 ):
     """
@@ -52,71 +66,50 @@ async def list_poets(
     - **sort_order**: Sort order (asc, desc)
     - **min_poems**: Filter by minimum number of poems
     - **min_translations**: Filter by minimum number of translations
+    - **cursor**: Opaque cursor returned as `next_cursor`; when given, `skip` is ignored
+    - **count**: Total count mode (default: exact for offset paging, none for cursor paging)
 
     **Returns:**
     - List of poets with statistics and activity data
     """
-    try:
-        # Base query with poem and translation counts (separated by AI and Human)
-        query = (
-            service.db.query(
-                Poem.poet_name,
-                func.count(Poem.id).label("poem_count"),
-                func.count(Translation.id).label("translation_count"),
-                func.sum(case((Translation.translator_type == "ai", 1), else_=0)).label("ai_translation_count"),
-                func.sum(case((Translation.translator_type == "human", 1), else_=0)).label("human_translation_count"),
-                func.avg(Translation.quality_rating).label("avg_quality_rating"),
-                func.max(Translation.created_at).label("last_translation_date"),
-                func.max(Poem.created_at).label("last_poem_date"),
-                func.group_concat(Poem.source_language, ", ").label("source_languages"),
-                func.group_concat(Translation.target_language, ", ").label("target_languages"),
-            )
-            .outerjoin(Translation, Poem.id == Translation.poem_id)
-            .group_by(Poem.poet_name)
-        )
-
-        # Apply filters
-        if search:
-            query = query.filter(Poem.poet_name.ilike(f"%{search}%"))
-
-        if min_poems is not None:
-            query = query.having(func.count(Poem.id) >= min_poems)
+    keyset = sort_by not in ("poem_count", "translation_count", "recent_activity")
+    descending = sort_order.lower() == "desc"
+    count_mode = count or ("none" if cursor else "exact")
+
+    after_name = None
+    if cursor:
+        if not keyset:
+            raise HTTPException(status_code=400, detail="Cursor pagination is only supported when sorting by name")
+        try:
+            (after_name,) = decode_cursor(cursor, 1)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-        if min_translations is not None:
-            query = query.having(func.count(Translation.id) >= min_translations)
-
-        # Apply sorting
-        if sort_by == "name":
-            order_column = Poem.poet_name
-        elif sort_by == "poem_count":
-            order_column = func.count(Poem.id)
-        elif sort_by == "translation_count":
-            order_column = func.count(Translation.id)
-        elif sort_by == "recent_activity":
-            # SQLite doesn't support greatest() function
-            # Use a CASE statement to choose the latest date
-            from sqlalchemy import case
-
-            order_column = case(
-                (
-                    func.max(Translation.created_at) >= func.max(Poem.created_at),
-                    func.max(Translation.created_at),
-                ),
-                else_=func.max(Poem.created_at),
-            )
+    try:
+        # Poet rows come from the materialized poets summary table
+        poet_summaries = service.repo.poet_summaries
+        stmt = poet_summaries.list_stmt(search, sort_by, sort_order, min_poems, min_translations)
+
+        if count_mode == "none":
+            total_count, total_is_exact = None, False
+        elif count_mode == "exact":
+            total_count, total_is_exact = poet_summaries.count(search, min_poems, min_translations), True
         else:
-            order_column = Poem.poet_name
+            total_count, total_is_exact = count_rows(service.db, stmt, count_mode)
 
-        if sort_order.lower() == "desc":
-            query = query.order_by(desc(order_column))
+        # Apply pagination, fetching one extra row to detect a next page. The cursor filter is
+        # added after counting so totals cover the whole result set.
+        if after_name is not None:
+            stmt = stmt.where(PoetSummary.poet_name < after_name if descending else PoetSummary.poet_name > after_name)
         else:
-            query = query.order_by(order_column)
-
-        # Get total count for pagination
-        total_count = query.count()
+            stmt = stmt.offset(skip)
+        poets_data = service.db.execute(stmt.limit(limit + 1)).scalars().all()
+        has_next = len(poets_data) > limit
+        poets_data = poets_data[:limit]
 
-        # Apply pagination
-        poets_data = query.offset(skip).limit(limit).all()
+        next_cursor = None
+        if has_next and keyset:
+            next_cursor = encode_cursor(poets_data[-1].poet_name)
 
         # Format response
         poets = []
@@ -124,25 +117,27 @@ async def list_poets(
             poet_info = {
                 "poet_name": row.poet_name,
                 "poem_count": row.poem_count,
-                "translation_count": row.translation_count or 0,
-                "ai_translation_count": row.ai_translation_count or 0,
-                "human_translation_count": row.human_translation_count or 0,
-                "avg_quality_rating": (float(row.avg_quality_rating) if row.avg_quality_rating else None),
-                "last_translation_date": (row.last_translation_date.isoformat() if row.last_translation_date else None),
-                "last_poem_date": (row.last_poem_date.isoformat() if row.last_poem_date else None),
-                "source_languages": [lang for lang in row.source_languages if lang is not None],
-                "target_languages": [lang for lang in row.target_languages if lang is not None],
-                "has_recent_activity": ((row.last_translation_date or row.last_poem_date) is not None),
+                "translation_count": row.translation_count,
+                "ai_translation_count": row.ai_translation_count,
+                "human_translation_count": row.human_translation_count,
+                "avg_quality_rating": row.avg_quality_rating or None,
+                "last_translation_date": (row.last_translation_at.isoformat() if row.last_translation_at else None),
+                "last_poem_date": (row.last_poem_at.isoformat() if row.last_poem_at else None),
+                "source_languages": json.loads(row.source_languages),
+                "target_languages": json.loads(row.target_languages),
+                "has_recent_activity": row.last_activity_at is not None,
             }
             poets.append(poet_info)
 
         pagination = PaginationInfo(
             current_page=(skip // limit) + 1,
-            total_pages=(total_count + limit - 1) // limit,
+            total_pages=((total_count + limit - 1) // limit if total_count is not None else None),
             total_items=total_count,
+            total_is_exact=total_is_exact,
             page_size=limit,
-            has_next=(skip + limit) < total_count,
-            has_previous=skip > 0,
+            has_next=has_next,
+            has_previous=skip > 0 or cursor is not None,
+            next_cursor=next_cursor,
         )
 
         return WebAPIResponse(
@@ -150,6 +145,8 @@ async def list_poets(
             data={"poets": poets, "pagination": pagination.dict()},
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch poets: {str(e)}")
 
@@ -190,7 +187,7 @@ async def get_poems_by_poet(
                 func.group_concat(Translation.target_language, ", ").label("target_languages"),
             )
             .outerjoin(Translation, Poem.id == Translation.poem_id)
-            .filter(Poem.poet_name == poet_name)
+            .filter(CRUDPoetSummary.matches(poet_name))
             .group_by(Poem.id)
         )
 
@@ -312,7 +309,7 @@ async def get_translations_by_poet(
         query = (
             service.db.query(Translation, Poem.poem_title, Poem.source_language)
             .join(Poem, Translation.poem_id == Poem.id)
-            .filter(Poem.poet_name == poet_name)
+            .filter(CRUDPoetSummary.matches(poet_name))
         )
 
         # Apply filters
@@ -410,108 +407,44 @@ async def get_poet_statistics(
     - Detailed statistics for the specified poet
     """
     try:
-        # Check if poet exists
-        poet_exists = service.db.query(Poem).filter(Poem.poet_name == poet_name).first()
+        summary = service.repo.poet_summaries.get_by_name(poet_name)
 
-        if not poet_exists:
+        if summary is None:
             raise HTTPException(status_code=404, detail=f"Poet '{poet_name}' not found")
 
-        # Get comprehensive statistics
-        stats = (
-            service.db.query(
-                func.count(Poem.id).label("total_poems"),
-                func.count(func.distinct(Poem.source_language)).label("source_languages_count"),
-                func.min(Poem.created_at).label("first_poem_date"),
-                func.max(Poem.created_at).label("last_poem_date"),
-            )
-            .filter(Poem.poet_name == poet_name)
-            .first()
-        )
-
-        translation_stats = (
-            service.db.query(
-                func.count(Translation.id).label("total_translations"),
-                func.count(func.distinct(Translation.target_language)).label("target_languages_count"),
-                func.avg(Translation.quality_rating).label("avg_quality_rating"),
-                func.count(func.distinct(Translation.translator_type)).label("translator_types_count"),
-                func.min(Translation.created_at).label("first_translation_date"),
-                func.max(Translation.created_at).label("last_translation_date"),
-            )
-            .join(Poem, Translation.poem_id == Poem.id)
-            .filter(Poem.poet_name == poet_name)
-            .first()
-        )
-
-        # Language pair distribution
-        language_pairs = (
-            service.db.query(
-                Poem.source_language,
-                Translation.target_language,
-                func.count(Translation.id).label("translation_count"),
+        data = service.repo.poet_summaries.to_dict(summary)
+        translator_distribution = [
+            {"translator_type": translator_type, "count": count, "avg_quality": avg_quality or None}
+            for translator_type, count, avg_quality in (
+                ("ai", summary.ai_translation_count, summary.ai_avg_quality_rating),
+                ("human", summary.human_translation_count, summary.human_avg_quality_rating),
             )
-            .join(Poem, Translation.poem_id == Poem.id)
-            .filter(Poem.poet_name == poet_name)
-            .group_by(Poem.source_language, Translation.target_language)
-            .order_by(desc(func.count(Translation.id)))
-            .all()
-        )
-
-        # Translator type distribution
-        translator_distribution = (
-            service.db.query(
-                Translation.translator_type,
-                func.count(Translation.id).label("count"),
-                func.avg(Translation.quality_rating).label("avg_quality"),
-            )
-            .join(Poem, Translation.poem_id == Poem.id)
-            .filter(Poem.poet_name == poet_name)
-            .group_by(Translation.translator_type)
-            .all()
-        )
+            if count
+        ]
 
         # Format response
         poet_stats = {
             "poet_name": poet_name,
             "poem_statistics": {
-                "total_poems": stats.total_poems,
-                "source_languages_count": stats.source_languages_count,
-                "first_poem_date": (stats.first_poem_date.isoformat() if stats.first_poem_date else None),
-                "last_poem_date": (stats.last_poem_date.isoformat() if stats.last_poem_date else None),
+                "total_poems": summary.poem_count,
+                "source_languages_count": len(data["source_languages"]),
+                "first_poem_date": (summary.first_poem_at.isoformat() if summary.first_poem_at else None),
+                "last_poem_date": (summary.last_poem_at.isoformat() if summary.last_poem_at else None),
             },
             "translation_statistics": {
-                "total_translations": translation_stats.total_translations or 0,
-                "target_languages_count": translation_stats.target_languages_count or 0,
-                "avg_quality_rating": (
-                    float(translation_stats.avg_quality_rating) if translation_stats.avg_quality_rating else None
-                ),
-                "translator_types_count": translation_stats.translator_types_count or 0,
+                "total_translations": summary.translation_count,
+                "target_languages_count": len(data["target_languages"]),
+                "avg_quality_rating": summary.avg_quality_rating or None,
+                "translator_types_count": len(translator_distribution),
                 "first_translation_date": (
-                    translation_stats.first_translation_date.isoformat()
-                    if translation_stats.first_translation_date
-                    else None
+                    summary.first_translation_at.isoformat() if summary.first_translation_at else None
                 ),
                 "last_translation_date": (
-                    translation_stats.last_translation_date.isoformat()
-                    if translation_stats.last_translation_date
-                    else None
+                    summary.last_translation_at.isoformat() if summary.last_translation_at else None
                 ),
             },
-            "language_pairs": [
-                {
-                    "source_language": pair.source_language,
-                    "target_language": pair.target_language,
-                    "translation_count": pair.translation_count,
-                }
-                for pair in language_pairs
-            ],
-            "translator_distribution": [
-                {
-                    "translator_type": dist.translator_type,
-                    "count": dist.count,
-                    "avg_quality": (float(dist.avg_quality) if dist.avg_quality else None),
-                }
-                for dist in translator_distribution
-            ],
+            "language_pairs": data["language_pairs"],
+            "translator_distribution": translator_distribution,
         }
 
         return WebAPIResponse(success=True, data=poet_stats)
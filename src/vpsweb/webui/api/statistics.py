@@ -4,11 +4,14 @@ VPSWeb Web UI - Statistics and Comparison API Endpoints v0.3.1
 API endpoints for repository statistics, data analysis, and translation comparisons.
 """
 
+from dataclasses import asdict
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
+from src.vpsweb.repository.backup import BackupError
+from src.vpsweb.repository.cache import get_cache_stats
 from src.vpsweb.repository.crud import RepositoryService
 from src.vpsweb.repository.database import get_db
 from src.vpsweb.repository.schemas import ComparisonView, RepositoryStats
@@ -41,6 +44,94 @@ async def get_repository_overview(
         )
 
 
+@router.get("/cache")
+async def get_entity_cache_stats():
+    """
+    Get hit ratio, size and memory usage of the poem and BBR entity caches.
+
+    **Returns:**
+    - Per-cache statistics
+    """
+    return get_cache_stats()
+
+
+def _get_backup_scheduler(request: Request):
+    scheduler = getattr(request.app.state, "backup_scheduler", None)
+    if scheduler is None:
+        raise HTTPException(status_code=503, detail="Repository backups are not configured")
+    return scheduler
+
+
+def _is_backup_error(error: Exception) -> bool:
+    # The app builds its scheduler from ``vpsweb.repository.backup`` while this module
+    # imports ``src.vpsweb.repository.backup``; the two load as separate modules with
+    # separate BackupError classes, so match the class by name rather than identity.
+    return any(cls.__name__ == BackupError.__name__ for cls in type(error).__mro__)
+
+
+@router.get("/backups")
+async def get_backup_status(request: Request):
+    """
+    Get the schedule, run counters, durations and recent history of repository backups.
+
+    **Returns:**
+    - Backup status including the last run and the next scheduled run
+    """
+    return _get_backup_scheduler(request).status()
+
+
+@router.post("/backups")
+async def run_backup(
+    request: Request,
+    snapshot: bool = Query(True, description="Also snapshot the output directories"),
+):
+    """
+    Take an online backup of the repository database now.
+
+    **Returns:**
+    - The completed run; ``success`` is false and ``error`` is set if it failed
+    """
+    scheduler = _get_backup_scheduler(request)
+    try:
+        run = await scheduler.run_now(snapshot=snapshot)
+    except Exception as e:
+        if not _is_backup_error(e):
+            raise
+        raise HTTPException(status_code=409, detail=str(e))
+    return asdict(run)
+
+
+@router.get("/maintenance")
+async def get_maintenance_status(
+    request: Request,
+    limit: int = Query(20, ge=1, le=1000, description="Recorded runs to return"),
+):
+    """
+    Get database fragmentation, the maintenance schedule and recorded page, freelist and index statistics.
+
+    **Returns:**
+    - Current storage statistics and the most recent maintenance runs, newest first
+    """
+    scheduler = getattr(request.app.state, "maintenance_scheduler", None)
+    if scheduler is None:
+        raise HTTPException(status_code=503, detail="Database maintenance is not configured")
+    return await scheduler.status(limit=limit)
+
+
+@router.post("/maintenance")
+async def run_maintenance(request: Request):
+    """
+    Run ANALYZE/optimize/incremental vacuum now, within the configured time budget.
+
+    **Returns:**
+    - The recorded run
+    """
+    scheduler = getattr(request.app.state, "maintenance_scheduler", None)
+    if scheduler is None:
+        raise HTTPException(status_code=503, detail="Database maintenance is not configured")
+    return await scheduler.run_now()
+
+
 @router.get("/translations/comparison/{poem_id}", response_model=ComparisonView)
 async def get_translation_comparison(
     poem_id: str,
@@ -11,6 +11,8 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from ...repository.database import get_db
+from ...repository.models import ULIDBinary
+from ...repository.pagination import InvalidCursorError, encode_cursor
 from ...repository.schemas import (
     HumanNoteCreate,
     TranslationCreate,
@@ -19,6 +21,7 @@ from ...repository.schemas import (
 )
 from ...repository.service import RepositoryWebService
 from ..container import container
+from ..job_queue import QueueFullError
 from ..schemas import TranslationRequest, WebAPIResponse
 from ..services.interfaces import IWorkflowServiceV2
 
@@ -51,12 +54,16 @@ async def trigger_translation(
     )
     print(f"🔧 [API] workflow_service type: {type(workflow_service)}")
 
-    task_id = await workflow_service.start_translation_workflow(
-        poem_id=request.poem_id,
-        target_lang=request.target_lang,
-        workflow_mode=request.workflow_mode,
-        background_tasks=background_tasks,
-    )
+    try:
+        task_id = await workflow_service.start_translation_workflow(
+            poem_id=request.poem_id,
+            target_lang=request.target_lang,
+            workflow_mode=request.workflow_mode,
+            background_tasks=background_tasks,
+            lane=request.lane,
+        )
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
 
     print(f"✅ [API] Got task_id: {task_id}")
 
@@ -74,27 +81,53 @@ async def list_translations(
     poem_id: Optional[str] = Query(None, description="Filter by poem ID"),
     target_language: Optional[str] = Query(None, description="Filter by target language"),
     translator_type: Optional[str] = Query(None, description="Filter by translator type"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (keyset pagination)"),
+    count: str = Query(
+        "none",
+        pattern="^(exact|approximate|none)$",
+        description="Total count mode: exact, approximate or none",
+    ),
     service: RepositoryWebService = Depends(get_repository_service),
 ):
     """
     Get list of translations with optional filtering and pagination.
+
+    Pass the returned `next_cursor` as `cursor` to page with keyset pagination;
+    `skip` is ignored when a cursor is given.
     """
-    raw_translations = service.repo.translations.get_multi(
-        skip=skip,
-        limit=limit,
-        poem_id=poem_id,
-        target_language=target_language,
-        translator_type=translator_type,
-    )
+    filters = {
+        "poem_id": poem_id,
+        "target_language": target_language,
+        "translator_type": translator_type,
+    }
+
+    if cursor:
+        try:
+            raw_translations, next_cursor = service.repo.translations.get_multi_after(
+                limit=limit, cursor=cursor, **filters
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        # Offset paging keeps working; fetch one extra row to hand out a cursor for the next page
+        raw_translations = service.repo.translations.get_multi(skip=skip, limit=limit + 1, **filters)
+        next_cursor = None
+        if len(raw_translations) > limit:
+            raw_translations = raw_translations[:limit]
+            next_cursor = encode_cursor(raw_translations[-1].created_at, raw_translations[-1].id)
+
+    total_count, total_is_exact = service.repo.translations.count_by_mode(count, **filters)
 
     # Convert SQLAlchemy models to Pydantic response schemas
     translations = [TranslationResponse.model_validate(t) for t in raw_translations]
 
     return {
         "translations": translations,
-        "total_count": len(translations),
+        "total_count": total_count if total_count is not None else len(translations),
+        "total_is_exact": total_is_exact,
         "skip": skip,
         "limit": limit,
+        "next_cursor": next_cursor,
     }
 
 
@@ -137,6 +170,25 @@ async def get_translation(
     return translation
 
 
+@router.get("/{translation_id}/payload", response_model=WebAPIResponse)
+async def get_translation_payload(
+    translation_id: str,
+    service: RepositoryWebService = Depends(get_repository_service),
+):
+    """
+    Get the archived workflow results for a translation.
+
+    The payload is stored compressed in a side table and only loaded here.
+    """
+    payload = service.repo.translation_payloads.get_data(translation_id)
+    if payload is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No workflow payload stored for translation '{translation_id}'",
+        )
+    return WebAPIResponse(success=True, message="Workflow payload retrieved", data=payload)
+
+
 @router.put("/{translation_id}", response_model=TranslationResponse)
 async def update_translation(
     translation_id: str,
@@ -184,10 +236,12 @@ async def update_quality_rating(
 
     try:
         # Update only the quality rating using a raw SQL statement
-        from sqlalchemy import text
+        from sqlalchemy import bindparam, text
 
         result = service.db.execute(
-            text("UPDATE translations SET quality_rating = :rating WHERE id = :id"),
+            text("UPDATE translations SET quality_rating = :rating WHERE id = :id").bindparams(
+                bindparam("id", type_=ULIDBinary)
+            ),
             {"rating": rating_data.quality_rating, "id": translation_id},
         )
         service.db.commit()
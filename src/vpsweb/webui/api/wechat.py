@@ -5,6 +5,7 @@ API endpoints for generating WeChat articles from translation workflow data.
 Integrates the CLI WeChat article generation workflow with the WebUI.
 """
 
+import asyncio
 import json
 from datetime import datetime
 from pathlib import Path
@@ -19,11 +20,18 @@ from vpsweb.repository.database import get_db
 from vpsweb.repository.models import Translation
 from vpsweb.services.config import ConfigFacade, get_config_facade
 
+from vpsweb.utils.article_generator import ArticleGenerationCancelled
+
+from ..job_queue import Job, JobQueue, QueueFullError, rate_limit_of
 from ..services.vpsweb_adapter import VPSWebWorkflowAdapterV2
+from ..task_store import InMemoryTaskStore, TaskNamespace
 from ..utils.wechat_article_runner import WeChatArticleRunner
 
 router = APIRouter()
 
+# Job kind of article generation on the shared job queue
+WECHAT_ARTICLE_JOB = "wechat_article"
+
 
 def get_repository_service(db: Session = Depends(get_db)) -> RepositoryService:
     """Dependency to get repository service instance"""
@@ -157,72 +165,46 @@ async def generate_wechat_article(
         translation_data = await _build_translation_data(translation, poem, workflow_steps, service)
         print(f"✅ Translation data built successfully")
 
-        print(f"🏃 Initializing WeChat article runner...")
-        # Initialize WeChat article runner with ConfigFacade
-        runner = WeChatArticleRunner(config_facade=config_facade)
-        print(f"✅ WeChat article runner initialized with ConfigFacade")
-
-        print(f"📝 Starting article generation (dry_run={request_body.dry_run})...")
-
-        # Generate task ID and start background generation
+        # Generate task ID and queue generation on the shared worker pool
         import uuid
 
         task_id = str(uuid.uuid4())
 
         # Store task in app state for status tracking
         if not hasattr(request.app.state, "wechat_tasks"):
-            request.app.state.wechat_tasks = {}
+            request.app.state.wechat_tasks = InMemoryTaskStore().namespace("wechat_tasks")
 
         request.app.state.wechat_tasks[task_id] = {
-            "status": "running",
+            "status": "queued",
             "translation_id": translation_id,
             "started_at": datetime.now().isoformat(),
             "result": None,
             "error": None,
+            "phase_timings": {},
         }
 
-        # Start background generation
-        from concurrent.futures import ThreadPoolExecutor
-
-        # Store app reference for background function
-        app_state = request.app.state
-
-        def generate_article_background():
-            try:
-                print(f"🔧 Background task {task_id}: Starting article generation...")
-                result = runner.generate_from_translation_data(
-                    translation_data=translation_data,
-                    author=request_body.author,
-                    digest=request_body.digest,
-                    dry_run=request_body.dry_run,
-                    custom_metadata={
+        print(f"📝 Queueing article generation (dry_run={request_body.dry_run})...")
+        try:
+            await request.app.state.job_queue.submit(
+                WECHAT_ARTICLE_JOB,
+                {
+                    "task_id": task_id,
+                    "translation_data": translation_data,
+                    "author": request_body.author,
+                    "digest": request_body.digest,
+                    "dry_run": request_body.dry_run,
+                    "custom_metadata": {
                         "translation_id": translation_id,
                         "poem_id": translation.poem_id,
                         "generated_from": "webui",
                     },
-                )
-                print(f"✅ Background task {task_id}: Article generation completed")
-
-                # Get article summary
-                article_summary = runner.get_article_summary(result)
-                print(f"✅ Background task {task_id}: Article summary retrieved")
-
-                # Update task status
-                app_state.wechat_tasks[task_id]["status"] = "completed"
-                app_state.wechat_tasks[task_id]["result"] = article_summary
-                app_state.wechat_tasks[task_id]["completed_at"] = datetime.now().isoformat()
-
-            except Exception as e:
-                print(f"❌ Background task {task_id} failed: {e}")
-                app_state.wechat_tasks[task_id]["status"] = "failed"
-                app_state.wechat_tasks[task_id]["error"] = str(e)
-                app_state.wechat_tasks[task_id]["failed_at"] = datetime.now().isoformat()
-
-        # Start background task
-        executor = ThreadPoolExecutor(max_workers=1)
-        executor.submit(generate_article_background)
+                },
+            )
+        except QueueFullError:
+            del request.app.state.wechat_tasks[task_id]
+            raise
 
-        print(f"🚀 Background task {task_id} started for translation {translation_id}")
+        print(f"🚀 Background task {task_id} queued for translation {translation_id}")
 
         return WeChatArticleResponse(
             success=True,
@@ -230,6 +212,9 @@ async def generate_wechat_article(
             data={"task_id": task_id},
         )
 
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
     except ImportError as e:
         # Handle import errors specifically
         error_msg = f"Import error in WeChat article generation: {str(e)}"
@@ -315,8 +300,10 @@ async def check_wechat_article_status(
                     "started_at": task_info.get("started_at"),
                     "completed_at": task_info.get("completed_at"),
                     "failed_at": task_info.get("failed_at"),
+                    "cancelled_at": task_info.get("cancelled_at"),
                     "error": task_info.get("error"),
                     "result": task_info.get("result"),
+                    "phase_timings": task_info.get("phase_timings", {}),
                 }
             )
 
@@ -342,6 +329,129 @@ async def check_wechat_article_status(
     )
 
 
+@router.post(
+    "/{translation_id}/wechat-article-tasks/{task_id}/cancel",
+    response_model=WeChatArticleResponse,
+)
+async def cancel_wechat_article_task(translation_id: str, task_id: str, request: Request):
+    """
+    Cancel a queued or running WeChat article generation task.
+
+    A queued task is skipped when a worker reaches it; a running task stops
+    before its next phase (notes synthesis, HTML render).
+
+    **Path Parameters:**
+    - **translation_id**: ULID of the translation
+    - **task_id**: ID returned when generation was started
+    """
+    wechat_tasks = getattr(request.app.state, "wechat_tasks", None)
+    if wechat_tasks is None or task_id not in wechat_tasks:
+        raise HTTPException(status_code=404, detail=f"WeChat article task '{task_id}' not found")
+
+    with wechat_tasks.edit(task_id) as task:
+        if task.get("translation_id") != translation_id:
+            raise HTTPException(status_code=404, detail=f"WeChat article task '{task_id}' not found")
+        if task["status"] not in ("queued", "running"):
+            raise HTTPException(
+                status_code=409,
+                detail=f"WeChat article task '{task_id}' is already {task['status']}",
+            )
+        task["status"] = "cancelled"
+        task["cancelled_at"] = datetime.now().isoformat()
+
+    return WeChatArticleResponse(
+        success=True,
+        message="WeChat article generation cancelled",
+        data={"task_id": task_id},
+    )
+
+
+def register_wechat_article_jobs(job_queue: JobQueue, wechat_tasks: TaskNamespace) -> None:
+    """Run queued WeChat article jobs on the shared worker pool, tracking them in ``wechat_tasks``"""
+
+    async def handler(job: Job) -> None:
+        await _run_wechat_article_job(job, wechat_tasks)
+
+    job_queue.register(WECHAT_ARTICLE_JOB, handler)
+
+
+async def _run_wechat_article_job(job: Job, wechat_tasks: TaskNamespace) -> None:
+    """
+    Generate one queued WeChat article in a worker thread.
+
+    The task record moves from queued to running to completed, failed or
+    cancelled, and keeps the seconds spent in each generation phase.
+    """
+    task_id = job.payload["task_id"]
+    if wechat_tasks.get(task_id) is None:
+        # Task state is gone (in-memory store after a restart); track the job afresh
+        metadata = job.payload["custom_metadata"]
+        wechat_tasks[task_id] = {
+            "status": "queued",
+            "translation_id": metadata["translation_id"],
+            "started_at": datetime.now().isoformat(),
+            "result": None,
+            "error": None,
+            "phase_timings": {},
+        }
+
+    # Checked in the same edit so a cancellation cannot land between check and start
+    with wechat_tasks.edit(task_id) as task:
+        if task["status"] == "cancelled":
+            print(f"⏭️ Background task {task_id} was cancelled before it started")
+            return
+        task["status"] = "running"
+
+    def cancelled() -> bool:
+        return wechat_tasks[task_id]["status"] == "cancelled"
+
+    phase_timings: Dict[str, float] = {}
+
+    def generate() -> Dict[str, Any]:
+        runner = WeChatArticleRunner(config_facade=get_config_facade())
+        try:
+            result = runner.generate_from_translation_data(
+                translation_data=job.payload["translation_data"],
+                author=job.payload["author"],
+                digest=job.payload["digest"],
+                dry_run=job.payload["dry_run"],
+                custom_metadata=job.payload["custom_metadata"],
+                cancel_check=cancelled,
+            )
+            return runner.get_article_summary(result)
+        finally:
+            phase_timings.update(runner.article_generator.phase_timings)
+
+    try:
+        print(f"🔧 Background task {task_id}: Starting article generation...")
+        article_summary = await asyncio.to_thread(generate)
+    except ArticleGenerationCancelled:
+        print(f"⏹️ Background task {task_id} cancelled")
+        with wechat_tasks.edit(task_id) as task:
+            task["phase_timings"] = phase_timings
+    except Exception as e:
+        if rate_limit_of(e) is not None and job.can_retry:
+            with wechat_tasks.edit(task_id) as task:
+                task["status"] = "queued"
+            raise
+        print(f"❌ Background task {task_id} failed: {e}")
+        with wechat_tasks.edit(task_id) as task:
+            task["status"] = "failed"
+            task["error"] = str(e)
+            task["failed_at"] = datetime.now().isoformat()
+            task["phase_timings"] = phase_timings
+        raise
+    else:
+        print(f"✅ Background task {task_id}: Article generation completed")
+        with wechat_tasks.edit(task_id) as task:
+            # A cancellation during the last phase keeps its status; the files are written anyway
+            if task["status"] != "cancelled":
+                task["status"] = "completed"
+                task["completed_at"] = datetime.now().isoformat()
+            task["result"] = article_summary
+            task["phase_timings"] = phase_timings
+
+
 async def _build_translation_data(
     translation: Translation,
     poem,
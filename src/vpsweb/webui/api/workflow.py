@@ -9,6 +9,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from vpsweb.repository.database import get_db
+from vpsweb.webui.job_queue import QueueFullError
 from vpsweb.webui.schemas import TranslationRequest, WebAPIResponse
 from vpsweb.webui.services.interfaces import IWorkflowServiceV2
 
@@ -35,7 +36,7 @@ def get_workflow_service(db: Session = Depends(get_db)) -> IWorkflowServiceV2:
 
         container = DIContainer()
         # Register minimal dependencies needed for workflow service
-        container.register_instance(ITaskManagementServiceV2, TaskManagementServiceV2({}, logger=None))
+        container.register_instance(ITaskManagementServiceV2, TaskManagementServiceV2(logger=None))
         container.register_singleton(IWorkflowServiceV2, WorkflowServiceV2)
 
         return container.resolve(IWorkflowServiceV2)
@@ -52,7 +53,7 @@ async def start_translation_workflow(
     """
     try:
         # Fetch the poem to get the source language
-        poem = workflow_service.repository_service.repo.poems.get_by_id(request.poem_id)
+        poem = workflow_service.repository_service.repo.poems.get_snapshot(request.poem_id)
         if not poem:
             raise HTTPException(
                 status_code=404,
@@ -67,12 +68,15 @@ async def start_translation_workflow(
             target_lang=request.target_lang,
             workflow_mode=request.workflow_mode,
             background_tasks=background_tasks,
+            lane=request.lane,
         )
         return WebAPIResponse(
             success=True,
             message="Translation workflow started successfully.",
             data={"task_id": task_id},
         )
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -4,6 +4,8 @@ VPSWeb Web UI Configuration v0.3.1
 Configuration settings for the FastAPI web interface.
 """
 
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -16,6 +18,37 @@ class WebUISettings(BaseSettings):
     log_level: str = "INFO"
     debug: bool = False
 
+    # Task state storage: "memory" (single worker) or "sqlite" (shared by all workers)
+    task_store: str = "memory"
+    task_store_path: str = "./repository_root/tasks.db"
+    task_store_poll_interval: float = 0.1
+    # Recent versions kept per task so reconnecting SSE clients can replay missed events
+    task_event_replay_size: int = 64
+    # Task retention: entries kept per namespace, seconds finished tasks are kept and seconds
+    # unfinished ones may go without an update; finished tasks drop their step outputs after
+    # task_compact_after seconds; the sweep runs every task_sweep_interval seconds (0 disables)
+    task_max_entries: int = 500
+    task_ttl: float = 3600.0
+    task_max_idle: float = 86400.0
+    task_compact_after: float = 60.0
+    task_sweep_interval: float = 60.0
+
+    # HTML templates: auto-reload follows `reload` unless set; bytecode cache defaults to the temp dir
+    template_auto_reload: Optional[bool] = None
+    template_bytecode_cache_dir: Optional[str] = None
+    template_precompile: bool = True
+
+    # Seconds between checks for edited prompt templates; 0 disables hot reload
+    prompt_reload_interval: float = 1.0
+
+    # Translation job queue: concurrent workflows, batch-lane share, waiting-job limit and persistence file
+    job_queue_workers: int = 2
+    job_queue_batch_workers: int = 1
+    job_queue_max_queued: int = 50
+    job_queue_max_attempts: int = 3
+    job_queue_rate_limit_cooldown: float = 30.0
+    job_queue_path: str = "./repository_root/jobs.db"
+
     model_config = {
         "env_file": ".env",
         "env_prefix": "WEBUI_",
@@ -0,0 +1,304 @@
+"""
+VPSWeb Web UI - SSE Event Hub v1.0
+
+Publish/subscribe fan-out for Server-Sent Events.
+
+An event is published once per topic and delivered to every subscriber's
+own bounded queue, so any number of browser tabs can follow the same task.
+A slow subscriber only affects itself: when its queue is full the
+subscription's overflow policy decides what happens:
+
+- ``drop_oldest``: discard the oldest queued event (default; progress
+  streams only need the latest state)
+- ``drop_newest``: discard the event being published
+- ``disconnect``: close the subscription, ending that client's stream
+
+Subscribers wait on their queue, so an idle stream costs nothing until an
+event arrives. ``TaskEventHub`` feeds the hub from the shared task store:
+one pump per watched task waits for the task to change and publishes a
+snapshot, however many streams are open for it.
+
+Task events are identified by the task's store version, which increases
+monotonically. SSE endpoints send it as the event id; a client that
+reconnects with ``Last-Event-ID`` is replayed the retained versions it
+missed (see ``TaskStore.enable_history``) before switching to live events.
+"""
+
+import asyncio
+import copy
+import logging
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from .task_store import TaskNamespace
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "disconnect")
+
+_CLOSED = object()
+
+
+def parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    """Event id from a ``Last-Event-ID`` header; None if absent or not a task event id"""
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+class Subscription:
+    """One subscriber's queue of events for a topic"""
+
+    def __init__(self, hub: "EventHub", topic: str, max_queue: int, overflow: str):
+        self.hub = hub
+        self.topic = topic
+        self.overflow = overflow
+        self.loop = asyncio.get_running_loop()
+        # One extra slot so the close marker always fits
+        self._queue: asyncio.Queue = asyncio.Queue(max_queue + 1)
+        self.max_queue = max_queue
+        self.dropped = 0
+        self.closed = False
+
+    def _offer(self, event: Any) -> None:
+        """Queue an event, applying the overflow policy (runs on the subscriber's loop)"""
+        if self.closed:
+            return
+        if self._queue.qsize() >= self.max_queue:
+            self.dropped += 1
+            if self.overflow == "drop_newest":
+                return
+            if self.overflow == "disconnect":
+                logger.warning(f"Closing slow subscriber of '{self.topic}' after {self.max_queue} queued events")
+                self.close()
+                return
+            self._queue.get_nowait()
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """
+        Next event, or None once the subscription is closed
+
+        Raises:
+            asyncio.TimeoutError: If no event arrives within ``timeout`` seconds
+        """
+        if self.closed and self._queue.empty():
+            return None
+        event = await asyncio.wait_for(self._queue.get(), timeout)
+        return None if event is _CLOSED else event
+
+    def close(self) -> None:
+        """Stop receiving events; a pending ``get`` returns None"""
+        if self.closed:
+            return
+        self.closed = True
+        self.hub._unsubscribe(self)
+        self._queue.put_nowait(_CLOSED)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        event = await self.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class EventHub:
+    """Fan-out of published events to all subscribers of a topic"""
+
+    def __init__(self, max_queue: int = 100, overflow: str = "drop_oldest"):
+        """
+        Args:
+            max_queue: Default number of undelivered events kept per subscriber
+            overflow: Default overflow policy, one of ``OVERFLOW_POLICIES``
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}'")
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self, topic: str, max_queue: Optional[int] = None, overflow: Optional[str] = None) -> Subscription:
+        """Subscribe the running event loop to a topic; close the subscription when done"""
+        overflow = overflow or self.overflow
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}'")
+        subscription = Subscription(self, topic, max_queue or self.max_queue, overflow)
+        with self._lock:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.topic]
+                    self._on_idle(subscription.topic)
+
+    def _on_idle(self, topic: str) -> None:
+        """Called (under the lock) when the last subscriber of a topic leaves"""
+
+    def publish(self, topic: str, event: Any) -> int:
+        """
+        Deliver an event to every subscriber of a topic; safe to call from any thread
+
+        Returns:
+            Number of subscribers the event was delivered to
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(topic, ()))
+        self.published += 1
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        for subscription in subscribers:
+            if subscription.loop is current_loop:
+                subscription._offer(event)
+            else:
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription._offer, event)
+                except RuntimeError:
+                    # The subscriber's event loop has been closed
+                    pass
+        return len(subscribers)
+
+    def subscriber_count(self, topic: Optional[str] = None) -> int:
+        with self._lock:
+            if topic is not None:
+                return len(self._subscribers.get(topic, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            subscriptions = [s for subscribers in self._subscribers.values() for s in subscribers]
+        return {
+            "topics": len({s.topic for s in subscriptions}),
+            "subscribers": len(subscriptions),
+            "published": self.published,
+            "dropped": sum(s.dropped for s in subscriptions),
+        }
+
+
+class TaskEventHub(EventHub):
+    """
+    Event hub publishing task store changes
+
+    Each event is ``{"version": int, "task": dict | None}``: a snapshot of the
+    task (``to_dict()`` for TaskStatus objects) taken once per change and
+    shared by all subscribers, or None when the task has been removed.
+    """
+
+    def __init__(self, tasks: TaskNamespace, max_queue: int = 100, overflow: str = "drop_oldest"):
+        super().__init__(max_queue=max_queue, overflow=overflow)
+        self.tasks = tasks
+        self._pumps: Dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def _event(version: int, task: Any) -> Dict[str, Any]:
+        if task is None:
+            return {"version": version, "task": None}
+        task = task.to_dict() if hasattr(task, "to_dict") else task
+        # Values of the in-memory store are live objects
+        return {"version": version, "task": copy.deepcopy(task)}
+
+    def snapshot(self, task_id: str) -> Dict[str, Any]:
+        """Current ``{"version", "task"}`` event for a task"""
+        version = self.tasks.version(task_id)
+        task = self.tasks.get(task_id)
+        return self._event(version if task is not None else 0, task)
+
+    def history(self, task_id: str) -> List[Dict[str, Any]]:
+        """Retained events of a task, oldest first"""
+        return [self._event(version, task) for version, task in self.tasks.history(task_id)]
+
+    def task_at(self, task_id: str, version: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Task snapshot of a retained version (what a reconnecting client last saw), if known"""
+        if version is None:
+            return None
+        for event in self.history(task_id):
+            if event["version"] == version:
+                return event["task"]
+        return None
+
+    async def stream(
+        self, task_id: str, after: Optional[int] = None, heartbeat: Optional[float] = None
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Events of a task: a replay followed by live changes
+
+        Without ``after`` the replay is the current snapshot; with it, every
+        retained event newer than ``after`` (or the current snapshot if the
+        history holds none). Events are never repeated or out of order. The
+        stream yields None after ``heartbeat`` idle seconds and ends after
+        the task has been removed.
+        """
+        with self.subscribe(task_id) as subscription:
+            replay = self.history(task_id) if after is not None else []
+            replay = [event for event in replay if event["version"] > after] if replay else [self.snapshot(task_id)]
+            last = after or 0
+            for event in replay:
+                if event["version"] > last or event["task"] is None:
+                    last = event["version"]
+                    yield event
+                if event["task"] is None:
+                    return
+
+            while True:
+                try:
+                    event = await subscription.get(timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event is None:
+                    return
+                if event["task"] is None:
+                    yield event
+                    return
+                if event["version"] > last:
+                    last = event["version"]
+                    yield event
+
+    def subscribe(self, topic: str, max_queue: Optional[int] = None, overflow: Optional[str] = None) -> Subscription:
+        subscription = super().subscribe(topic, max_queue=max_queue, overflow=overflow)
+        with self._lock:
+            if topic not in self._pumps:
+                self._pumps[topic] = asyncio.create_task(self._pump(topic, self.tasks.version(topic)))
+        return subscription
+
+    def _on_idle(self, topic: str) -> None:
+        pump = self._pumps.pop(topic, None)
+        if pump is not None:
+            pump.get_loop().call_soon_threadsafe(pump.cancel)
+
+    async def _pump(self, task_id: str, version: int) -> None:
+        """Publish a snapshot whenever the task changes, until nobody listens or it is removed"""
+        try:
+            while True:
+                version = await self.tasks.wait_for_change(task_id, version)
+                event = self.snapshot(task_id)
+                version = event["version"]
+                self.publish(task_id, event)
+                if event["task"] is None:
+                    break
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Task event pump for {task_id} failed: {e}")
+        finally:
+            with self._lock:
+                if self._pumps.get(task_id) is asyncio.current_task():
+                    del self._pumps[task_id]
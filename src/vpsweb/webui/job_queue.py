@@ -0,0 +1,483 @@
+"""
+VPSWeb Web UI - Job Queue v1.0
+
+Durable in-process queue for long-running jobs such as translation workflows.
+
+Jobs are persisted in a SQLite file before ``submit`` returns and removed
+once they finish, so work accepted before a restart or crash is picked up
+again. A fixed pool of worker coroutines runs them in two priority lanes:
+``interactive`` jobs (started from the UI) always go first, and ``batch``
+jobs may only occupy ``batch_workers`` workers so a batch run never
+blocks an interactive request.
+
+Admission control:
+
+- ``submit`` raises ``QueueFullError`` once ``max_queued`` jobs wait, with
+  a suggested retry delay that endpoints return as HTTP 429
+- a job failing with a provider rate limit (HTTP 429) is retried later;
+  the number of jobs run concurrently is halved and no job starts until
+  the cooldown (the provider's Retry-After, if known) has passed. Each
+  successful job raises the limit by one again, up to the pool size.
+
+Wait and run times are recorded per lane for ``stats`` and in the
+process-wide latency histograms served at ``/metrics``.
+
+Running jobs hold a lease that the queue renews while it is alive. Jobs
+whose lease expired (their process died) are reclaimed by any queue on
+the same file; claiming is atomic, so with several worker processes each
+job still runs once at a time.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from vpsweb.utils.metrics import JOB_RUN_SECONDS, JOB_WAIT_SECONDS, Histogram
+
+logger = logging.getLogger(__name__)
+
+JOB_LANES = ("interactive", "batch")
+
+JobHandler = Callable[["Job"], Awaitable[None]]
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def rate_limit_of(exc: BaseException) -> Optional[float]:
+    """
+    Whether an exception was caused by a provider rate limit (HTTP 429)
+
+    Follows the exception's cause/context chain, since step and workflow
+    errors wrap the provider's error.
+
+    Returns:
+        The provider's Retry-After in seconds (0 if unknown), or None if the
+        exception was not caused by a rate limit
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if getattr(exc, "status_code", None) == 429:
+            return float(getattr(exc, "retry_after", None) or 0)
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+@dataclass
+class Job:
+    """A unit of queued work"""
+
+    kind: str
+    payload: Dict[str, Any]
+    lane: str = "interactive"
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+    max_attempts: int = 3
+    enqueued_at: float = field(default_factory=time.time)
+    # Earliest time (epoch seconds) the job may start
+    not_before: float = 0.0
+
+    @property
+    def can_retry(self) -> bool:
+        """Whether a rate-limited run will be retried"""
+        return self.attempts < self.max_attempts
+
+
+class JobStore:
+    """
+    SQLite persistence of queued and running jobs
+
+    Each thread uses its own connection; the file is in WAL mode so
+    several processes can share it.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        # Serializes statements (the in-memory database has a single connection)
+        self._lock = threading.RLock()
+
+        conn = self._connection()
+        if path != ":memory:":
+            conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                lane TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                max_attempts INTEGER NOT NULL,
+                enqueued_at REAL NOT NULL,
+                not_before REAL NOT NULL,
+                lease_until REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, lease_until);
+            """
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self.path == ":memory:" and self._connections:
+                # One in-memory database, shared by all threads
+                conn = self._connections[0]
+            else:
+                conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def add(self, job: Job) -> None:
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, 'queued', ?, ?, ?, ?, NULL)",
+                (
+                    job.id,
+                    job.kind,
+                    job.lane,
+                    json.dumps(job.payload, ensure_ascii=False),
+                    job.attempts,
+                    job.max_attempts,
+                    job.enqueued_at,
+                    job.not_before,
+                ),
+            )
+
+    def claim(self, job: Job, lease_until: float) -> bool:
+        """Mark a job running; False if it is gone or another live queue holds it"""
+        with self._lock:
+            cursor = self._connection().execute(
+                "UPDATE jobs SET status = 'running', attempts = ?, lease_until = ? "
+                "WHERE id = ? AND (status = 'queued' OR lease_until < ?)",
+                (job.attempts, lease_until, job.id, time.time()),
+            )
+            return cursor.rowcount == 1
+
+    def requeue(self, job: Job) -> None:
+        with self._lock:
+            self._connection().execute(
+                "UPDATE jobs SET status = 'queued', attempts = ?, not_before = ?, lease_until = NULL WHERE id = ?",
+                (job.attempts, job.not_before, job.id),
+            )
+
+    def remove(self, job_id: str) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def renew(self, job_ids: List[str], lease_until: float) -> None:
+        if not job_ids:
+            return
+        with self._lock:
+            self._connection().executemany(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND status = 'running'",
+                [(lease_until, job_id) for job_id in job_ids],
+            )
+
+    def claimable(self) -> List[Job]:
+        """Queued jobs and running jobs whose lease expired, oldest first"""
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    "SELECT id, kind, lane, payload, attempts, max_attempts, enqueued_at, not_before FROM jobs "
+                    "WHERE status = 'queued' OR lease_until < ? ORDER BY enqueued_at",
+                    (time.time(),),
+                )
+                .fetchall()
+            )
+        return [
+            Job(
+                id=row[0],
+                kind=row[1],
+                lane=row[2],
+                payload=json.loads(row[3]),
+                attempts=row[4],
+                max_attempts=row[5],
+                enqueued_at=row[6],
+                not_before=row[7],
+            )
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class JobQueue:
+    """Worker pool running persisted jobs by lane priority, with rate-limit backoff"""
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        workers: int = 2,
+        batch_workers: int = 1,
+        max_queued: int = 50,
+        max_attempts: int = 3,
+        rate_limit_cooldown: float = 30.0,
+        lease_seconds: float = 60.0,
+    ):
+        """
+        Args:
+            store: Job persistence; an in-memory database if None
+            workers: Maximum number of jobs run at once
+            batch_workers: Maximum number of batch-lane jobs run at once
+            max_queued: Waiting jobs accepted before ``submit`` refuses more
+            max_attempts: Runs of a job before a rate-limited job is given up
+            rate_limit_cooldown: Seconds to hold new jobs after a rate limit
+                without Retry-After; doubles while rate limits continue
+            lease_seconds: How long a running job stays claimed without renewal
+        """
+        self.store = store or JobStore()
+        self.workers = max(1, workers)
+        self.batch_workers = max(1, min(batch_workers, self.workers))
+        self.max_queued = max_queued
+        self.max_attempts = max_attempts
+        self.rate_limit_cooldown = rate_limit_cooldown
+        self.lease_seconds = lease_seconds
+
+        # Jobs allowed to run at once; lowered after rate limits
+        self.concurrency = self.workers
+        self._handlers: Dict[str, JobHandler] = {}
+        self._queued: Dict[str, List[Job]] = {lane: [] for lane in JOB_LANES}
+        self._running: Dict[str, Job] = {}
+        self._paused_until = 0.0
+        self._rate_limit_streak = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._tasks: List[asyncio.Task] = []
+
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.rate_limited = 0
+        self.rejected = 0
+        self.wait_time = {lane: Histogram() for lane in JOB_LANES}
+        self.run_time = {lane: Histogram() for lane in JOB_LANES}
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """Run jobs of a kind with ``handler``, awaited with the Job"""
+        self._handlers[kind] = handler
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    @property
+    def active_jobs(self) -> int:
+        """Number of jobs currently being run by the workers"""
+        return len(self._running)
+
+    def depth(self, lane: Optional[str] = None) -> int:
+        """Number of waiting jobs, in one lane or overall"""
+        if lane is not None:
+            return len(self._queued[lane])
+        return sum(len(jobs) for jobs in self._queued.values())
+
+    async def submit(self, kind: str, payload: Dict[str, Any], lane: str = "interactive") -> Job:
+        """
+        Persist a job and queue it for a worker
+
+        Raises:
+            ValueError: For an unknown lane or job kind
+            QueueFullError: If ``max_queued`` jobs are already waiting
+        """
+        if lane not in JOB_LANES:
+            raise ValueError(f"Unknown job lane '{lane}'")
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind '{kind}'")
+        if self.depth() >= self.max_queued:
+            self.rejected += 1
+            raise QueueFullError(f"Job queue is full ({self.max_queued} jobs waiting)", self.retry_after())
+
+        job = Job(kind=kind, payload=payload, lane=lane, max_attempts=self.max_attempts)
+        await asyncio.to_thread(self.store.add, job)
+        self._queued[lane].append(job)
+        await self._wake()
+        logger.info(f"Queued {kind} job {job.id} in lane '{lane}' (depth {self.depth()})")
+        return job
+
+    def retry_after(self) -> int:
+        """Suggested seconds before submitting again"""
+        paused_for = self._paused_until - time.time()
+        if paused_for > 0:
+            return math.ceil(paused_for)
+        timer = self.run_time["interactive"]
+        average = timer.sum / timer.count if timer.count else 30.0
+        return max(1, math.ceil(average * self.depth() / self.concurrency))
+
+    async def start(self) -> None:
+        """Recover persisted jobs and start the workers"""
+        if self._tasks:
+            return
+        self._condition = asyncio.Condition()
+        await self._recover()
+        self._tasks = [asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._lease_loop(), name="job-lease"))
+        logger.info(f"Job queue started with {self.workers} workers ({self.depth()} jobs recovered)")
+
+    async def stop(self) -> None:
+        """Stop the workers; interrupted jobs are queued again for the next start"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in list(self._running.values()):
+            await asyncio.to_thread(self.store.requeue, job)
+        self._running.clear()
+        logger.info("Job queue stopped")
+
+    def close(self) -> None:
+        self.store.close()
+
+    async def _recover(self) -> None:
+        known = {job.id for job in self._running.values()}
+        known.update(job.id for jobs in self._queued.values() for job in jobs)
+        for job in await asyncio.to_thread(self.store.claimable):
+            if job.id not in known and job.lane in self._queued:
+                self._queued[job.lane].append(job)
+
+    async def _wake(self) -> None:
+        if self._condition is not None:
+            async with self._condition:
+                self._condition.notify_all()
+
+    def _next_job(self) -> Optional[Job]:
+        """Waiting job to start now, interactive lane first; None if none may start"""
+        now = time.time()
+        if now < self._paused_until or len(self._running) >= self.concurrency:
+            return None
+        for lane in JOB_LANES:
+            if lane == "batch" and sum(job.lane == "batch" for job in self._running.values()) >= self.batch_workers:
+                continue
+            for index, job in enumerate(self._queued[lane]):
+                if job.not_before <= now:
+                    return self._queued[lane].pop(index)
+        return None
+
+    def _next_wakeup(self) -> Optional[float]:
+        """Seconds until a delayed job or the end of a rate-limit pause"""
+        times = [job.not_before for jobs in self._queued.values() for job in jobs if job.not_before]
+        if self._paused_until:
+            times.append(self._paused_until)
+        future = [moment - time.time() for moment in times if moment > time.time()]
+        return min(future) if future else None
+
+    async def _worker(self) -> None:
+        while True:
+            async with self._condition:
+                job = self._next_job()
+                while job is None:
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), self._next_wakeup())
+                    except asyncio.TimeoutError:
+                        pass
+                    job = self._next_job()
+                job.attempts += 1
+                self._running[job.id] = job
+
+            try:
+                claimed = await asyncio.to_thread(self.store.claim, job, time.time() + self.lease_seconds)
+                if claimed:
+                    await self._run(job)
+            finally:
+                self._running.pop(job.id, None)
+                await self._wake()
+
+    async def _run(self, job: Job) -> None:
+        started = time.time()
+        waited = started - max(job.enqueued_at, job.not_before)
+        self.wait_time[job.lane].observe(waited)
+        JOB_WAIT_SECONDS.observe(waited, job.kind, job.lane)
+        handler = self._handlers.get(job.kind)
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job kind '{job.kind}'")
+            await handler(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._observe_run(job, time.time() - started)
+            retry_after = rate_limit_of(e)
+            if retry_after is not None:
+                self._on_rate_limit(retry_after)
+                if job.can_retry:
+                    job.not_before = self._paused_until
+                    self.retried += 1
+                    await asyncio.to_thread(self.store.requeue, job)
+                    self._queued[job.lane].insert(0, job)
+                    logger.warning(
+                        f"Job {job.id} hit a provider rate limit; retrying in "
+                        f"{job.not_before - time.time():.0f}s with concurrency {self.concurrency}"
+                    )
+                    return
+            self.failed += 1
+            logger.error(f"Job {job.id} ({job.kind}) failed after {job.attempts} attempt(s): {e}")
+        else:
+            self._observe_run(job, time.time() - started)
+            self.completed += 1
+            self._rate_limit_streak = 0
+            self.concurrency = min(self.workers, self.concurrency + 1)
+        await asyncio.to_thread(self.store.remove, job.id)
+
+    def _observe_run(self, job: Job, seconds: float) -> None:
+        self.run_time[job.lane].observe(seconds)
+        JOB_RUN_SECONDS.observe(seconds, job.kind, job.lane)
+
+    def _on_rate_limit(self, retry_after: float) -> None:
+        self.rate_limited += 1
+        self._rate_limit_streak += 1
+        self.concurrency = max(1, self.concurrency // 2)
+        cooldown = retry_after or min(self.rate_limit_cooldown * 2 ** (self._rate_limit_streak - 1), 600.0)
+        self._paused_until = max(self._paused_until, time.time() + cooldown)
+
+    async def _lease_loop(self) -> None:
+        """Renew the leases of running jobs and pick up jobs abandoned by dead processes"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await asyncio.to_thread(self.store.renew, list(self._running), time.time() + self.lease_seconds)
+                await self._recover()
+                await self._wake()
+            except Exception as e:
+                logger.error(f"Job lease renewal failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        paused_for = max(0.0, self._paused_until - time.time())
+        return {
+            "workers": self.workers,
+            "concurrency": self.concurrency,
+            "paused_seconds": round(paused_for, 1),
+            "depth": {lane: self.depth(lane) for lane in JOB_LANES},
+            "running": {lane: sum(job.lane == lane for job in self._running.values()) for lane in JOB_LANES},
+            "completed": self.completed,
+            "failed": self.failed,
+            "retried": self.retried,
+            "rate_limited": self.rate_limited,
+            "rejected": self.rejected,
+            "wait_time": {lane: timer.as_dict() for lane, timer in self.wait_time.items()},
+            "run_time": {lane: timer.as_dict() for lane, timer in self.run_time.items()},
+        }
@@ -8,19 +8,24 @@ and the service layer pattern. It replaces the monolithic main.py architecture.
 import asyncio
 import logging
 import time
+from contextlib import aclosing
 from typing import Optional
 
 from fastapi import Depends, FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
 from sse_starlette import EventSourceResponse
 
 from vpsweb.core.container import DIContainer
 from vpsweb.models.config import LogLevel
+from vpsweb.repository.backup import BackupError, BackupScheduler
 from vpsweb.repository.crud import RepositoryService
 from vpsweb.repository.database import get_db
+from vpsweb.repository.instrumentation import log_repeated_statements, track_queries
+from vpsweb.repository.maintenance import MaintenanceScheduler
 from vpsweb.repository.service import RepositoryWebService
+from vpsweb.repository.settings import settings as repository_settings
 from vpsweb.services.config import initialize_config_facade
 from vpsweb.services.llm.factory import LLMFactory
 from vpsweb.services.prompts import PromptService
@@ -30,8 +35,10 @@ from vpsweb.utils.config_loader import (
     load_task_templates_config,
 )
 from vpsweb.utils.logger import setup_logging
+from vpsweb.utils.metrics import HTTP_REQUEST_SECONDS, UNMATCHED_ROUTE, metrics
 from vpsweb.utils.storage import StorageHandler
 from vpsweb.webui.api import (
+    export,
     manual_workflow,
     poems,
     poets,
@@ -40,7 +47,12 @@ from vpsweb.webui.api import (
     wechat,
     workflow,
 )
+from vpsweb.webui.config import settings as webui_settings
 from vpsweb.webui.container import container
+from vpsweb.webui.event_hub import TaskEventHub, parse_last_event_id
+from vpsweb.webui.job_queue import JobQueue, JobStore
+from vpsweb.webui.task_models import compact_task, task_is_finished
+from vpsweb.webui.task_store import InMemoryTaskStore, RetentionPolicy, TaskSweeper, create_task_store
 
 from .services.interfaces import (
     IBBRServiceV2,
@@ -81,10 +93,200 @@ except Exception as e:
     logging.getLogger(__name__).warning(f"Failed to load config for logging setup: {e}, using INFO level")
 
 
+def _partial_output_events(task_id: str, current_task: dict, previous: dict) -> list:
+    """SSE "field" events for step output fields that streamed in since the state a client last saw"""
+    import asyncio
+    import json
+
+    events = []
+    seen = previous.get("partial_outputs") or {}
+    for step, fields in (current_task.get("partial_outputs") or {}).items():
+        for field, content in fields.items():
+            if seen.get(step, {}).get(field) != content:
+                events.append(
+                    {
+                        "event": "field",
+                        "data": json.dumps(
+                            {
+                                "task_id": task_id,
+                                "step": step,
+                                "field": field,
+                                "content": content,
+                                "timestamp": asyncio.get_event_loop().time(),
+                            }
+                        ),
+                    }
+                )
+    return events
+
+
+def _translation_change_events(task_id: str, current_task: dict, previous: dict) -> list:
+    """SSE events describing how a task changed since the state a client last saw"""
+    import asyncio
+    import json
+
+    field_events = _partial_output_events(task_id, current_task, previous)
+    status_changed = current_task.get("status") != previous.get("status")
+    progress_changed = current_task.get("progress", 0) != previous.get("progress", 0)
+    step_changed = current_task.get("current_step") != previous.get("current_step")
+    if not (status_changed or progress_changed or step_changed):
+        return field_events
+
+    print(
+        f"[SSE APP_STATE] Task {task_id} status changed: {current_task.get('status')}, progress: {current_task.get('progress', 0)}%, step: {current_task.get('current_step')}"
+    )
+
+    # Send update event
+    events = field_events + [
+        {
+            "event": "status",
+            "data": json.dumps(
+                {
+                    "task_id": task_id,
+                    "status": current_task.get("status"),
+                    "progress": current_task.get("progress", 0),
+                    "current_step": current_task.get("current_step"),
+                    "step_states": current_task.get("step_states", {}),
+                    "step_progress": current_task.get("step_progress", {}),
+                    "timestamp": asyncio.get_event_loop().time(),
+                }
+            ),
+        }
+    ]
+
+    # Send step-specific events
+    if step_changed:
+        # Send step_change event (frontend expects this)
+        events.append(
+            {
+                "event": "step_change",
+                "data": json.dumps(
+                    {
+                        "task_id": task_id,
+                        "status": current_task.get("status"),
+                        "progress": current_task.get("progress", 0),
+                        "current_step": current_task.get("current_step"),
+                        "step_states": current_task.get("step_states", {}),
+                        "step_progress": current_task.get("step_progress", {}),
+                        "step_details": current_task.get("step_details", {}),
+                        "timestamp": asyncio.get_event_loop().time(),
+                    }
+                ),
+            }
+        )
+
+        # Create step to number mapping
+        step_to_number = {
+            "Initial Translation": 1,
+            "Editor Review": 2,
+            "Translator Revision": 3,
+        }
+
+        if current_task.get("step_states") and current_task.get("current_step") in current_task.get("step_states", {}):
+            step_state = current_task.get("step_states", {})[current_task.get("current_step")]
+            step_number = step_to_number.get(current_task.get("current_step"), 1)
+
+            if step_state == "running":
+                events.append(
+                    {
+                        "event": "step_start",
+                        "data": json.dumps(
+                            {
+                                "task_id": task_id,
+                                "step": step_number,
+                                "message": f"Step started: {current_task.get('current_step')}",
+                                "timestamp": asyncio.get_event_loop().time(),
+                            }
+                        ),
+                    }
+                )
+            elif step_state == "completed":
+                events.append(
+                    {
+                        "event": "step_complete",
+                        "data": json.dumps(
+                            {
+                                "task_id": task_id,
+                                "step": step_number,
+                                "message": f"Step completed: {current_task.get('current_step')}",
+                                "timestamp": asyncio.get_event_loop().time(),
+                            }
+                        ),
+                    }
+                )
+
+    # If task completed, send completion event
+    if current_task.get("status") == "completed":
+        events.append(
+            {
+                "event": "completed",
+                "data": json.dumps(
+                    {
+                        "task_id": task_id,
+                        "message": "✅ Translation workflow completed successfully!",
+                        "progress": 100,
+                        "timestamp": asyncio.get_event_loop().time(),
+                    }
+                ),
+            }
+        )
+    elif current_task.get("status") == "failed":
+        events.append(
+            {
+                "event": "error",
+                "data": json.dumps(
+                    {
+                        "task_id": task_id,
+                        "message": f"Translation failed: {current_task.get('current_step')}",
+                        "timestamp": asyncio.get_event_loop().time(),
+                    }
+                ),
+            }
+        )
+    return events
+
+
+def _workflow_change_event_type(current_dict: dict, last_status: dict) -> Optional[str]:
+    """SSE event type for a workflow task change ("status" or "step_change"), or None if nothing relevant changed"""
+    # Enhanced change detection - focus on step changes, not progress percentage
+    has_progress_change = (
+        current_dict["status"] != last_status["status"] or current_dict["current_step"] != last_status["current_step"]
+    )
+
+    # Specific step change detection - check for step status transitions
+    has_step_change = False
+    current_step_details = current_dict.get("step_details") or {}
+    last_step_details = last_status.get("step_details") or {}
+
+    # Check if current step status changed (running -> completed)
+    if current_step_details.get("step_status") != last_step_details.get("step_status"):
+        has_step_change = True
+        print(
+            f"🔍 [SSE] Step status change detected: {last_step_details.get('step_status')} -> {current_step_details.get('step_status')}"
+        )
+
+    # Check if any step states changed
+    if current_dict.get("step_states", {}) != last_status.get("step_states", {}):
+        has_step_change = True
+        print(f"🔍 [SSE] Step states changed detected")
+
+    # Additional check for task timestamp changes (more sensitive detection)
+    has_time_change = current_dict.get("updated_at") != last_status.get("updated_at")
+
+    # Send update if any significant field changed OR timestamp changed OR step changed
+    if has_step_change:
+        return "step_change"
+    if has_progress_change or has_time_change:
+        return "status"
+    return None
+
+
 async def create_translation_events_from_app_state(request: Request, task_id: str):
     """
     Create translation progress events from app.state.tasks (like original working design).
-    This function reads TaskStatus objects directly from app.state.tasks and streams updates.
+    This function streams task changes pushed by the task event hub. Every task event
+    carries the task version as its SSE id; a client reconnecting with Last-Event-ID
+    is replayed the changes it missed before switching to live updates.
     """
     import asyncio
     import json
@@ -95,7 +297,8 @@ async def create_translation_events_from_app_state(request: Request, task_id: st
 
         # Initialize app.state.tasks if not present
         if not hasattr(app.state, "tasks"):
-            app.state.tasks = {}
+            app.state.tasks = InMemoryTaskStore().namespace("tasks")
+            app.state.task_events = TaskEventHub(app.state.tasks)
 
         # Debug: Print app.state.tasks info
         print(f"[SSE APP_STATE] Looking for task {task_id} in app.state.tasks. Total tasks: {len(app.state.tasks)}")
@@ -116,198 +319,95 @@ async def create_translation_events_from_app_state(request: Request, task_id: st
             }
             return
 
-        task_status = app.state.tasks[task_id]
-        print(
-            f"[SSE APP_STATE] SSE connection established for task {task_id}, current status: {task_status.get('status')}, progress: {task_status.get('progress', 0)}%"
-        )
-
-        # Send initial connection event
-        yield {
-            "event": "connected",
-            "data": json.dumps(
-                {
-                    "task_id": task_id,
-                    "status": task_status.get("status", "unknown"),
-                    "progress": task_status.get("progress", 0),
-                    "timestamp": asyncio.get_event_loop().time(),
-                }
-            ),
-        }
-
-        # Send current task status
-        yield {
-            "event": "status",
-            "data": json.dumps(
-                {
-                    "task_id": task_id,
-                    "status": task_status.get("status", "unknown"),
-                    "progress": task_status.get("progress", 0),
-                    "current_step": task_status.get("current_step"),
-                    "step_states": task_status.get("step_states", {}),
-                    "step_progress": task_status.get("step_progress", {}),
-                    "timestamp": asyncio.get_event_loop().time(),
-                }
-            ),
-        }
-
-        # If task is already completed, send completion event and exit
-        if task_status.get("status") == "completed":
-            yield {
-                "event": "completed",
-                "data": json.dumps(
-                    {
-                        "task_id": task_id,
-                        "message": "✅ Translation workflow completed successfully!",
-                        "progress": 100,
-                        "timestamp": asyncio.get_event_loop().time(),
-                    }
-                ),
-            }
-            return
-
-        # Listen for task status changes by polling app.state.tasks
-        last_status = task_status.get("status")
-        last_progress = task_status.get("progress", 0)
-        last_step = task_status.get("current_step")
-
-        while True:
-            # Check if client disconnected
-            if await request.is_disconnected():
-                print(f"[SSE APP_STATE] Client disconnected from task {task_id}")
-                break
-
-            # Get current task status from app.state.tasks
-            current_task = app.state.tasks.get(task_id)
-            if not current_task:
-                yield {
-                    "event": "error",
-                    "data": json.dumps(
-                        {
-                            "task_id": task_id,
-                            "message": "Task disappeared from app.state.tasks",
-                            "timestamp": asyncio.get_event_loop().time(),
-                        }
-                    ),
-                }
-                break
-
-            # Check for status changes
-            status_changed = current_task.get("status") != last_status
-            progress_changed = current_task.get("progress", 0) != last_progress
-            step_changed = current_task.get("current_step") != last_step
-
-            if status_changed or progress_changed or step_changed:
-                print(
-                    f"[SSE APP_STATE] Task {task_id} status changed: {current_task.get('status')}, progress: {current_task.get('progress', 0)}%, step: {current_task.get('current_step')}"
-                )
+        task_events = app.state.task_events
+        last_event_id = parse_last_event_id(request.headers.get("last-event-id"))
+        # State the client already has when resuming, if it is still in the replay log
+        previous = task_events.task_at(task_id, last_event_id)
 
-                # Send update event
-                yield {
-                    "event": "status",
-                    "data": json.dumps(
-                        {
-                            "task_id": task_id,
-                            "status": current_task.get("status"),
-                            "progress": current_task.get("progress", 0),
-                            "current_step": current_task.get("current_step"),
-                            "step_states": current_task.get("step_states", {}),
-                            "step_progress": current_task.get("step_progress", {}),
-                            "timestamp": asyncio.get_event_loop().time(),
-                        }
-                    ),
-                }
+        async with aclosing(task_events.stream(task_id, after=last_event_id)) as events:
+            async for event in events:
+                # Check if client disconnected
+                if await request.is_disconnected():
+                    print(f"[SSE APP_STATE] Client disconnected from task {task_id}")
+                    break
 
-                # Send step-specific events
-                if step_changed and last_step != current_task.get("current_step"):
-                    # Send step_change event (frontend expects this)
+                current_task = event["task"]
+                if not current_task:
                     yield {
-                        "event": "step_change",
+                        "event": "error",
                         "data": json.dumps(
                             {
                                 "task_id": task_id,
-                                "status": current_task.get("status"),
-                                "progress": current_task.get("progress", 0),
-                                "current_step": current_task.get("current_step"),
-                                "step_states": current_task.get("step_states", {}),
-                                "step_progress": current_task.get("step_progress", {}),
-                                "step_details": current_task.get("step_details", {}),
+                                "message": "Task disappeared from app.state.tasks",
                                 "timestamp": asyncio.get_event_loop().time(),
                             }
                         ),
                     }
+                    break
+                event_id = str(event["version"])
 
-                    # Create step to number mapping
-                    step_to_number = {
-                        "Initial Translation": 1,
-                        "Editor Review": 2,
-                        "Translator Revision": 3,
-                    }
-
-                    if current_task.get("step_states") and current_task.get("current_step") in current_task.get(
-                        "step_states", {}
-                    ):
-                        step_state = current_task.get("step_states", {})[current_task.get("current_step")]
-                        step_number = step_to_number.get(current_task.get("current_step"), 1)
-
-                        if step_state == "running":
-                            yield {
-                                "event": "step_start",
-                                "data": json.dumps(
-                                    {
-                                        "task_id": task_id,
-                                        "step": step_number,
-                                        "message": f"Step started: {current_task.get('current_step')}",
-                                        "timestamp": asyncio.get_event_loop().time(),
-                                    }
-                                ),
-                            }
-                        elif step_state == "completed":
-                            yield {
-                                "event": "step_complete",
-                                "data": json.dumps(
-                                    {
-                                        "task_id": task_id,
-                                        "step": step_number,
-                                        "message": f"Step completed: {current_task.get('current_step')}",
-                                        "timestamp": asyncio.get_event_loop().time(),
-                                    }
-                                ),
-                            }
+                if previous is None:
+                    print(
+                        f"[SSE APP_STATE] SSE connection established for task {task_id}, current status: {current_task.get('status')}, progress: {current_task.get('progress', 0)}%"
+                    )
 
-                # If task completed, send completion event
-                if current_task.get("status") == "completed":
+                    # Send initial connection event
                     yield {
-                        "event": "completed",
+                        "event": "connected",
+                        "id": event_id,
                         "data": json.dumps(
                             {
                                 "task_id": task_id,
-                                "message": "✅ Translation workflow completed successfully!",
-                                "progress": 100,
+                                "status": current_task.get("status", "unknown"),
+                                "progress": current_task.get("progress", 0),
                                 "timestamp": asyncio.get_event_loop().time(),
                             }
                         ),
                     }
-                    break
-                elif current_task.get("status") == "failed":
+
+                    # Send current task status
                     yield {
-                        "event": "error",
+                        "event": "status",
+                        "id": event_id,
                         "data": json.dumps(
                             {
                                 "task_id": task_id,
-                                "message": f"Translation failed: {current_task.get('current_step')}",
+                                "status": current_task.get("status", "unknown"),
+                                "progress": current_task.get("progress", 0),
+                                "current_step": current_task.get("current_step"),
+                                "step_states": current_task.get("step_states", {}),
+                                "step_progress": current_task.get("step_progress", {}),
                                 "timestamp": asyncio.get_event_loop().time(),
                             }
                         ),
                     }
-                    break
 
-                # Update last known values
-                last_status = current_task.get("status")
-                last_progress = current_task.get("progress", 0)
-                last_step = current_task.get("current_step")
+                    # Output fields that streamed in before the client connected
+                    for field_event in _partial_output_events(task_id, current_task, {}):
+                        yield {**field_event, "id": event_id}
+
+                    # If task is already completed, send completion event and exit
+                    if current_task.get("status") == "completed":
+                        yield {
+                            "event": "completed",
+                            "id": event_id,
+                            "data": json.dumps(
+                                {
+                                    "task_id": task_id,
+                                    "message": "✅ Translation workflow completed successfully!",
+                                    "progress": 100,
+                                    "timestamp": asyncio.get_event_loop().time(),
+                                }
+                            ),
+                        }
+                        break
+                else:
+                    for change_event in _translation_change_events(task_id, current_task, previous):
+                        yield {**change_event, "id": event_id}
+                    if current_task.get("status") in ("completed", "failed"):
+                        break
 
-            # Wait before next check (poll every 500ms for responsiveness)
-            await asyncio.sleep(0.5)
+                previous = current_task
 
     except Exception as e:
         print(f"[SSE APP_STATE] Error generating events for task {task_id}: {e}")
@@ -401,8 +501,34 @@ class ApplicationRouterV2:
         """Application startup event."""
         self.logger.info("VPSWeb Application starting up...")
 
-        # Initialize any startup tasks
-        # For example: start background task cleanup, validate services, etc.
+        # Compile page templates before the first request
+        if webui_settings.template_precompile:
+            await asyncio.to_thread(self.template_service.precompile)
+
+        # Pick up edited prompt templates without a restart
+        prompt_service = getattr(self.app.state, "prompt_service", None)
+        if prompt_service is not None and webui_settings.prompt_reload_interval > 0:
+            prompt_service.start_watching(webui_settings.prompt_reload_interval)
+
+        # Start the workflow workers, resuming jobs queued before the last shutdown
+        job_queue = getattr(self.app.state, "job_queue", None)
+        if job_queue is not None:
+            await job_queue.start()
+
+        # Expire and compact finished tasks in the background
+        task_sweeper = getattr(self.app.state, "task_sweeper", None)
+        if task_sweeper is not None:
+            task_sweeper.start()
+
+        # Start scheduled repository backups
+        backup_scheduler = getattr(self.app.state, "backup_scheduler", None)
+        if backup_scheduler is not None:
+            backup_scheduler.start()
+
+        # Start idle-time database maintenance
+        maintenance_scheduler = getattr(self.app.state, "maintenance_scheduler", None)
+        if maintenance_scheduler is not None:
+            maintenance_scheduler.start()
 
         self.logger.info("VPSWeb Application startup complete")
 
@@ -410,37 +536,103 @@ class ApplicationRouterV2:
         """Application shutdown event."""
         self.logger.info("VPSWeb Application shutting down...")
 
-        # Cleanup resources
-        # For example: cleanup tasks, close connections, etc.
+        # Stop scheduled repository backups
+        backup_scheduler = getattr(self.app.state, "backup_scheduler", None)
+        if backup_scheduler is not None:
+            await backup_scheduler.stop()
+
+        # Stop database maintenance
+        maintenance_scheduler = getattr(self.app.state, "maintenance_scheduler", None)
+        if maintenance_scheduler is not None:
+            await maintenance_scheduler.stop()
+
+        prompt_service = getattr(self.app.state, "prompt_service", None)
+        if prompt_service is not None:
+            prompt_service.stop_watching()
+
+        # Interrupted workflows stay queued for the next start
+        job_queue = getattr(self.app.state, "job_queue", None)
+        if job_queue is not None:
+            await job_queue.stop()
+            job_queue.close()
+
+        task_sweeper = getattr(self.app.state, "task_sweeper", None)
+        if task_sweeper is not None:
+            await task_sweeper.stop()
+
+        # Release the task store's connections and watcher thread
+        task_store = getattr(self.app.state, "task_store", None)
+        if task_store is not None:
+            task_store.close()
 
         self.logger.info("VPSWeb Application shutdown complete")
 
+    def _request_finished(self):
+        self.app.state.active_requests -= 1
+        self.app.state.last_request_at = time.monotonic()
+
+    async def _count_stream(self, body_iterator):
+        try:
+            async for chunk in body_iterator:
+                yield chunk
+        finally:
+            self._request_finished()
+
     async def _performance_middleware(self, request: Request, call_next):
         """Performance monitoring middleware."""
         import time
 
         start_time = time.time()
 
-        # Process the request
-        response = await call_next(request)
+        # Track activity for idle-time maintenance; health probes and metric scrapes do not count
+        counted = request.url.path not in ("/health", "/metrics")
+        if counted:
+            self.app.state.active_requests += 1
+
+        # Process the request, counting the SQL statements it executes
+        streaming = False
+        try:
+            with track_queries(route=request.url.path) as db_stats:
+                response = await call_next(request)
+            # An SSE stream stays active until its body is exhausted or the client goes away
+            streaming = counted and response.headers.get("content-type", "").startswith("text/event-stream")
+            if streaming:
+                response.body_iterator = self._count_stream(response.body_iterator)
+        finally:
+            if counted and not streaming:
+                self._request_finished()
 
         # Calculate processing time
         process_time = (time.time() - start_time) * 1000  # Convert to milliseconds
 
+        # Tag database stats with the matched route template (e.g. /api/v1/poems/{poem_id})
+        route = request.scope.get("route")
+        db_stats.route = getattr(route, "path", request.url.path)
+        log_repeated_statements(db_stats)
+
+        # Latency by route template; unmatched paths (404s, static files) share one series
+        route_template = getattr(route, "path", UNMATCHED_ROUTE)
+        HTTP_REQUEST_SECONDS.observe(
+            process_time / 1000, request.method, route_template, f"{response.status_code // 100}xx"
+        )
+
         # Log performance metrics
         await self.performance_service.log_request_performance(
             method=request.method,
-            path=request.url.path,
+            path=route_template,
             status_code=response.status_code,
             duration=process_time,
             additional_data={
                 "user_agent": request.headers.get("user-agent"),
                 "content_length": response.headers.get("content-length"),
+                **db_stats.to_dict(),
             },
         )
 
-        # Add performance header
+        # Add performance headers
         response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
+        response.headers["X-DB-Queries"] = str(db_stats.query_count)
+        response.headers["X-DB-Time"] = f"{db_stats.total_time_ms:.2f}ms"
 
         return response
 
@@ -605,17 +797,23 @@ class ApplicationRouterV2:
             try:
                 # Use same pattern as API - fresh database session via dependency injection
                 repository_service = RepositoryService(db)
-                poem = repository_service.poems.get_by_id(poem_id)
+                aggregate = repository_service.get_poem_aggregate(
+                    poem_id, include_text=False, include_step_content=False, include_bbr_content=False
+                )
 
                 # Handle transaction isolation issue - retry once if poem not found initially
-                if not poem:
+                if not aggregate:
                     # Fresh query to handle SQLite WAL transaction visibility
                     db.rollback()  # Ensure we start with a clean transaction
-                    poem = repository_service.poems.get_by_id(poem_id)
+                    aggregate = repository_service.get_poem_aggregate(
+                        poem_id, include_text=False, include_step_content=False, include_bbr_content=False
+                    )
 
-                if not poem:
+                if not aggregate:
                     raise Exception(f"Poem with ID {poem_id} not found")
 
+                poem = aggregate["poem"]
+
                 # Convert to dictionary format expected by templates
                 poem_data = {
                     "id": poem.id,
@@ -626,9 +824,9 @@ class ApplicationRouterV2:
                     "metadata_json": poem.metadata_json,
                     "created_at": (poem.created_at.isoformat() if poem.created_at else None),
                     "updated_at": (poem.updated_at.isoformat() if poem.updated_at else None),
-                    "translation_count": poem.translation_count,
-                    "ai_translation_count": poem.ai_translation_count,
-                    "human_translation_count": poem.human_translation_count,
+                    "translation_count": aggregate["translation_count"],
+                    "ai_translation_count": aggregate["ai_translation_count"],
+                    "human_translation_count": aggregate["human_translation_count"],
                     "selected": poem.selected,  # Add selected field for the selection toggle
                 }
 
@@ -673,159 +871,78 @@ class ApplicationRouterV2:
                     }
                     return
 
-                # Send initial status
-                task_status = app.state.tasks[task_id]
-                initial_status = task_status.to_dict()
-                yield {"event": "status", "data": json.dumps(initial_status)}
-                print(
-                    f"📡 [SSE] Initial status sent for task {task_id}: {initial_status['status']} - {initial_status['current_step']}"
-                )
-
-                # Stream for updates with real-time app.state access (original working design)
-                max_iterations = 3000  # 10 minutes with 0.2-second intervals (600 / 0.2 = 3000)
-                last_status = None
-                consecutive_errors = 0
-                max_consecutive_errors = 5
-                last_update_time = time.time()
-
-                for i in range(max_iterations):
-                    # Check if client disconnected
-                    if await request.is_disconnected():
-                        print(f"🔌 Client disconnected from task {task_id} SSE stream")
-                        break
+                # Resume after the last event the client received, if it is still in the replay log
+                task_events = app.state.task_events
+                last_event_id = parse_last_event_id(request.headers.get("last-event-id"))
+                last_status = task_events.task_at(task_id, last_event_id)
 
-                    await asyncio.sleep(0.2)  # Check every 200ms for better responsiveness (faster than before)
+                # Stream task changes pushed by the event hub; heartbeat while nothing happens
+                deadline = time.monotonic() + 600  # 10 minutes
+                updates = 0
 
-                    try:
-                        # Reset consecutive errors counter on successful iteration
-                        consecutive_errors = 0
-                        current_time = time.time()
-
-                        # Get current task status from app.state
-                        if task_id in app.state.tasks:
-                            current_task = app.state.tasks[task_id]
-                            current_dict = current_task.to_dict()
-
-                            # Enhanced change detection - focus on step changes, not progress percentage
-                            has_progress_change = (
-                                last_status is None
-                                or current_dict["status"] != last_status["status"]
-                                or current_dict["current_step"] != last_status["current_step"]
-                            )
-
-                            # Specific step change detection - check for step status transitions
-                            has_step_change = False
-                            if last_status is not None:
-                                current_step_details = current_dict.get("step_details", {})
-                                last_step_details = last_status.get("step_details", {})
-
-                                # Check if current step status changed (running -> completed)
-                                if current_step_details.get("step_status") != last_step_details.get("step_status"):
-                                    has_step_change = True
+                async with aclosing(task_events.stream(task_id, after=last_event_id, heartbeat=5.0)) as events:
+                    async for event in events:
+                        if event is None:
+                            # Force periodic updates to ensure connection stays alive (heartbeat)
+                            yield {
+                                "event": "heartbeat",
+                                "data": json.dumps({"timestamp": time.time()}),
+                            }
+                        elif event["task"] is None:
+                            # Task was removed from app.state
+                            yield {
+                                "event": "error",
+                                "data": json.dumps({"message": "Task disappeared from memory"}),
+                            }
+                            break
+                        else:
+                            current_dict = event["task"]
+                            event_id = str(event["version"])
+                            updates += 1
+
+                            if last_status is None:
+                                # Send initial status
+                                last_status = current_dict
+                                yield {"event": "status", "id": event_id, "data": json.dumps(current_dict)}
+                                print(
+                                    f"📡 [SSE] Initial status sent for task {task_id}: {current_dict['status']} - {current_dict['current_step']}"
+                                )
+                            else:
+                                event_type = _workflow_change_event_type(current_dict, last_status)
+                                if event_type is not None:
+                                    last_status = current_dict
+                                    yield {"event": event_type, "id": event_id, "data": json.dumps(current_dict)}
+                                    step_status = (current_dict.get("step_details") or {}).get("step_status", "unknown")
                                     print(
-                                        f"🔍 [SSE] Step status change detected: {last_step_details.get('step_status')} -> {current_step_details.get('step_status')}"
+                                        f"📡 [SSE] {event_type.upper()} sent for task {task_id}: {current_dict['status']} - {current_dict['current_step']} ({step_status})"
                                     )
 
-                                # Check if any step states changed
-                                current_step_states = current_dict.get("step_states", {})
-                                last_step_states = last_status.get("step_states", {})
-                                if current_step_states != last_step_states:
-                                    has_step_change = True
-                                    print(f"🔍 [SSE] Step states changed detected")
-
-                            # Additional check for task timestamp changes (more sensitive detection)
-                            has_time_change = (
-                                last_status is not None
-                                and "updated_at" in current_dict
-                                and "updated_at" in last_status
-                                and current_dict["updated_at"] != last_status["updated_at"]
-                            )
-
-                            # Send update if any significant field changed OR timestamp changed OR step changed
-                            if has_progress_change or has_step_change or has_time_change:
-                                last_status = current_dict.copy()
-                                last_update_time = current_time
-
-                                # Determine event type based on what changed
-                                event_type = "status"
-                                if has_step_change and last_status is not None:
-                                    event_type = "step_change"
-
+                            # Stop streaming once the task is complete
+                            if current_dict["status"] in ["completed", "failed"]:
                                 yield {
-                                    "event": event_type,
+                                    "event": current_dict["status"],
+                                    "id": event_id,
                                     "data": json.dumps(current_dict),
                                 }
-                                step_states = current_dict.get("step_states", {})
-                                current_step_state = step_states.get(current_dict["current_step"], "unknown")
-                                step_details = current_dict.get("step_details", {})
-                                step_status = step_details.get("step_status", "unknown")
-
                                 print(
-                                    f"📡 [SSE] {event_type.upper()} sent for task {task_id}: {current_dict['status']} - {current_dict['current_step']} ({step_status})"
-                                )
-
-                            # Stop streaming if task is complete - but add a brief delay to ensure final state is captured
-                            if current_task.status.value in [
-                                "completed",
-                                "failed",
-                            ]:
-                                # Wait a moment to ensure the final state is stable
-                                await asyncio.sleep(0.5)
-
-                                # Get final state one more time
-                                final_dict = current_task.to_dict()
-                                yield {
-                                    "event": current_task.status.value,
-                                    "data": json.dumps(final_dict),
-                                }
-                                print(
-                                    f"📡 [SSE] Final status sent for task {task_id}: {current_task.status.value} - {final_dict['current_step']}"
+                                    f"📡 [SSE] Final status sent for task {task_id}: {current_dict['status']} - {current_dict['current_step']}"
                                 )
                                 break
 
-                            # Force periodic updates every 5 seconds to ensure connection stays alive (heartbeat)
-                            if current_time - last_update_time > 5.0:
-                                last_update_time = current_time
-                                yield {
-                                    "event": "heartbeat",
-                                    "data": json.dumps({"timestamp": current_time}),
-                                }
-
-                        else:
-                            # Task was removed from app.state
-                            yield {
-                                "event": "error",
-                                "data": json.dumps({"message": "Task disappeared from memory"}),
-                            }
+                        # Check if client disconnected
+                        if await request.is_disconnected():
+                            print(f"🔌 Client disconnected from task {task_id} SSE stream")
                             break
 
-                    except asyncio.CancelledError:
-                        print(f"⏹️ SSE stream cancelled for task {task_id}")
-                        break
-                    except Exception as e:
-                        consecutive_errors += 1
-                        print(
-                            f"❌ [SSE] Error {consecutive_errors}/{max_consecutive_errors} in stream for task {task_id}: {str(e)}"
-                        )
-
-                        if consecutive_errors >= max_consecutive_errors:
+                        if time.monotonic() >= deadline:
+                            # Send completion event if timed out
                             yield {
-                                "event": "error",
-                                "data": json.dumps({"message": f"SSE stream error: {str(e)}"}),
+                                "event": "timeout",
+                                "data": json.dumps({"message": "Workflow timed out after 10 minutes"}),
                             }
                             break
 
-                        # Continue after a brief delay for non-critical errors
-                        await asyncio.sleep(1.0)
-
-                # Send completion event if timed out
-                if i >= max_iterations - 1:
-                    yield {
-                        "event": "timeout",
-                        "data": json.dumps({"message": "Workflow timed out after 10 minutes"}),
-                    }
-
-                print(f"🏁 SSE stream ended for task {task_id} after {i+1} iterations")
+                print(f"🏁 SSE stream ended for task {task_id} after {updates} updates")
 
             return EventSourceResponse(
                 event_generator(),
@@ -844,11 +961,15 @@ class ApplicationRouterV2:
         async def poem_compare(request: Request, poem_id: str):
             """Display comparison view for translations of a specific poem."""
             try:
-                # Get poem data directly from repository
-                poem = self.poem_service.repository_service.repo.poems.get_by_id(poem_id)
-                if not poem:
+                # Load poem and translations in one aggregate; the page fetches translation text itself
+                aggregate = self.poem_service.repository_service.repo.get_poem_aggregate(
+                    poem_id, include_text=False, include_step_content=False, include_bbr_content=False
+                )
+                if not aggregate:
                     raise Exception(f"Poem with ID {poem_id} not found")
 
+                poem = aggregate["poem"]
+
                 # Convert to dictionary format expected by templates
                 poem_data = {
                     "id": poem.id,
@@ -859,15 +980,12 @@ class ApplicationRouterV2:
                     "metadata_json": poem.metadata_json,
                     "created_at": (poem.created_at.isoformat() if poem.created_at else None),
                     "updated_at": (poem.updated_at.isoformat() if poem.updated_at else None),
-                    "translation_count": poem.translation_count,
-                    "ai_translation_count": poem.ai_translation_count,
-                    "human_translation_count": poem.human_translation_count,
+                    "translation_count": aggregate["translation_count"],
+                    "ai_translation_count": aggregate["ai_translation_count"],
+                    "human_translation_count": aggregate["human_translation_count"],
                 }
 
-                # Get translations for this poem using the repository service through poem_service
-                translations = self.poem_service.repository_service.repo.translations.get_multi(
-                    poem_id=poem_id, limit=100
-                )
+                translations = [entry["translation"] for entry in aggregate["translations"]]
 
                 template_context = {
                     "request": request,
@@ -891,11 +1009,15 @@ class ApplicationRouterV2:
         async def poem_translate(request: Request, poem_id: str):
             """Display translation creation page for a specific poem."""
             try:
-                # Get poem data directly from repository
-                poem = self.poem_service.repository_service.repo.poems.get_by_id(poem_id)
-                if not poem:
+                # Load poem and translations in one aggregate; the page fetches translation text itself
+                aggregate = self.poem_service.repository_service.repo.get_poem_aggregate(
+                    poem_id, include_text=False, include_step_content=False, include_bbr_content=False
+                )
+                if not aggregate:
                     raise Exception(f"Poem with ID {poem_id} not found")
 
+                poem = aggregate["poem"]
+
                 # Convert to dictionary format expected by templates
                 poem_data = {
                     "id": poem.id,
@@ -906,9 +1028,9 @@ class ApplicationRouterV2:
                     "metadata_json": poem.metadata_json,
                     "created_at": (poem.created_at.isoformat() if poem.created_at else None),
                     "updated_at": (poem.updated_at.isoformat() if poem.updated_at else None),
-                    "translation_count": poem.translation_count,
-                    "ai_translation_count": poem.ai_translation_count,
-                    "human_translation_count": poem.human_translation_count,
+                    "translation_count": aggregate["translation_count"],
+                    "ai_translation_count": aggregate["ai_translation_count"],
+                    "human_translation_count": aggregate["human_translation_count"],
                     "selected": poem.selected,  # Add selected field for the selection toggle
                 }
 
@@ -1148,7 +1270,7 @@ class ApplicationRouterV2:
                 app_name = await self.config_service.get_setting("app_name", "VPSWeb")
                 app_version = await self.config_service.get_setting("version", "0.4.2")
 
-                return {
+                health = {
                     "status": "healthy",
                     "app_name": app_name,
                     "version": app_version,
@@ -1160,6 +1282,26 @@ class ApplicationRouterV2:
                     },
                 }
 
+                # Database fragmentation and the last maintenance run
+                maintenance_scheduler = getattr(app.state, "maintenance_scheduler", None)
+                if maintenance_scheduler is not None:
+                    try:
+                        health["database"] = await maintenance_scheduler.health()
+                    except Exception as e:
+                        health["database"] = {"error": str(e)}
+
+                # Retained tasks and their approximate size per namespace
+                task_store = getattr(app.state, "task_store", None)
+                if task_store is not None:
+                    health["task_store"] = await asyncio.to_thread(task_store.stats)
+
+                # Queue depth, wait and run times of translation workflows
+                job_queue = getattr(app.state, "job_queue", None)
+                if job_queue is not None:
+                    health["job_queue"] = job_queue.stats()
+
+                return health
+
             except Exception as e:
                 self.logger.error(f"Health check failed: {e}")
                 return JSONResponse(
@@ -1171,6 +1313,11 @@ class ApplicationRouterV2:
                     },
                 )
 
+        @app.get("/metrics", include_in_schema=False)
+        async def prometheus_metrics():
+            """Latency histograms in the Prometheus text format, for scraping."""
+            return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
         @app.get("/dashboard/stats")
         async def dashboard_statistics():
             """Get statistics for the dashboard."""
@@ -1223,6 +1370,7 @@ class ApplicationRouterV2:
         )
         app.include_router(statistics.router, prefix="/api/v1/statistics", tags=["statistics"])
         app.include_router(poets.router, prefix="/api/v1/poets", tags=["poets"])
+        app.include_router(export.router, prefix="/api/v1/export", tags=["export"])
         app.include_router(wechat.router, prefix="/api/v1/wechat", tags=["wechat"])
         app.include_router(workflow.router, prefix="/api/v1/workflow", tags=["workflow"])
         app.include_router(manual_workflow.router, prefix="/api/v1", tags=["manual"])
@@ -1311,7 +1459,69 @@ class ApplicationFactoryV2:
             docs_url="/docs",
             redoc_url="/redoc",
         )
-        app.state.tasks = {}
+        # Background task state, shared between worker processes by the sqlite backend
+        app.state.task_store = create_task_store(
+            webui_settings.task_store, webui_settings.task_store_path, webui_settings.task_store_poll_interval
+        )
+        app.state.task_store.enable_history("tasks", webui_settings.task_event_replay_size)
+        # Bounded retention; manual sessions have no finished state and only expire when idle
+        task_lifecycles = {
+            "tasks": {"finished": task_is_finished, "compact": compact_task},
+            "wechat_tasks": {"finished": task_is_finished},
+            "manual_sessions": {},
+        }
+        for namespace, lifecycle in task_lifecycles.items():
+            app.state.task_store.set_retention(
+                namespace,
+                RetentionPolicy(
+                    max_entries=webui_settings.task_max_entries,
+                    ttl=webui_settings.task_ttl,
+                    max_idle=webui_settings.task_max_idle,
+                    compact_after=webui_settings.task_compact_after,
+                    **lifecycle,
+                ),
+            )
+        app.state.task_sweeper = TaskSweeper(app.state.task_store, webui_settings.task_sweep_interval)
+        app.state.tasks = app.state.task_store.namespace("tasks")
+        app.state.wechat_tasks = app.state.task_store.namespace("wechat_tasks")
+        app.state.task_events = TaskEventHub(app.state.tasks)
+
+        # Worker pool for translation workflows and WeChat articles; queued jobs survive restarts
+        app.state.job_queue = JobQueue(
+            JobStore(webui_settings.job_queue_path),
+            workers=webui_settings.job_queue_workers,
+            batch_workers=webui_settings.job_queue_batch_workers,
+            max_queued=webui_settings.job_queue_max_queued,
+            max_attempts=webui_settings.job_queue_max_attempts,
+            rate_limit_cooldown=webui_settings.job_queue_rate_limit_cooldown,
+        )
+        wechat.register_wechat_article_jobs(app.state.job_queue, app.state.wechat_tasks)
+
+        # Online backups of the repository database and output directories
+        try:
+            app.state.backup_scheduler = BackupScheduler.from_settings()
+        except BackupError as e:
+            app_logger.warning(f"Repository backups disabled: {e}")
+            app.state.backup_scheduler = None
+
+        # Idle-time ANALYZE/optimize/incremental vacuum of the repository database
+        app.state.active_requests = 0
+        app.state.last_request_at = time.monotonic()
+
+        def is_idle() -> bool:
+            # Open SSE streams count as active requests; running workflows write to the same database
+            idle_for = time.monotonic() - app.state.last_request_at
+            return (
+                not app.state.active_requests
+                and not app.state.job_queue.active_jobs
+                and idle_for >= repository_settings.maintenance_idle_seconds
+            )
+
+        try:
+            app.state.maintenance_scheduler = MaintenanceScheduler.from_settings(is_idle=is_idle)
+        except BackupError as e:
+            app_logger.warning(f"Database maintenance disabled: {e}")
+            app.state.maintenance_scheduler = None
 
         # Create DI container and clear any existing registrations
         container.clear()
@@ -1342,7 +1552,15 @@ class ApplicationFactoryV2:
             repository_service = RepositoryWebService(create_session())
 
         # Register and resolve business services
-        container.register_instance(ITemplateServiceV2, TemplateServiceV2(logger=app_logger))
+        template_auto_reload = webui_settings.template_auto_reload
+        container.register_instance(
+            ITemplateServiceV2,
+            TemplateServiceV2(
+                logger=app_logger,
+                auto_reload=webui_settings.reload if template_auto_reload is None else template_auto_reload,
+                bytecode_cache_dir=webui_settings.template_bytecode_cache_dir,
+            ),
+        )
         container.register_instance(
             IPoemServiceV2,
             PoemServiceV2(
@@ -1376,6 +1594,7 @@ class ApplicationFactoryV2:
                 storage_handler=storage_handler,
                 task_service=task_service,
                 logger=app_logger,
+                job_queue=app.state.job_queue,
             ),
         )
 
@@ -1408,6 +1627,8 @@ class ApplicationFactoryV2:
 
         config_facade = initialize_config_facade(complete_config, models_config, task_templates_config)
         prompt_service = PromptService()
+        # Every PromptService on the prompts directory shares its templates, so one watcher reloads them all
+        app.state.prompt_service = prompt_service
         llm_factory = LLMFactory(config_facade=config_facade)
 
         container.register_instance(
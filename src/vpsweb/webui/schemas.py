@@ -12,6 +12,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from src.vpsweb.repository.schemas import (
     ComparisonView,
+    PoemListItem,
     PoemResponse,
     RepositoryStats,
     TranslationResponse,
@@ -81,6 +82,11 @@ class TranslationRequest(WebUIBase):
     poem_id: str = Field(..., description="ID of the poem to translate")
     target_lang: str = Field(..., min_length=2, max_length=10, description="Target language")
     workflow_mode: WorkflowMode = Field(WorkflowMode.HYBRID, description="Translation workflow mode")
+    lane: str = Field(
+        "interactive",
+        pattern="^(interactive|batch)$",
+        description="Job queue priority lane: interactive or batch",
+    )
 
 
 # Page display schemas
@@ -200,19 +206,21 @@ class PaginationInfo(WebUIBase):
     """Schema for pagination information"""
 
     current_page: int = Field(..., ge=1, description="Current page")
-    total_pages: int = Field(..., ge=0, description="Total pages")
-    total_items: int = Field(..., ge=0, description="Total items")
+    total_pages: Optional[int] = Field(None, ge=0, description="Total pages (None when counting is skipped)")
+    total_items: Optional[int] = Field(None, ge=0, description="Total items (None when counting is skipped)")
+    total_is_exact: bool = Field(True, description="Whether total_items is an exact count")
     page_size: int = Field(..., ge=1, le=100, description="Items per page")
     has_next: bool = Field(False, description="Has next page")
     has_previous: bool = Field(False, description="Has previous page")
     next_page_url: Optional[str] = Field(None, description="Next page URL")
     previous_page_url: Optional[str] = Field(None, description="Previous page URL")
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page (keyset pagination)")
 
 
 class PaginatedPoemResponse(WebUIBase):
     """Schema for paginated poem list response"""
 
-    poems: List[PoemResponse] = Field(..., description="List of poems")
+    poems: List[PoemListItem] = Field(..., description="List of poems")
     pagination: PaginationInfo = Field(..., description="Pagination information")
 
 
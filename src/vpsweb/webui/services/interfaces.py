@@ -56,6 +56,8 @@ class ITranslationServiceV2(ABC):
         poem_id: Optional[str] = None,
         source_lang: Optional[str] = None,
         target_lang: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
     ) -> Dict[str, Any]:
         """Get paginated list of translations with filtering."""
 
@@ -133,6 +135,7 @@ class IWorkflowServiceV2(ABC):
         workflow_mode: str,
         background_tasks: "BackgroundTasks",
         user_id: Optional[str] = None,
+        lane: str = "interactive",
     ) -> str:
         """Start a new translation workflow."""
 
@@ -208,6 +211,10 @@ class ITemplateServiceV2(ABC):
     async def validate_template_data(self, template_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate template data before rendering."""
 
+    def precompile(self) -> int:
+        """Compile templates ahead of the first request; returns the number compiled."""
+        return 0
+
 
 class IExceptionHandlerServiceV2(ABC):
     """Interface for error handling and response formatting."""
@@ -263,6 +270,7 @@ class ITaskManagementServiceV2(ABC):
         task_type: str,
         task_data: Dict[str, Any],
         user_id: Optional[str] = None,
+        task_id: Optional[str] = None,
     ) -> str:
         """Create a new background task."""
 
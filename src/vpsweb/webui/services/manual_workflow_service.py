@@ -8,13 +8,14 @@ where users interact with external LLM services through copy-paste operations.
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, MutableMapping, Optional
 
 from vpsweb.repository.service import RepositoryWebService
 from vpsweb.services.parser import OutputParser
 from vpsweb.services.prompts import PromptService
 from vpsweb.utils.storage import StorageHandler
 from vpsweb.webui.services.interfaces import IWorkflowServiceV2
+from vpsweb.webui.task_store import InMemoryTaskStore
 
 logger = logging.getLogger(__name__)
 
@@ -35,15 +36,24 @@ class ManualWorkflowService:
         repository_service: RepositoryWebService,
         storage_handler: StorageHandler,
         logger: Optional[logging.Logger] = None,
+        sessions: Optional[MutableMapping[str, Dict[str, Any]]] = None,
     ):
-        """Initialize the manual workflow service."""
+        """
+        Initialize the manual workflow service.
+
+        Args:
+            sessions: Session storage, e.g. a shared task store namespace so
+                any worker can continue a session; in-memory by default
+        """
         self.prompt_service = prompt_service
         self.output_parser = output_parser
         self.workflow_service = workflow_service
         self.repository_service = repository_service
         self.storage_handler = storage_handler
         self.logger = logger or logging.getLogger(__name__)
-        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self.sessions: MutableMapping[str, Dict[str, Any]] = (
+            sessions if sessions is not None else InMemoryTaskStore().namespace("manual_sessions")
+        )
 
     async def start_session(self, poem_id: str, target_lang: str) -> Dict[str, Any]:
         """
@@ -180,6 +190,7 @@ class ManualWorkflowService:
             # Check if this was the last step
             if current_step_index == len(step_sequence) - 1:
                 # Workflow completed - save to database
+                self.sessions[session_id] = session
                 await self._complete_workflow(session_id)
                 return {
                     "status": "completed",
@@ -189,6 +200,8 @@ class ManualWorkflowService:
                 # Move to next step
                 session["current_step_index"] += 1
                 next_step_index = session["current_step_index"]
+                # Write back before awaiting, sessions may live in a shared store
+                self.sessions[session_id] = session
                 next_step = step_sequence[next_step_index]
 
                 # Get poem for next step prompt
@@ -426,7 +439,7 @@ class ManualWorkflowService:
             )
 
             # Clean up session
-            del self.sessions[session_id]
+            self.sessions.pop(session_id, None)
 
             self.logger.info(f"Completed manual workflow session {session_id}")
 
@@ -443,12 +456,12 @@ class ManualWorkflowService:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
         expired_sessions = []
 
-        for session_id, session in self.sessions.items():
+        for session_id, session in list(self.sessions.items()):
             if session["created_at"] < cutoff_time:
                 expired_sessions.append(session_id)
 
         for session_id in expired_sessions:
-            del self.sessions[session_id]
+            self.sessions.pop(session_id, None)
 
         if expired_sessions:
             self.logger.info(f"Cleaned up {len(expired_sessions)} expired manual workflow sessions")
@@ -13,7 +13,8 @@ from sqlalchemy import desc
 from sqlalchemy.orm import Session
 
 from ...repository.crud import RepositoryService
-from ...repository.models import Poem
+from ...repository.models import UTC_PLUS_8, Poem, compute_content_hash
+from ...repository.schemas import PoemUpdate
 from ...utils.ulid_utils import generate_ulid
 
 logger = logging.getLogger(__name__)
@@ -172,12 +173,14 @@ class PoemService:
                 source_language=source_language.strip().lower(),
                 original_text=content.strip(),
                 metadata_json=metadata_json,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                content_hash=compute_content_hash(poet_name, poem_title, content),
+                created_at=datetime.now(UTC_PLUS_8),
+                updated_at=datetime.now(UTC_PLUS_8),
             )
 
             # Save to database
             self.db.add(poem)
+            self.repository_service.poet_summaries.refresh(poem.poet_name)
             self.db.commit()
             self.db.refresh(poem)
 
@@ -231,41 +234,36 @@ class PoemService:
             ValueError: If updated fields are invalid
         """
         try:
-            poem = self.repository_service.poems.get_by_id(poem_id)
-            if not poem:
-                return None
-
-            # Update fields if provided
+            changes: Dict[str, Any] = {}
             if poet_name is not None:
                 if not poet_name or not poet_name.strip():
                     raise ValueError("Poet name cannot be empty")
-                poem.poet_name = poet_name.strip()
+                changes["poet_name"] = poet_name.strip()
 
             if poem_title is not None:
                 if not poem_title or not poem_title.strip():
                     raise ValueError("Poem title cannot be empty")
-                poem.poem_title = poem_title.strip()
+                changes["poem_title"] = poem_title.strip()
 
             if source_language is not None:
                 if not source_language or not source_language.strip():
                     raise ValueError("Source language cannot be empty")
-                poem.source_language = source_language.strip().lower()
+                changes["source_language"] = source_language.strip().lower()
 
             if content is not None:
                 if not content or not content.strip():
                     raise ValueError("Poem content cannot be empty")
                 if len(content.strip()) < 10:
                     raise ValueError("Poem content must be at least 10 characters")
-                poem.original_text = content.strip()
+                changes["original_text"] = content.strip()
 
             if metadata_json is not None:
-                poem.metadata_json = metadata_json
+                changes["metadata_json"] = metadata_json
 
-            poem.updated_at = datetime.utcnow()
-
-            # Save changes
-            self.db.commit()
-            self.db.refresh(poem)
+            # The repository also refreshes the content hash, poet summaries and cached snapshot
+            poem = self.repository_service.poems.update(poem_id, PoemUpdate(**changes))
+            if not poem:
+                return None
 
             logger.info(f"Updated poem: {poem_id}")
 
@@ -301,14 +299,11 @@ class PoemService:
             True if poem was deleted, False if not found
         """
         try:
-            poem = self.repository_service.poems.get_by_id(poem_id)
-            if not poem:
+            # Translations, logs and notes go with the poem (ON DELETE CASCADE); the
+            # repository also refreshes the poet summary and drops cached snapshots
+            if not self.repository_service.poems.delete(poem_id):
                 return False
 
-            # Delete poem (cascade will delete translations, logs, and notes)
-            self.db.delete(poem)
-            self.db.commit()
-
             logger.info(f"Deleted poem: {poem_id}")
             return True
 
@@ -337,19 +332,15 @@ class PoemService:
                 .all()
             )
 
-            # Count by poet (top 10)
-            poets = (
-                self.db.query(Poem.poet_name, self.db.func.count(Poem.id).label("count"))
-                .group_by(Poem.poet_name)
-                .order_by(desc(self.db.func.count(Poem.id)))
-                .limit(10)
-                .all()
-            )
+            # Count by poet (top 10), from the materialized poet summaries
+            poets = self.db.execute(
+                self.repository_service.poet_summaries.list_stmt(sort_by="poem_count", sort_order="desc").limit(10)
+            ).scalars()
 
             return {
                 "total_poems": total_poems,
                 "languages": [{"language": lang.source_language, "count": lang.count} for lang in languages],
-                "top_poets": [{"poet_name": poet.poet_name, "poem_count": poet.count} for poet in poets],
+                "top_poets": [{"poet_name": poet.poet_name, "poem_count": poet.poem_count} for poet in poets],
             }
 
         except Exception as e:
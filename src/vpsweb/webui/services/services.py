@@ -11,8 +11,10 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from vpsweb.core.workflow import TranslationWorkflow
+from vpsweb.repository.pagination import encode_cursor
 from vpsweb.repository.service import RepositoryWebService
 from vpsweb.services.config import ConfigFacade
+from vpsweb.services.prompts import combine_prompt_hashes
 from vpsweb.utils.tools_phase3a import (
     ErrorCollector,
     PerformanceMonitor,
@@ -20,6 +22,9 @@ from vpsweb.utils.tools_phase3a import (
 )
 
 from ...utils.language_mapper import LanguageMapper
+from ..job_queue import Job, JobQueue, rate_limit_of
+from ..task_store import InMemoryTaskStore, TaskNamespace
+from ..templating import get_template_environment, precompile_templates
 from .interfaces import (
     IBBRServiceV2,
     IConfigServiceV2,
@@ -373,31 +378,39 @@ class TranslationServiceV2(ITranslationServiceV2):
         poem_id: Optional[str] = None,
         source_lang: Optional[str] = None,
         target_lang: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
     ) -> Dict[str, Any]:
         """Get paginated list of translations with filtering."""
         try:
-            translations = self.repository_service.repo.translations.get_multi(
-                skip=skip,
-                limit=limit,
-                poem_id=poem_id,
-                source_lang=source_lang,
-                target_lang=target_lang,
-            )
+            crud = self.repository_service.repo.translations
+            filters = {
+                "poem_id": poem_id,
+                "source_language": source_lang,
+                "target_language": target_lang,
+            }
 
-            total_count = self.repository_service.repo.translations.count(
-                poem_id=poem_id,
-                source_lang=source_lang,
-                target_lang=target_lang,
-            )
+            if cursor:
+                translations, next_cursor = crud.get_multi_after(limit=limit, cursor=cursor, **filters)
+            else:
+                translations = crud.get_multi(skip=skip, limit=limit + 1, **filters)
+                next_cursor = None
+                if len(translations) > limit:
+                    translations = translations[:limit]
+                    next_cursor = encode_cursor(translations[-1].created_at, translations[-1].id)
+
+            total_count, total_is_exact = crud.count_by_mode(count_mode, **filters)
 
             result = {
                 "translations": translations,
                 "total_count": total_count,
+                "total_is_exact": total_is_exact,
                 "pagination": {
                     "skip": skip,
                     "limit": limit,
-                    "has_next": skip + limit < total_count,
-                    "has_prev": skip > 0,
+                    "has_next": next_cursor is not None,
+                    "has_prev": skip > 0 or cursor is not None,
+                    "next_cursor": next_cursor,
                 },
                 "filters": {
                     "poem_id": poem_id,
@@ -610,6 +623,7 @@ class WorkflowServiceV2(IWorkflowServiceV2):
         task_service: Optional[ITaskManagementServiceV2] = None,
         logger: Optional[logging.Logger] = None,
         config_path: Optional[str] = None,
+        job_queue: Optional[JobQueue] = None,
     ):
         self.repository_service = repository_service
         self.storage_handler = storage_handler
@@ -620,6 +634,10 @@ class WorkflowServiceV2(IWorkflowServiceV2):
         self._config = None
         self._workflow_config = None
         self._providers_config = None
+        # Workflows run on the job queue's worker pool when one is given, else as BackgroundTasks
+        self.job_queue = job_queue
+        if job_queue is not None:
+            job_queue.register("translation_workflow", self._run_workflow_job)
 
     async def _load_configuration(self):
         from vpsweb.services.config import get_config_facade
@@ -644,8 +662,14 @@ class WorkflowServiceV2(IWorkflowServiceV2):
         workflow_mode: str,
         background_tasks: BackgroundTasks,
         user_id: Optional[str] = None,
+        lane: str = "interactive",
     ) -> str:
-        """Start a new translation workflow as a background task."""
+        """
+        Start a new translation workflow as a background task.
+
+        With a job queue the workflow is queued in ``lane`` ("interactive" or
+        "batch"); QueueFullError is raised when the queue is at capacity.
+        """
         try:
             self.logger.info(f"🚀 [WORKFLOW] Starting translation workflow for poem {poem_id}")
 
@@ -671,15 +695,22 @@ class WorkflowServiceV2(IWorkflowServiceV2):
 
             self.logger.info(f"📋 [WORKFLOW] Created task {task_id}, scheduling background task...")
 
-            # Add the workflow execution to background tasks
-            background_tasks.add_task(
-                self._execute_workflow,
-                task_id=task_id,
-                poem_id=poem_id,
-                target_lang=target_lang,
-                workflow_mode=workflow_mode,
-                source_lang=source_lang,
-            )
+            workflow_args = {
+                "task_id": task_id,
+                "poem_id": poem_id,
+                "target_lang": target_lang,
+                "workflow_mode": getattr(workflow_mode, "value", workflow_mode),
+                "source_lang": source_lang,
+            }
+            if self.job_queue is not None:
+                try:
+                    await self.job_queue.submit("translation_workflow", {**workflow_args, "user_id": user_id}, lane)
+                except Exception as e:
+                    await self.task_service.update_task_status(task_id, "failed", error=str(e))
+                    raise
+            else:
+                # Add the workflow execution to background tasks
+                background_tasks.add_task(self._execute_workflow, **workflow_args)
 
             self.logger.info(f"✅ [WORKFLOW] Background task scheduled for task {task_id}")
 
@@ -690,6 +721,24 @@ class WorkflowServiceV2(IWorkflowServiceV2):
             self.logger.error(f"Error starting workflow: {e}")
             raise
 
+    async def _run_workflow_job(self, job: Job) -> None:
+        """Job queue handler for "translation_workflow" jobs."""
+        payload = dict(job.payload)
+        user_id = payload.pop("user_id", None)
+        task = await self.task_service.get_task(payload["task_id"])
+        if task is None:
+            # A job recovered after a restart whose task state was not persisted
+            await self.task_service.create_task(
+                "translation_workflow",
+                {key: payload[key] for key in ("poem_id", "source_lang", "target_lang", "workflow_mode")},
+                user_id,
+                task_id=payload["task_id"],
+            )
+        elif task.get("status") == "cancelled":
+            self.logger.info(f"Skipping cancelled task {payload['task_id']}")
+            return
+        await self._execute_workflow(**payload, job=job)
+
     async def _execute_workflow(
         self,
         task_id: str,
@@ -697,12 +746,17 @@ class WorkflowServiceV2(IWorkflowServiceV2):
         target_lang: str,
         workflow_mode: str,
         source_lang: str,
+        job: Optional[Job] = None,
     ):
-        """Execute real workflow using the workflow orchestrator."""
-        import asyncio
+        """
+        Execute real workflow using the workflow orchestrator.
+
+        When run as a queued ``job``, errors are re-raised for the queue; a
+        provider rate limit that the queue will retry leaves the task pending.
+        """
         from datetime import datetime
 
-        from vpsweb.core.interfaces import WorkflowConfig
+        from vpsweb.models.config import WorkflowMode
 
         self.logger.info(f"🎬 [WORKFLOW] _execute_workflow STARTED for task_id={task_id}")
         self.logger.info(f"📝 [WORKFLOW] poem_id={poem_id}, target_lang={target_lang}")
@@ -714,9 +768,10 @@ class WorkflowServiceV2(IWorkflowServiceV2):
             return
 
         try:
-            # Add initial delay to give SSE connection time to establish
-            self.logger.info(f"⏳ [WORKFLOW] Waiting 1 second for SSE connection to establish...")
-            await asyncio.sleep(1)
+            # Queued jobs carry the mode as its string value
+            workflow_mode_enum = (
+                WorkflowMode(workflow_mode.lower()) if isinstance(workflow_mode, str) else workflow_mode
+            )
 
             await self.task_service.update_task_status(task_id, "running")
 
@@ -779,13 +834,6 @@ class WorkflowServiceV2(IWorkflowServiceV2):
 
             # Prepare workflow configuration with steps
             from vpsweb.core.interfaces import WorkflowStep
-            from vpsweb.models.config import WorkflowMode
-
-            # Convert string workflow_mode to enum
-            if isinstance(workflow_mode, str):
-                workflow_mode_enum = WorkflowMode(workflow_mode.lower())
-            else:
-                workflow_mode_enum = workflow_mode
 
             # Get step configurations using ConfigFacade task template resolution
             workflow_steps = []
@@ -806,7 +854,7 @@ class WorkflowServiceV2(IWorkflowServiceV2):
                 for step_name in step_names:
                     try:
                         # Use ConfigFacade to resolve task template
-                        resolved_step = config_facade.get_workflow_step_config(workflow_mode.value, step_name)
+                        resolved_step = config_facade.get_workflow_step_config(workflow_mode_enum.value, step_name)
 
                         workflow_step = WorkflowStep(
                             name=step_name,
@@ -835,7 +883,9 @@ class WorkflowServiceV2(IWorkflowServiceV2):
                     for step_name in step_names:
                         try:
                             # Use local ConfigFacade to resolve task template
-                            resolved_step = self._config_facade.get_workflow_step_config(workflow_mode.value, step_name)
+                            resolved_step = self._config_facade.get_workflow_step_config(
+                                workflow_mode_enum.value, step_name
+                            )
 
                             workflow_step = WorkflowStep(
                                 name=step_name,
@@ -880,17 +930,8 @@ class WorkflowServiceV2(IWorkflowServiceV2):
                             )
                         workflow_steps.append(workflow_step)
 
-            workflow_config = WorkflowConfig(
-                name=f"Translation-{workflow_mode}",
-                description=f"Translation workflow using {workflow_mode} mode",
-                steps=workflow_steps,
-                metadata={
-                    "source_lang": source_lang,
-                    "target_lang": target_lang,
-                    "workflow_mode": workflow_mode,
-                    "model_config": self._providers_config,
-                    "workflow_config": self._workflow_config,
-                },
+            self.logger.info(
+                f"⚙️ [WORKFLOW] Resolved {len(workflow_steps)}/{len(step_names)} steps for {workflow_mode_enum.value} mode"
             )
 
             # Prepare input data for workflow
@@ -937,9 +978,22 @@ class WorkflowServiceV2(IWorkflowServiceV2):
                     task_id=task_id,
                     repository_service=getattr(self, "repository_service", None),
                 )
-            await self.task_service.update_task(task_id, {"workflow": workflow})
             workflow.progress_callback = progress_callback
 
+            # Completed output fields reach the SSE stream while a step's response is still streaming
+            step_display_names = {
+                "initial_translation": "Initial Translation",
+                "editor_review": "Editor Review",
+                "translator_revision": "Translator Revision",
+            }
+
+            async def field_callback(step_name: str, field: str, content: str):
+                await self.task_service.record_partial_output(
+                    task_id, step_display_names.get(step_name, step_name), field, content
+                )
+
+            workflow.step_executor.field_callback = field_callback
+
             # Execute real workflow using orchestrator
             self.logger.info(f"🚀 [WORKFLOW] Starting real workflow execution for task {task_id}")
             result = await workflow.execute(input_data=input_data, show_progress=True)
@@ -987,18 +1041,25 @@ class WorkflowServiceV2(IWorkflowServiceV2):
             }
 
             # Update the task with completion data
-            if task_id in self.task_service.tasks:
-                self.task_service.tasks[task_id].update(final_task_data)
+            await self.task_service.update_task(task_id, final_task_data)
 
             await self.task_service.update_task_status(task_id, "completed", result=result.__dict__)
             self.logger.info(f"Real workflow completed successfully for task {task_id}")
 
         except Exception as e:
+            if job is not None and job.can_retry and rate_limit_of(e) is not None:
+                self.logger.warning(f"Workflow for task {task_id} was rate limited by the provider; requeueing")
+                await self.task_service.update_task(
+                    task_id, {"status": "pending", "message": "Provider rate limit reached, waiting to retry"}
+                )
+                raise
             self.logger.error(
                 f"Real workflow execution failed for task {task_id}: {e}",
                 exc_info=True,
             )
             await self.task_service.update_task_status(task_id, "failed", error=str(e))
+            if job is not None:
+                raise
 
     async def _persist_workflow_result(
         self,
@@ -1077,7 +1138,14 @@ class WorkflowServiceV2(IWorkflowServiceV2):
             translator_type=TranslatorType.AI,
             translator_info=result.initial_translation.model_info.get("model", "unknown"),
             quality_rating=None,
-            metadata={
+        )
+        translation = self.repository_service.repo.translations.create(translation_create)
+
+        # Archive the full step results in the compressed payload side table so list queries
+        # on translations never carry them
+        self.repository_service.repo.translation_payloads.save(
+            translation.id,
+            {
                 "status": "completed",
                 "steps_executed": [
                     "initial_translation",
@@ -1095,7 +1163,6 @@ class WorkflowServiceV2(IWorkflowServiceV2):
                 "metadata": result.input.metadata,
             },
         )
-        translation = self.repository_service.repo.translations.create(translation_create)
 
         # Create AI Log with the translation_id
         ai_log_create = AILogCreate(
@@ -1115,6 +1182,10 @@ class WorkflowServiceV2(IWorkflowServiceV2):
                 }
             ),
             runtime_seconds=result.duration_seconds,
+            prompt_hash=combine_prompt_hashes(
+                getattr(step, "prompt_hash", None)
+                for step in (result.initial_translation, result.editor_review, result.revised_translation)
+            ),
             notes=f"Translation workflow completed using {workflow_mode} mode",
         )
         ai_log = self.repository_service.repo.ai_logs.create(ai_log_create)
@@ -1196,6 +1267,7 @@ class WorkflowServiceV2(IWorkflowServiceV2):
                 completion_tokens=step_data.completion_tokens,
                 duration_seconds=step_duration,
                 cost=step_cost,
+                prompt_hash=getattr(step_data, "prompt_hash", None),
                 translated_title=step_translated_title,
                 translated_poet_name=step_translated_poet_name,
                 timestamp=datetime.now(timezone(timedelta(hours=8))),  # UTC+8 timezone
@@ -1737,11 +1809,11 @@ class TaskManagementServiceV2(ITaskManagementServiceV2):
 
     def __init__(
         self,
-        tasks_store: Optional[Dict[str, Any]] = None,
+        tasks_store: Optional[TaskNamespace] = None,
         logger: Optional[logging.Logger] = None,
     ):
         self.logger = logger or logging.getLogger(__name__)
-        self.tasks: Dict[str, Any] = tasks_store if tasks_store is not None else {}
+        self.tasks: TaskNamespace = tasks_store if tasks_store is not None else InMemoryTaskStore().namespace("tasks")
         self.max_age_hours = 24
 
     async def create_task(
@@ -1749,9 +1821,10 @@ class TaskManagementServiceV2(ITaskManagementServiceV2):
         task_type: str,
         task_data: Dict[str, Any],
         user_id: Optional[str] = None,
+        task_id: Optional[str] = None,
     ) -> str:
-        """Create a new background task."""
-        task_id = generate_unique_id()
+        """Create a new background task (under ``task_id`` if given, e.g. to restore a queued job's task)."""
+        task_id = task_id or generate_unique_id()
 
         task = {
             "id": task_id,
@@ -1776,7 +1849,8 @@ class TaskManagementServiceV2(ITaskManagementServiceV2):
     async def update_task(self, task_id: str, updates: Dict[str, Any]):
         """Update a task with new data."""
         if task_id in self.tasks:
-            self.tasks[task_id].update(updates)
+            with self.tasks.edit(task_id) as task:
+                task.update(updates)
 
     async def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get a task by its ID."""
@@ -1791,14 +1865,15 @@ class TaskManagementServiceV2(ITaskManagementServiceV2):
     ) -> None:
         """Update task status."""
         if task_id in self.tasks:
-            self.tasks[task_id].update(
-                {
-                    "status": status,
-                    "updated_at": datetime.now(timezone.utc),
-                    "result": result,
-                    "error": error,
-                }
-            )
+            with self.tasks.edit(task_id) as task:
+                task.update(
+                    {
+                        "status": status,
+                        "updated_at": datetime.now(timezone.utc),
+                        "result": result,
+                        "error": error,
+                    }
+                )
             self.logger.info(f"Updated task {task_id} status to {status}")
 
     async def update_task_progress(
@@ -1809,9 +1884,11 @@ class TaskManagementServiceV2(ITaskManagementServiceV2):
         details: Dict[str, Any],
     ) -> None:
         """Update task progress while preserving step states and other important fields."""
-        if task_id in self.tasks:
+        if task_id not in self.tasks:
+            return
+
+        with self.tasks.edit(task_id) as existing_task:
             # Preserve existing important fields
-            existing_task = self.tasks[task_id]
             preserved_fields = {
                 "step_states": existing_task.get("step_states", {}),
                 "message": existing_task.get("message", ""),
@@ -1827,7 +1904,7 @@ class TaskManagementServiceV2(ITaskManagementServiceV2):
             }
 
             # Update with new progress data
-            self.tasks[task_id].update(
+            existing_task.update(
                 {
                     **preserved_fields,  # Preserve existing important fields
                     "current_step": step,
@@ -1841,10 +1918,20 @@ class TaskManagementServiceV2(ITaskManagementServiceV2):
             )
 
             # Debug logging for step_states
-            updated_step_states = self.tasks[task_id].get("step_states", {})
-            self.logger.info(
-                f"Updated task {task_id} progress to {progress}% at step {step}, step_states: {updated_step_states}"
-            )
+            updated_step_states = existing_task.get("step_states", {})
+        self.logger.info(
+            f"Updated task {task_id} progress to {progress}% at step {step}, step_states: {updated_step_states}"
+        )
+
+    async def record_partial_output(self, task_id: str, step: str, field: str, content: str) -> None:
+        """Store an output field of a step as soon as it has streamed in, ahead of the step result."""
+        if task_id not in self.tasks:
+            return
+
+        with self.tasks.edit(task_id) as task:
+            partial_outputs = task.setdefault("partial_outputs", {})
+            partial_outputs.setdefault(step, {})[field] = content
+            task["updated_at"] = datetime.now(timezone.utc)
 
     async def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get task information."""
@@ -1889,7 +1976,7 @@ class TaskManagementServiceV2(ITaskManagementServiceV2):
         expired_tasks = [task_id for task_id, task in self.tasks.items() if task["created_at"] < cutoff_time]
 
         for task_id in expired_tasks:
-            del self.tasks[task_id]
+            self.tasks.pop(task_id, None)
 
         if expired_tasks:
             self.logger.info(f"Cleaned up {len(expired_tasks)} expired tasks")
@@ -1904,15 +1991,22 @@ class TemplateServiceV2(ITemplateServiceV2):
         self,
         template_dir: str = "src/vpsweb/webui/web/templates",
         logger: Optional[logging.Logger] = None,
+        auto_reload: bool = True,
+        bytecode_cache_dir: Optional[str] = None,
     ):
         self.template_dir = template_dir
         self.logger = logger or logging.getLogger(__name__)
         self._templates = {}
 
-        # Initialize Jinja2 environment
+        # Shared Jinja2 environment: templates are compiled once per process, not per render
         from fastapi.templating import Jinja2Templates
 
-        self.templates = Jinja2Templates(directory=template_dir)
+        self.environment = get_template_environment(template_dir, auto_reload, bytecode_cache_dir)
+        self.templates = Jinja2Templates(env=self.environment)
+
+    def precompile(self) -> int:
+        """Compile all page templates ahead of the first request."""
+        return precompile_templates(self.environment)
 
     async def render_template(
         self,
@@ -1922,19 +2016,7 @@ class TemplateServiceV2(ITemplateServiceV2):
     ) -> str:
         """Render a template with context."""
         try:
-            from jinja2 import Environment, FileSystemLoader
-
-            env = Environment(loader=FileSystemLoader(self.template_dir))
-
-            # Add custom filters
-            def strip_leading_spaces(text):
-                """Strip leading spaces from each line in text."""
-                if text is None:
-                    return ""
-                return "\n".join(line.lstrip() for line in text.split("\n"))
-
-            env.filters["strip_leading_spaces"] = strip_leading_spaces
-            template = env.get_template(template_name)
+            template = self.environment.get_template(template_name)
 
             # Prepare template context with request-safe data
             template_context = context.copy()
@@ -2216,12 +2298,12 @@ class BBRServiceV2(IBBRServiceV2):
         """Get Background Briefing Report for a poem."""
         try:
             # Check if poem exists
-            poem = self.repository_service.repo.poems.get_by_id(poem_id)
+            poem = self.repository_service.repo.poems.get_snapshot(poem_id)
             if not poem:
                 raise ValueError(f"Poem not found: {poem_id}")
 
             # Get BBR from repository
-            bbr = self.repository_service.repo.background_briefing_reports.get_by_poem(poem_id)
+            bbr = self.repository_service.repo.background_briefing_reports.get_snapshot_by_poem(poem_id)
 
             if not bbr:
                 return None
@@ -2258,7 +2340,7 @@ class BBRServiceV2(IBBRServiceV2):
             from ...services.bbr_generator import BBRGenerator
 
             # Check if poem exists
-            poem = self.repository_service.repo.poems.get_by_id(poem_id)
+            poem = self.repository_service.repo.poems.get_snapshot(poem_id)
             if not poem:
                 raise ValueError(f"Poem not found: {poem_id}")
 
@@ -2333,12 +2415,12 @@ class BBRServiceV2(IBBRServiceV2):
         """Delete Background Briefing Report for a poem."""
         try:
             # Check if poem exists
-            poem = self.repository_service.repo.poems.get_by_id(poem_id)
+            poem = self.repository_service.repo.poems.get_snapshot(poem_id)
             if not poem:
                 raise ValueError(f"Poem not found: {poem_id}")
 
             # Check if BBR exists
-            existing_bbr = self.repository_service.repo.background_briefing_reports.get_by_poem(poem_id)
+            existing_bbr = self.repository_service.repo.background_briefing_reports.get_snapshot_by_poem(poem_id)
             if not existing_bbr:
                 return False
 
@@ -2360,7 +2442,7 @@ class BBRServiceV2(IBBRServiceV2):
     def has_bbr(self, poem_id: str) -> bool:
         """Check if poem has Background Briefing Report."""
         try:
-            bbr = self.repository_service.repo.background_briefing_reports.get_by_poem(poem_id)
+            bbr = self.repository_service.repo.background_briefing_reports.get_snapshot_by_poem(poem_id)
             return bbr is not None
 
         except Exception as e:
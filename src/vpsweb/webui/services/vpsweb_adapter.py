@@ -261,8 +261,6 @@ class VPSWebWorkflowAdapterV2:
         from vpsweb.webui.task_models import TaskStatus as InMemoryTaskStatus
 
         task_status = InMemoryTaskStatus(task_id=task_id)
-        app.state.tasks[task_id] = task_status
-        app.state.task_locks[task_id] = __import__("threading").Lock()
 
         # Set initial workflow step states
         task_status.update_step(
@@ -280,6 +278,7 @@ class VPSWebWorkflowAdapterV2:
             step_details={"step_status": "waiting"},
             step_state="waiting",
         )
+        app.state.tasks[task_id] = task_status
 
         # Schedule asynchronous execution
         asyncio.create_task(
@@ -323,8 +322,7 @@ class VPSWebWorkflowAdapterV2:
         # Get FastAPI app instance
         from vpsweb.webui.main import app
 
-        task_status = app.state.tasks.get(task_id)
-        if not task_status:
+        if task_id not in app.state.tasks:
             self.logger.error(f"Task {task_id} not found in app.state")
             return
 
@@ -345,7 +343,7 @@ class VPSWebWorkflowAdapterV2:
                 ]:
                     return
 
-                with app.state.task_locks[task_id]:
+                with app.state.tasks.edit(task_id) as current_task_status:
                     # Calculate progress percentage based on step
                     progress_map = {
                         "Initial Translation": 33,
@@ -389,7 +387,7 @@ class VPSWebWorkflowAdapterV2:
                 await asyncio.sleep(0.01)
 
             # Set task as running
-            with app.state.task_locks[task_id]:
+            with app.state.tasks.edit(task_id) as task_status:
                 task_status.status = TaskStatusEnum.RUNNING
                 task_status.started_at = datetime.now()
                 task_status.current_step = "Initial Translation"
@@ -447,7 +445,7 @@ class VPSWebWorkflowAdapterV2:
                 )
 
                 # Mark task as completed
-                with app.state.task_locks[task_id]:
+                with app.state.tasks.edit(task_id) as task_status:
                     task_status.set_completed(
                         result={
                             "workflow_result": result.__dict__,
@@ -463,7 +461,7 @@ class VPSWebWorkflowAdapterV2:
             else:
                 # Workflow failed
                 error_msg = "; ".join(result.errors) if result.errors else "Unknown error"
-                with app.state.task_locks[task_id]:
+                with app.state.tasks.edit(task_id) as task_status:
                     task_status.set_failed(
                         error=error_msg,
                         message="Translation workflow failed",
@@ -478,8 +476,8 @@ class VPSWebWorkflowAdapterV2:
             )
 
             # Update task status to failed
-            if task_status:
-                with app.state.task_locks[task_id]:
+            if task_id in app.state.tasks:
+                with app.state.tasks.edit(task_id) as task_status:
                     task_status.set_failed(
                         error=str(e),
                         message="Translation workflow encountered an error",
@@ -12,14 +12,29 @@ from typing import Any, Dict, Optional
 
 from fastapi import Request
 
+from .event_hub import EventHub, Subscription
+from .task_models import task_is_finished
+from .task_store import InMemoryTaskStore, RetentionPolicy, TaskNamespace
+
 
 class TranslationTaskManager:
     """Manages translation task state for SSE streaming."""
 
-    def __init__(self):
-        self.tasks: Dict[str, Dict[str, Any]] = {}
-        self.subscribers: Dict[str, asyncio.Queue] = {}
-        self.task_retention_time = 300  # Keep completed tasks for 5 minutes
+    def __init__(self, max_tasks: int = 100):
+        self.task_retention_time = 300  # Keep finished tasks for 5 minutes
+        store = InMemoryTaskStore()
+        store.set_retention(
+            "sse_tasks",
+            RetentionPolicy(
+                max_entries=max_tasks,
+                ttl=self.task_retention_time,
+                max_idle=24 * 3600,
+                finished=task_is_finished,
+            ),
+        )
+        self.tasks: TaskNamespace = store.namespace("sse_tasks")
+        # Every subscriber gets its own queue, so several tabs can follow one task
+        self.subscribers = EventHub(max_queue=10)
 
     def create_task(self, task_id: str, poem_id: str, target_lang: str, workflow_mode: str) -> Dict[str, Any]:
         """Create a new translation task."""
@@ -64,59 +79,35 @@ class TranslationTaskManager:
         elif status == "completed":
             task["completed_at"] = time.time()
             task["progress"] = 100
+        # Written back so the retention clock restarts
+        self.tasks[task_id] = task
 
         # Notify all subscribers on status change
         if old_status != status:
-            if task_id in self.subscribers:
-                asyncio.create_task(self._notify_subscribers(task_id))
+            self.subscribers.publish(task_id, dict(task))
 
-    async def _notify_subscribers(self, task_id: str):
-        """Notify all subscribers of task updates."""
-        if task_id in self.subscribers:
-            task = self.tasks[task_id]
-            try:
-                await self.subscribers[task_id].put(task)
-            except Exception as e:
-                print(f"Error notifying subscribers for task {task_id}: {e}")
-
-    def subscribe(self, task_id: str) -> asyncio.Queue:
+    def subscribe(self, task_id: str) -> Subscription:
         """Subscribe to task updates."""
-        if task_id not in self.subscribers:
-            self.subscribers[task_id] = asyncio.Queue(maxsize=10)
-        return self.subscribers[task_id]
+        return self.subscribers.subscribe(task_id)
 
-    def unsubscribe(self, task_id: str):
+    def unsubscribe(self, subscription: Subscription):
         """Unsubscribe from task updates."""
-        if task_id in self.subscribers:
-            del self.subscribers[task_id]
+        subscription.close()
 
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get task status."""
         return self.tasks.get(task_id)
 
     def cleanup_expired_tasks(self):
-        """Remove expired completed tasks."""
-        current_time = time.time()
-        expired_tasks = []
-        for task_id, task in self.tasks.items():
-            if (
-                task["status"] == "completed"
-                and task.get("completed_at")
-                and current_time - task["completed_at"] > self.task_retention_time
-            ):
-                expired_tasks.append(task_id)
-
-        for task_id in expired_tasks:
-            del self.tasks[task_id]
-            if task_id in self.subscribers:
-                del self.subscribers[task_id]
+        """Remove expired finished tasks and the oldest ones beyond ``max_tasks``."""
+        self.tasks.store.sweep()
 
 
 async def create_real_translation_events(request: Request, task_id: str, task_manager: TranslationTaskManager):
     """Create real translation progress events from actual task status."""
+    subscription = None
     try:
-        # TODO: Temporarily disable cleanup to debug task retention issue
-        # task_manager.cleanup_expired_tasks()
+        task_manager.cleanup_expired_tasks()
 
         # Debug: Print task manager info
         print(f"[SSE DEBUG] TaskManager ID: {id(task_manager)}, Tasks in manager: {list(task_manager.tasks.keys())}")
@@ -138,7 +129,7 @@ async def create_real_translation_events(request: Request, task_id: str, task_ma
             return
 
         # Subscribe to task updates
-        queue = task_manager.subscribe(task_id)
+        subscription = task_manager.subscribe(task_id)
 
         # Send initial connection event
         yield {
@@ -194,7 +185,9 @@ async def create_real_translation_events(request: Request, task_id: str, task_ma
 
             try:
                 # Wait for task updates with timeout
-                updated_task = await asyncio.wait_for(queue.get(), timeout=2.0)
+                updated_task = await subscription.get(timeout=2.0)
+                if updated_task is None:
+                    break
 
                 # Send update event based on task status
                 if updated_task["status"] == "running":
@@ -305,7 +298,5 @@ async def create_real_translation_events(request: Request, task_id: str, task_ma
         }
     finally:
         # Unsubscribe when done
-        try:
-            task_manager.unsubscribe(task_id)
-        except:
-            pass
+        if subscription is not None:
+            task_manager.unsubscribe(subscription)
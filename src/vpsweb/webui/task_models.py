@@ -6,7 +6,7 @@ This replaces the database-backed task management with a simplified
 approach suitable for personal use systems.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
@@ -79,6 +79,30 @@ class TaskStatus:
             "updated_at": self.updated_at.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TaskStatus":
+        """Rebuild a task status from its ``to_dict`` representation"""
+
+        def parse_time(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            task_id=data["task_id"],
+            status=TaskStatusEnum(data.get("status", TaskStatusEnum.PENDING.value)),
+            progress=data.get("progress", 0),
+            current_step=data.get("current_step", ""),
+            step_details=data.get("step_details"),
+            step_progress=data.get("step_progress"),
+            step_states=data.get("step_states"),
+            message=data.get("message", ""),
+            error=data.get("error"),
+            result=data.get("result"),
+            created_at=parse_time(data.get("created_at")) or datetime.now(),
+            started_at=parse_time(data.get("started_at")),
+            completed_at=parse_time(data.get("completed_at")),
+            updated_at=parse_time(data.get("updated_at")) or datetime.now(),
+        )
+
     def update_step(
         self,
         step_name: str,
@@ -139,6 +163,55 @@ class TaskStatus:
         self.updated_at = datetime.now()
 
 
+FINISHED_TASK_STATUSES = ("completed", "failed", "cancelled")
+
+# Fields of task dicts holding step outputs, which are persisted with the translation
+TASK_OUTPUT_FIELDS = ("partial_outputs", "details")
+
+
+def task_is_finished(task: Any) -> bool:
+    """Whether a task (a TaskStatus or a task dict) has completed, failed or been cancelled"""
+    status = task.status if isinstance(task, TaskStatus) else task.get("status")
+    return getattr(status, "value", status) in FINISHED_TASK_STATUSES
+
+
+def _scalar_fields(data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if not isinstance(data, dict):
+        return data
+    return {key: value for key, value in data.items() if value is None or isinstance(value, (str, int, float, bool))}
+
+
+def _without_output(details: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if not isinstance(details, dict):
+        return details
+    return {key: value for key, value in details.items() if key != "output"}
+
+
+def compact_task(task: Any) -> Any:
+    """
+    Slim summary of a finished task for long-term tracking
+
+    Step outputs are dropped: the workflow stores them with the translation
+    in the repository database before the task completes. The result keeps
+    its scalar fields (workflow ID, tokens, cost, duration).
+
+    Returns:
+        The compacted task, or None if it holds no outputs to drop
+    """
+    if isinstance(task, TaskStatus):
+        result, details = _scalar_fields(task.result), _without_output(task.step_details)
+        if result == task.result and details == task.step_details:
+            return None
+        return replace(task, result=result, step_details=details)
+
+    slim = {key: value for key, value in task.items() if key not in TASK_OUTPUT_FIELDS}
+    if "result" in slim:
+        slim["result"] = _scalar_fields(slim["result"])
+    if "step_details" in slim:
+        slim["step_details"] = _without_output(slim["step_details"])
+    return slim if slim != task else None
+
+
 @dataclass
 class WorkflowStep:
     """Individual workflow step information"""
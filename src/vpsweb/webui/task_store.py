@@ -0,0 +1,774 @@
+"""
+VPSWeb Web UI - Shared Task Store v1.0
+
+Pluggable storage for background task state (translation tasks, WeChat
+article tasks, manual workflow sessions) with change notification.
+
+``InMemoryTaskStore`` keeps live objects in the process and suits a single
+worker. ``SQLiteTaskStore`` keeps JSON documents in a WAL-mode SQLite file
+shared by all worker processes, so any worker can report on and stream any
+task. Writes in other processes are detected by polling
+``PRAGMA data_version``, which changes whenever another connection commits.
+
+State is grouped in namespaces exposed as mutable mappings::
+
+    tasks = store.namespace("tasks")
+    tasks[task_id] = {"status": "pending"}
+    with tasks.edit(task_id) as task:  # atomic read-modify-write
+        task["status"] = "running"
+    version = await tasks.wait_for_change(task_id, version, timeout=1.0)
+
+Values read from a shared store are copies: changes must be written back
+with ``edit`` or item assignment.
+
+Namespaces can keep a bounded history of each key's recent versions
+(``enable_history``), which lets SSE clients that reconnect replay the
+changes they missed.
+
+Namespaces can also be bounded (``set_retention``): ``sweep`` compacts
+finished entries (and their history) to a slim summary, expires entries
+past their TTL and evicts the oldest entries beyond a maximum count.
+``TaskSweeper`` runs the sweep periodically; ``stats`` reports entries
+and approximate bytes per namespace, with the share taken by history.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .task_models import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+TASK_STORE_BACKENDS = ("memory", "sqlite")
+
+_MISSING = object()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, TaskStatus):
+        return {"$task_status": value.to_dict()}
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    # Runtime handles (workflows, executors) cannot be shared between processes
+    return repr(value)
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if "$datetime" in obj:
+            return datetime.fromisoformat(obj["$datetime"])
+        if "$task_status" in obj:
+            return TaskStatus.from_dict(obj["$task_status"])
+    return obj
+
+
+def encode_value(value: Any) -> str:
+    """Serialize a task value to JSON, keeping datetimes and TaskStatus objects"""
+    return json.dumps(value, ensure_ascii=False, default=_json_default)
+
+
+def decode_value(data: str) -> Any:
+    return json.loads(data, object_hook=_json_object_hook)
+
+
+@dataclass
+class RetentionPolicy:
+    """
+    Bounds on one namespace, applied by ``TaskStore.sweep``
+
+    Attributes:
+        max_entries: Most entries kept; finished entries, then the least
+            recently written ones, are evicted first
+        ttl: Seconds a finished entry is kept after its last write
+        max_idle: Seconds an unfinished entry may go without a write
+            (abandoned sessions, tasks of a crashed worker)
+        compact_after: Seconds after its last write before a finished entry is compacted
+        finished: Whether an entry is finished
+        compact: Slim summary of a finished entry, or None if there is nothing to drop
+    """
+
+    max_entries: Optional[int] = None
+    ttl: Optional[float] = None
+    max_idle: Optional[float] = None
+    compact_after: float = 0.0
+    finished: Callable[[Any], bool] = lambda value: False
+    compact: Optional[Callable[[Any], Any]] = None
+
+
+class TaskStore(ABC):
+    """
+    Namespaced key-value store for task state with change notification
+
+    Every write gives the key a new version from a store-wide clock (0 means
+    absent), so versions of one key increase monotonically;
+    ``wait_for_change`` lets coroutines sleep until a key's version moves
+    instead of polling.
+    """
+
+    def __init__(self):
+        self._waiters: Dict[Tuple[str, str], List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        self._waiters_lock = threading.Lock()
+        self.history_sizes: Dict[str, int] = {}
+        self.retention: Dict[str, RetentionPolicy] = {}
+        # Entries removed or slimmed down by sweeps since the store was opened
+        self.swept: Dict[str, int] = {"compacted": 0, "expired": 0, "evicted": 0}
+
+    def enable_history(self, namespace: str, size: int) -> None:
+        """Keep the last ``size`` versions of every key in a namespace (0 disables)"""
+        if size > 0:
+            self.history_sizes[namespace] = size
+        else:
+            self.history_sizes.pop(namespace, None)
+
+    def set_retention(self, namespace: str, policy: Optional[RetentionPolicy]) -> None:
+        """Bound a namespace by the policy on every ``sweep`` (None removes the bounds)"""
+        if policy is not None:
+            self.retention[namespace] = policy
+        else:
+            self.retention.pop(namespace, None)
+
+    @abstractmethod
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Value stored under the key, or ``default``"""
+
+    @abstractmethod
+    def version(self, namespace: str, key: str) -> int:
+        """Current version of the key; 0 if it is absent"""
+
+    @abstractmethod
+    def put(self, namespace: str, key: str, value: Any) -> int:
+        """Store a value and return its new version"""
+
+    @abstractmethod
+    def compact(self, namespace: str, key: str, value: Any) -> int:
+        """Store a slim value in place of the key's value and history; returns its new version"""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> bool:
+        """Remove a key; returns whether it existed"""
+
+    @abstractmethod
+    def keys(self, namespace: str) -> List[str]:
+        """Keys of a namespace"""
+
+    @abstractmethod
+    def items(self, namespace: str) -> List[Tuple[str, Any]]:
+        """Key-value pairs of a namespace"""
+
+    @abstractmethod
+    def edit(self, namespace: str, key: str):
+        """
+        Context manager yielding the value for an atomic read-modify-write
+
+        The (mutated) value is written back when the block exits without an
+        exception. No other writer can change the key in between.
+
+        Raises:
+            KeyError: If the key is absent
+        """
+
+    @abstractmethod
+    def history(self, namespace: str, key: str) -> List[Tuple[int, Any]]:
+        """Retained ``(version, value)`` pairs of a key, oldest first; empty without history"""
+
+    @abstractmethod
+    def written_at(self, namespace: str) -> Dict[str, float]:
+        """Time of the last write of every key in a namespace"""
+
+    @abstractmethod
+    def usage(self) -> Dict[str, Dict[str, int]]:
+        """
+        Entries and approximate bytes per namespace
+
+        ``bytes`` is the serialized size of values and history together;
+        ``history_bytes`` is the part taken by history.
+        """
+
+    def namespace(self, name: str) -> "TaskNamespace":
+        return TaskNamespace(self, name)
+
+    def sweep(self, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Apply the retention policies once
+
+        Returns:
+            Number of entries compacted, expired and evicted by this sweep
+        """
+        now = time.time() if now is None else now
+        counts = {"compacted": 0, "expired": 0, "evicted": 0}
+        for namespace, policy in list(self.retention.items()):
+            written = self.written_at(namespace)
+            values = dict(self.items(namespace))
+            finished = {key for key, value in values.items() if policy.finished(value)}
+
+            expired = set()
+            for key in values:
+                age = now - written.get(key, now)
+                limit = policy.ttl if key in finished else policy.max_idle
+                if limit is not None and age > limit:
+                    expired.add(key)
+
+            evicted: List[str] = []
+            if policy.max_entries is not None:
+                remaining = [key for key in values if key not in expired]
+                excess = len(remaining) - policy.max_entries
+                if excess > 0:
+                    remaining.sort(key=lambda key: (key not in finished, written.get(key, now)))
+                    evicted = remaining[:excess]
+
+            for key in [*expired, *evicted]:
+                self.delete(namespace, key)
+            counts["expired"] += len(expired)
+            counts["evicted"] += len(evicted)
+
+            if policy.compact is not None:
+                for key in finished - expired - set(evicted):
+                    if now - written.get(key, now) < policy.compact_after:
+                        continue
+                    slim = policy.compact(values[key])
+                    if slim is not None:
+                        self.compact(namespace, key, slim)
+                        counts["compacted"] += 1
+
+        for name, count in counts.items():
+            self.swept[name] += count
+        if any(counts.values()):
+            logger.info(
+                f"Task store sweep: {counts['compacted']} compacted, {counts['expired']} expired, "
+                f"{counts['evicted']} evicted"
+            )
+        return counts
+
+    def stats(self) -> Dict[str, Any]:
+        """Entries and approximate bytes per namespace, with sweep totals"""
+        return {"namespaces": self.usage(), **self.swept}
+
+    def close(self) -> None:
+        """Release connections and background threads"""
+
+    async def wait_for_change(self, namespace: str, key: str, version: int, timeout: Optional[float] = None) -> int:
+        """
+        Wait until the key's version differs from ``version`` or the timeout passes
+
+        Returns:
+            The key's current version (unchanged after a timeout)
+        """
+        current = self.version(namespace, key)
+        if current != version:
+            return current
+
+        loop = asyncio.get_running_loop()
+        waiter = (loop, loop.create_future())
+        with self._waiters_lock:
+            self._waiters.setdefault((namespace, key), []).append(waiter)
+        self._watch()
+        try:
+            # A write may have landed between the first check and registration
+            current = self.version(namespace, key)
+            if current != version:
+                return current
+            try:
+                await asyncio.wait_for(waiter[1], timeout)
+            except asyncio.TimeoutError:
+                pass
+            return self.version(namespace, key)
+        finally:
+            with self._waiters_lock:
+                waiters = self._waiters.get((namespace, key), [])
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    self._waiters.pop((namespace, key), None)
+
+    def _watch(self) -> None:
+        """Start watching for changes made by other processes (if the backend has any)"""
+
+    def _notify(self, namespace: Optional[str] = None, key: Optional[str] = None) -> None:
+        """Wake the waiters of one key, or of every key when ``namespace`` is None"""
+        with self._waiters_lock:
+            if namespace is None:
+                waiters = [waiter for group in self._waiters.values() for waiter in group]
+            else:
+                waiters = list(self._waiters.get((namespace, key), ()))
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+            except RuntimeError:
+                # The waiter's event loop has been closed
+                pass
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _serialized_size(value: Any) -> int:
+    try:
+        return len(encode_value(value).encode("utf-8"))
+    except (TypeError, ValueError, RecursionError):
+        # Live objects that cannot be encoded (cyclic structures, mocks) are not counted
+        return 0
+
+
+class InMemoryTaskStore(TaskStore):
+    """
+    Process-local store of live objects; in-place changes are visible immediately
+
+    ``usage`` keeps running totals of serialized sizes and only measures the
+    entries and history versions written since it was last called, so
+    repeated calls (``/health``) do not re-encode the stored state.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._data: Dict[Tuple[str, str], Any] = {}
+        self._versions: Dict[Tuple[str, str], int] = {}
+        # [version, value copy, serialized bytes or None until measured] per retained version
+        self._history: Dict[Tuple[str, str], deque] = {}
+        self._written: Dict[Tuple[str, str], float] = {}
+        # Last measured size of each value, and the keys written since
+        self._sizes: Dict[Tuple[str, str], int] = {}
+        self._unmeasured: Set[Tuple[str, str]] = set()
+        self._usage: Dict[str, Dict[str, int]] = {}
+        self._clock = 0
+        self._lock = threading.RLock()
+
+    def _bump(self, namespace: str, key: str) -> int:
+        self._clock += 1
+        self._versions[(namespace, key)] = self._clock
+        self._written[(namespace, key)] = time.time()
+        if (namespace, key) not in self._sizes:
+            self._sizes[(namespace, key)] = 0
+            self._usage.setdefault(namespace, {"entries": 0, "bytes": 0, "history_bytes": 0})["entries"] += 1
+        self._unmeasured.add((namespace, key))
+
+        size = self.history_sizes.get(namespace)
+        if size:
+            # Values are live objects, so the history keeps copies
+            entries = self._history.setdefault((namespace, key), deque(maxlen=size))
+            if len(entries) == entries.maxlen:
+                self._count_history(namespace, -(entries[0][2] or 0))
+            entries.append([self._clock, copy.deepcopy(self._data[(namespace, key)]), None])
+        return self._clock
+
+    def _count_history(self, namespace: str, size: int) -> None:
+        usage = self._usage[namespace]
+        usage["bytes"] += size
+        usage["history_bytes"] += size
+
+    def _drop_history(self, namespace: str, key: str) -> None:
+        for _, _, size in self._history.pop((namespace, key), ()):
+            self._count_history(namespace, -(size or 0))
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        return self._data.get((namespace, key), default)
+
+    def version(self, namespace: str, key: str) -> int:
+        return self._versions.get((namespace, key), 0)
+
+    def put(self, namespace: str, key: str, value: Any) -> int:
+        with self._lock:
+            self._data[(namespace, key)] = value
+            version = self._bump(namespace, key)
+        self._notify(namespace, key)
+        return version
+
+    def compact(self, namespace: str, key: str, value: Any) -> int:
+        with self._lock:
+            self._data[(namespace, key)] = value
+            # The full versions go; replay starts again from the slim one
+            self._drop_history(namespace, key)
+            version = self._bump(namespace, key)
+        self._notify(namespace, key)
+        return version
+
+    def delete(self, namespace: str, key: str) -> bool:
+        with self._lock:
+            existed = self._data.pop((namespace, key), _MISSING) is not _MISSING
+            self._versions.pop((namespace, key), None)
+            self._written.pop((namespace, key), None)
+            self._unmeasured.discard((namespace, key))
+            if existed:
+                self._drop_history(namespace, key)
+                usage = self._usage[namespace]
+                usage["entries"] -= 1
+                usage["bytes"] -= self._sizes.pop((namespace, key))
+                if not usage["entries"]:
+                    del self._usage[namespace]
+        if existed:
+            self._notify(namespace, key)
+        return existed
+
+    def keys(self, namespace: str) -> List[str]:
+        with self._lock:
+            return [key for ns, key in self._data if ns == namespace]
+
+    def items(self, namespace: str) -> List[Tuple[str, Any]]:
+        with self._lock:
+            return [(key, value) for (ns, key), value in self._data.items() if ns == namespace]
+
+    def history(self, namespace: str, key: str) -> List[Tuple[int, Any]]:
+        with self._lock:
+            return [(version, value) for version, value, _ in self._history.get((namespace, key), ())]
+
+    def written_at(self, namespace: str) -> Dict[str, float]:
+        with self._lock:
+            return {key: written for (ns, key), written in self._written.items() if ns == namespace}
+
+    def usage(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            for namespace, key in self._unmeasured:
+                usage = self._usage[namespace]
+                size = _serialized_size(self._data[(namespace, key)])
+                usage["bytes"] += size - self._sizes[(namespace, key)]
+                self._sizes[(namespace, key)] = size
+                for entry in self._history.get((namespace, key), ()):
+                    if entry[2] is None:
+                        entry[2] = _serialized_size(entry[1])
+                        self._count_history(namespace, entry[2])
+            self._unmeasured.clear()
+            return {namespace: dict(usage) for namespace, usage in self._usage.items()}
+
+    @contextmanager
+    def edit(self, namespace: str, key: str) -> Iterator[Any]:
+        with self._lock:
+            value = self._data[(namespace, key)]
+            yield value
+            self._bump(namespace, key)
+        self._notify(namespace, key)
+
+
+class SQLiteTaskStore(TaskStore):
+    """
+    Task state shared between processes through a SQLite file
+
+    Each thread uses its own connection. A daemon thread polls
+    ``PRAGMA data_version`` while coroutines are waiting for changes and
+    wakes them when another process commits.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.1):
+        """
+        Args:
+            path: SQLite database file; created with its directory if missing
+            poll_interval: Seconds between checks for writes by other processes
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.poll_interval = poll_interval
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS task_clock (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                value INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO task_clock (id, value) VALUES (1, 0);
+            CREATE TABLE IF NOT EXISTS task_history (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (namespace, key, version)
+            ) WITHOUT ROWID;
+            """
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _store(self, conn: sqlite3.Connection, namespace: str, key: str, value: Any) -> int:
+        version = conn.execute("UPDATE task_clock SET value = value + 1 WHERE id = 1 RETURNING value").fetchone()[0]
+        data = encode_value(value)
+        conn.execute(
+            "INSERT OR REPLACE INTO tasks (namespace, key, value, version, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (namespace, key, data, version, time.time()),
+        )
+        size = self.history_sizes.get(namespace)
+        if size:
+            conn.execute(
+                "INSERT INTO task_history (namespace, key, version, value) VALUES (?, ?, ?, ?)",
+                (namespace, key, version, data),
+            )
+            # Keep the newest `size` versions of the key
+            conn.execute(
+                "DELETE FROM task_history WHERE namespace = ? AND key = ? AND version < ("
+                "SELECT MIN(version) FROM (SELECT version FROM task_history WHERE namespace = ? AND key = ? "
+                "ORDER BY version DESC LIMIT ?))",
+                (namespace, key, namespace, key, size),
+            )
+        return version
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        row = (
+            self._connection()
+            .execute("SELECT value FROM tasks WHERE namespace = ? AND key = ?", (namespace, key))
+            .fetchone()
+        )
+        return decode_value(row[0]) if row else default
+
+    def version(self, namespace: str, key: str) -> int:
+        row = (
+            self._connection()
+            .execute("SELECT version FROM tasks WHERE namespace = ? AND key = ?", (namespace, key))
+            .fetchone()
+        )
+        return row[0] if row else 0
+
+    def put(self, namespace: str, key: str, value: Any) -> int:
+        with self._write() as conn:
+            version = self._store(conn, namespace, key, value)
+        self._notify(namespace, key)
+        return version
+
+    def compact(self, namespace: str, key: str, value: Any) -> int:
+        with self._write() as conn:
+            # The full versions go; replay starts again from the slim one
+            conn.execute("DELETE FROM task_history WHERE namespace = ? AND key = ?", (namespace, key))
+            version = self._store(conn, namespace, key, value)
+        self._notify(namespace, key)
+        return version
+
+    def delete(self, namespace: str, key: str) -> bool:
+        with self._write() as conn:
+            existed = conn.execute("DELETE FROM tasks WHERE namespace = ? AND key = ?", (namespace, key)).rowcount > 0
+            conn.execute("DELETE FROM task_history WHERE namespace = ? AND key = ?", (namespace, key))
+        if existed:
+            self._notify(namespace, key)
+        return existed
+
+    def keys(self, namespace: str) -> List[str]:
+        rows = self._connection().execute("SELECT key FROM tasks WHERE namespace = ? ORDER BY key", (namespace,))
+        return [key for (key,) in rows]
+
+    def items(self, namespace: str) -> List[Tuple[str, Any]]:
+        rows = self._connection().execute("SELECT key, value FROM tasks WHERE namespace = ? ORDER BY key", (namespace,))
+        return [(key, decode_value(value)) for key, value in rows]
+
+    def history(self, namespace: str, key: str) -> List[Tuple[int, Any]]:
+        rows = self._connection().execute(
+            "SELECT version, value FROM task_history WHERE namespace = ? AND key = ? ORDER BY version",
+            (namespace, key),
+        )
+        return [(version, decode_value(value)) for version, value in rows]
+
+    def written_at(self, namespace: str) -> Dict[str, float]:
+        rows = self._connection().execute("SELECT key, updated_at FROM tasks WHERE namespace = ?", (namespace,))
+        return dict(rows.fetchall())
+
+    def usage(self) -> Dict[str, Dict[str, int]]:
+        conn = self._connection()
+        usage = {
+            namespace: {"entries": entries, "bytes": size, "history_bytes": 0}
+            for namespace, entries, size in conn.execute(
+                "SELECT namespace, COUNT(*), SUM(LENGTH(CAST(value AS BLOB))) FROM tasks GROUP BY namespace"
+            )
+        }
+        for namespace, size in conn.execute(
+            "SELECT namespace, SUM(LENGTH(CAST(value AS BLOB))) FROM task_history GROUP BY namespace"
+        ):
+            entry = usage.setdefault(namespace, {"entries": 0, "bytes": 0, "history_bytes": 0})
+            entry["bytes"] += size
+            entry["history_bytes"] += size
+        return usage
+
+    @contextmanager
+    def edit(self, namespace: str, key: str) -> Iterator[Any]:
+        with self._write() as conn:
+            row = conn.execute("SELECT value FROM tasks WHERE namespace = ? AND key = ?", (namespace, key)).fetchone()
+            if row is None:
+                raise KeyError(key)
+            value = decode_value(row[0])
+            yield value
+            self._store(conn, namespace, key, value)
+        self._notify(namespace, key)
+
+    def _watch(self) -> None:
+        if self._watcher is None and not self._closed.is_set():
+            with self._waiters_lock:
+                if self._watcher is None:
+                    self._watcher = threading.Thread(target=self._watch_loop, name="task-store-watcher", daemon=True)
+                    self._watcher.start()
+
+    def _watch_loop(self) -> None:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            last = conn.execute("PRAGMA data_version").fetchone()[0]
+            while not self._closed.wait(self.poll_interval):
+                if not self._waiters:
+                    continue
+                current = conn.execute("PRAGMA data_version").fetchone()[0]
+                if current != last:
+                    last = current
+                    # Waiters re-read their key's version, so waking all of them is safe
+                    self._notify()
+        except sqlite3.Error as e:
+            logger.error(f"Task store watcher stopped: {e}")
+        finally:
+            conn.close()
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=1.0)
+            self._watcher = None
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class TaskNamespace(MutableMapping):
+    """Mapping view of one namespace of a task store"""
+
+    def __init__(self, store: TaskStore, name: str):
+        self.store = store
+        self.name = name
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.store.get(self.name, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.store.put(self.name, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self.store.delete(self.name, key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.store.version(self.name, key) > 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.keys(self.name))
+
+    def __len__(self) -> int:
+        return len(self.store.keys(self.name))
+
+    def items(self) -> List[Tuple[str, Any]]:  # type: ignore[override]
+        return self.store.items(self.name)
+
+    def values(self) -> List[Any]:  # type: ignore[override]
+        return [value for _, value in self.store.items(self.name)]
+
+    def edit(self, key: str):
+        """Atomic read-modify-write of one value (see ``TaskStore.edit``)"""
+        return self.store.edit(self.name, key)
+
+    def version(self, key: str) -> int:
+        return self.store.version(self.name, key)
+
+    def history(self, key: str) -> List[Tuple[int, Any]]:
+        return self.store.history(self.name, key)
+
+    async def wait_for_change(self, key: str, version: int, timeout: Optional[float] = None) -> int:
+        return await self.store.wait_for_change(self.name, key, version, timeout)
+
+    def __repr__(self) -> str:
+        return f"TaskNamespace({type(self.store).__name__}, '{self.name}')"
+
+
+class TaskSweeper:
+    """Runs a task store's ``sweep`` every ``interval_seconds`` in the background"""
+
+    def __init__(self, store: TaskStore, interval_seconds: float):
+        self.store = store
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self.interval_seconds > 0 and self._task is None and self.store.retention:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await asyncio.to_thread(self.store.sweep)
+            except Exception as e:
+                logger.error(f"Task store sweep failed: {e}")
+
+
+def create_task_store(backend: str = "memory", path: Optional[str] = None, poll_interval: float = 0.1) -> TaskStore:
+    """
+    Build the task store for a backend name
+
+    Raises:
+        ValueError: If the backend is unknown or the SQLite backend has no path
+    """
+    if backend == "memory":
+        return InMemoryTaskStore()
+    if backend == "sqlite":
+        if not path:
+            raise ValueError("The sqlite task store needs a database path")
+        return SQLiteTaskStore(path, poll_interval=poll_interval)
+    raise ValueError(f"Unknown task store backend '{backend}'; expected one of {', '.join(TASK_STORE_BACKENDS)}")
@@ -0,0 +1,79 @@
+"""
+VPSWeb Web UI - Template Environment v1.0
+
+Process-wide Jinja2 environments for HTML page rendering.
+
+Each template directory gets one environment, shared by every render, so a
+template is parsed and compiled once per process and then served from the
+environment's in-memory cache. Compiled bytecode is also written to an
+on-disk cache that other workers and later restarts reuse; entries are
+validated against the template source checksum, so edited templates are
+never served stale.
+
+With ``auto_reload`` (the dev-mode default, following ``WEBUI_RELOAD``)
+Jinja checks each template's mtime on use and recompiles changed files;
+without it templates are never re-checked after the first load.
+``precompile_templates`` compiles every page template up front, so the
+first request for a page does no compile work either.
+"""
+
+import logging
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+logger = logging.getLogger(__name__)
+
+
+def strip_leading_spaces(text):
+    """Strip leading spaces from each line in text."""
+    if text is None:
+        return ""
+    return "\n".join(line.lstrip() for line in text.split("\n"))
+
+
+@lru_cache(maxsize=None)
+def get_template_environment(
+    template_dir: str, auto_reload: bool = True, bytecode_cache_dir: Optional[str] = None
+) -> Environment:
+    """
+    Shared Jinja2 environment for a template directory
+
+    Args:
+        template_dir: Directory the templates are loaded from
+        auto_reload: Recompile templates whose files changed since they were loaded
+        bytecode_cache_dir: Directory for compiled template bytecode; the
+            system temporary directory if None
+    """
+    if bytecode_cache_dir:
+        Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        auto_reload=auto_reload,
+        bytecode_cache=FileSystemBytecodeCache(bytecode_cache_dir),
+        cache_size=-1,  # keep every compiled template
+    )
+    env.filters["strip_leading_spaces"] = strip_leading_spaces
+    return env
+
+
+def precompile_templates(env: Environment, extensions: tuple = ("html",)) -> int:
+    """
+    Load every template with one of the given extensions into the environment's cache
+
+    Returns:
+        Number of templates compiled (or loaded from the bytecode cache)
+    """
+    start = time.perf_counter()
+    count = 0
+    for name in env.list_templates(extensions=list(extensions)):
+        try:
+            env.get_template(name)
+            count += 1
+        except Exception as e:
+            logger.warning(f"Could not precompile template {name}: {e}")
+    logger.info(f"Precompiled {count} templates in {(time.perf_counter() - start) * 1000:.0f}ms")
+    return count
@@ -15,14 +15,14 @@ import json
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 # 添加根路径以确保可以导入其他模块
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
 
 from vpsweb.models.wechat import ArticleGenerationResult, WeChatArticleStatus
 from vpsweb.services.config import ConfigFacade, get_config_facade
-from vpsweb.utils.article_generator import ArticleGenerator, ArticleGeneratorError
+from vpsweb.utils.article_generator import ArticleGenerationCancelled, ArticleGenerator, ArticleGeneratorError
 from vpsweb.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -129,6 +129,7 @@ class WeChatArticleRunner:
         digest: Optional[str] = None,
         dry_run: bool = False,
         custom_metadata: Optional[Dict[str, Any]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
     ) -> ArticleGenerationResult:
         """
         从翻译JSON文件生成微信文章
@@ -140,6 +141,7 @@ class WeChatArticleRunner:
             digest: 自定义摘要
             dry_run: 是否为试运行模式
             custom_metadata: 自定义元数据
+            cancel_check: 取消检查函数，在每个生成阶段前调用
 
         Returns:
             文章生成结果
@@ -156,6 +158,7 @@ class WeChatArticleRunner:
                 author=author,
                 digest=digest,
                 dry_run=dry_run,
+                cancel_check=cancel_check,
             )
             print(f"✅ Article generator returned result successfully!")
 
@@ -183,6 +186,7 @@ class WeChatArticleRunner:
         digest: Optional[str] = None,
         dry_run: bool = False,
         custom_metadata: Optional[Dict[str, Any]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
     ) -> ArticleGenerationResult:
         """
         从翻译数据字典生成微信文章
@@ -194,6 +198,7 @@ class WeChatArticleRunner:
             digest: 自定义摘要
             dry_run: 是否为试运行模式
             custom_metadata: 自定义元数据
+            cancel_check: 取消检查函数，在每个生成阶段前调用
 
         Returns:
             文章生成结果
@@ -219,6 +224,7 @@ class WeChatArticleRunner:
                     digest=digest,
                     dry_run=dry_run,
                     custom_metadata=custom_metadata,
+                    cancel_check=cancel_check,
                 )
                 print(f"✅ Article generation completed successfully!")
 
@@ -232,6 +238,8 @@ class WeChatArticleRunner:
                 Path(temp_json_path).unlink(missing_ok=True)
                 print(f"🧹 Temporary file cleaned up: {temp_json_path}")
 
+        except ArticleGenerationCancelled:
+            raise
         except Exception as e:
             print(f"❌ Failed to generate article from data: {e}")
             logger.error(f"从翻译数据生成微信文章失败: {e}")
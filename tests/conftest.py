@@ -12,6 +12,8 @@ import os
 # can access the same in-memory database. The cache=shared parameter allows
 # multiple connections to share the same in-memory database.
 os.environ["REPO_DATABASE_URL"] = "sqlite:///file:memdb1?mode=memory&cache=shared"
+# Keep queued translation jobs in memory rather than in ./repository_root/jobs.db
+os.environ["WEBUI_JOB_QUEUE_PATH"] = ":memory:"
 
 import shutil
 import tempfile
@@ -108,6 +108,11 @@ def db_session(sync_test_engine) -> Generator[Session, None, None]:
     """
     from sqlalchemy.orm import sessionmaker
 
+    from src.vpsweb.repository.cache import clear_caches
+
+    # Entity caches are process-wide; start every test with empty caches
+    clear_caches()
+
     session = sessionmaker(
         bind=sync_test_engine,
         autocommit=False,
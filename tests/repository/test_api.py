@@ -26,3 +26,89 @@ async def test_health_check_endpoint(test_client: AsyncClient):
     assert data["status"] == "healthy"
     assert "services" in data
     assert "version" in data
+
+
+@pytest.mark.api
+@pytest.mark.unit
+def test_backup_while_another_is_running_returns_conflict(tmp_path):
+    """
+    Test that requesting a backup during a running one returns 409.
+
+    The app's scheduler comes from vpsweb.repository.backup, as in
+    webui/main.py, while the endpoint imports src.vpsweb.repository.backup,
+    so it must recognise BackupError from either module path.
+    """
+    import sqlite3
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from vpsweb.repository.backup import BackupManager, BackupScheduler
+    from vpsweb.webui.api import statistics
+
+    database_path = tmp_path / "repo.db"
+    sqlite3.connect(database_path).close()
+    manager = BackupManager(database_path, tmp_path / "backups", snapshot_dirs=[], step_sleep=0)
+
+    app = FastAPI()
+    app.include_router(statistics.router, prefix="/api/v1/statistics")
+    app.state.backup_scheduler = BackupScheduler(manager, interval_seconds=0)
+    client = TestClient(app)
+
+    # Hold the run lock as an in-progress backup does
+    manager._run_lock.acquire()
+    try:
+        response = client.post("/api/v1/statistics/backups", params={"snapshot": False})
+    finally:
+        manager._run_lock.release()
+    assert response.status_code == 409
+    assert "already running" in response.json()["detail"]
+
+    response = client.post("/api/v1/statistics/backups", params={"snapshot": False})
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+
+
+@pytest.mark.api
+@pytest.mark.unit
+def test_poet_pages_include_every_spelling_of_the_poet(db_session):
+    """Test that a poet's poems and translations pages match the poet summary's normalized name."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from src.vpsweb.repository.crud import RepositoryService
+    from src.vpsweb.repository.schemas import PoemCreate, TranslationCreate, TranslatorType
+    from src.vpsweb.webui.api import poets
+
+    repo = RepositoryService(db_session)
+    for index, spelling in enumerate(["Page Poet", "page POET"]):
+        poem = repo.poems.create(
+            PoemCreate(
+                poet_name=spelling,
+                poem_title=f"Page Poem {index}",
+                source_language="English",
+                original_text="Test content",
+            )
+        )
+        repo.translations.create(
+            TranslationCreate(
+                poem_id=poem.id,
+                translator_type=TranslatorType.HUMAN,
+                translator_info="Test Translator",
+                target_language="zh-CN",
+                translated_text="测试翻译内容，这是一个完整的翻译句子。",
+            )
+        )
+
+    app = FastAPI()
+    app.include_router(poets.router, prefix="/api/v1/poets")
+    app.dependency_overrides[poets.get_db] = lambda: db_session
+    client = TestClient(app)
+
+    response = client.get("/api/v1/poets/PAGE POET/poems")
+    assert response.status_code == 200
+    assert sorted(poem["poem_title"] for poem in response.json()["data"]["poems"]) == ["Page Poem 0", "Page Poem 1"]
+
+    response = client.get("/api/v1/poets/Page Poet/translations")
+    assert response.status_code == 200
+    assert response.json()["data"]["pagination"]["total_items"] == 2
@@ -18,6 +18,7 @@ from src.vpsweb.repository.models import (
     HumanNote,
     Poem,
     Translation,
+    TranslationWorkflowStep,
 )
 from src.vpsweb.repository.schemas import (
     PoemCreate,
@@ -229,3 +230,692 @@ class TestEssentialCRUD:
         existing_poem = repo.poems.get_by_id(poem.id)
         assert existing_poem is not None
         # Foreign key constraint should prevent deletion with related translations
+
+    def test_poem_aggregate_uses_fixed_query_count(self, db_session):
+        """Test that the poem aggregate loader does not issue per-translation queries."""
+        from sqlalchemy import event
+
+        repo = RepositoryService(db_session)
+
+        poem = repo.poems.create(
+            PoemCreate(
+                poet_name="Test Poet",
+                poem_title="Aggregate Poem",
+                source_language="English",
+                original_text="Test content",
+            )
+        )
+        for index in range(3):
+            translation = repo.translations.create(
+                TranslationCreate(
+                    poem_id=poem.id,
+                    translator_type=TranslatorType.HUMAN,
+                    translator_info=f"Translator {index}",
+                    target_language="zh-CN",
+                    translated_text="测试翻译内容，这是一个完整的翻译句子。",
+                )
+            )
+            db_session.add(
+                HumanNote(
+                    id=str(uuid.uuid4())[:26],
+                    translation_id=translation.id,
+                    note_text=f"Note {index}",
+                )
+            )
+        db_session.commit()
+        poem_id = poem.id
+        db_session.expunge_all()
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            aggregate = repo.get_poem_aggregate(poem_id, include_text=False)
+            for entry in aggregate["translations"]:
+                assert len(entry["human_notes"]) == 1
+                assert entry["ai_logs"] == []
+                assert entry["workflow_steps"] == []
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+        # poem, BBR, translations, AI logs, human notes, workflow steps
+        assert len(statements) == 6
+        assert aggregate["translation_count"] == 3
+        assert aggregate["human_translation_count"] == 3
+        assert aggregate["background_briefing_report"] is None
+
+    def test_query_instrumentation_flags_repeated_statements(self, db_session):
+        """Test that per-scope query tracking caps counts and spots N+1 patterns."""
+        from src.vpsweb.repository.instrumentation import assert_max_queries
+
+        repo = RepositoryService(db_session)
+        poem = repo.poems.create(
+            PoemCreate(
+                poet_name="Test Poet",
+                poem_title="Instrumented Poem",
+                source_language="English",
+                original_text="Test content",
+            )
+        )
+        translation_ids = [
+            repo.translations.create(
+                TranslationCreate(
+                    poem_id=poem.id,
+                    translator_type=TranslatorType.HUMAN,
+                    translator_info=f"Translator {index}",
+                    target_language="zh-CN",
+                    translated_text="测试翻译内容，这是一个完整的翻译句子。",
+                )
+            ).id
+            for index in range(5)
+        ]
+        poem_id = poem.id
+        db_session.expunge_all()
+
+        with assert_max_queries(6) as stats:
+            repo.get_poem_aggregate(poem_id, include_text=False)
+        assert stats.repeated_statements(threshold=2) == []
+
+        # One query per translation is the N+1 shape the tracker should flag
+        with pytest.raises(AssertionError, match="Expected at most 2 queries"):
+            with assert_max_queries(2) as stats:
+                for translation_id in translation_ids:
+                    repo.human_notes.get_by_translation(translation_id)
+        repeated = stats.repeated_statements(threshold=5)
+        assert len(repeated) == 1
+        assert repeated[0][1] == 5
+        assert "human_notes" in repeated[0][0]
+
+    def test_entity_cache_snapshots_and_invalidation(self, db_session):
+        """Test that poem/BBR snapshots are cached, immutable and invalidated by writes."""
+        import dataclasses
+
+        from src.vpsweb.repository.cache import bbr_cache, poem_cache
+        from src.vpsweb.repository.instrumentation import assert_max_queries, track_queries
+        from src.vpsweb.repository.schemas import PoemUpdate
+
+        repo = RepositoryService(db_session)
+        poem = repo.poems.create(
+            PoemCreate(
+                poet_name="Test Poet",
+                poem_title="Cached Poem",
+                source_language="English",
+                original_text="Test content",
+            )
+        )
+
+        snapshot = repo.poems.get_snapshot(poem.id)
+        assert snapshot.poem_title == "Cached Poem"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.poem_title = "Changed"
+        with assert_max_queries(0):
+            assert repo.poems.get_snapshot(poem.id) is snapshot
+
+        repo.poems.update(poem.id, PoemUpdate(poem_title="Renamed Poem"))
+        assert repo.poems.get_snapshot(poem.id).poem_title == "Renamed Poem"
+
+        # A missing BBR is cached as None until one is created
+        assert repo.background_briefing_reports.get_snapshot_by_poem(poem.id) is None
+        with assert_max_queries(0):
+            assert repo.background_briefing_reports.get_snapshot_by_poem(poem.id) is None
+        repo.background_briefing_reports.create(
+            {"id": str(uuid.uuid4())[:26], "poem_id": poem.id, "content": '{"sections": []}'}
+        )
+        bbr = repo.background_briefing_reports.get_snapshot_by_poem(poem.id)
+        assert bbr.content == '{"sections": []}'
+
+        # Deleting the poem also drops its cached BBR, which is re-read from the database
+        repo.poems.delete(poem.id)
+        assert repo.poems.get_snapshot(poem.id) is None
+        with track_queries() as reload_stats:
+            repo.background_briefing_reports.get_snapshot_by_poem(poem.id)
+        assert reload_stats.query_count == 1
+
+        stats = poem_cache.stats()
+        assert stats["hits"] >= 1 and stats["invalidations"] >= 2
+        assert 0 < stats["hit_ratio"] < 1
+        assert bbr_cache.stats()["memory_bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_poem_service_writes_invalidate_cached_snapshots(self, db_session):
+        """Test that web UI poem edits and deletes are not hidden by cached snapshots."""
+        from src.vpsweb.repository.instrumentation import track_queries
+        from src.vpsweb.webui.services.poem_service import PoemService
+
+        repo = RepositoryService(db_session)
+        service = PoemService(db_session)
+        poem = repo.poems.create(
+            PoemCreate(
+                poet_name="Service Poet",
+                poem_title="Service Poem",
+                source_language="English",
+                original_text="Test content",
+            )
+        )
+        repo.background_briefing_reports.create(
+            {"id": str(uuid.uuid4())[:26], "poem_id": poem.id, "content": '{"sections": []}'}
+        )
+        assert repo.poems.get_snapshot(poem.id).poem_title == "Service Poem"
+        assert repo.background_briefing_reports.get_snapshot_by_poem(poem.id) is not None
+
+        updated = await service.update_poem(poem.id, poem_title=" Edited Service Poem ")
+        assert updated["poem_title"] == "Edited Service Poem"
+        assert repo.poems.get_snapshot(poem.id).poem_title == "Edited Service Poem"
+        assert repo.poet_summaries.get_by_name("Service Poet").poem_count == 1
+        assert await service.update_poem("missing", poem_title="Anything") is None
+
+        # The poem's cached BBR is dropped too and re-read from the database
+        assert await service.delete_poem(poem.id) is True
+        assert repo.poems.get_snapshot(poem.id) is None
+        with track_queries() as reload_stats:
+            repo.background_briefing_reports.get_snapshot_by_poem(poem.id)
+        assert reload_stats.query_count == 1
+        assert repo.poet_summaries.get_by_name("Service Poet") is None
+        assert await service.delete_poem(poem.id) is False
+
+    def test_poem_translation_stats_maintained_and_checked(self, db_session):
+        """Test that translation writes keep poem counters in sync and the check repairs drift."""
+        from sqlalchemy import update as sql_update
+
+        from src.vpsweb.repository.instrumentation import assert_max_queries
+        from src.vpsweb.repository.models import PoemTranslationStats
+
+        repo = RepositoryService(db_session)
+        poem = repo.poems.create(
+            PoemCreate(
+                poet_name="Test Poet",
+                poem_title="Counted Poem",
+                source_language="English",
+                original_text="Test content",
+            )
+        )
+        translations = [
+            repo.translations.create(
+                TranslationCreate(
+                    poem_id=poem.id,
+                    translator_type=translator_type,
+                    translator_info="Translator",
+                    target_language="zh-CN",
+                    translated_text="测试翻译内容，这是一个完整的翻译句子。",
+                )
+            )
+            for translator_type in (TranslatorType.AI, TranslatorType.AI, TranslatorType.HUMAN)
+        ]
+        repo.translations.delete(translations[0].id)
+
+        stats = repo.poem_stats.get_by_poem(poem.id)
+        assert (stats.translation_count, stats.ai_translation_count, stats.human_translation_count) == (2, 1, 1)
+        assert repo.poem_stats.check_consistency() == []
+
+        with assert_max_queries(1):
+            rows, _ = repo.poems.get_list_page(limit=10, include_text=False)
+        assert rows[0]["translation_count"] == 2
+        assert rows[0]["original_text"] is None
+
+        db_session.execute(
+            sql_update(PoemTranslationStats).where(PoemTranslationStats.poem_id == poem.id).values(translation_count=9)
+        )
+        db_session.commit()
+        mismatches = repo.poem_stats.check_consistency(fix=True)
+        assert [m["poem_id"] for m in mismatches] == [poem.id]
+        assert repo.poem_stats.check_consistency() == []
+
+    def test_poet_summary_maintained_on_writes(self, db_session):
+        """Test that poem and translation writes keep the poets summary table in sync."""
+        from src.vpsweb.repository.schemas import PoemUpdate
+
+        repo = RepositoryService(db_session)
+        first = repo.poems.create(
+            PoemCreate(
+                poet_name="Summary Poet",
+                poem_title="First Poem",
+                source_language="English",
+                original_text="Test content",
+            )
+        )
+        second = repo.poems.create(
+            PoemCreate(
+                poet_name="summary poet",
+                poem_title="Second Poem",
+                source_language="Chinese",
+                original_text="Test content",
+            )
+        )
+        for translator_type, rating in ((TranslatorType.AI, 4), (TranslatorType.HUMAN, 2)):
+            repo.translations.create(
+                TranslationCreate(
+                    poem_id=first.id,
+                    translator_type=translator_type,
+                    translator_info="Translator",
+                    target_language="zh-CN",
+                    translated_text="测试翻译内容，这是一个完整的翻译句子。",
+                    quality_rating=rating,
+                )
+            )
+
+        summary = repo.poet_summaries.get_by_name("SUMMARY POET")
+        data = repo.poet_summaries.to_dict(summary)
+        assert summary.poet_name == "summary poet"
+        assert (summary.poem_count, summary.ai_translation_count, summary.human_translation_count) == (2, 1, 1)
+        assert summary.avg_quality_rating == 3.0
+        assert data["source_languages"] == ["en", "zh-CN"]
+        assert data["language_pairs"] == [{"source_language": "en", "target_language": "zh-CN", "translation_count": 2}]
+        assert repo.poet_summaries.check_consistency() == []
+
+        # Renaming moves the poem to another summary; deleting the last poem drops the row
+        repo.poems.update(second.id, PoemUpdate(poet_name="Other Poet"))
+        assert repo.poet_summaries.get_by_name("Summary Poet").poem_count == 1
+        repo.poems.delete(second.id)
+        assert repo.poet_summaries.get_by_name("Other Poet") is None
+        names = repo.poet_summaries.get_names()
+        assert "Summary Poet" in names and "Other Poet" not in names
+        assert repo.poet_summaries.check_consistency() == []
+
+        # A batch refresh runs a fixed number of statements however many poets it covers
+        from src.vpsweb.repository.instrumentation import assert_max_queries
+
+        poets = [f"Batch Poet {i}" for i in range(20)]
+        for poet in poets:
+            repo.poems.create(
+                PoemCreate(poet_name=poet, poem_title="Batch Poem", source_language="English", original_text=poet)
+            )
+        with assert_max_queries(3):
+            summaries = repo.poet_summaries.refresh_many(poets + ["Summary Poet", "Nobody"])
+        assert summaries["nobody"] is None
+        assert summaries["summary poet"].poem_count == 1
+        assert all(summaries[f"batch poet {i}"].poem_count == 1 for i in range(20))
+        assert repo.poet_summaries.check_consistency() == []
+
+        # The refresh finds the poems of a poet through the normalized-name index
+        from sqlalchemy import text
+
+        stmt = repo.poet_summaries._rows_stmt().where(repo.poet_summaries._key_expr().in_(["summary poet"]))
+        compiled = stmt.compile(db_session.bind, compile_kwargs={"literal_binds": True})
+        plan = db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+        assert any("idx_poems_poet_key" in row[-1] for row in plan)
+
+    def test_bulk_import_chunks_and_skips_duplicates(self, db_session):
+        """Test that bulk import inserts in chunks, reports invalid rows and skips duplicate content."""
+        import io
+        import json
+
+        from src.vpsweb.repository.bulk_import import BulkPoemImporter, iter_jsonl
+
+        lines = [
+            json.dumps({"poet": "Bulk Poet", "title": f"Bulk Poem {index}", "text": f"Bulk poem content {index}"})
+            for index in range(5)
+        ]
+        lines.append(json.dumps({"poet": "bulk poet", "title": "BULK POEM 0", "text": "Bulk  poem content 0"}))
+        lines.append("{not json")
+        lines.append(json.dumps({"poet": "Bulk Poet", "title": "Too short", "text": "short"}))
+        source = "\n".join(lines)
+
+        repo = RepositoryService(db_session)
+        importer = BulkPoemImporter(db_session, chunk_size=3, defaults={"source_language": "en"})
+        report = importer.run(iter_jsonl(io.StringIO(source), "poems.jsonl"))
+
+        assert (report.total, report.imported, report.duplicates, report.invalid) == (8, 5, 1, 2)
+        assert report.chunks == 3
+        assert [error["ref"] for error in report.errors] == ["poems.jsonl:7", "poems.jsonl:8"]
+        assert repo.poet_summaries.get_by_name("Bulk Poet").poem_count == 5
+
+        # Re-running the same source finds every valid record already stored
+        report = importer.run(iter_jsonl(io.StringIO(source), "poems.jsonl"))
+        assert (report.imported, report.duplicates) == (0, 6)
+
+    def test_streaming_export_filters_and_watermark(self, db_session):
+        """Test that the export streams filtered rows and resumes from its watermark."""
+        import gzip
+        import json
+        from datetime import datetime
+
+        from src.vpsweb.repository.export import ExportError, RepositoryExporter
+        from src.vpsweb.repository.schemas import PoemUpdate
+
+        repo = RepositoryService(db_session)
+        poem = repo.poems.create(
+            PoemCreate(
+                poet_name="Export Poet",
+                poem_title="Export Poem",
+                source_language="English",
+                original_text="Test content",
+            )
+        )
+        translation_data = TranslationCreate(
+            poem_id=poem.id,
+            translator_type=TranslatorType.AI,
+            translator_info="Test Model",
+            target_language="zh-CN",
+            translated_text="测试翻译内容，这是一个完整的翻译句子。",
+        )
+        repo.translations.create(translation_data)
+        db_session.add(BackgroundBriefingReport(id=str(uuid.uuid4())[:26], poem_id=poem.id, content="{}"))
+        db_session.commit()
+
+        exporter = RepositoryExporter(db_session, poet_name="export poet", language="en", batch_size=1)
+        records = [
+            json.loads(line) for line in gzip.decompress(b"".join(exporter.iter_bytes(compress=True))).splitlines()
+        ]
+        assert [record["type"] for record in records] == ["poem", "bbr", "export_end"]
+        assert records[0]["id"] == poem.id
+        assert records[-1]["counts"] == {"poems": 1, "translations": 0, "workflow_steps": 0, "bbrs": 1}
+
+        exporter = RepositoryExporter(db_session, ["translations", "workflow_steps"], poet_name="Export Poet")
+        list(exporter.iter_lines())
+        assert exporter.counts == {"translations": 1, "workflow_steps": 0}
+
+        # Only rows changed after the previous watermark are exported again
+        watermark = records[-1]["watermark"]
+        repo.translations.create(translation_data)
+        exporter = RepositoryExporter(
+            db_session, poet_name="Export Poet", changed_since=datetime.fromisoformat(watermark)
+        )
+        assert [json.loads(line)["type"] for line in exporter.iter_lines()] == ["translation", "export_end"]
+
+        # Poems edited after an export are picked up by the next one
+        watermark = exporter.watermark.isoformat()
+        repo.poems.update(poem.id, PoemUpdate(poem_title="Edited Export Poem"))
+        exporter = RepositoryExporter(
+            db_session, ["poems"], poet_name="Export Poet", changed_since=datetime.fromisoformat(watermark)
+        )
+        assert [json.loads(line)["type"] for line in exporter.iter_lines()] == ["poem", "export_end"]
+
+        csv_lines = list(RepositoryExporter(db_session, ["poems"], fmt="csv", poet_name="Export Poet").iter_lines())
+        assert csv_lines[0].startswith("id,poet_name,poem_title")
+        with pytest.raises(ExportError):
+            RepositoryExporter(db_session, ["poems", "bbrs"], fmt="csv")
+
+    def test_ulid_keys_stored_as_binary(self, db_session):
+        """Test that ULID keys are stored as 16-byte BLOBs while legacy keys stay TEXT."""
+        from sqlalchemy import text
+
+        from src.vpsweb.utils.ulid_utils import binary_to_ulid, generate_ulid_batch, ulid_to_binary
+
+        repo = RepositoryService(db_session)
+        poem = repo.poems.create(
+            PoemCreate(
+                poet_name="Binary Key Poet",
+                poem_title="Binary Key Poem",
+                source_language="English",
+                original_text="Test content",
+            )
+        )
+        legacy = Poem(
+            id=str(uuid.uuid4())[:26],
+            poet_name="Binary Key Poet",
+            poem_title="Legacy Key Poem",
+            source_language="en",
+            original_text="Test content",
+        )
+        db_session.add(legacy)
+        db_session.commit()
+
+        stored = dict(
+            db_session.execute(
+                text("SELECT poem_title, typeof(id) FROM poems WHERE poet_name = 'Binary Key Poet'")
+            ).all()
+        )
+        assert stored == {"Binary Key Poem": "blob", "Legacy Key Poem": "text"}
+
+        poem_id, legacy_id = poem.id, legacy.id
+        db_session.expunge_all()
+        assert repo.poems.get_by_id(poem_id).id == poem_id
+        assert repo.poems.get_by_id(legacy_id).poem_title == "Legacy Key Poem"
+
+        # Binary form preserves the sort order of the string form
+        ids = generate_ulid_batch(100)
+        assert sorted(ulid_to_binary(ulid) for ulid in ids) == [ulid_to_binary(ulid) for ulid in sorted(ids)]
+        assert [binary_to_ulid(ulid_to_binary(ulid)) for ulid in ids] == ids
+
+    def test_online_backup_and_incremental_snapshot(self, tmp_path):
+        """Test stepwise database backup and hash-based output snapshots."""
+        import os
+        import sqlite3
+
+        from src.vpsweb.repository.backup import BackupError, BackupManager, database_path_from_url
+
+        database_path = tmp_path / "repo.db"
+        source = sqlite3.connect(database_path)
+        source.execute("CREATE TABLE poems (id INTEGER PRIMARY KEY, text TEXT)")
+        source.executemany("INSERT INTO poems (text) VALUES (?)", [("床前明月光" * 50,)] * 500)
+        source.commit()
+
+        outputs = tmp_path / "outputs"
+        (outputs / "json").mkdir(parents=True)
+        (outputs / "json" / "a.json").write_text('{"a": 1}')
+        (outputs / "json" / "b.json").write_text('{"b": 2}')
+
+        manager = BackupManager(
+            database_path, tmp_path / "backups", snapshot_dirs=[outputs], keep=2, pages_per_step=8, step_sleep=0
+        )
+        first = manager.run()
+        assert first.success, first.error
+        assert first.database.steps > 1
+        backup = sqlite3.connect(first.database.path)
+        assert backup.execute("SELECT COUNT(*) FROM poems").fetchone()[0] == 500
+        backup.close()
+        assert (first.snapshot.files, first.snapshot.copied) == (2, 2)
+
+        # Only the changed and new files are copied; unchanged ones are linked
+        (outputs / "json" / "b.json").write_text('{"b": 3}')
+        (outputs / "json" / "c.json").write_text('{"c": 4}')
+        source.execute("DELETE FROM poems WHERE id > 100")
+        source.commit()
+        second = manager.run()
+        source.close()
+        assert (second.snapshot.files, second.snapshot.copied, second.snapshot.linked) == (3, 2, 1)
+        snapshot_dir = tmp_path / "backups" / "snapshots" / os.path.basename(second.snapshot.path)
+        assert (snapshot_dir / "outputs" / "json" / "b.json").read_text() == '{"b": 3}'
+        assert (snapshot_dir / "outputs" / "json" / "a.json").read_text() == '{"a": 1}'
+
+        # Retention keeps the newest copies; status reports every run
+        manager.run(snapshot=False)
+        assert len(list((tmp_path / "backups" / "database").glob("repo-*.db"))) == 2
+        status = manager.status()
+        assert (status["runs"], status["failures"]) == (3, 0)
+        assert status["last_duration_seconds"] is not None
+
+        # Only file-backed databases can be backed up; in-memory and URI filenames are refused
+        assert database_path_from_url(f"sqlite:///{database_path}") == database_path
+        for url in (
+            "sqlite:///:memory:",
+            "sqlite:///file:memdb1?mode=memory&cache=shared&uri=true",
+            f"sqlite:///file:{database_path}?uri=true",
+            "postgresql://localhost/repo",
+        ):
+            with pytest.raises(BackupError):
+                database_path_from_url(url)
+
+    def test_maintenance_analyzes_vacuums_and_records_stats(self, tmp_path, monkeypatch):
+        """Test that maintenance refreshes statistics, releases free pages and records a run."""
+        from sqlalchemy import create_engine
+
+        from src.vpsweb.repository import maintenance
+        from src.vpsweb.repository.database import Base
+        from src.vpsweb.repository.maintenance import MaintenanceManager
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'repo.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE scratch (id INTEGER PRIMARY KEY, text TEXT)")
+            conn.exec_driver_sql(
+                "INSERT INTO scratch (text) SELECT printf('%.500c', 'x') FROM "
+                "(WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 2000) SELECT i FROM n)"
+            )
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DELETE FROM scratch WHERE id > 100")
+
+        # Converting to incremental auto-vacuum needs a full VACUUM and is opt-in
+        default = MaintenanceManager(engine, budget_seconds=10)
+        assert default.storage_stats()["fragmentation"] > 0.5
+        with engine.connect() as conn:
+            assert "scratch" in MaintenanceManager.stale_tables(conn)
+        skipped = default.run()
+        assert skipped["error"] is None
+        assert "scratch" in skipped["analyzed_tables"]
+        assert (skipped["vacuumed_pages"], skipped["auto_vacuum"]) == (0, "none")
+
+        # Nor does it start when its estimated duration exceeds the remaining budget
+        manager = MaintenanceManager(engine, budget_seconds=10, vacuum_convert_max_bytes=64 * 1024 * 1024)
+        with monkeypatch.context() as patch:
+            patch.setattr(maintenance, "VACUUM_BYTES_PER_SECOND", 1)
+            over_budget = manager.run()
+        assert over_budget["budget_exhausted"] and over_budget["vacuumed_pages"] == 0
+        assert over_budget["auto_vacuum"] == "none"
+
+        first = manager.run()
+        assert first["error"] is None
+        assert first["vacuumed_pages"] > 0
+        assert (first["freelist_count"], first["auto_vacuum"]) == (0, "incremental")
+
+        # Freed pages are now released incrementally; fresh statistics are not redone
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DELETE FROM scratch WHERE id > 10")
+        second = manager.run()
+        assert second["vacuumed_pages"] > 0 and second["freelist_count"] == 0
+        assert "poems" not in second["analyzed_tables"]
+
+        history = manager.history()
+        assert [run["trigger"] for run in history] == ["manual"] * 4
+        assert history[0]["page_count"] == second["page_count"]
+        engine.dispose()
+
+        # Files created through the app's connect hook start out incremental, so the
+        # default manager releases their free pages without any conversion
+        from sqlalchemy import event
+
+        from src.vpsweb.repository.database import set_sqlite_pragma
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'new.db'}")
+        event.listen(engine, "connect", set_sqlite_pragma)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE scratch (id INTEGER PRIMARY KEY, text TEXT)")
+            conn.exec_driver_sql(
+                "INSERT INTO scratch (text) SELECT printf('%.500c', 'x') FROM "
+                "(WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 500) SELECT i FROM n)"
+            )
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DELETE FROM scratch")
+        fresh = MaintenanceManager(engine, budget_seconds=10).run()
+        assert fresh["auto_vacuum"] == "incremental"
+        assert fresh["vacuumed_pages"] > 0 and fresh["freelist_count"] == 0
+        engine.dispose()
+
+    def test_poem_keyset_pagination(self, db_session):
+        """Test that cursor pages cover every poem exactly once."""
+        from src.vpsweb.repository.pagination import InvalidCursorError
+
+        repo = RepositoryService(db_session)
+        for index in range(5):
+            repo.poems.create(
+                PoemCreate(
+                    poet_name="Keyset Poet",
+                    poem_title=f"Keyset Poem {index}",
+                    source_language="English",
+                    original_text="Test content",
+                )
+            )
+
+        seen = []
+        cursor = None
+        while True:
+            poems, cursor = repo.poems.get_multi_after(limit=2, cursor=cursor, poet_name="Keyset Poet")
+            seen.extend(poem.id for poem in poems)
+            if cursor is None:
+                break
+
+        offset_ids = [poem.id for poem in repo.poems.get_multi(limit=10, poet_name="Keyset Poet")]
+        assert seen == offset_ids
+        assert len(set(seen)) == 5
+        assert repo.poems.count_by_mode("exact", poet_name="Keyset Poet") == (5, True)
+        assert repo.poems.count_by_mode("none", poet_name="Keyset Poet") == (None, False)
+
+        with pytest.raises(InvalidCursorError):
+            repo.poems.get_multi_after(limit=2, cursor="not-a-cursor")
+
+    def test_translation_payload_round_trip(self, db_session):
+        """Test that workflow payloads are stored compressed and step content is deferred."""
+        repo = RepositoryService(db_session)
+
+        poem = repo.poems.create(
+            PoemCreate(
+                poet_name="Test Poet",
+                poem_title="Payload Poem",
+                source_language="English",
+                original_text="Test content",
+            )
+        )
+        translation = repo.translations.create(
+            TranslationCreate(
+                poem_id=poem.id,
+                translator_type=TranslatorType.AI,
+                translator_info="Test Model",
+                target_language="zh-CN",
+                translated_text="测试翻译内容，这是一个完整的翻译句子。",
+            )
+        )
+
+        document = {"results": {"initial_translation": {"content": "雾来了" * 500}}}
+        payload = repo.translation_payloads.save(translation.id, document)
+        assert payload.compressed_size < payload.raw_size
+        assert repo.translation_payloads.get_data(translation.id) == document
+
+        # Replacing keeps a single row per translation
+        repo.translation_payloads.save(translation.id, {"results": {}})
+        assert repo.translation_payloads.get_storage_stats()["payload_count"] >= 1
+        assert repo.translation_payloads.get_data(translation.id) == {"results": {}}
+
+        # Heavy step columns are deferred so relationship and list loads skip them
+        step_columns = TranslationWorkflowStep.__mapper__.column_attrs
+        assert all(step_columns[name].deferred for name in ("content", "notes", "model_info"))
+
+    def test_workflow_step_update(self, db_session):
+        """Test that updating a workflow step persists the change and returns the step."""
+        from datetime import datetime
+
+        from src.vpsweb.repository.schemas import AILogCreate, TranslationWorkflowStepCreate, WorkflowMode
+
+        repo = RepositoryService(db_session)
+        poem = repo.poems.create(
+            PoemCreate(
+                poet_name="Test Poet",
+                poem_title="Step Poem",
+                source_language="English",
+                original_text="Test content",
+            )
+        )
+        translation = repo.translations.create(
+            TranslationCreate(
+                poem_id=poem.id,
+                translator_type=TranslatorType.AI,
+                translator_info="Test Model",
+                target_language="zh-CN",
+                translated_text="测试翻译内容，这是一个完整的翻译句子。",
+            )
+        )
+        ai_log = repo.ai_logs.create(
+            AILogCreate(translation_id=translation.id, model_name="test-model", workflow_mode=WorkflowMode.HYBRID)
+        )
+        step = repo.workflow_steps.create(
+            TranslationWorkflowStepCreate(
+                translation_id=translation.id,
+                ai_log_id=ai_log.id,
+                workflow_id="workflow-1",
+                step_type=WorkflowStepType.INITIAL_TRANSLATION,
+                step_order=1,
+                content="雾来了",
+                timestamp=datetime.now(),
+            )
+        )
+
+        updated = repo.workflow_steps.update(step.id, {"content": "雾来了，踮着猫的小脚", "tokens_used": 42})
+        assert updated is not None
+        assert updated.id == step.id
+        assert updated.content == "雾来了，踮着猫的小脚"
+        assert repo.workflow_steps.get_by_id(step.id).tokens_used == 42
+        assert repo.workflow_steps.update("missing-step", {"content": "x"}) is None
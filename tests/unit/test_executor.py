@@ -20,6 +20,8 @@ from src.vpsweb.models.config import StepConfig
 from src.vpsweb.models.translation import TranslationInput
 from src.vpsweb.services.prompts import PromptService
 
+PROMPT_HASH = "9f2c" * 16
+
 
 class TestStepExecutor:
     """Test cases for StepExecutor functionality."""
@@ -106,9 +108,10 @@ class TestStepExecutor:
         mock_provider.generate.return_value = sample_llm_response
         mock_llm_factory.get_provider.return_value = mock_provider
 
-        mock_prompt_service.render_prompt.return_value = (
+        mock_prompt_service.render_prompt_versioned.return_value = (
             "System prompt content",
             "User prompt content",
+            PROMPT_HASH,
         )
 
         input_data = {
@@ -134,12 +137,90 @@ class TestStepExecutor:
         assert metadata["model_info"]["model"] == "gpt-3.5-turbo"
         assert metadata["usage"]["tokens_used"] == 150
         assert metadata["execution_time_seconds"] > 0
+        assert metadata["prompt_hash"] == PROMPT_HASH
 
         # Verify mocks were called
         mock_llm_factory.get_provider.assert_called_once()
-        mock_prompt_service.render_prompt.assert_called_once_with("initial_translation.yaml", input_data)
+        mock_prompt_service.render_prompt_versioned.assert_called_once_with("initial_translation.yaml", input_data)
         mock_provider.generate.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_step_streams_completed_fields(
+        self,
+        step_executor,
+        mock_llm_factory,
+        mock_prompt_service,
+        sample_step_config,
+        sample_llm_response,
+    ):
+        """With a field callback, streaming providers report each output field as it closes."""
+        chunks = ["<initial_translation>雾来了</initial", "_translation>\n<initial_translation_notes>Notes"]
+
+        async def generate(**kwargs):
+            assert kwargs["stream"] is True
+            for chunk in chunks:
+                await kwargs["on_chunk"](chunk)
+            return sample_llm_response
+
+        mock_provider = Mock(supports_streaming=True)
+        mock_provider.generate = generate
+        mock_llm_factory.get_provider.return_value = mock_provider
+        mock_prompt_service.render_prompt_versioned.return_value = ("System", "User", PROMPT_HASH)
+
+        fields = []
+
+        async def field_callback(step_name, field, content):
+            fields.append((step_name, field, content))
+
+        step_executor.field_callback = field_callback
+        result = await step_executor.execute_step("initial_translation", {}, sample_step_config)
+
+        # The notes are reported when the stream ends, though their closing tag never came
+        assert fields == [
+            ("initial_translation", "initial_translation", "雾来了"),
+            ("initial_translation", "initial_translation_notes", "Notes"),
+        ]
+        assert result["output"]["initial_translation"] == "雾来了\n踏着猫的小脚。"
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_does_not_report_partial_fields(
+        self,
+        step_executor,
+        mock_llm_factory,
+        mock_prompt_service,
+        sample_step_config,
+        sample_llm_response,
+    ):
+        """A stream that fails inside a field reports nothing of it; the retry streams it again."""
+        attempts = []
+
+        async def generate(**kwargs):
+            attempts.append(kwargs)
+            if len(attempts) == 1:
+                await kwargs["on_chunk"]("<initial_translation>雾来了\n")
+                await kwargs["on_chunk"]("踏着猫")
+                raise ConnectionError("stream closed by peer")
+            await kwargs["on_chunk"]("<initial_translation>雾来了\n踏着猫的小脚。</initial_translation>")
+            return sample_llm_response
+
+        mock_provider = Mock(supports_streaming=True)
+        mock_provider.generate = generate
+        mock_llm_factory.get_provider.return_value = mock_provider
+        mock_prompt_service.render_prompt_versioned.return_value = ("System", "User", PROMPT_HASH)
+        sample_step_config.retry_attempts = 1
+
+        fields = []
+
+        async def field_callback(step_name, field, content):
+            fields.append((field, content))
+
+        step_executor.field_callback = field_callback
+        result = await step_executor.execute_step("initial_translation", {}, sample_step_config)
+
+        assert len(attempts) == 2
+        assert fields == [("initial_translation", "雾来了\n踏着猫的小脚。")]
+        assert result["output"]["initial_translation"] == "雾来了\n踏着猫的小脚。"
+
     @pytest.mark.asyncio
     async def test_execute_step_with_retry_success(
         self,
@@ -158,9 +239,10 @@ class TestStepExecutor:
         ]
         mock_llm_factory.get_provider.return_value = mock_provider
 
-        mock_prompt_service.render_prompt.return_value = (
+        mock_prompt_service.render_prompt_versioned.return_value = (
             "System prompt content",
             "User prompt content",
+            PROMPT_HASH,
         )
 
         input_data = {
@@ -190,9 +272,10 @@ class TestStepExecutor:
         mock_provider.generate.side_effect = Exception("API error")
         mock_llm_factory.get_provider.return_value = mock_provider
 
-        mock_prompt_service.render_prompt.return_value = (
+        mock_prompt_service.render_prompt_versioned.return_value = (
             "System prompt content",
             "User prompt content",
+            PROMPT_HASH,
         )
 
         input_data = {
@@ -214,7 +297,7 @@ class TestStepExecutor:
         # Setup mock to raise template error
         from src.vpsweb.services.prompts import TemplateLoadError
 
-        mock_prompt_service.render_prompt.side_effect = TemplateLoadError("Template not found")
+        mock_prompt_service.render_prompt_versioned.side_effect = TemplateLoadError("Template not found")
 
         input_data = {
             "original_poem": "Test poem",
@@ -242,9 +325,10 @@ class TestStepExecutor:
         mock_provider.generate.return_value = Mock(content="Invalid XML content", tokens_used=50)
         mock_llm_factory.get_provider.return_value = mock_provider
 
-        mock_prompt_service.render_prompt.return_value = (
+        mock_prompt_service.render_prompt_versioned.return_value = (
             "System prompt content",
             "User prompt content",
+            PROMPT_HASH,
         )
 
         input_data = {
@@ -275,9 +359,10 @@ class TestStepExecutor:
         mock_provider.generate.return_value = sample_llm_response
         mock_llm_factory.get_provider.return_value = mock_provider
 
-        mock_prompt_service.render_prompt.return_value = (
+        mock_prompt_service.render_prompt_versioned.return_value = (
             "System prompt content",
             "User prompt content",
+            PROMPT_HASH,
         )
 
         # Execute initial translation
@@ -290,7 +375,7 @@ class TestStepExecutor:
         assert "initial_translation_notes" in result["output"]
 
         # Verify correct input data was passed
-        call_args = mock_prompt_service.render_prompt.call_args[0]
+        call_args = mock_prompt_service.render_prompt_versioned.call_args[0]
         assert call_args[0] == "initial_translation.yaml"
         assert call_args[1]["original_poem"] == "The fog comes on little cat feet."
         assert call_args[1]["source_lang"] == "English"
@@ -317,9 +402,10 @@ class TestStepExecutor:
         mock_provider.generate.return_value = editor_response
         mock_llm_factory.get_provider.return_value = mock_provider
 
-        mock_prompt_service.render_prompt.return_value = (
+        mock_prompt_service.render_prompt_versioned.return_value = (
             "Editor review system prompt",
             "Editor review user prompt",
+            PROMPT_HASH,
         )
 
         # Create initial translation
@@ -361,7 +447,7 @@ class TestStepExecutor:
         assert result["status"] == "success"
 
         # Verify correct input data was passed
-        call_args = mock_prompt_service.render_prompt.call_args[0]
+        call_args = mock_prompt_service.render_prompt_versioned.call_args[0]
         assert call_args[0] == "editor_review.yaml"
         assert call_args[1]["initial_translation"] == "雾来了\n踏着猫的小脚。"
 
@@ -386,9 +472,10 @@ class TestStepExecutor:
         mock_provider.generate.return_value = revision_response
         mock_llm_factory.get_provider.return_value = mock_provider
 
-        mock_prompt_service.render_prompt.return_value = (
+        mock_prompt_service.render_prompt_versioned.return_value = (
             "Revision system prompt",
             "Revision user prompt",
+            PROMPT_HASH,
         )
 
         # Create editor review and initial translation
@@ -435,7 +522,7 @@ class TestStepExecutor:
         assert result["status"] == "success"
 
         # Verify correct input data was passed
-        call_args = mock_prompt_service.render_prompt.call_args[0]
+        call_args = mock_prompt_service.render_prompt_versioned.call_args[0]
         assert call_args[0] == "translator_revision.yaml"
         assert call_args[1]["editor_suggestions"] == "Consider using more poetic language"
 
@@ -526,9 +613,10 @@ class TestStepExecutor:
         mock_provider.generate.return_value = empty_response
         mock_llm_factory.get_provider.return_value = mock_provider
 
-        mock_prompt_service.render_prompt.return_value = (
+        mock_prompt_service.render_prompt_versioned.return_value = (
             "System prompt content",
             "User prompt content",
+            PROMPT_HASH,
         )
 
         input_data = {
@@ -558,9 +646,10 @@ class TestStepExecutor:
         mock_provider.generate.return_value = plain_text_response
         mock_llm_factory.get_provider.return_value = mock_provider
 
-        mock_prompt_service.render_prompt.return_value = (
+        mock_prompt_service.render_prompt_versioned.return_value = (
             "System prompt content",
             "User prompt content",
+            PROMPT_HASH,
         )
 
         # Modify config to not require specific fields
@@ -0,0 +1,258 @@
+"""
+Unit tests for the durable translation job queue.
+"""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from vpsweb.models.config import WorkflowMode
+from vpsweb.services import config as config_module
+from vpsweb.services.llm.base import RateLimitError
+from vpsweb.webui.api import wechat
+from vpsweb.webui.job_queue import Job, JobQueue, JobStore, QueueFullError, rate_limit_of
+from vpsweb.webui.services import services
+from vpsweb.webui.task_store import InMemoryTaskStore, SQLiteTaskStore, TaskNamespace
+
+
+class TestJobQueue:
+    """Test suite for lanes, admission control and persistence."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_jobs_run_first_within_the_worker_limit(self):
+        queue = JobQueue(workers=2, batch_workers=1)
+        release = asyncio.Event()
+        started, active, peak = [], [], []
+
+        async def handler(job):
+            started.append(job.payload["n"])
+            active.append(job.id)
+            peak.append(len(active))
+            await release.wait()
+            active.remove(job.id)
+
+        queue.register("work", handler)
+        for n in range(3):
+            await queue.submit("work", {"n": f"batch-{n}"}, lane="batch")
+        await queue.submit("work", {"n": "interactive"})
+        await queue.start()
+        try:
+            await asyncio.sleep(0.05)
+            # One batch worker at most; the other worker takes the interactive job
+            assert sorted(started) == ["batch-0", "interactive"]
+            assert queue.stats()["depth"] == {"interactive": 0, "batch": 2}
+            assert queue.active_jobs == 2
+
+            release.set()
+            for _ in range(100):
+                if queue.completed == 4:
+                    break
+                await asyncio.sleep(0.01)
+            assert queue.completed == 4 and max(peak) == 2 and queue.active_jobs == 0
+            assert queue.stats()["wait_time"]["batch"]["count"] == 3
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_jobs_back_off_and_retry(self):
+        queue = JobQueue(workers=4, max_queued=1, rate_limit_cooldown=0.05)
+        calls = []
+
+        async def handler(job):
+            calls.append(job.attempts)
+            if job.attempts == 1:
+                try:
+                    raise RateLimitError("slow down", provider="test", status_code=429)
+                except RateLimitError:
+                    # Providers' errors reach the queue wrapped by the executor
+                    raise RuntimeError("step failed")
+
+        queue.register("work", handler)
+        await queue.start()
+        try:
+            await queue.submit("work", {})
+            with pytest.raises(QueueFullError) as excinfo:
+                await queue.submit("work", {})
+            assert excinfo.value.retry_after >= 1
+
+            for _ in range(100):
+                if queue.completed:
+                    break
+                await asyncio.sleep(0.01)
+            assert calls == [1, 2]
+            assert queue.rate_limited == queue.retried == 1
+            # Halved after the rate limit, then raised again by the success
+            assert queue.concurrency == 3
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_jobs_survive_a_restart(self, tmp_path):
+        path = str(tmp_path / "jobs.db")
+        first = JobQueue(JobStore(path))
+        first.register("work", lambda job: asyncio.sleep(10))
+        await first.submit("work", {"task_id": "t1"}, lane="batch")
+        first.close()
+
+        done = asyncio.Event()
+        second = JobQueue(JobStore(path))
+
+        async def handler(job):
+            assert job.payload == {"task_id": "t1"} and job.lane == "batch"
+            done.set()
+
+        second.register("work", handler)
+        await second.start()
+        try:
+            await asyncio.wait_for(done.wait(), timeout=2)
+        finally:
+            await second.stop()
+            assert second.store.claimable() == []
+            second.close()
+
+    def test_rate_limit_detection_follows_the_exception_chain(self):
+        error = RateLimitError("429", provider="test", status_code=429)
+        wrapped = RuntimeError("workflow failed")
+        wrapped.__cause__ = error
+        assert rate_limit_of(wrapped) == 0
+        assert rate_limit_of(RuntimeError("other")) is None
+
+    @pytest.mark.asyncio
+    async def test_wechat_article_jobs_record_phases_and_honour_cancellation(self, monkeypatch):
+        class FakeRunner:
+            def __init__(self, config_facade=None):
+                self.article_generator = type("Generator", (), {"phase_timings": {}})()
+
+            def generate_from_translation_data(self, translation_data, cancel_check=None, **kwargs):
+                assert not cancel_check()
+                self.article_generator.phase_timings = {"notes_synthesis": 1.5, "html_render": 0.1}
+                return translation_data["slug"]
+
+            def get_article_summary(self, result):
+                return {"slug": result}
+
+        monkeypatch.setattr(wechat, "WeChatArticleRunner", FakeRunner)
+        monkeypatch.setattr(wechat, "get_config_facade", lambda: None)
+        wechat_tasks = InMemoryTaskStore().namespace("wechat_tasks")
+        queue = JobQueue()
+        wechat.register_wechat_article_jobs(queue, wechat_tasks)
+
+        for task_id in ("kept", "cancelled"):
+            wechat_tasks[task_id] = {"status": "queued", "translation_id": "t1"}
+            await queue.submit(
+                wechat.WECHAT_ARTICLE_JOB,
+                {
+                    "task_id": task_id,
+                    "translation_data": {"slug": task_id},
+                    "author": None,
+                    "digest": None,
+                    "dry_run": True,
+                    "custom_metadata": {"translation_id": "t1"},
+                },
+            )
+        with wechat_tasks.edit("cancelled") as task:
+            task["status"] = "cancelled"
+
+        await queue.start()
+        try:
+            for _ in range(100):
+                if queue.completed == 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await queue.stop()
+
+        assert wechat_tasks["kept"]["status"] == "completed"
+        assert wechat_tasks["kept"]["result"] == {"slug": "kept"}
+        assert wechat_tasks["kept"]["phase_timings"] == {"notes_synthesis": 1.5, "html_render": 0.1}
+        assert wechat_tasks["cancelled"] == {"status": "cancelled", "translation_id": "t1"}
+
+    @pytest.mark.asyncio
+    async def test_wechat_article_job_cancelled_between_claim_and_start_does_not_run(self, monkeypatch, tmp_path):
+        class CancelAfterRead(TaskNamespace):
+            def get(self, key, default=None):
+                # The worker has read the task; the user cancels before it starts
+                value = super().get(key, default)
+                with self.edit(key) as task:
+                    task["status"] = "cancelled"
+                return value
+
+        monkeypatch.setattr(wechat, "WeChatArticleRunner", Mock(side_effect=AssertionError("article generated")))
+        store = SQLiteTaskStore(str(tmp_path / "tasks.db"))
+        wechat_tasks = CancelAfterRead(store, "wechat_tasks")
+        wechat_tasks["t"] = {"status": "queued", "translation_id": "t1"}
+        job = Job(wechat.WECHAT_ARTICLE_JOB, {"task_id": "t", "custom_metadata": {"translation_id": "t1"}})
+
+        try:
+            await wechat._run_wechat_article_job(job, wechat_tasks)
+            assert wechat_tasks["t"] == {"status": "cancelled", "translation_id": "t1"}
+        finally:
+            store.close()
+
+    @pytest.mark.asyncio
+    async def test_queued_workflows_resolve_their_steps(self, monkeypatch, caplog):
+        resolved, started = [], []
+
+        class FakeFacade:
+            main = SimpleNamespace(workflow=None)
+            providers = None
+
+            def get_workflow_step_config(self, mode, step_name):
+                resolved.append((mode, step_name))
+                return {
+                    "provider": "tongyi",
+                    "model": "qwen-max",
+                    "prompt_template": f"{step_name}.yaml",
+                    "temperature": 0.7,
+                    "max_tokens": 1000,
+                    "timeout": 30.0,
+                    "retry_attempts": 1,
+                }
+
+        class FakeWorkflow:
+            def __init__(self, **kwargs):
+                started.append(kwargs["workflow_mode"])
+                self.step_executor = SimpleNamespace()
+
+            async def execute(self, input_data, show_progress=False):
+                raise RuntimeError("stop after step resolution")
+
+        monkeypatch.setattr(config_module, "get_config_facade", lambda: FakeFacade())
+        monkeypatch.setattr(services, "TranslationWorkflow", FakeWorkflow)
+        poem = SimpleNamespace(
+            source_language="English", original_text="The fog comes", poem_title="Fog", poet_name="Sandburg"
+        )
+        repository_service = Mock()
+        repository_service.repo.poems.get_by_id.return_value = poem
+        queue = JobQueue()
+        workflow_service = services.WorkflowServiceV2(
+            repository_service=repository_service,
+            storage_handler=Mock(),
+            task_service=services.TaskManagementServiceV2(),
+            job_queue=queue,
+        )
+
+        task_id = await workflow_service.start_translation_workflow("p1", "Chinese", WorkflowMode.HYBRID, None)
+        caplog.set_level(logging.ERROR)
+        await queue.start()
+        try:
+            for _ in range(100):
+                if started:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await queue.stop()
+
+        # The payload carries the mode as a string; steps resolve from it without errors
+        assert resolved == [
+            ("hybrid", "initial_translation"),
+            ("hybrid", "editor_review"),
+            ("hybrid", "translator_revision"),
+        ]
+        assert started == [WorkflowMode.HYBRID]
+        assert not [record for record in caplog.records if "Failed to resolve step" in record.getMessage()]
+        task = await workflow_service.task_service.get_task(task_id)
+        assert task["status"] == "failed"
@@ -0,0 +1,52 @@
+"""
+Unit tests for the latency histograms and their Prometheus export.
+"""
+
+import pytest
+
+from vpsweb.utils.metrics import OVERFLOW_LABEL, Histogram, HistogramFamily, MetricsRegistry
+
+
+class TestHistogram:
+    """Test suite for bucketed latency histograms."""
+
+    def test_percentiles_are_estimated_within_a_bucket(self):
+        histogram = Histogram()
+        for _ in range(90):
+            histogram.observe(0.010)
+        for _ in range(10):
+            histogram.observe(2.0)
+
+        # 10ms falls in the (8ms, 16ms] bucket, 2s in (1.024s, 2.048s]
+        assert 0.008 < histogram.quantile(0.5) <= 0.016
+        assert 1.024 < histogram.quantile(0.99) <= 2.0
+        assert histogram.as_dict()["count"] == 100
+        assert histogram.as_dict()["max_seconds"] == 2.0
+        assert Histogram().quantile(0.95) == 0.0
+
+    def test_label_combinations_are_capped(self):
+        family = HistogramFamily("requests", "Requests", ("route",), max_series=2)
+        for route in ("/a", "/b", "/c", "/d"):
+            family.observe(0.1, route)
+
+        assert [values for values, _ in family.series()] == [("/a",), ("/b",), (OVERFLOW_LABEL,)]
+        assert family.labels("/d").count == 2
+        with pytest.raises(ValueError):
+            family.labels("/a", "extra")
+
+    def test_prometheus_text_format(self):
+        registry = MetricsRegistry()
+        family = registry.histogram("vpsweb_test_seconds", "Test latency", ("route",), buckets=(0.1, 1.0))
+        assert registry.histogram("vpsweb_test_seconds", "Test latency", ("route",)) is family
+        family.observe(0.05, '/poems/{poem_id}"')
+        family.observe(5.0, '/poems/{poem_id}"')
+
+        lines = registry.render().splitlines()
+        assert lines[:2] == ["# HELP vpsweb_test_seconds Test latency", "# TYPE vpsweb_test_seconds histogram"]
+        assert lines[2:] == [
+            'vpsweb_test_seconds_bucket{route="/poems/{poem_id}\\"",le="0.1"} 1',
+            'vpsweb_test_seconds_bucket{route="/poems/{poem_id}\\"",le="1.0"} 1',
+            'vpsweb_test_seconds_bucket{route="/poems/{poem_id}\\"",le="+Inf"} 2',
+            'vpsweb_test_seconds_sum{route="/poems/{poem_id}\\""} 5.05',
+            'vpsweb_test_seconds_count{route="/poems/{poem_id}\\""} 2',
+        ]
@@ -4,8 +4,10 @@ Essential tests for the OutputParser class.
 Only tests critical functionality - XML parsing and error handling.
 """
 
+import json
+
 import pytest
-from src.vpsweb.services.parser import OutputParser
+from src.vpsweb.services.parser import OutputParser, StreamingJSONExtractor, StreamingXMLExtractor
 
 
 class TestOutputParser:
@@ -46,3 +48,71 @@ class TestOutputParser:
 
         with pytest.raises(XMLParsingError):
             OutputParser.parse_xml("")
+
+    def test_parse_xml_nested_tags_and_stray_text(self):
+        """Nested tags become dicts; code fences, comparisons and unclosed tags are skipped."""
+        xml_string = """Reasoning: line 2 < line 1, keep it short<br>
+        ```xml
+        <translation>
+          <title> 雾 </title>
+          <body>雾来了 a < b</body>
+          <note>unclosed
+        </translation>
+        <stray></closing>
+        ```"""
+
+        result = OutputParser.parse_xml(xml_string)
+
+        assert result == {"translation": {"title": "雾", "body": "雾来了 a < b"}}
+
+    def test_parse_initial_translation_tolerates_unclosed_tags(self):
+        """Required fields are recovered from truncated output and tags with trailing spaces."""
+        xml_string = (
+            "```xml\n<translated_poem_title >雾</translated_poem_title >\n"
+            "<initial_translation>\n雾来了\n</initial_translation>\n"
+            "<initial_translation_notes>Notes cut off mid-sentence"
+        )
+
+        result = OutputParser.parse_initial_translation_xml(xml_string)
+
+        assert result["initial_translation"] == "雾来了"
+        assert result["initial_translation_notes"] == "Notes cut off mid-sentence"
+        assert result["translated_poem_title"] == "雾"
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7])
+    def test_streaming_extractor_emits_fields_as_they_close(self, chunk_size):
+        """Tags split across chunks are reassembled; each field closes before the rest arrives."""
+        response = (
+            "Thinking: a < b\n<initial_translation>\n雾来了\n踏着<i>猫</i>的小脚。\n</initial_translation >\n"
+            "<initial_translation_notes>Notes cut off"
+        )
+        extractor = StreamingXMLExtractor()
+        events = []
+        for start in range(0, len(response), chunk_size):
+            events += extractor.feed(response[start : start + chunk_size])
+
+        closed = {event.tag: event.text for event in events if event.kind == "close"}
+        assert closed == {"i": "猫", "initial_translation": "雾来了\n踏着<i>猫</i>的小脚。"}
+        assert "".join(event.text for event in events if event.tag == "initial_translation_notes") == "Notes cut off"
+
+        events = extractor.close()
+        assert [(event.kind, event.tag, event.text) for event in events] == [
+            ("close", "initial_translation_notes", "Notes cut off")
+        ]
+        assert (
+            extractor.fields["initial_translation"]
+            == OutputParser.parse_initial_translation_xml(response)["initial_translation"]
+        )
+
+    def test_streaming_json_extractor_reads_bbr_fields(self):
+        """Top-level BBR fields complete one by one, across escapes and nested brackets."""
+        report = {"text_anchor": {"lines": 4, "note": 'a "}" b\\'}, "poet_style": "x, y: z", "themes": [1, {"a": "]"}]}
+        response = "```json\n" + json.dumps(report, ensure_ascii=False) + "\n```"
+        extractor = StreamingJSONExtractor()
+        completed = []
+        for char in response:
+            completed += [event.tag for event in extractor.feed(char) if event.kind == "close"]
+
+        assert completed == ["text_anchor", "poet_style", "themes"]
+        assert extractor.fields == report
+        assert extractor.done
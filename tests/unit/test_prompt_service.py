@@ -0,0 +1,84 @@
+"""
+Unit tests for prompt template versioning and hot reload.
+"""
+
+import os
+
+import pytest
+
+from vpsweb.services.prompts import PromptService, TemplateLoadError, combine_prompt_hashes
+
+
+def write_template(path, user: str) -> None:
+    path.write_text(f'system: "You are a translator."\nuser: "{user}"\n', encoding="utf-8")
+    # Make the change visible even on filesystems with coarse timestamps
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestPromptTemplateReload:
+    """Test suite for reloading and pinning prompt template versions."""
+
+    def test_reload_swaps_version_for_every_service(self, tmp_path):
+        """An edited file replaces the loaded version in all services; the old one stays pinnable."""
+        template_file = tmp_path / "greeting.yaml"
+        write_template(template_file, "Hello {{ name }}")
+        service = PromptService(str(tmp_path))
+        other = PromptService(str(tmp_path))
+
+        _, user, old_hash = service.render_prompt_versioned("greeting", {"name": "Ada"})
+        assert user == "Hello Ada"
+        assert service.reload_changed() == []
+
+        write_template(template_file, "Goodbye {{ name }}")
+        assert service.reload_changed() == ["greeting"]
+
+        _, user, new_hash = other.render_prompt_versioned("greeting", {"name": "Ada"})
+        assert user == "Goodbye Ada"
+        assert new_hash != old_hash
+        assert other.get_template_info("greeting")["content_hash"] == new_hash
+        assert other.render_prompt("greeting", {"name": "Ada"}, content_hash=old_hash)[1] == "Hello Ada"
+        with pytest.raises(TemplateLoadError):
+            other.render_prompt("greeting", {"name": "Ada"}, content_hash="0" * 64)
+
+    def test_reload_reads_only_edited_files(self, tmp_path, monkeypatch):
+        """Editing one template reloads it alone; unchanged and merely touched files are not re-read."""
+        write_template(tmp_path / "greeting.yaml", "Hello {{ name }}")
+        write_template(tmp_path / "farewell.yaml", "Bye {{ name }}")
+        service = PromptService(str(tmp_path))
+        _, greeting_before, greeting_hash = service.render_prompt_versioned("greeting", {"name": "Ada"})
+        farewell = service.load_prompt_template("farewell")
+
+        reads = []
+        read_template = service._read_template
+        monkeypatch.setattr(service, "_read_template", lambda name: reads.append(name) or read_template(name))
+
+        write_template(tmp_path / "greeting.yaml", "Hi {{ name }}")
+        assert service.reload_changed() == ["greeting"]
+        assert reads == ["greeting"]
+        _, greeting_after, new_hash = service.render_prompt_versioned("greeting", {"name": "Ada"})
+        assert (greeting_before, greeting_after) == ("Hello Ada", "Hi Ada")
+        assert new_hash != greeting_hash
+        assert service.load_prompt_template("farewell") is farewell
+
+        # A touched file is read once to compare hashes, then left alone
+        write_template(tmp_path / "farewell.yaml", "Bye {{ name }}")
+        assert service.reload_changed() == []
+        assert service.reload_changed() == []
+        assert reads == ["greeting", "farewell"]
+        assert service.load_prompt_template("farewell") is farewell
+
+    def test_broken_edit_keeps_serving_loaded_version(self, tmp_path):
+        template_file = tmp_path / "greeting.yaml"
+        write_template(template_file, "Hello {{ name }}")
+        service = PromptService(str(tmp_path))
+        content_hash = service.get_prompt_version("greeting")
+
+        write_template(template_file, "Hello {{ name ")
+        assert service.reload_changed() == []
+        assert service.render_prompt_versioned("greeting", {"name": "Ada"})[1:] == ("Hello Ada", content_hash)
+
+    def test_combined_prompt_hash(self):
+        assert combine_prompt_hashes([None, None]) is None
+        assert combine_prompt_hashes(["a", None, "b"]) == combine_prompt_hashes(["a", "b"])
+        assert combine_prompt_hashes(["a", "b"]) != combine_prompt_hashes(["b", "a"])
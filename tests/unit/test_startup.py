@@ -0,0 +1,71 @@
+"""
+Unit tests for the CLI and web app startup-time budgets.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from vpsweb.utils.startup import STARTUP_BUDGETS_MS, StartupError, measure_startup, parse_importtime
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Wall-clock budgets depend on the machine, so they only run when asked for
+budget = pytest.mark.skipif(
+    not os.environ.get("VPSWEB_STARTUP_BUDGETS"),
+    reason="set VPSWEB_STARTUP_BUDGETS=1 to check startup-time budgets",
+)
+
+
+class TestStartupBudget:
+    """Cold starts in a fresh interpreter stay within their budgets."""
+
+    @pytest.mark.slow
+    @budget
+    def test_cli_help_is_within_budget_and_skips_heavy_imports(self):
+        profile = measure_startup("cli", profile_imports=True)
+
+        assert profile.elapsed_ms <= STARTUP_BUDGETS_MS["cli"], profile.slowest(10)
+        modules = {timing.module for timing in profile.imports}
+        assert "click" in modules
+        # Only the commands that run a workflow or an article load these
+        for heavy in ("vpsweb.core.workflow", "vpsweb.utils.article_generator", "httpx", "pydantic"):
+            assert heavy not in modules
+
+    @pytest.mark.slow
+    @budget
+    def test_app_reaches_readiness_within_budget(self, tmp_path):
+        env = {
+            "REPO_DATABASE_URL": f"sqlite:///{tmp_path / 'repo.db'}",
+            "REPO_BACKUP_DIR": str(tmp_path / "backups"),
+            "REPO_BACKUP_INTERVAL_HOURS": "0",
+            "REPO_MAINTENANCE_INTERVAL_HOURS": "0",
+            "WEBUI_JOB_QUEUE_PATH": str(tmp_path / "jobs.db"),
+            "WEBUI_TASK_STORE_PATH": str(tmp_path / "tasks.db"),
+        }
+        profile = measure_startup("app", cwd=str(PROJECT_ROOT), env=env)
+
+        assert profile.elapsed_ms <= STARTUP_BUDGETS_MS["app"]
+
+    def test_unknown_targets_are_rejected(self):
+        with pytest.raises(StartupError):
+            measure_startup("worker")
+
+    def test_importtime_output_is_parsed_with_nesting(self):
+        output = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       120 |        120 |     _io",
+                "import time:       310 |       1410 |   click.core",
+                "import time:       479 |       1889 | click",
+                "Usage: vpsweb [OPTIONS] COMMAND [ARGS]...",
+            ]
+        )
+
+        timings = parse_importtime(output)
+        assert [(t.module, t.self_us, t.cumulative_us, t.depth) for t in timings] == [
+            ("_io", 120, 120, 2),
+            ("click.core", 310, 1410, 1),
+            ("click", 479, 1889, 0),
+        ]
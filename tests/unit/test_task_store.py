@@ -0,0 +1,232 @@
+"""
+Unit tests for the shared task store and SSE event hub.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from vpsweb.webui.event_hub import EventHub, TaskEventHub
+from vpsweb.webui.task_models import TaskStatus, TaskStatusEnum, compact_task, task_is_finished
+from vpsweb.webui.task_store import (
+    InMemoryTaskStore,
+    RetentionPolicy,
+    SQLiteTaskStore,
+    create_task_store,
+)
+
+
+class TestTaskStore:
+    """Test suite for the in-memory and SQLite task stores."""
+
+    def test_in_memory_namespace_keeps_live_objects(self):
+        """In-memory values are the stored objects; edits bump the version."""
+        tasks = InMemoryTaskStore().namespace("tasks")
+        task = {"status": "pending"}
+        tasks["t1"] = task
+
+        assert tasks["t1"] is task
+        version = tasks.version("t1")
+        with tasks.edit("t1") as edited:
+            edited["status"] = "running"
+        assert task["status"] == "running"
+        assert tasks.version("t1") > version
+        assert tasks.version("missing") == 0
+
+    @pytest.mark.asyncio
+    async def test_sqlite_store_is_shared_between_instances(self, tmp_path):
+        """Two stores on one file (as in two workers) see and wake on each other's writes."""
+        path = tmp_path / "tasks.db"
+        writer = SQLiteTaskStore(str(path), poll_interval=0.01)
+        reader = SQLiteTaskStore(str(path), poll_interval=0.01)
+        try:
+            created_at = datetime.now(timezone.utc)
+            writer.namespace("tasks")["t1"] = {"status": "pending", "created_at": created_at}
+            writer.namespace("legacy")["t2"] = TaskStatus(task_id="t2")
+
+            tasks = reader.namespace("tasks")
+            assert list(tasks) == ["t1"]
+            assert tasks["t1"] == {"status": "pending", "created_at": created_at}
+            legacy = reader.namespace("legacy")["t2"]
+            assert isinstance(legacy, TaskStatus) and legacy.status == TaskStatusEnum.PENDING
+
+            version = tasks.version("t1")
+            waiter = asyncio.create_task(tasks.wait_for_change("t1", version, timeout=5))
+            await asyncio.sleep(0.05)
+            with writer.namespace("tasks").edit("t1") as task:
+                task["status"] = "running"
+            new_version = await asyncio.wait_for(waiter, timeout=2)
+
+            assert new_version > version
+            assert tasks["t1"]["status"] == "running"
+            assert await tasks.wait_for_change("t1", new_version, timeout=0.05) == new_version
+
+            del writer.namespace("tasks")["t1"]
+            assert "t1" not in tasks
+            with pytest.raises(KeyError):
+                with tasks.edit("t1"):
+                    pass
+        finally:
+            writer.close()
+            reader.close()
+
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    def test_sweep_compacts_expires_and_evicts(self, backend, tmp_path):
+        store = create_task_store(backend, str(tmp_path / "tasks.db"))
+        store.set_retention(
+            "tasks",
+            RetentionPolicy(max_entries=2, ttl=100, max_idle=1000, finished=task_is_finished, compact=compact_task),
+        )
+        store.enable_history("tasks", 3)
+        tasks = store.namespace("tasks")
+        try:
+            tasks["done"] = {"status": "running", "partial_outputs": {"x": "y" * 500}}
+            tasks["done"] = {
+                "status": "completed",
+                "partial_outputs": {"x": "y" * 500},
+                "result": {"id": "w1", "steps": {}},
+            }
+            tasks["running"] = {"status": "running"}
+            usage = store.stats()["namespaces"]["tasks"]
+            assert usage["entries"] == 2 and usage["history_bytes"] > 1000 and usage["bytes"] > 1500
+
+            # Finished tasks are slimmed down once, history included; unfinished ones are left alone
+            now = max(store.written_at("tasks").values())
+            assert store.sweep(now) == {"compacted": 1, "expired": 0, "evicted": 0}
+            slim = {"status": "completed", "result": {"id": "w1"}}
+            assert tasks["done"] == slim
+            assert [value for _, value in tasks.history("done")] == [slim]
+            usage = store.stats()["namespaces"]["tasks"]
+            assert usage["history_bytes"] < 200 and usage["bytes"] < 300
+            assert store.sweep(now) == {"compacted": 0, "expired": 0, "evicted": 0}
+
+            # Finished entries expire after the TTL, unfinished ones only when idle for longer
+            assert store.sweep(now + 500)["expired"] == 1
+            assert list(tasks) == ["running"]
+
+            # Beyond max_entries finished entries are evicted first
+            tasks["failed"] = {"status": "failed"}
+            tasks["queued"] = {"status": "pending"}
+            now = max(store.written_at("tasks").values())
+            assert store.sweep(now)["evicted"] == 1
+            assert sorted(tasks) == ["queued", "running"]
+
+            assert store.sweep(now + 5000)["expired"] == 2
+            assert "tasks" not in store.stats()["namespaces"]
+            assert store.stats()["expired"] == 3
+        finally:
+            store.close()
+
+    def test_in_memory_usage_only_measures_new_writes(self, monkeypatch):
+        """Repeated stats calls (as from /health) encode only what was written since the last one."""
+        from vpsweb.webui import task_store
+
+        store = InMemoryTaskStore()
+        store.enable_history("tasks", 2)
+        tasks = store.namespace("tasks")
+        for progress in range(4):
+            tasks["t1"] = {"status": "running", "progress": progress, "log": "x" * 100}
+        tasks["t2"] = {"status": "pending"}
+        assert store.stats()["namespaces"]["tasks"]["entries"] == 2
+        del tasks["t2"]
+        with tasks.edit("t1") as task:
+            task["status"] = "completed"
+
+        encode = Mock(wraps=task_store.encode_value)
+        monkeypatch.setattr(task_store, "encode_value", encode)
+        usage = store.stats()["namespaces"]
+        # The edited value and the one history version it added
+        assert encode.call_count == 2
+
+        value_bytes = len(task_store.encode_value(tasks["t1"]).encode("utf-8"))
+        history_bytes = sum(len(task_store.encode_value(value).encode("utf-8")) for _, value in tasks.history("t1"))
+        assert usage == {"tasks": {"entries": 1, "bytes": value_bytes + history_bytes, "history_bytes": history_bytes}}
+
+        encode.reset_mock()
+        assert store.stats()["namespaces"] == usage
+        assert encode.call_count == 0
+
+        del tasks["t1"]
+        assert store.stats()["namespaces"] == {}
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError):
+            create_task_store("redis")
+
+
+class TestTaskEventHub:
+    """Test suite for SSE event fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_task_changes_reach_every_subscriber(self):
+        """A second subscriber (browser tab) no longer steals the first one's events."""
+        tasks = InMemoryTaskStore().namespace("tasks")
+        tasks["t1"] = TaskStatus(task_id="t1")
+        hub = TaskEventHub(tasks)
+
+        with hub.subscribe("t1") as first, hub.subscribe("t1") as second:
+            await asyncio.sleep(0)
+            with tasks.edit("t1") as task:
+                task.set_running()
+
+            for subscription in (first, second):
+                event = await subscription.get(timeout=1)
+                assert event["version"] == tasks.version("t1")
+                assert event["task"]["status"] == "running"
+
+            del tasks["t1"]
+            assert (await first.get(timeout=1))["task"] is None
+        assert hub.subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_overflow_policies(self):
+        hub = EventHub(max_queue=2)
+        with (
+            hub.subscribe("t", overflow="drop_oldest") as oldest,
+            hub.subscribe("t", overflow="drop_newest") as newest,
+            hub.subscribe("t", overflow="disconnect") as slow,
+        ):
+            for number in range(3):
+                hub.publish("t", number)
+
+            assert [await oldest.get(), await oldest.get()] == [1, 2]
+            assert [await newest.get(), await newest.get()] == [0, 1]
+            assert oldest.dropped == newest.dropped == 1
+            assert slow.closed
+            assert [event async for event in slow] == [0, 1]
+            assert hub.subscriber_count("t") == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    async def test_stream_replays_missed_events_after_last_event_id(self, backend, tmp_path):
+        """A reconnecting client gets the versions it missed, then live events, without repeats."""
+        store = create_task_store(backend, str(tmp_path / "tasks.db"))
+        store.enable_history("tasks", 3)
+        tasks = store.namespace("tasks")
+        try:
+            tasks["t1"] = {"status": "running", "progress": 0}
+            seen = tasks.version("t1")
+            for progress in (33, 67, 90, 95):
+                with tasks.edit("t1") as task:
+                    task["progress"] = progress
+
+            # Only the newest three versions are retained
+            assert [task["progress"] for _, task in tasks.history("t1")] == [67, 90, 95]
+
+            hub = TaskEventHub(tasks)
+            events = hub.stream("t1", after=tasks.history("t1")[0][0])
+            replayed = [await events.__anext__(), await events.__anext__()]
+            assert [event["task"]["progress"] for event in replayed] == [90, 95]
+            assert hub.task_at("t1", seen) is None
+
+            with tasks.edit("t1") as task:
+                task["status"] = "completed"
+            live = await asyncio.wait_for(events.__anext__(), timeout=2)
+            assert live["version"] == tasks.version("t1") > replayed[-1]["version"]
+            assert live["task"]["status"] == "completed"
+            await events.aclose()
+            assert hub.subscriber_count() == 0
+        finally:
+            store.close()